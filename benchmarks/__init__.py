@@ -0,0 +1,8 @@
+"""
+Performance benchmarks.
+
+Standalone scripts measuring throughput and latency of hot paths. They are
+not part of the test suite; run them manually from the repository root:
+
+    python -m benchmarks.<benchmark_module> --help
+"""
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Account Activation WAL Benchmark
+
+Measures the WAL volume written per activation (pg_current_wal_lsn() before
+and after) for three write paths:
+
+    - full-row UPSERT: what save() ran before change tracking (email,
+      password_hash, is_activated rewritten on every save)
+    - save(): UPDATE of the changed columns only, the path of the in-memory
+      activation store (which activates a loaded Account, then saves it)
+    - activate_with_code(): the single-statement activation that
+      ActivateAccountHandler uses with PostgreSQL (never calls save())
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied. Accounts and their activation codes are inserted first;
+each variant activates its own accounts.
+
+Usage:
+    # Default: 2000 activations per variant
+    python -m benchmarks.bench_account_activation_wal
+
+    # Custom load
+    python -m benchmarks.bench_account_activation_wal --accounts 10000
+
+Output:
+    One line per write path with total WAL bytes and WAL bytes per
+    activation.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from src.account.domain.entities.account import Account
+from src.account.domain.entities.account_activation import AccountActivation
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.account_mapper import to_persistence
+from src.account.infrastructure.persistence.postgres_account_activation_repository import (
+    PostgresAccountActivationRepository,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+
+
+def full_row_upsert(db: PostgresConnectionFactory, account: Account) -> None:
+    """save() as implemented before change tracking (UPSERT of every column)."""
+    row = to_persistence(account)
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO account (
+                    id, email, password_hash, is_activated, created_at, updated_at
+                )
+                VALUES (%s, %s, %s, %s, NOW(), NOW())
+                ON CONFLICT (id) DO UPDATE SET
+                    email = EXCLUDED.email,
+                    password_hash = EXCLUDED.password_hash,
+                    is_activated = EXCLUDED.is_activated,
+                    updated_at = NOW()
+                """,
+                (row["id"], row["email"], row["password_hash"], row["is_activated"]),
+            )
+
+
+def current_wal_lsn(db: PostgresConnectionFactory) -> str:
+    """Return the current WAL insert location."""
+    with db.read_only_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_current_wal_lsn()")
+            row = cursor.fetchone()
+    assert row is not None
+    return str(row[0])
+
+
+def wal_bytes_since(db: PostgresConnectionFactory, lsn: str) -> int:
+    """Return the WAL bytes written since lsn."""
+    with db.read_only_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s)", (lsn,))
+            row = cursor.fetchone()
+    assert row is not None
+    return int(row[0])
+
+
+def measure(
+    name: str,
+    db: PostgresConnectionFactory,
+    repository: PostgresAccountRepository,
+    activate: Callable[[Account, AccountActivation], None],
+    count: int,
+) -> None:
+    """Create count accounts with their codes, then activate them, printing WAL volume."""
+    run = time.time_ns()
+    password = Password.from_hash("$2b$12$benchmarkhashbenchmarkhashbenchmarkhashbenchmarkhash12")
+    accounts = [
+        Account.create(Email(f"bench-wal-{run}-{i}@example.com"), password) for i in range(count)
+    ]
+    repository.save_many(accounts)
+    activations = [AccountActivation.create_for_account(account.id) for account in accounts]
+    PostgresAccountActivationRepository(db).save_many(activations)
+
+    # Loaded from the database, as the activation workflow does
+    loaded = [repository.find_by_id(account.id) for account in accounts]
+
+    started_lsn = current_wal_lsn(db)
+    for found, activation in zip(loaded, activations, strict=True):
+        assert found is not None
+        activate(found, activation)
+    written = wal_bytes_since(db, started_lsn)
+
+    print(f"{name:<28}{written:>14}{written / count:>14.0f}")
+
+
+def main() -> int:
+    """
+    Main entry point for the activation WAL benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        repository = PostgresAccountRepository(db)
+        activation_repository = PostgresAccountActivationRepository(db)
+
+        def upsert(account: Account, _activation: AccountActivation) -> None:
+            account.activate()
+            full_row_upsert(db, account)
+
+        def save(account: Account, _activation: AccountActivation) -> None:
+            account.activate()
+            repository.save(account)
+
+        def activate_with_code(account: Account, activation: AccountActivation) -> None:
+            activation_repository.activate_with_code(account.id, activation.code)
+
+        print(f"{'write path':<28}{'WAL bytes':>14}{'bytes/act':>14}")
+        print("-" * 56)
+        measure("full-row UPSERT (previous)", db, repository, upsert, args.accounts)
+        measure("changed columns (save())", db, repository, save, args.accounts)
+        measure("activate_with_code()", db, repository, activate_with_code, args.accounts)
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
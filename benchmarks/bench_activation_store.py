@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Activation Code Store Benchmark
+
+Issues activation code saves and lookups at a fixed target rate (open loop,
+default 10k codes/sec) against PostgresAccountActivationRepository and
+InMemoryAccountActivationRepository, and reports per-operation latency and
+the rate actually sustained.
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied. Accounts referenced by the codes are inserted first
+(foreign key of account_activation).
+
+Usage:
+    # Default: 10000 codes/sec for 2 seconds
+    python -m benchmarks.bench_activation_store
+
+    # Custom load
+    python -m benchmarks.bench_activation_store --rate 20000 --seconds 5
+
+Output:
+    One line per store and operation with achieved ops/sec and latency
+    percentiles, then the number of codes held by the in-memory store.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from psycopg2.extras import execute_values
+
+from src.account.domain.entities.account_activation import AccountActivation
+from src.account.domain.repositories.account_activation_repository import (
+    AccountActivationRepository,
+)
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.infrastructure.persistence.in_memory_account_activation_repository import (
+    InMemoryAccountActivationRepository,
+)
+from src.account.infrastructure.persistence.postgres_account_activation_repository import (
+    PostgresAccountActivationRepository,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+
+
+def create_accounts(db: PostgresConnectionFactory, count: int) -> list[AccountId]:
+    """Insert count accounts in one statement and return their ids."""
+    run = time.time_ns()
+    ids = [AccountId.generate() for _ in range(count)]
+    rows = [
+        (str(account_id.value), f"bench-activation-{run}-{i}@example.com", "$2b$12$benchmarkhash")
+        for i, account_id in enumerate(ids)
+    ]
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            execute_values(
+                cursor,
+                "INSERT INTO account (id, email, password_hash, is_activated, created_at,"
+                " updated_at) VALUES %s",
+                rows,
+                template="(%s, %s, %s, FALSE, NOW(), NOW())",
+                page_size=1000,
+            )
+    return ids
+
+
+def run_paced(
+    operation: Callable[[AccountId], object], ids: list[AccountId], rate: float
+) -> tuple[float, list[float]]:
+    """
+    Run operation once per id, started at the target rate (open loop).
+
+    Returns:
+        (achieved ops/sec, sorted latencies in seconds)
+    """
+    latencies = []
+    started = time.perf_counter()
+    for index, account_id in enumerate(ids):
+        scheduled = started + index / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        op_started = time.perf_counter()
+        operation(account_id)
+        latencies.append(time.perf_counter() - op_started)
+
+    elapsed = time.perf_counter() - started
+    return len(ids) / elapsed, sorted(latencies)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return the given percentile (0..1) of pre-sorted values (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def bench_store(
+    name: str, repository: AccountActivationRepository, ids: list[AccountId], rate: float
+) -> None:
+    """Print save and find results for one store."""
+
+    def save(account_id: AccountId) -> None:
+        repository.save(AccountActivation.create_for_account(account_id))
+
+    for operation_name, operation in (("save", save), ("find", repository.find_by_account_id)):
+        achieved, latencies = run_paced(operation, ids, rate)
+        print(
+            f"{name:<12}{operation_name:<8}{achieved:>12.0f}"
+            f"{percentile(latencies, 0.5) * 1e6:>12.1f}{percentile(latencies, 0.99) * 1e6:>12.1f}"
+        )
+
+
+def main() -> int:
+    """
+    Main entry point for the activation store benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rate", type=float, default=10000.0, help="Target codes/sec")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        ids = create_accounts(db, int(args.rate * args.seconds))
+        memory = InMemoryAccountActivationRepository(PostgresAccountRepository(db))
+
+        print(f"{'store':<12}{'op':<8}{'ops/sec':>12}{'p50 us':>12}{'p99 us':>12}")
+        print("-" * 56)
+        bench_store("postgres", PostgresAccountActivationRepository(db), ids, args.rate)
+        bench_store("memory", memory, ids, args.rate)
+    finally:
+        db.close()
+
+    print()
+    print(f"In-memory store holds {len(memory)} codes (live or within retention)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Bulk Repository Benchmark
+
+Persists and looks up accounts through PostgresAccountRepository in batches
+of 1, 100 and 10000 (save_many(), find_by_ids(), find_by_emails()), against
+the single-row methods called once per account (one connection checkout
+and, for writes, one commit each).
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied.
+
+Usage:
+    # Default: 10000 accounts per measurement, batch sizes 1, 100, 10000
+    python -m benchmarks.bench_bulk_repository
+
+    # Custom load
+    python -m benchmarks.bench_bulk_repository --accounts 20000 --batch-sizes 1 500 20000
+
+Output:
+    One line per operation and batch size with accounts/sec and
+    microseconds per account.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+from src.account.domain.entities.account import Account
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+
+
+def new_accounts(count: int) -> list[Account]:
+    """Build count new accounts with unique emails (not timed)."""
+    run = time.time_ns()
+    password = Password.from_hash("$2b$12$benchmarkhash")
+    return [
+        Account.create(Email(f"bench-bulk-{run}-{i}@example.com"), password) for i in range(count)
+    ]
+
+
+def batches(accounts: Sequence[Account], size: int) -> list[Sequence[Account]]:
+    """Split accounts into consecutive batches of at most size accounts."""
+    return [accounts[start : start + size] for start in range(0, len(accounts), size)]
+
+
+def measure(
+    name: str, size: int, run_batch: Callable[[Sequence[Account]], object], accounts: list[Account]
+) -> None:
+    """Run every batch of accounts and print throughput."""
+    started = time.perf_counter()
+    for batch in batches(accounts, size):
+        run_batch(batch)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<18}{size:>8}{len(accounts) / elapsed:>14.0f}{elapsed / len(accounts) * 1e6:>12.1f}"
+    )
+
+
+def save_one_by_one(repository: PostgresAccountRepository, accounts: Sequence[Account]) -> None:
+    """Single-row baseline: one save() per account."""
+    for account in accounts:
+        repository.save(account)
+
+
+def find_one_by_one(repository: PostgresAccountRepository, accounts: Sequence[Account]) -> None:
+    """Single-row baseline: one find_by_id() per account."""
+    for account in accounts:
+        repository.find_by_id(account.id)
+
+
+def main() -> int:
+    """
+    Main entry point for the bulk repository benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=10_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    args = parser.parse_args()
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        repository = PostgresAccountRepository(db)
+
+        def save_batch(batch: Sequence[Account]) -> None:
+            repository.save_many(batch)
+
+        def find_ids_batch(batch: Sequence[Account]) -> None:
+            repository.find_by_ids(account.id for account in batch)
+
+        def find_emails_batch(batch: Sequence[Account]) -> None:
+            repository.find_by_emails(account.email for account in batch)
+
+        def save_single(batch: Sequence[Account]) -> None:
+            save_one_by_one(repository, batch)
+
+        def find_single(batch: Sequence[Account]) -> None:
+            find_one_by_one(repository, batch)
+
+        print(f"{'operation':<18}{'batch':>8}{'accounts/s':>14}{'us/account':>12}")
+        print("-" * 52)
+        saved = new_accounts(args.accounts)
+        measure("save() per row", 1, save_single, saved)
+        measure("find_by_id()", 1, find_single, saved)
+
+        for size in args.batch_sizes:
+            accounts = new_accounts(args.accounts)
+            measure("save_many()", size, save_batch, accounts)
+            measure("find_by_ids()", size, find_ids_batch, accounts)
+            measure("find_by_emails()", size, find_emails_batch, accounts)
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Connection Pool Contention Benchmark
+
+Simulates a burst of sync FastAPI handlers (40 request threads) competing
+for a pool of 10 connections, each holding its connection for a short query.
+Compares psycopg2's ThreadedConnectionPool, which raises PoolError as soon as
+the pool is exhausted, with BlockingConnectionPool, which queues callers up
+to the acquisition timeout.
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables).
+
+Usage:
+    # Default: 40 threads x 25 requests, 10 connections, 5ms queries
+    python -m benchmarks.bench_connection_pool
+
+    # Custom load
+    python -m benchmarks.bench_connection_pool --threads 80 --query-ms 20
+
+Output:
+    One line per pool with successful/failed requests, throughput and
+    latency percentiles, then the wait-time histogram of the blocking pool.
+"""
+
+import argparse
+import functools
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+from psycopg2 import pool
+from psycopg2.extensions import connection as Connection  # noqa: N812
+
+from src.shared.infrastructure.database.connection import (
+    BlockingConnectionPool,
+    _get_database_config,
+)
+
+
+def run_burst(
+    getconn: Callable[[], Connection],
+    putconn: Callable[[Connection], None],
+    threads: int,
+    requests: int,
+    query_seconds: float,
+) -> tuple[int, int, float, list[float]]:
+    """
+    Run requests from a thread pool, each checking out a connection for one query.
+
+    Args:
+        getconn: Pool checkout function
+        putconn: Pool return function
+        threads: Simulated request threadpool size
+        requests: Requests per thread
+        query_seconds: Server-side duration of each query (pg_sleep)
+
+    Returns:
+        (succeeded, failed, elapsed seconds, latencies of successful requests)
+    """
+
+    def request(_: int) -> float | None:
+        started = time.perf_counter()
+        try:
+            conn = getconn()
+        except pool.PoolError:
+            return None
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_sleep(%s)", (query_seconds,))
+            conn.rollback()
+        finally:
+            putconn(conn)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as request_threads:
+        results = list(request_threads.map(request, range(threads * requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency in results if latency is not None)
+    return len(latencies), len(results) - len(latencies), elapsed, latencies
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return the given percentile (0..1) of pre-sorted values (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def print_result(
+    name: str, succeeded: int, failed: int, elapsed: float, latencies: list[float]
+) -> None:
+    """Print one result line."""
+    print(
+        f"{name:<26}{succeeded:>8}{failed:>8}{succeeded / elapsed:>10.1f}"
+        f"{percentile(latencies, 0.5) * 1000:>10.1f}{percentile(latencies, 0.99) * 1000:>10.1f}"
+    )
+
+
+def main() -> int:
+    """
+    Main entry point for the pool contention benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=40)
+    parser.add_argument("--requests", type=int, default=25, help="Requests per thread")
+    parser.add_argument("--minconn", type=int, default=2)
+    parser.add_argument("--maxconn", type=int, default=10)
+    parser.add_argument("--query-ms", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    args = parser.parse_args()
+
+    config = _get_database_config()
+    query_seconds = args.query_ms / 1000
+
+    print(f"{'pool':<26}{'ok':>8}{'failed':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    print("-" * 72)
+
+    threaded = pool.ThreadedConnectionPool(args.minconn, args.maxconn, **config)
+    try:
+        result = run_burst(
+            threaded.getconn, threaded.putconn, args.threads, args.requests, query_seconds
+        )
+        print_result("ThreadedConnectionPool", *result)
+    finally:
+        threaded.closeall()
+
+    blocking = BlockingConnectionPool(
+        minconn=args.minconn,
+        maxconn=args.maxconn,
+        connect=functools.partial(psycopg2.connect, **config),
+        timeout=args.timeout,
+    )
+    try:
+        result = run_burst(
+            blocking.getconn, blocking.putconn, args.threads, args.requests, query_seconds
+        )
+        print_result("BlockingConnectionPool", *result)
+        stats = blocking.stats()
+    finally:
+        blocking.closeall()
+
+    print()
+    print(f"BlockingConnectionPool wait times ({stats.timeouts} timeouts):")
+    for upper_bound, count in stats.wait_time_histogram:
+        print(f"  <= {upper_bound * 1000:>8.0f} ms  {count:>6}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Domain Object Memory Benchmark
+
+Loads accounts through account_mapper.to_domain() (as an export, cache
+warmup or bulk job would) and measures the memory they retain with
+tracemalloc, against the same accounts built from the previous dataclass
+layout (per-instance __dict__, no __slots__). Rows are produced lazily, so
+only what the loaded accounts keep alive is counted. No database required.
+
+Usage:
+    # Default: 1000000 accounts
+    python -m benchmarks.bench_domain_memory
+
+    # Custom load
+    python -m benchmarks.bench_domain_memory --accounts 200000
+
+Output:
+    One line per layout with retained MiB and bytes per account.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.infrastructure.persistence.account_mapper import to_domain
+
+Row = dict[str, str | UUID | bool | datetime]
+
+
+@dataclass(frozen=True)
+class DictAccountId:
+    """AccountId as declared before __slots__ (UuidV7 base included)."""
+
+    value: UUID
+
+
+@dataclass(frozen=True)
+class DictEmail:
+    """Email as declared before __slots__."""
+
+    value: str
+
+
+@dataclass(frozen=True)
+class DictPassword:
+    """Password as declared before __slots__."""
+
+    hashed_value: str
+
+
+@dataclass
+class DictAccount:
+    """Account as declared before __slots__."""
+
+    _id: DictAccountId
+    _email: DictEmail
+    _password: DictPassword
+    _is_activated: bool = False
+
+
+def to_dict_layout(row: Row) -> DictAccount:
+    """Reconstruction into the previous layout (same work as to_domain())."""
+    account_id = row["id"] if isinstance(row["id"], UUID) else UUID(str(row["id"]))
+    return DictAccount(
+        _id=DictAccountId(account_id),
+        _email=DictEmail(str(row["email"])),
+        _password=DictPassword(str(row["password_hash"])),
+        _is_activated=bool(row["is_activated"]),
+    )
+
+
+def generate_rows(count: int) -> Iterator[Row]:
+    """Yield account rows as returned by RealDictCursor, one at a time."""
+    now = datetime.now(UTC)
+    for i in range(count):
+        yield {
+            "id": AccountId.generate().value,
+            "email": f"user{i}@example.com",
+            "password_hash": f"$2b$12${i:053d}",
+            "is_activated": i % 2 == 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def measure(name: str, convert: Callable[[Row], object], count: int) -> None:
+    """Load count accounts and print the memory they retain."""
+    gc.collect()
+    tracemalloc.start()
+    accounts = [convert(row) for row in generate_rows(count)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<24}{retained / 2**20:>12.1f}{retained / len(accounts):>12.0f}")
+    del accounts
+
+
+def main() -> int:
+    """
+    Main entry point for the domain memory benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'layout':<24}{'MiB':>12}{'B/account':>12}")
+    print("-" * 48)
+    measure("__dict__ (previous)", to_dict_layout, args.accounts)
+    measure("__slots__ (to_domain)", to_domain, args.accounts)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
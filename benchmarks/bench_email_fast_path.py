@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Email Fast Path Benchmark
+
+Measures the cost of validating addresses the memo has never seen (first
+registration of each user): the full email_validator parse against the
+precompiled ASCII fast path used by Email(value). A share of the stream
+uses unusual addresses (IDN, apostrophes) that still take the full
+parse. No database required.
+
+Usage:
+    # Default: 50000 addresses, 5% outside the fast path
+    python -m benchmarks.bench_email_fast_path
+
+    # Custom load
+    python -m benchmarks.bench_email_fast_path --addresses 200000 --unusual-ratio 0.2
+
+Output:
+    One line per path with addresses/sec and microseconds per address,
+    then the share of addresses served by the fast path.
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+
+from email_validator import validate_email
+
+from src.account.domain.value_objects import email as email_module
+from src.account.domain.value_objects.email import Email
+
+UNUSUAL_DOMAINS = ["exämple.com", "xn--exmple-cua.com", "mail.example.org"]
+
+
+def build_stream(addresses: int, unusual_ratio: float, seed: int, run: int) -> list[str]:
+    """Build unique addresses, some of them outside the ASCII fast path."""
+    rng = random.Random(seed)
+    stream = []
+    for i in range(addresses):
+        if rng.random() < unusual_ratio:
+            stream.append(f"o'user.{run}.{i}@{rng.choice(UNUSUAL_DOMAINS)}")
+        else:
+            stream.append(f"User.{run}.{i}+tag@{rng.choice(['example.com', 'mail.example.org'])}")
+    return stream
+
+
+def full_parse(raw_value: str) -> str:
+    """Validation as performed before the fast path (email_validator per address)."""
+    return validate_email(raw_value, check_deliverability=False).normalized.lower()
+
+
+def measure(name: str, validate: Callable[[str], object], stream: list[str]) -> None:
+    """Validate every address of the stream and print throughput."""
+    started = time.perf_counter()
+    for raw_value in stream:
+        validate(raw_value)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<26}{len(stream) / elapsed:>14.0f}{elapsed / len(stream) * 1e6:>10.2f}")
+
+
+def main() -> int:
+    """
+    Main entry point for the email fast path benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--addresses", type=int, default=50_000)
+    parser.add_argument("--unusual-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # Distinct addresses per path: Email(value) never hits its memo
+    baseline = build_stream(args.addresses, args.unusual_ratio, args.seed, run=0)
+    current = build_stream(args.addresses, args.unusual_ratio, args.seed, run=1)
+
+    print(f"{'Email validation':<26}{'addresses/s':>14}{'us/addr':>10}")
+    print("-" * 50)
+    measure("email_validator per call", full_parse, baseline)
+    measure("Email(value) fast path", Email, current)
+
+    fast = sum(email_module._normalize_ascii(raw_value) is not None for raw_value in current)
+    print()
+    print(f"Fast path: {fast / len(current):.1%} of addresses ({fast}/{len(current)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
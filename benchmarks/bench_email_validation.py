@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Email Validation Memo Benchmark
+
+Replays a registration stream where a share of the submitted addresses were
+already seen (retries, duplicate signups), and measures the Email(value)
+step of each registration: email_validator on every call (previous
+behaviour) versus the memoized Email value object. bcrypt and the database
+are left out, so only the validation cost is compared. No database required.
+
+Usage:
+    # Default: 50000 registrations, 30% repeated addresses
+    python -m benchmarks.bench_email_validation
+
+    # Custom load
+    python -m benchmarks.bench_email_validation --registrations 200000 --repeat-ratio 0.5
+
+Output:
+    One line per path with registrations/sec and microseconds per
+    registration, then the memo hit rate.
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+
+from email_validator import EmailNotValidError, validate_email
+
+from src.account.domain.value_objects.email import Email
+
+
+def build_stream(registrations: int, repeat_ratio: float, seed: int) -> list[str]:
+    """
+    Build raw addresses, repeating earlier ones with the given probability.
+
+    Repeats favour recent addresses (retries arrive soon after the first
+    attempt), and a few inputs differ only by case, as typed by users.
+    """
+    rng = random.Random(seed)
+    stream: list[str] = []
+    for i in range(registrations):
+        if stream and rng.random() < repeat_ratio:
+            stream.append(stream[-1 - min(len(stream) - 1, int(rng.expovariate(1 / 50)))])
+        else:
+            local = f"user.{i}" if i % 10 else f"User.{i}"
+            stream.append(f"{local}@{rng.choice(['example.com', 'mail.example.org'])}")
+    return stream
+
+
+def uncached(raw_value: str) -> str:
+    """Validation as performed before the memo (email_validator per call)."""
+    try:
+        return validate_email(raw_value, check_deliverability=False).normalized.lower()
+    except EmailNotValidError as e:
+        raise ValueError(f"Invalid email: {str(e)}") from e
+
+
+def measure(name: str, validate: Callable[[str], object], stream: list[str]) -> None:
+    """Validate every address of the stream and print throughput."""
+    started = time.perf_counter()
+    for raw_value in stream:
+        validate(raw_value)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<26}{len(stream) / elapsed:>16.0f}{elapsed / len(stream) * 1e6:>10.2f}")
+
+
+def main() -> int:
+    """
+    Main entry point for the email validation benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--registrations", type=int, default=50_000)
+    parser.add_argument("--repeat-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    stream = build_stream(args.registrations, args.repeat_ratio, args.seed)
+
+    print(f"{'Email validation':<26}{'registrations/s':>16}{'us/reg':>10}")
+    print("-" * 52)
+    measure("email_validator per call", uncached, stream)
+    measure("memoized Email(value)", Email, stream)
+
+    stats = Email.validation_cache_stats()
+    print()
+    print(
+        f"Memo: {stats.hit_rate:.1%} hit rate "
+        f"({stats.hits} hits, {stats.misses} misses, {stats.size}/{stats.max_size} entries)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Event Batching Benchmark
+
+Simulates a burst of registrations: seeds accounts, then dispatches one
+AccountCreated event per account to an AsyncEventDispatcher running the
+real AccountCreatedHandler and activation repository (email delivery is a
+no-op). Measures events per second from the first dispatch until the queue
+is drained, for each EVENT_BATCH_SIZE: 1 is the per-event handle() path (one
+upsert and one email call per account), larger sizes go through
+handle_batch() (one multi-row upsert and one email submission per batch).
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied. Seeded accounts (and their activation codes) are
+deleted at the end.
+
+Usage:
+    # Default: 5000 events, batch sizes 1 to 500, 4 workers
+    python -m benchmarks.bench_event_batching
+
+    # Custom load
+    python -m benchmarks.bench_event_batching --events 20000 --workers 8 --batch-sizes 1 200
+
+Output:
+    One line per batch size with events/sec, handle_batch() calls and the
+    number of email submissions.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+from injector import Injector
+
+from src.account.application.events.account_created_handler import AccountCreatedHandler
+from src.account.domain.entities.account import Account
+from src.account.domain.events.account_created import AccountCreated
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.postgres_account_activation_repository import (
+    PostgresAccountActivationRepository,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.application.services.email_message import EmailMessage
+from src.shared.application.services.email_service import EmailService
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+from src.shared.infrastructure.events.async_event_dispatcher import AsyncEventDispatcher
+
+# Email prefix of the seeded accounts
+SEED_PREFIX = "bench-batching-"
+
+
+class CountingEmailService(EmailService):
+    """No-op email delivery counting provider submissions."""
+
+    def __init__(self) -> None:
+        self.submissions = 0
+        self._lock = threading.Lock()
+
+    def send_email(self, message: EmailMessage) -> None:
+        with self._lock:
+            self.submissions += 1
+
+    def send_emails(self, messages: Sequence[EmailMessage]) -> None:
+        with self._lock:
+            self.submissions += 1
+
+
+def seed(db: PostgresConnectionFactory, events: int) -> list[Account]:
+    """Insert events accounts (one bcrypt-like hash shared by all)."""
+    password = Password.from_hash("$2b$12$" + "b" * 53)
+    accounts = [
+        Account.create(Email(f"{SEED_PREFIX}{index}@example.com"), password)
+        for index in range(events)
+    ]
+    PostgresAccountRepository(db).save_many(accounts)
+    return accounts
+
+
+def delete_seeded(db: PostgresConnectionFactory) -> None:
+    """Delete the seeded accounts (activation codes cascade)."""
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM account WHERE email LIKE %s", (SEED_PREFIX + "%",))
+
+
+def run(
+    db: PostgresConnectionFactory, accounts: list[Account], workers: int, batch_size: int
+) -> tuple[float, int, int]:
+    """Dispatch one event per account, drain; return events/sec, batches and submissions."""
+    email_service = CountingEmailService()
+    injector = Mock(spec=Injector)
+    injector.get.return_value = AccountCreatedHandler(
+        PostgresAccountActivationRepository(db), email_service
+    )
+    dispatcher = AsyncEventDispatcher(
+        injector, db, workers=workers, queue_size=len(accounts), batch_size=batch_size
+    )
+    dispatcher.register(AccountCreated, AccountCreatedHandler)
+    events = [AccountCreated(a.id, a.email, datetime.now(UTC)) for a in accounts]
+
+    started = time.perf_counter()
+    for event in events:
+        dispatcher.dispatch(event)
+    dispatcher.shutdown(timeout=None)
+    elapsed = time.perf_counter() - started
+
+    stats = dispatcher.stats()
+    if stats.failed:
+        print(f"  {stats.failed} events failed", file=sys.stderr)
+    return len(events) / elapsed, stats.batches, email_service.submissions
+
+
+def main() -> int:
+    """
+    Main entry point for the event batching benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 500])
+    args = parser.parse_args()
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        delete_seeded(db)
+        accounts = seed(db, args.events)
+
+        print(f"{'batch size':>12}{'events/s':>12}{'batch calls':>14}{'email calls':>14}")
+        print("-" * 52)
+        for batch_size in args.batch_sizes:
+            rate, batches, submissions = run(db, accounts, args.workers, batch_size)
+            print(f"{batch_size:>12}{rate:>12.0f}{batches:>14}{submissions:>14}")
+    finally:
+        try:
+            delete_seeded(db)
+        finally:
+            db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
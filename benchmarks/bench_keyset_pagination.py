@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Keyset Pagination Benchmark
+
+Seeds a range of accounts with time-ordered UUID v7 ids, then measures the
+latency of one page read at increasing depths: keyset pagination
+(PostgresAccountRepository.find_page(), WHERE id > cursor) against OFFSET
+pagination over the same id range. Seeded ids are dated in 2001, one
+millisecond apart, so the range is isolated from real accounts; the rows are
+deleted at the end (by id range) unless --keep is given.
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied. Seeding 10M rows takes several minutes and about 2 GB of
+disk; use --rows for a quicker run.
+
+Usage:
+    # Default: 10M seeded accounts, pages of 100
+    python -m benchmarks.bench_keyset_pagination
+
+    # Custom load
+    python -m benchmarks.bench_keyset_pagination --rows 1000000 --page-size 50 --repeat 20
+
+Output:
+    One line per depth (rows skipped) with the median page latency of each
+    strategy in milliseconds.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from uuid import UUID
+
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+
+# Timestamp of the first seeded id (before any real account)
+SEED_START = datetime(2001, 1, 1, tzinfo=UTC)
+
+# Fractions of the seeded range skipped before the measured page
+DEPTHS = (0.0, 0.01, 0.1, 0.5, 0.9, 0.99)
+
+# Rows inserted per statement while seeding
+SEED_BATCH = 500_000
+
+
+def seeded_id(index: int) -> UUID:
+    """Id of the index-th seeded account (same layout as the SQL in seed())."""
+    milliseconds = AccountId.min_for_timestamp(SEED_START).value.int >> 80
+    return UUID(
+        int=(milliseconds + index) << 80 | 0x7 << 76 | (index % 4096) << 64 | 0b10 << 62 | index
+    )
+
+
+def seed(db: PostgresConnectionFactory, rows: int) -> None:
+    """Insert rows accounts, ids one millisecond apart from SEED_START."""
+    milliseconds = AccountId.min_for_timestamp(SEED_START).value.int >> 80
+    for start in range(0, rows, SEED_BATCH):
+        with db.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO account (id, email, password_hash, is_activated)
+                    SELECT (
+                        LPAD(TO_HEX(%s + i), 12, '0') || '7' || LPAD(TO_HEX(i %% 4096), 3, '0')
+                        || '8' || LPAD(TO_HEX(i), 15, '0')
+                    )::uuid,
+                    'bench-page-' || i || '@example.com', 'hash', FALSE
+                    FROM generate_series(%s, %s) AS i
+                    """,
+                    (milliseconds, start, min(start + SEED_BATCH, rows) - 1),
+                )
+        print(f"  seeded {min(start + SEED_BATCH, rows)}/{rows}", file=sys.stderr)
+
+    with db.connection() as conn:
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("VACUUM ANALYZE account")
+        finally:
+            conn.autocommit = False
+
+
+def delete_seeded(db: PostgresConnectionFactory, rows: int) -> None:
+    """Delete the seeded id range."""
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM account WHERE id >= %s AND id <= %s",
+                (str(seeded_id(0)), str(seeded_id(rows - 1))),
+            )
+
+
+def offset_page(
+    db: PostgresConnectionFactory, rows: int, skipped: int, page_size: int
+) -> list[tuple[object, ...]]:
+    """OFFSET pagination over the seeded range (reads and discards skipped rows)."""
+    with db.read_only_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT id, email, password_hash, is_activated, created_at, updated_at
+                FROM account
+                WHERE id >= %s AND id <= %s
+                ORDER BY id
+                OFFSET %s LIMIT %s
+                """,
+                (str(seeded_id(0)), str(seeded_id(rows - 1)), skipped, page_size),
+            )
+            return cursor.fetchall()
+
+
+def median_ms(read: Callable[[], object], repeat: int) -> float:
+    """Median latency of read() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        read()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main() -> int:
+    """
+    Main entry point for the keyset pagination benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded rows")
+    args = parser.parse_args()
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        seed(db, args.rows)
+        repository = PostgresAccountRepository(db)
+        window = (SEED_START, SEED_START + timedelta(milliseconds=args.rows))
+
+        print(f"{'rows skipped':>14}{'keyset ms':>12}{'OFFSET ms':>12}")
+        print("-" * 38)
+        for depth in DEPTHS:
+            skipped = int(args.rows * depth)
+            cursor = AccountId(seeded_id(skipped - 1)) if skipped else None
+
+            keyset = partial(repository.find_page, cursor, args.page_size, *window)
+            offset = partial(offset_page, db, args.rows, skipped, args.page_size)
+
+            keyset_ms = median_ms(keyset, args.repeat)
+            offset_ms = median_ms(offset, args.repeat)
+            print(f"{skipped:>14}{keyset_ms:>12.2f}{offset_ms:>12.2f}")
+    finally:
+        try:
+            if not args.keep:
+                delete_seeded(db, args.rows)
+        finally:
+            db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Outbox Relay Throughput Benchmark
+
+Seeds pending outbox rows of a benchmark-only event type, then measures how
+many events per second OutboxRelay delivers to a no-op handler, for each
+batch size and number of parallel relays. Every relay claims its batches
+with FOR UPDATE SKIP LOCKED, so the run also reports whether each event was
+delivered exactly once. Only the benchmark event type is claimed or
+deleted: real pending events are left untouched.
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied. Parallel relays each hold one pooled connection: keep
+--relays below DATABASE_POOL_MAX.
+
+Usage:
+    # Default: 20000 events, batch sizes 1 to 1000, 1 and 4 relays
+    python -m benchmarks.bench_outbox_relay
+
+    # Custom load
+    python -m benchmarks.bench_outbox_relay --events 100000 --relays 1 2 8 --batch-sizes 100 500
+
+Output:
+    One line per batch size with events/sec for each relay count; "!" marks
+    a run where some event was not delivered exactly once.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from injector import Injector
+
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+from src.shared.infrastructure.events.outbox_event_dispatcher import (
+    OutboxCodec,
+    OutboxEventDispatcher,
+)
+from src.shared.infrastructure.events.outbox_relay import OutboxRelay
+
+# outbox.event_type of the seeded rows
+BENCH_EVENT_TYPE = "BenchOutboxEvent"
+
+
+class BenchEvent:
+    """Event carrying the seeded row index."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+class CountingHandler:
+    """No-op handler counting deliveries per event (shared by all relays)."""
+
+    deliveries: Counter[int] = Counter()
+    lock = threading.Lock()
+
+    def handle(self, event: BenchEvent) -> None:
+        with self.lock:
+            self.deliveries[event.index] += 1
+
+
+def decode(payload: dict[str, Any]) -> BenchEvent:
+    return BenchEvent(payload["index"])
+
+
+def encode(event: BenchEvent) -> dict[str, Any]:
+    return {"index": event.index}
+
+
+def seed(db: PostgresConnectionFactory, events: int) -> None:
+    """Insert events pending rows of the benchmark event type."""
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO outbox (event_type, payload)
+                SELECT %s, jsonb_build_object('index', i)
+                FROM generate_series(1, %s) AS i
+                """,
+                (BENCH_EVENT_TYPE, events),
+            )
+
+
+def delete_seeded(db: PostgresConnectionFactory) -> None:
+    """Delete every row of the benchmark event type."""
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM outbox WHERE event_type = %s", (BENCH_EVENT_TYPE,))
+
+
+def drain(relay: OutboxRelay) -> None:
+    """Relay batches until nothing is left to claim."""
+    while relay.relay_batch():
+        pass
+
+
+def run(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    events: int,
+    batch_size: int,
+    relays: int,
+) -> tuple[float, bool]:
+    """Seed, drain with parallel relays; return events/sec and the exactly-once check."""
+    delete_seeded(db)
+    seed(db, events)
+    CountingHandler.deliveries.clear()
+
+    threads = [
+        threading.Thread(target=drain, args=(OutboxRelay(db, dispatcher, batch_size=batch_size),))
+        for _ in range(relays)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    deliveries = CountingHandler.deliveries
+    exactly_once = len(deliveries) == events and set(deliveries.values()) == {1}
+    return events / elapsed, exactly_once
+
+
+def main() -> int:
+    """
+    Main entry point for the outbox relay benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 500, 1000])
+    parser.add_argument("--relays", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    db = PostgresConnectionFactory()
+    dispatcher = OutboxEventDispatcher(Injector(), db)
+    dispatcher.register(BenchEvent, CountingHandler)
+    dispatcher.register_codec(BenchEvent, OutboxCodec(BENCH_EVENT_TYPE, encode, decode))
+
+    db.open()
+    try:
+        print(f"{'batch size':>12}" + "".join(f"{f'{n} relay(s) ev/s':>20}" for n in args.relays))
+        print("-" * (12 + 20 * len(args.relays)))
+        for batch_size in args.batch_sizes:
+            line = f"{batch_size:>12}"
+            for relays in args.relays:
+                rate, exactly_once = run(db, dispatcher, args.events, batch_size, relays)
+                line += f"{rate:>19.0f}{' ' if exactly_once else '!'}"
+            print(line)
+    finally:
+        try:
+            delete_seeded(db)
+        finally:
+            db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
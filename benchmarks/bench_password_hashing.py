@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Password Hashing Throughput Benchmark
+
+Measures registrations/sec through POST /accounts (real handler, repository
+and PostgreSQL) with ProcessPoolPasswordHasher at increasing worker counts.
+Each configuration runs twice: through the async endpoint, which awaits the
+hash on the event loop, and through a sync copy of the endpoint that blocks
+an anyio threadpool thread (40 by default) on the hash, as FastAPI sync
+endpoints do. Requests are sent concurrently in-process (httpx ASGI
+transport), so the numbers exclude network and HTTP parsing costs.
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied. Registered accounts are deleted at the end.
+
+Usage:
+    # Default: 200 registrations per run, 100 concurrent, workers 1..CPU count
+    python -m benchmarks.bench_password_hashing
+
+    # Custom load
+    python -m benchmarks.bench_password_hashing --registrations 500 --concurrency 200
+
+Output:
+    One line per worker count with registrations/sec for both endpoints and
+    the peak hashing queue depth of the async run.
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI, Response
+from fastapi_injector import Injected, attach_injector
+from injector import Binder, Injector
+
+from src.account.application.commands.register_account import (
+    RegisterAccountCommand,
+    RegisterAccountHandler,
+)
+from src.account.application.events.account_created_handler import AccountCreatedHandler
+from src.account.domain.events.account_created import AccountCreated
+from src.account.domain.value_objects.password import PlainTextPassword
+from src.account.infrastructure.di.account_module import AccountModule
+from src.account.infrastructure.http.account_controller import router as account_router
+from src.account.infrastructure.http.dtos import RegisterAccountRequest
+from src.shared.domain.events.event_dispatcher import EventDispatcher
+from src.shared.domain.services.password_hasher import PasswordHasher
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+from src.shared.infrastructure.di.container import InfrastructureModule
+from src.shared.infrastructure.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
+
+PLAIN_PASSWORD = "SecurePass123!"
+
+# Email prefix of the registered accounts
+EMAIL_PREFIX = "bench-hashing-"
+
+# Path of the sync copy of the registration endpoint
+SYNC_PATH = "/bench/accounts-sync"
+
+_emails = itertools.count()
+
+
+def create_sync_account(
+    request: RegisterAccountRequest,
+    handler: RegisterAccountHandler = Injected(RegisterAccountHandler),  # noqa: B008
+) -> None:
+    """Sync registration endpoint: the threadpool thread blocks on the hash."""
+    command = RegisterAccountCommand(
+        email=request.email, password=PlainTextPassword(request.password)
+    )
+    handler.handle(command)
+
+
+def build_app(hasher: PasswordHasher) -> tuple[FastAPI, Injector]:
+    """Build the registration API with hasher bound as the PasswordHasher."""
+
+    def bind_hasher(binder: Binder) -> None:
+        binder.bind(PasswordHasher, to=hasher)  # type: ignore[type-abstract]
+
+    injector = Injector([InfrastructureModule(), AccountModule(), bind_hasher])
+    dispatcher = injector.get(EventDispatcher)  # type: ignore[type-abstract]
+    dispatcher.register(AccountCreated, AccountCreatedHandler)
+
+    app = FastAPI()
+    attach_injector(app, injector)
+    app.include_router(account_router)
+    app.add_api_route(
+        SYNC_PATH, create_sync_account, methods=["POST"], status_code=201, response_class=Response
+    )
+    return app, injector
+
+
+async def run_registrations(app: FastAPI, path: str, registrations: int, concurrency: int) -> float:
+    """
+    Send registrations concurrent POST requests to path.
+
+    Returns:
+        Registrations per second
+    """
+    slots = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def register() -> None:
+            async with slots:
+                payload = {
+                    "email": f"{EMAIL_PREFIX}{next(_emails)}@example.com",
+                    "password": PLAIN_PASSWORD,
+                }
+                response = await client.post(path, json=payload)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(register() for _ in range(registrations)))
+        return registrations / (time.perf_counter() - started)
+
+
+def delete_registered(db: DatabaseConnectionFactory) -> None:
+    """Delete the benchmark accounts (activation codes cascade)."""
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM account WHERE email LIKE %s", (EMAIL_PREFIX + "%",))
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    """Return worker counts to benchmark (powers of two up to max_workers)."""
+    counts = []
+    count = 1
+    while count < max_workers:
+        counts.append(count)
+        count *= 2
+    counts.append(max_workers)
+    return counts
+
+
+async def run(workers: int, registrations: int, concurrency: int) -> tuple[float, float, int]:
+    """Return async and sync registrations/sec and the async run's peak queue depth."""
+    hasher = ProcessPoolPasswordHasher(max_workers=workers)
+    app, injector = build_app(hasher)
+    db = injector.get(DatabaseConnectionFactory)  # type: ignore[type-abstract]
+    db.open()
+    try:
+        # Warm up: spawn worker processes and pooled connections outside the measured window
+        await run_registrations(app, "/accounts/", workers, workers)
+
+        async_rate = await run_registrations(app, "/accounts/", registrations, concurrency)
+        peak = hasher.stats().peak_queue_depth
+        sync_rate = await run_registrations(app, SYNC_PATH, registrations, concurrency)
+    finally:
+        try:
+            delete_registered(db)
+        finally:
+            hasher.shutdown()
+            db.close()
+    return async_rate, sync_rate, peak
+
+
+def main() -> int:
+    """
+    Main entry point for the hashing benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--registrations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(
+        f"{'workers':>8}{'async endpoint reg/s':>24}{'sync endpoint reg/s':>24}{'peak queue':>12}"
+    )
+    print("-" * 68)
+
+    for workers in worker_counts(args.max_workers):
+        async_rate, sync_rate, peak = asyncio.run(
+            run(workers, args.registrations, args.concurrency)
+        )
+        print(f"{workers:>8}{async_rate:>24.1f}{sync_rate:>24.1f}{peak:>12}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
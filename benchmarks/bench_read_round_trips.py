@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Read Path Round-Trip Benchmark
+
+Counts the queries sent to PostgreSQL per account lookup. A small TCP proxy
+sits between the connection pool and the server and counts frontend Query
+('Q') messages, one per round trip. Compares the implicit-transaction read
+path (BEGIN, SELECT, then ROLLBACK when the connection is returned) with
+read_only_connection() (SELECT only, autocommit).
+
+Requires a reachable PostgreSQL (DATABASE_* environment variables) with
+migrations applied.
+
+Usage:
+    # Default: 500 lookups per mode
+    python -m benchmarks.bench_read_round_trips
+
+    # Custom load
+    python -m benchmarks.bench_read_round_trips --lookups 2000
+
+Output:
+    One line per mode with round trips per lookup and lookups/sec.
+"""
+
+import argparse
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from src.account.domain.entities.account import Account
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.account_mapper import to_domain
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import (
+    PostgresConnectionFactory,
+    _get_database_config,
+)
+
+SELECT_BY_EMAIL = """
+    SELECT id, email, password_hash, is_activated, created_at, updated_at
+    FROM account
+    WHERE email = %s
+"""
+COLUMNS = ["id", "email", "password_hash", "is_activated", "created_at", "updated_at"]
+
+
+class QueryCountingProxy:
+    """
+    TCP proxy counting PostgreSQL simple-query messages sent by clients.
+
+    The client side must disable SSL/GSS encryption so the protocol stream
+    is readable (sslmode=disable, gssencmode=disable).
+    """
+
+    def __init__(self, upstream_host: str, upstream_port: int) -> None:
+        self._upstream = (upstream_host, upstream_port)
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self._lock = threading.Lock()
+        self.queries = 0
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    @property
+    def port(self) -> int:
+        return int(self._server.getsockname()[1])
+
+    def reset(self) -> None:
+        with self._lock:
+            self.queries = 0
+
+    def _accept_loop(self) -> None:
+        while True:
+            client, _ = self._server.accept()
+            upstream = socket.create_connection(self._upstream)
+            threading.Thread(
+                target=self._pump_frontend, args=(client, upstream), daemon=True
+            ).start()
+            threading.Thread(target=self._pump, args=(upstream, client), daemon=True).start()
+
+    def _pump(self, source: socket.socket, target: socket.socket) -> None:
+        try:
+            while data := source.recv(65536):
+                target.sendall(data)
+        except OSError:
+            pass
+        finally:
+            target.close()
+
+    def _pump_frontend(self, client: socket.socket, upstream: socket.socket) -> None:
+        buffer = b""
+        started = False  # Startup packet has no type byte
+        try:
+            while data := client.recv(65536):
+                upstream.sendall(data)
+                buffer += data
+                while True:
+                    if not started:
+                        if len(buffer) < 4:
+                            break
+                        (length,) = struct.unpack("!I", buffer[:4])
+                        if len(buffer) < length:
+                            break
+                        buffer = buffer[length:]
+                        started = True
+                        continue
+                    if len(buffer) < 5:
+                        break
+                    (length,) = struct.unpack("!I", buffer[1:5])
+                    if len(buffer) < length + 1:
+                        break
+                    if buffer[:1] == b"Q":
+                        with self._lock:
+                            self.queries += 1
+                    buffer = buffer[length + 1 :]
+        except OSError:
+            pass
+        finally:
+            upstream.close()
+
+
+def measure(proxy: QueryCountingProxy, lookup: Callable[[], object], lookups: int) -> None:
+    """Run lookups and print round trips per lookup and throughput."""
+    lookup()  # Warm up: open pooled connection outside the measured window
+    proxy.reset()
+
+    started = time.perf_counter()
+    for _ in range(lookups):
+        lookup()
+    elapsed = time.perf_counter() - started
+
+    round_trips = proxy.queries / lookups
+    print(f"{lookup.__name__:<28}{round_trips:>18.2f}{lookups / elapsed:>16.1f}")
+
+
+def main() -> int:
+    """
+    Main entry point for the round-trip benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+
+    config = _get_database_config()
+    proxy = QueryCountingProxy(str(config["host"]), int(config["port"]))
+
+    # Route the application pool through the proxy, unencrypted
+    os.environ["DATABASE_HOST"] = "127.0.0.1"
+    os.environ["DATABASE_PORT"] = str(proxy.port)
+    os.environ["PGSSLMODE"] = "disable"
+    os.environ["PGGSSENCMODE"] = "disable"
+
+    db = PostgresConnectionFactory()
+    repository = PostgresAccountRepository(db)
+
+    email = Email(f"bench-read-{time.time_ns()}@example.com")
+    repository.save(Account.create(email, Password.from_hash("$2b$12$benchmarkhash")))
+
+    def implicit_transaction() -> object:
+        # Read path before read_only_connection(): psycopg2 sends BEGIN before
+        # the SELECT and the pool sends ROLLBACK when the connection returns
+        with db.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(SELECT_BY_EMAIL, (email.value,))
+                row = cursor.fetchone()
+        return to_domain(dict(zip(COLUMNS, row, strict=False))) if row else None
+
+    def read_only_connection() -> object:
+        return repository.find_by_email(email)
+
+    print(f"{'read path':<28}{'queries/lookup':>18}{'lookups/sec':>16}")
+    print("-" * 62)
+    try:
+        measure(proxy, implicit_transaction, args.lookups)
+        measure(proxy, read_only_connection, args.lookups)
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+UUID Adaptation Benchmark
+
+Measures the client CPU spent on account identifiers between PostgreSQL and
+the domain, before and after native UUID adaptation:
+
+- mapper: to_domain() of a row whose id is a string (UUID(str) parse, then
+  AccountId version check) versus a UUID from the driver
+  (AccountId.from_trusted())
+- fetch: reading uuid values from the server on a plain connection (text,
+  parsed into AccountId) versus a pooled connection (register_uuid
+  typecaster, AccountId.from_trusted())
+- parameters: building a 1000-id = ANY(%s) query from str(account_id.value)
+  strings versus UUID objects (cursor.mogrify(), client side only)
+
+The fetch section needs a reachable PostgreSQL (DATABASE_* environment
+variables); it selects generated UUIDs and touches no table.
+
+Usage:
+    # Default: 200000 identifiers
+    python -m benchmarks.bench_uuid_adaptation
+
+    # Custom load
+    python -m benchmarks.bench_uuid_adaptation --ids 500000
+
+Output:
+    One line per section and variant with CPU nanoseconds per identifier.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+import psycopg2
+
+from src.account.domain.entities.account import Account
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.account_mapper import to_domain
+from src.shared.infrastructure.database.connection import (
+    PostgresConnectionFactory,
+    _get_database_config,
+)
+
+# Identifiers per = ANY(%s) query in the parameters section
+PARAMETER_BATCH = 1000
+
+
+def measure(name: str, run: Callable[[], int]) -> None:
+    """Run once and print CPU nanoseconds per identifier processed."""
+    started = time.process_time()
+    count = run()
+    elapsed = time.process_time() - started
+    print(f"{name:<44}{elapsed / count * 1e9:>12.0f}")
+
+
+def legacy_to_domain(row: dict[str, Any]) -> Account:
+    """to_domain() before native UUIDs: UUID(str(...)) then AccountId version check."""
+    return Account(
+        _id=AccountId(UUID(str(row["id"]))),
+        _email=Email.from_trusted(str(row["email"])),
+        _password=Password(str(row["password_hash"])),
+        _is_activated=bool(row["is_activated"]),
+    )
+
+
+def bench_mapper(ids: list[UUID]) -> None:
+    """to_domain() with string ids versus native UUID ids."""
+    now = datetime.now(UTC)
+    base = {"email": "user@example.com", "password_hash": "$2b$12$hash", "is_activated": False}
+    text_rows = [{**base, "id": str(value), "created_at": now, "updated_at": now} for value in ids]
+    uuid_rows = [{**base, "id": value, "created_at": now, "updated_at": now} for value in ids]
+
+    def text_ids() -> int:
+        for row in text_rows:
+            legacy_to_domain(row)
+        return len(text_rows)
+
+    def uuid_ids() -> int:
+        for row in uuid_rows:
+            to_domain(row)  # type: ignore[arg-type]
+        return len(uuid_rows)
+
+    measure("mapper: str id (parse + version check)", text_ids)
+    measure("mapper: UUID id (from_trusted)", uuid_ids)
+
+
+def bench_fetch(count: int) -> None:
+    """Fetch generated uuids as text versus through the UUID typecaster."""
+    # Random version 7 UUIDs (version and variant nibbles forced)
+    query = """
+        SELECT OVERLAY(OVERLAY(MD5(i::TEXT) PLACING '7' FROM 13) PLACING '8' FROM 17)::uuid
+        FROM generate_series(1, %s) AS i
+    """
+
+    config: dict[str, Any] = dict(_get_database_config())
+    plain = psycopg2.connect(**config)
+    try:
+
+        def text_values() -> int:
+            with plain.cursor() as cursor:
+                cursor.execute(query, (count,))
+                for (value,) in cursor:
+                    AccountId(UUID(value))
+            return count
+
+        measure("fetch: text values, AccountId(UUID(str))", text_values)
+    finally:
+        plain.close()
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+
+        def native_values() -> int:
+            with db.read_only_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (count,))
+                    for (value,) in cursor:
+                        AccountId.from_trusted(value)
+            return count
+
+        measure("fetch: UUID typecaster, from_trusted()", native_values)
+    finally:
+        db.close()
+
+
+def bench_parameters(ids: list[UUID]) -> None:
+    """Build = ANY(%s) queries from strings versus UUID objects."""
+    account_ids = [AccountId(value) for value in ids]
+    batches = [
+        account_ids[start : start + PARAMETER_BATCH]
+        for start in range(0, len(account_ids), PARAMETER_BATCH)
+    ]
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        with db.read_only_connection() as conn:
+            with conn.cursor() as cursor:
+
+                def text_parameters() -> int:
+                    for batch in batches:
+                        values = [str(account_id.value) for account_id in batch]
+                        cursor.mogrify("WHERE id = ANY(%s::uuid[])", (values,))
+                    return len(account_ids)
+
+                def uuid_parameters() -> int:
+                    for batch in batches:
+                        values = [account_id.value for account_id in batch]
+                        cursor.mogrify("WHERE id = ANY(%s)", (values,))
+                    return len(account_ids)
+
+                measure("parameters: str(account_id.value)", text_parameters)
+                measure("parameters: account_id.value (UUID adapter)", uuid_parameters)
+    finally:
+        db.close()
+
+
+def main() -> int:
+    """
+    Main entry point for the UUID adaptation benchmark.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ids", type=int, default=200_000)
+    args = parser.parse_args()
+
+    ids = [AccountId.generate().value for _ in range(args.ids)]
+
+    print(f"{'variant':<44}{'cpu ns/id':>12}")
+    print("-" * 56)
+    bench_mapper(ids)
+    bench_fetch(args.ids)
+    bench_parameters(ids)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+-- Rollback: Stop notifying account changes
+-- Description: Rollback for notify_account_changes migration
+-- Date: 2025-11-10 09:00:00
+
+-- Drop the UPDATE/DELETE trigger first (depends on the function)
+DROP TRIGGER IF EXISTS trg_account_notify_changed ON account;
+
+DROP FUNCTION IF EXISTS notify_account_changed();
@@ -0,0 +1,40 @@
+-- Migration: Notify account changes
+-- Description: Publish account row changes on the account_changed channel (cache invalidation)
+-- Date: 2025-11-10 09:00:00
+-- depends: 20251104_131949_create_account_activation_table
+
+-- This migration adds a trigger sending NOTIFY account_changed with the
+-- account id whenever an account row is updated or deleted.
+--
+-- Design Decisions:
+--   - Trigger instead of application-side NOTIFY: covers every writer,
+--     including set-based statements (activate_with_code) and other services
+--   - Payload: account id only (cached entries are looked up by id; the
+--     email index is cleared with the entry)
+--   - Row-level AFTER trigger: NOTIFY is transactional, delivered on COMMIT
+--     only (rolled back writes never invalidate anything)
+--   - UPDATE and DELETE only: CachingAccountRepository caches loaded rows
+--     and never caches "not found", so a new row has nothing to invalidate
+--
+-- Performance Considerations:
+--   - INSERT not notified: registrations and bulk loads (COPY merge,
+--     save_many) queue no notification per row
+--   - Identical notifications within one transaction are folded by PostgreSQL
+--   - Every API worker listens: each notification is delivered to (and
+--     evicts one entry in) every process
+
+CREATE OR REPLACE FUNCTION notify_account_changed() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('account_changed', COALESCE(NEW.id, OLD.id)::TEXT);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_account_notify_changed ON account;
+
+CREATE TRIGGER trg_account_notify_changed
+    AFTER UPDATE OR DELETE ON account
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_account_changed();
+
+COMMENT ON FUNCTION notify_account_changed() IS 'Sends NOTIFY account_changed with the changed account id';
@@ -0,0 +1,13 @@
+-- Rollback: Drop outbox table
+-- Description: Rollback for create_outbox_table migration
+-- Date: 2025-11-12 09:00:00
+
+-- This rollback removes the outbox table and its pending-events index.
+--
+-- Safety:
+--   - IF EXISTS prevents errors if already dropped
+--   - Pending (undelivered) events are lost: drain relays first
+
+DROP INDEX IF EXISTS idx_outbox_pending;
+
+DROP TABLE IF EXISTS outbox;
@@ -0,0 +1,62 @@
+-- Migration: Create outbox table
+-- Description: Transactional outbox for domain events, relayed by background workers
+-- Date: 2025-11-12 09:00:00
+-- depends: 20251110_090000_notify_account_changes
+
+-- This migration creates the `outbox` table. OutboxEventDispatcher inserts
+-- one row per domain event in the transaction of the command that raised it
+-- (e.g. the account INSERT), and OutboxRelay workers deliver the events to
+-- their handlers afterwards.
+--
+-- Design Decisions:
+--   - Same transaction as the aggregate: an event exists if and only if the
+--     command committed (no loss between COMMIT and delivery)
+--   - BIGINT identity id: Delivery order follows insertion order
+--   - JSONB payload: Event serialized by a per-type codec (no pickling)
+--   - processed_at instead of DELETE: Delivered rows stay inspectable; a
+--     cleanup job can purge them by processed_at
+--   - attempts / last_error / next_attempt_at: Failed deliveries are retried
+--     with a delay, then left pending as dead letters after max attempts
+--
+-- Concurrency:
+--   - Relays claim batches with SELECT ... FOR UPDATE SKIP LOCKED: several
+--     relay processes run in parallel without delivering a row twice
+--
+-- Performance Considerations:
+--   - Partial index on pending rows: the claim scans only undelivered
+--     events, however many delivered rows accumulate
+
+CREATE TABLE IF NOT EXISTS outbox (
+    -- Primary Key: Insertion order (delivery order)
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+
+    -- Event Type: Codec name (e.g. AccountCreated)
+    event_type VARCHAR(100) NOT NULL,
+
+    -- Payload: Serialized event
+    payload JSONB NOT NULL,
+
+    -- Audit: When the event was recorded
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    -- Retry State: Failed deliveries and next eligible time
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    -- Delivery: NULL until a handler completed
+    processed_at TIMESTAMPTZ
+);
+
+-- Performance Index: Claim pending events in id order
+CREATE INDEX IF NOT EXISTS idx_outbox_pending
+    ON outbox(id)
+    WHERE processed_at IS NULL;
+
+-- Comments for schema documentation
+COMMENT ON TABLE outbox IS 'Domain events recorded with their command transaction, delivered by OutboxRelay';
+COMMENT ON COLUMN outbox.event_type IS 'Event codec name (e.g. AccountCreated)';
+COMMENT ON COLUMN outbox.payload IS 'Serialized event (JSON object)';
+COMMENT ON COLUMN outbox.attempts IS 'Failed delivery attempts';
+COMMENT ON COLUMN outbox.next_attempt_at IS 'Earliest time of the next delivery attempt';
+COMMENT ON COLUMN outbox.processed_at IS 'Delivery timestamp (NULL while pending)';
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Streaming Account Export Script
+
+Writes accounts to a CSV or NDJSON file for analytics or migrations. Rows are
+read through a server-side cursor and written as they arrive: memory use
+does not depend on the number of accounts.
+
+Usage:
+    # All accounts as NDJSON on stdout
+    python -m scripts.export_accounts - --format ndjson > accounts.ndjson
+
+    # Accounts created in October, as CSV
+    python -m scripts.export_accounts october.csv \\
+        --created-from 2025-10-01T00:00:00+00:00 --created-until 2025-11-01T00:00:00+00:00
+
+    # Accounts with their hashes, for scripts/import_accounts.py on another
+    # database (new ids and timestamps are assigned: not a backup)
+    python -m scripts.export_accounts accounts.csv --include-password-hash
+
+Environment Variables (same as the application):
+    - DATABASE_HOST, DATABASE_PORT, DATABASE_NAME, DATABASE_USER, DATABASE_PASSWORD
+
+Output:
+    The export file, then a summary (rows written, rows/sec) on stderr;
+    --progress adds a line every 10000 rows. Timestamps without an offset
+    are read as UTC.
+"""
+
+import argparse
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TextIO
+
+from src.account.infrastructure.persistence.account_exporter import (
+    ExportFormat,
+    export_accounts,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    STREAM_ITERSIZE,
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+
+
+def detect_format(path: str, requested: str | None) -> ExportFormat:
+    """
+    Pick the output format from --format, or from the file extension.
+
+    Raises:
+        ValueError: If the format cannot be determined
+    """
+    if requested is not None:
+        return ExportFormat(requested)
+
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return ExportFormat.CSV
+    if suffix in (".ndjson", ".jsonl"):
+        return ExportFormat.NDJSON
+    raise ValueError(f"Cannot infer format of {path!r}: use --format csv|ndjson")
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (UTC when no offset is given)."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def export_file(args: argparse.Namespace, export_format: ExportFormat, out: TextIO) -> int:
+    """Run the export and print the summary."""
+
+    def on_progress(rows: int) -> None:
+        print(f"  {rows} accounts written", file=sys.stderr)
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        result = export_accounts(
+            PostgresAccountRepository(db),
+            out,
+            export_format,
+            created_from=args.created_from,
+            created_until=args.created_until,
+            include_password_hash=args.include_password_hash,
+            itersize=args.itersize,
+            on_progress=on_progress if args.progress else None,
+        )
+    finally:
+        db.close()
+
+    print(
+        f"✓ {result.rows} accounts exported "
+        f"({result.rows_per_second:.0f} rows/s, {result.elapsed:.1f}s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main() -> int:
+    """
+    Main entry point for the account export script.
+
+    Returns:
+        Exit code (0 = success, 1 = error)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file", help="Output CSV or NDJSON file ('-' for stdout)")
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat])
+    parser.add_argument("--created-from", type=parse_timestamp, help="Inclusive lower bound")
+    parser.add_argument("--created-until", type=parse_timestamp, help="Exclusive upper bound")
+    parser.add_argument(
+        "--include-password-hash", action="store_true", help="Also export bcrypt hashes"
+    )
+    parser.add_argument(
+        "--itersize", type=int, default=STREAM_ITERSIZE, help="Rows per database round trip"
+    )
+    parser.add_argument("--progress", action="store_true", help="Print progress on stderr")
+    args = parser.parse_args()
+
+    try:
+        export_format = detect_format(args.file, args.format)
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+
+    if args.file == "-":
+        return export_file(args, export_format, sys.stdout)
+    with open(args.file, "w", encoding="utf-8", newline="") as out:
+        return export_file(args, export_format, out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
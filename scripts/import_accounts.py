@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Bulk Account Import Script
+
+Imports legacy accounts with pre-hashed bcrypt passwords from a CSV or NDJSON
+file, without going through POST /accounts (no hashing, no activation
+email). The file is streamed: validation runs in worker processes, valid
+rows are loaded with COPY into a staging table and merged into account in
+a single transaction. Memory use does not depend on the file size.
+
+Usage:
+    # Import a CSV file (header: email,password_hash[,is_activated])
+    python -m scripts.import_accounts legacy_users.csv
+
+    # NDJSON, dry run (everything rolled back), report rejected/duplicates
+    python -m scripts.import_accounts users.ndjson --dry-run --report report.csv
+
+    # Read from stdin
+    zcat users.csv.gz | python -m scripts.import_accounts - --format csv
+
+Environment Variables (same as the application):
+    - DATABASE_HOST, DATABASE_PORT, DATABASE_NAME, DATABASE_USER, DATABASE_PASSWORD
+
+Output:
+    Progress (records read, rows/sec) on stderr, then a summary: records
+    read, rejected, inserted, duplicates and rows/sec. The optional report is
+    a CSV of line,email,reason for every record that was not imported.
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+from typing import TextIO
+
+from src.account.infrastructure.persistence.account_importer import (
+    IMPORT_CHUNK_SIZE,
+    DuplicateRecord,
+    ImportFormat,
+    PostgresAccountImporter,
+    RejectedRecord,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+
+# Seconds between two progress lines
+PROGRESS_INTERVAL = 5.0
+
+
+def detect_format(path: str, requested: str | None) -> ImportFormat:
+    """
+    Pick the input format from --format, or from the file extension.
+
+    Raises:
+        ValueError: If the format cannot be determined
+    """
+    if requested is not None:
+        return ImportFormat(requested)
+
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return ImportFormat.CSV
+    if suffix in (".ndjson", ".jsonl"):
+        return ImportFormat.NDJSON
+    raise ValueError(f"Cannot infer format of {path!r}: use --format csv|ndjson")
+
+
+def import_file(
+    args: argparse.Namespace, import_format: ImportFormat, source: TextIO, report: TextIO | None
+) -> int:
+    """Run the import and print the summary."""
+    writer = csv.writer(report) if report is not None else None
+    if writer is not None:
+        writer.writerow(["line", "email", "reason"])
+
+    def on_rejected(record: RejectedRecord) -> None:
+        if writer is not None:
+            writer.writerow([record.line, "", f"invalid: {record.reason}"])
+
+    def on_duplicate(record: DuplicateRecord) -> None:
+        if writer is not None:
+            writer.writerow([record.line, record.email, record.reason])
+
+    started = time.perf_counter()
+    last_report = started
+
+    def on_progress(read: int) -> None:
+        nonlocal last_report
+        now = time.perf_counter()
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            print(f"  {read} records read ({read / (now - started):.0f} rows/s)", file=sys.stderr)
+
+    db = PostgresConnectionFactory()
+    db.open()
+    try:
+        importer = PostgresAccountImporter(db, workers=args.workers, chunk_size=args.chunk_size)
+        result = importer.run(
+            source,
+            import_format,
+            dry_run=args.dry_run,
+            on_rejected=on_rejected,
+            on_duplicate=on_duplicate,
+            on_progress=on_progress,
+        )
+    finally:
+        db.close()
+
+    print("-" * 60)
+    print(f"Read:       {result.read}")
+    print(f"Rejected:   {result.rejected}")
+    print(f"Duplicates: {result.duplicates}")
+    print(f"Inserted:   {result.inserted}" + (" (dry run, rolled back)" if result.dry_run else ""))
+    print(f"Throughput: {result.rows_per_second:.0f} rows/s ({result.elapsed:.1f}s)")
+    return 0
+
+
+def main() -> int:
+    """
+    Main entry point for the account import script.
+
+    Returns:
+        Exit code (0 = success, 1 = error)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file", help="CSV or NDJSON file ('-' for stdin)")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat])
+    parser.add_argument("--dry-run", action="store_true", help="Validate and merge, then roll back")
+    parser.add_argument("--report", help="CSV file listing rejected and duplicate records")
+    parser.add_argument("--workers", type=int, help="Validation processes (default: CPU count)")
+    parser.add_argument(
+        "--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="Lines per validation task"
+    )
+    args = parser.parse_args()
+
+    try:
+        import_format = detect_format(args.file, args.format)
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+
+    report = open(args.report, "w", newline="", encoding="utf-8") if args.report else None
+    try:
+        if args.file == "-":
+            return import_file(args, import_format, sys.stdin, report)
+        with open(args.file, encoding="utf-8", newline="") as source:
+            return import_file(args, import_format, source, report)
+    except ValueError as e:
+        print(f"✗ Import failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if report is not None:
+            report.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
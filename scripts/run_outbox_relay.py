@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Outbox Relay Process
+
+Delivers the domain events recorded in the outbox table (EVENT_DISPATCHER=
+outbox) to their handlers, outside the API workers. Any number of relay
+processes can run in parallel: batches are claimed with FOR UPDATE SKIP
+LOCKED, so each event is handled by one relay only.
+
+Usage:
+    # Relay with the OUTBOX_RELAY_* settings of the environment
+    python -m scripts.run_outbox_relay
+
+    # Larger batches, poll every 2 seconds when idle
+    python -m scripts.run_outbox_relay --batch-size 500 --poll-interval 2
+
+    # Deliver what is pending, then exit (cron, deployments)
+    python -m scripts.run_outbox_relay --drain
+
+Environment Variables (same as the application):
+    - DATABASE_HOST, DATABASE_PORT, DATABASE_NAME, DATABASE_USER, DATABASE_PASSWORD
+    - OUTBOX_RELAY_BATCH_SIZE, OUTBOX_RELAY_POLL_INTERVAL,
+      OUTBOX_RELAY_MAX_ATTEMPTS, OUTBOX_RELAY_RETRY_DELAY (defaults for the options)
+    - Set OUTBOX_RELAY_IN_PROCESS=false on the API to relay only from here
+
+Output:
+    Handler logs on stderr, then a summary (batches, delivered, failed) when
+    the relay stops (SIGTERM, Ctrl+C or end of --drain).
+"""
+
+import argparse
+import logging
+import signal
+import sys
+from types import FrameType
+
+from injector import Injector
+
+from src.account.application.events.account_created_handler import AccountCreatedHandler
+from src.account.domain.events.account_created import AccountCreated
+from src.account.infrastructure.di.account_module import AccountModule
+from src.account.infrastructure.persistence.account_created_codec import (
+    ACCOUNT_CREATED_CODEC,
+)
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+from src.shared.infrastructure.di.container import InfrastructureModule
+from src.shared.infrastructure.events.outbox_event_dispatcher import OutboxEventDispatcher
+from src.shared.infrastructure.events.outbox_relay import OutboxRelay, _get_relay_config
+
+
+def main() -> int:
+    """
+    Main entry point for the outbox relay process.
+
+    Returns:
+        Exit code (0 = success, 1 = error)
+    """
+    defaults = _get_relay_config()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--batch-size", type=int, default=int(defaults["batch_size"]), help="Events per batch"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=defaults["poll_interval"],
+        help="Seconds between polls when idle",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=int(defaults["max_attempts"]),
+        help="Deliveries tried per event",
+    )
+    parser.add_argument(
+        "--retry-delay",
+        type=float,
+        default=defaults["retry_delay"],
+        help="Seconds of delay per attempt (claim lease)",
+    )
+    parser.add_argument("--drain", action="store_true", help="Exit once nothing is pending")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
+
+    # Handlers and their repositories share the injector's connection factory
+    # (one pool for the relay's claims and the handlers' writes)
+    injector = Injector([InfrastructureModule(), AccountModule()])
+    db = injector.get(DatabaseConnectionFactory)  # type: ignore[type-abstract]
+    dispatcher = OutboxEventDispatcher(injector, db)
+    dispatcher.register(AccountCreated, AccountCreatedHandler)
+    dispatcher.register_codec(AccountCreated, ACCOUNT_CREATED_CODEC)
+
+    try:
+        relay = OutboxRelay(
+            db,
+            dispatcher,
+            batch_size=args.batch_size,
+            poll_interval=args.poll_interval,
+            max_attempts=args.max_attempts,
+            retry_delay=args.retry_delay,
+        )
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+
+    def on_sigterm(_signum: int, _frame: FrameType | None) -> None:
+        relay.stop()
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+
+    db.open()
+    try:
+        if args.drain:
+            while relay.relay_batch() == args.batch_size:
+                pass
+        else:
+            relay.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.close()
+
+    stats = relay.stats()
+    print(
+        f"Batches: {stats.batches}  Delivered: {stats.delivered}  Failed: {stats.failed}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,17 +5,18 @@ This module implements the account activation workflow. It validates the
 activation code, checks expiration, and marks the account as active.
 
 Business Flow:
-    1. Load account by ID (AccountRepository.find_by_id)
-    2. Load activation code (AccountActivationRepository.find_by_account_id)
-    3. Validate code exists
-    4. Validate code not expired (60 seconds)
-    5. Validate code value matches
-    6. Mark account as active (account.activate())
-    7. Persist changes (AccountRepository.save)
+    1. Validate and activate in one repository call
+       (AccountActivationRepository.activate_with_code):
+       - Account exists
+       - Activation code exists
+       - Code not expired (60 seconds)
+       - Code value matches
+       - Mark account as active
+    2. Map the returned ActivationOutcome to a domain exception on failure
 
 Architecture:
     - Command Handler: Application layer orchestration
-    - Dependency Injection: Repositories via @inject
+    - Dependency Injection: Repository via @inject
     - Domain Exceptions: Business rule violations
     - Idempotent Operation: No error if already active
 
@@ -24,11 +25,13 @@ Design Decision:
     - ActivationCode as Value Object (not raw string) for type safety
     - Repository returns None (not exception) for "not found"
     - Handler raises domain exceptions for business rule violations
+    - Single round trip: repository reports an ActivationOutcome instead of
+      returning both aggregates for in-memory validation
 
 Usage Example:
     ```python
     # Injected via DI in controller
-    handler = ActivateAccountHandler(account_repo, activation_repo)
+    handler = ActivateAccountHandler(activation_repo, uow)
 
     command = ActivateAccountCommand(
         account_id=AccountId(uuid),
@@ -52,9 +55,10 @@ from src.account.domain.exceptions import (
 from src.account.domain.repositories.account_activation_repository import (
     AccountActivationRepository,
 )
-from src.account.domain.repositories.account_repository import AccountRepository
 from src.account.domain.value_objects.account_id import AccountId
 from src.account.domain.value_objects.activation_code import ActivationCode
+from src.account.domain.value_objects.activation_outcome import ActivationOutcome
+from src.shared.application.services.unit_of_work import UnitOfWork
 
 
 @dataclass(frozen=True)
@@ -85,9 +89,9 @@ class ActivateAccountHandler:
     """
     Use case handler for account activation.
 
-    Validates activation code and marks account as active. This handler
-    orchestrates the activation workflow by coordinating repositories and
-    enforcing business rules.
+    Validates activation code and marks account as active. The business
+    rules are evaluated by the repository in a single statement; this
+    handler translates the outcome into domain exceptions.
 
     Business Rules:
         - Account must exist
@@ -97,8 +101,8 @@ class ActivateAccountHandler:
         - Account marked as active (idempotent - no error if already active)
 
     Dependencies:
-        - AccountRepository: Load and persist account state
-        - AccountActivationRepository: Load activation codes
+        - AccountActivationRepository: Validate code and activate account
+        - UnitOfWork: Transaction boundary of the command
 
     Error Handling:
         Raises domain exceptions for business rule violations:
@@ -123,8 +127,8 @@ class ActivateAccountHandler:
     @inject
     def __init__(
         self,
-        account_repository: AccountRepository,
         activation_repository: AccountActivationRepository,
+        uow: UnitOfWork,
     ) -> None:
         """
         Initialize handler with injected dependencies.
@@ -133,11 +137,11 @@ class ActivateAccountHandler:
         type hints, allowing the handler to work outside HTTP request context.
 
         Args:
-            account_repository: Repository for account persistence
             activation_repository: Repository for activation codes
+            uow: Unit of work wrapping the activation (injected)
         """
-        self._account_repository = account_repository
         self._activation_repository = activation_repository
+        self._uow = uow
 
     def handle(self, command: ActivateAccountCommand) -> None:
         """
@@ -158,13 +162,11 @@ class ActivateAccountHandler:
             - Updates account.is_activated to True in database
             - Idempotent: No error if account already active
 
-        Validation Order:
-            1. Account exists (fail fast if account not found)
+        Validation Order (first failing rule wins):
+            1. Account exists
             2. Activation code exists
             3. Code not expired (check time before value)
             4. Code value matches
-            5. Activate account (domain entity method)
-            6. Persist changes
 
         Example:
             >>> command = ActivateAccountCommand(
@@ -172,24 +174,23 @@ class ActivateAccountHandler:
             ...     code=ActivationCode("1234")
             ... )
             >>> handler.handle(command)
-            # Database: UPDATE account SET is_activated = TRUE WHERE id = ...
+            # Database: one statement validating the code and setting is_activated
         """
-        account = self._account_repository.find_by_id(command.account_id)
-        if not account:
+        with self._uow.begin():
+            outcome = self._activation_repository.activate_with_code(
+                command.account_id, command.code
+            )
+
+        if outcome is ActivationOutcome.ACCOUNT_NOT_FOUND:
             raise AccountNotFoundError(f"Account {command.account_id.value} not found")
 
-        activation = self._activation_repository.find_by_account_id(command.account_id)
-        if not activation:
+        if outcome is ActivationOutcome.CODE_NOT_FOUND:
             raise ActivationCodeNotFoundError(
                 f"No activation code found for account {command.account_id.value}"
             )
 
-        if activation.is_expired():
+        if outcome is ActivationOutcome.CODE_EXPIRED:
             raise ActivationCodeExpiredError("Activation code expired (60 second limit)")
 
-        if activation.code != command.code:
+        if outcome is ActivationOutcome.CODE_MISMATCH:
             raise InvalidActivationCodeError("Invalid activation code")
-
-        account.activate()
-
-        self._account_repository.save(account)
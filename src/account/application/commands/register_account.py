@@ -6,16 +6,23 @@ account with email uniqueness validation and emits AccountCreated event.
 
 Business Rules:
     - Email addresses must be unique across all accounts
-    - Password is hashed before persistence (handled by Password VO)
+    - Password is hashed only once the email is known to be available
     - Account is created in inactive state (is_verified = False)
     - AccountCreated event emitted after successful persistence
 
 Command Flow:
     1. Receive RegisterAccountCommand (email, password)
     2. Check if email already exists (business rule validation)
-    3. Create Account aggregate via factory method
-    4. Persist account via repository
-    5. Dispatch AccountCreated event (triggers activation code generation)
+    3. Hash password (deferred: duplicate emails never pay for bcrypt)
+    4. Create Account aggregate via factory method
+    5. Insert account unless the email was registered concurrently
+    6. Dispatch AccountCreated event (triggers activation code generation)
+
+Async Callers:
+    Async endpoints run steps 2 and 3 themselves so bcrypt is awaited rather
+    than blocking a threadpool thread: ensure_email_available() (in the
+    threadpool), then hash_password() (awaited), then handle() with the
+    hashed Password (in the threadpool), which skips steps 2 and 3.
 """
 
 from dataclasses import dataclass
@@ -28,8 +35,10 @@ from src.account.domain.events.account_created import AccountCreated
 from src.account.domain.exceptions import EmailAlreadyExistsError
 from src.account.domain.repositories.account_repository import AccountRepository
 from src.account.domain.value_objects.email import Email
-from src.account.domain.value_objects.password import Password
+from src.account.domain.value_objects.password import Password, PlainTextPassword
+from src.shared.application.services.unit_of_work import UnitOfWork
 from src.shared.domain.events.event_dispatcher import EventDispatcher
+from src.shared.domain.services.password_hasher import PasswordHasher
 
 
 @dataclass(frozen=True)
@@ -43,7 +52,8 @@ class RegisterAccountCommand:
 
     Attributes:
         email: Email value object (validated, normalized)
-        password: Password value object (will be hashed)
+        password: Validated plain text password (hashed by the handler), or
+            a Password already hashed by the caller via hash_password()
 
     Immutability:
         frozen=True prevents modification after instantiation, ensuring
@@ -51,7 +61,7 @@ class RegisterAccountCommand:
     """
 
     email: Email
-    password: Password
+    password: PlainTextPassword | Password
 
 
 class RegisterAccountHandler:
@@ -73,10 +83,17 @@ class RegisterAccountHandler:
         1. Email uniqueness validation (raises EmailAlreadyExistsError)
         2. Account creation via domain factory method
         3. Persistence via repository abstraction
+        4. Event dispatch in the same unit of work (single commit)
     """
 
     @inject
-    def __init__(self, repository: AccountRepository, dispatcher: EventDispatcher) -> None:
+    def __init__(
+        self,
+        repository: AccountRepository,
+        dispatcher: EventDispatcher,
+        hasher: PasswordHasher,
+        uow: UnitOfWork,
+    ) -> None:
         """
         Initialize handler with injected dependencies.
 
@@ -87,9 +104,38 @@ class RegisterAccountHandler:
         Args:
             repository: Account repository abstraction (injected)
             dispatcher: Event dispatcher for domain events (injected)
+            hasher: Password hasher running bcrypt off the request thread (injected)
+            uow: Unit of work grouping the account and activation writes (injected)
         """
         self._repository = repository
         self._dispatcher = dispatcher
+        self._hasher = hasher
+        self._uow = uow
+
+    def ensure_email_available(self, email: Email) -> None:
+        """
+        Reject an email that is already registered (fast path, no hashing).
+
+        Args:
+            email: Email of the registration
+
+        Raises:
+            EmailAlreadyExistsError: If email is already registered
+        """
+        if self._repository.find_by_email(email) is not None:
+            raise EmailAlreadyExistsError(email)
+
+    async def hash_password(self, password: PlainTextPassword) -> Password:
+        """
+        Hash the password without holding a thread (async endpoints).
+
+        Args:
+            password: Validated plain text password
+
+        Returns:
+            Password: Hashed password to pass in RegisterAccountCommand
+        """
+        return await password.hash_async(self._hasher)
 
     def handle(self, command: RegisterAccountCommand) -> None:
         """
@@ -105,40 +151,57 @@ class RegisterAccountHandler:
             EmailAlreadyExistsError: If email is already registered
             ValueError: If email or password validation fails (raised by VOs)
 
+        Performance:
+            The bcrypt hash (~250ms) runs only after the uniqueness check
+            passes, so duplicate-email requests (retries, bots) are rejected
+            without spending CPU on a hash that would be thrown away.
+
         Side Effects:
             - Creates new account record in database
             - Emits AccountCreated domain event (triggers activation workflow)
 
         Implementation Notes:
-            This handler uses a Check-Then-Insert pattern for email uniqueness
-            validation. While simpler than Try-Insert-Catch-Constraint, this
-            approach has a theoretical race condition window between the check
-            and insert operations.
-
-            For production with high concurrency, consider:
-            - Database UNIQUE constraint + catch IntegrityError in repository
-            - SELECT FOR UPDATE in transaction
-            - Optimistic locking with version field
-
-            For this application scope (registration API), the race condition
-            risk is acceptable given the low probability and non-critical impact.
+            Email uniqueness is enforced by create_if_email_absent(), a single
+            INSERT ... ON CONFLICT (email) DO NOTHING: the database arbitrates
+            concurrent registrations, so a lost race is reported as
+            EmailAlreadyExistsError rather than an unhandled IntegrityError.
+
+            The preceding find_by_email() is only a fast path that rejects
+            known duplicates before paying for bcrypt; correctness does not
+            depend on it.
+
+            The insert and the synchronous AccountCreated handlers (activation
+            code save) run in one unit of work: one pooled connection and a
+            single COMMIT. Hashing stays outside it so no connection is held
+            during bcrypt, and so does dispatcher.reserve(): a full event
+            queue is waited for (or rejected) before the connection is taken.
+
+            A command carrying an already hashed Password skips the fast path
+            and the hash: the caller ran ensure_email_available() and
+            hash_password() itself.
         """
-        # Business Rule: Email must be unique
-        # Note: Race condition possible between find and create (acceptable trade-off)
-        existing_account = self._repository.find_by_email(command.email)
-        if existing_account is not None:
-            raise EmailAlreadyExistsError(command.email)
-
-        account = Account.create(email=command.email, password=command.password)
-
-        self._repository.save(account)
-
-        # Emit AccountCreated domain event
-        # Event handler will generate activation code and send email
-        self._dispatcher.dispatch(
-            AccountCreated(
-                account_id=account.id,
-                email=account.email,
-                occurred_at=datetime.now(UTC),
+        if isinstance(command.password, Password):
+            password = command.password
+        else:
+            # Fast path: known duplicates are rejected without hashing
+            self.ensure_email_available(command.email)
+            password = command.password.hash(self._hasher)
+
+        account = Account.create(email=command.email, password=password)
+
+        # Event capacity is reserved before the unit of work: waiting for it
+        # (bounded async queue) holds no pooled connection and no uncommitted row
+        with self._dispatcher.reserve(AccountCreated), self._uow.begin():
+            # Business Rule: Email must be unique (atomic check-and-insert)
+            if not self._repository.create_if_email_absent(account):
+                raise EmailAlreadyExistsError(command.email)
+
+            # Emit AccountCreated domain event
+            # Event handler will generate activation code and send email
+            self._dispatcher.dispatch(
+                AccountCreated(
+                    account_id=account.id,
+                    email=account.email,
+                    occurred_at=datetime.now(UTC),
+                )
             )
-        )
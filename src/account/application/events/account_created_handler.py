@@ -7,7 +7,8 @@ by generating activation codes and sending activation emails to users.
 Business Flow:
     1. Listen for AccountCreated event (emitted by RegisterAccountHandler)
     2. Generate 4-digit activation code with 60-second expiration
-    3. Persist activation code to database (AccountActivationRepository)
+    3. Persist activation code to database, or reuse the unexpired code of
+       a previous delivery of the same event (AccountActivationRepository)
     4. Build activation link with AccountId and code
     5. Construct HTML email with clickable activation link
     6. Send email via EmailService (LoggerEmailService for MVP)
@@ -24,6 +25,12 @@ Design Decisions:
     - Email subject: "Activate your account" (configurable via EmailMessage)
     - From email: noreply@example.com (default in EmailMessage DTO)
 
+Batch Handling:
+    handle_batch() processes a group of events with one multi-row activation
+    upsert (save_many) and one email submission (send_emails), instead of a
+    round trip and an email call per account. AsyncEventDispatcher calls it
+    when EVENT_BATCH_SIZE > 1.
+
 Usage Example:
     ```python
     # Registered in EventDispatcher
@@ -32,9 +39,14 @@ Usage Example:
     # Triggered automatically when event dispatched
     event = AccountCreated(account_id=..., email=..., occurred_at=...)
     dispatcher.dispatch(event)  # Calls handler.handle(event)
+
+    # Or, from a batching dispatcher
+    handler.handle_batch([event1, event2, ...])
     ```
 """
 
+from collections.abc import Sequence
+
 from injector import inject
 
 from src.account.domain.entities.account_activation import AccountActivation
@@ -70,8 +82,9 @@ class AccountCreatedHandler:
         For MVP, this handler executes synchronously in the same thread as the
         RegisterAccountHandler. HTTP response blocks until email is sent.
 
-        Future Evolution: Replace with async execution (queue + background worker)
-        to decouple account creation from email delivery.
+        With EVENT_DISPATCHER=async, it runs on an AsyncEventDispatcher worker
+        thread once the registration has committed, in its own transaction
+        (handle_batch() for groups of events when batching is enabled).
 
     Example:
         >>> # Injected automatically via DI
@@ -110,7 +123,7 @@ class AccountCreatedHandler:
 
         Workflow:
             1. Generate activation code (AccountActivation.create_for_account)
-            2. Persist code to database (activation_repository.save)
+            2. Persist code unless an unexpired one exists (save_if_absent)
             3. Build activation link (BASE_URL + accountId + code)
             4. Construct HTML email body with clickable link
             5. Send email via EmailService
@@ -124,12 +137,19 @@ class AccountCreatedHandler:
 
         Business Rules:
             - Code expires 60 seconds after generation
-            - One code per account (UPSERT in repository)
+            - One code per account; a redelivered event (outbox relay) resends
+              the unexpired code already stored instead of replacing it
             - Email contains clickable link to activation page
 
         Error Handling:
             Exceptions propagate to EventDispatcher, which logs and continues.
             Account creation succeeds even if email fails (resilience pattern).
+            The activation save runs in RegisterAccountHandler's unit of work:
+            if it fails at the database level, the transaction is aborted and
+            the whole registration is rolled back (no account without a code).
+            Delivered by OutboxRelay, the handler runs outside any transaction:
+            the code is committed before the email is sent, and a failed send
+            is retried with the same code.
 
         Example:
             >>> event = AccountCreated(
@@ -139,26 +159,69 @@ class AccountCreatedHandler:
             ... )
             >>> handler.handle(event)
             # Database: INSERT INTO account_activation (account_id, code, ...)
+            #           ON CONFLICT (account_id) DO UPDATE ... WHERE expired
             # Log: 📧 Email sent: user@example.com | Subject: Activate your account | ...
         """
-        activation = AccountActivation.create_for_account(event.account_id)
+        activation = self._activation_repository.save_if_absent(
+            AccountActivation.create_for_account(event.account_id)
+        )
+
+        self._email_service.send_email(self._build_message(event, activation))
+
+    def handle_batch(self, events: Sequence[AccountCreated]) -> None:
+        """
+        Handle several AccountCreated events at once.
+
+        Same outcome as calling handle() for each event, with one multi-row
+        activation upsert and one email submission for the whole group.
+
+        Workflow:
+            1. Generate one activation code per event
+            2. Persist all codes (activation_repository.save_many)
+            3. Send all activation emails (email_service.send_emails)
+
+        Args:
+            events: AccountCreated domain events (a batch of the dispatcher)
+
+        Error Handling:
+            All codes are saved or none (single statement). Emails are only
+            sent once the codes are persisted; an email failure propagates
+            to the dispatcher with the codes already saved, as in handle().
+        """
+        activations = [AccountActivation.create_for_account(event.account_id) for event in events]
+
+        self._activation_repository.save_many(activations)
+
+        self._email_service.send_emails(
+            [
+                self._build_message(event, activation)
+                for event, activation in zip(events, activations, strict=True)
+            ]
+        )
+
+    def _build_message(self, event: AccountCreated, activation: AccountActivation) -> EmailMessage:
+        """
+        Build the activation email of an account.
 
-        self._activation_repository.save(activation)
+        Args:
+            event: AccountCreated event (recipient, account id)
+            activation: Activation holding the generated code
 
+        Returns:
+            EmailMessage: HTML email with activation link and code
+        """
         activation_link = (
             f"{BASE_URL}/activate/{event.account_id.value}?code={activation.code.code}"
         )
         email_body = self._build_email_body(activation_link, activation.code.code)
 
-        message = EmailMessage(
+        return EmailMessage(
             to_email=event.email,
             subject="Activate your account",
             body=email_body,
             # from_email uses default: noreply@example.com
         )
 
-        self._email_service.send_email(message)
-
     def _build_email_body(self, activation_link: str, code: str) -> str:
         """
         Build HTML email body with activation link and code.
@@ -0,0 +1,17 @@
+"""
+CQRS Query handlers for the Account bounded context.
+
+This module contains query handlers that execute read operations on the
+Account aggregate, without side effects.
+
+Queries mirror the command structure:
+- Queries describe what to read (ListAccounts)
+- Handlers fetch the data through repositories and shape the result
+- Queries and results are immutable (frozen dataclasses)
+- Handlers are injected with dependencies via @inject decorator
+
+Example: list_accounts.py contains:
+    - ListAccountsQuery (immutable DTO)
+    - AccountPage (immutable result)
+    - ListAccountsHandler (read orchestration)
+"""
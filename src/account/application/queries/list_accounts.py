@@ -0,0 +1,136 @@
+"""
+ListAccounts use case.
+
+This module implements the paginated account listing used by the admin
+API. Pages are read with keyset pagination over the UUID v7 primary key.
+
+Business Flow:
+    1. Read limit + 1 accounts after the cursor (AccountRepository.find_page)
+    2. Return the first limit accounts, and the last returned id as next
+       cursor when the extra account proves another page exists
+
+Architecture:
+    - Query Handler: Application layer orchestration (read only)
+    - Dependency Injection: Repository via @inject
+    - No UnitOfWork: Single SELECT, nothing to commit
+
+Design Decision:
+    - Keyset cursor (last id) instead of page numbers: constant cost at any
+      depth, and stable while accounts are being registered
+    - Extra row: Detects the last page without a COUNT(*) or an empty request
+
+Usage Example:
+    ```python
+    handler = ListAccountsHandler(repository)
+
+    page = handler.handle(ListAccountsQuery(limit=100))
+    while page.next_cursor is not None:
+        page = handler.handle(ListAccountsQuery(after=page.next_cursor, limit=100))
+    ```
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from injector import inject
+
+from src.account.domain.entities.account import Account
+from src.account.domain.repositories.account_repository import AccountRepository
+from src.account.domain.value_objects.account_id import AccountId
+
+# Largest page a single query may request
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class ListAccountsQuery:
+    """
+    Query for one page of accounts.
+
+    Attributes:
+        after: Cursor returned with the previous page (None for the first page)
+        limit: Page size (1 to MAX_PAGE_SIZE)
+        created_from: Only accounts created at or after this instant
+        created_until: Only accounts created before this instant
+
+    Raises:
+        ValueError: If limit is outside 1..MAX_PAGE_SIZE, or the time window
+            is empty (millisecond precision) or outside the UUID v7 range
+    """
+
+    after: AccountId | None = None
+    limit: int = 50
+    created_from: datetime | None = None
+    created_until: datetime | None = None
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+        # Compared as id boundaries: validates the range, mixes naive and aware values
+        boundaries = [
+            AccountId.min_for_timestamp(instant).value
+            for instant in (self.created_from, self.created_until)
+            if instant is not None
+        ]
+        if len(boundaries) == 2 and boundaries[0] >= boundaries[1]:
+            raise ValueError("created_from must be before created_until")
+
+
+@dataclass(frozen=True)
+class AccountPage:
+    """
+    One page of accounts.
+
+    Attributes:
+        accounts: Accounts of the page, ordered by id (creation order)
+        next_cursor: Id to pass as ListAccountsQuery.after for the next page
+            (None on the last page)
+    """
+
+    accounts: list[Account]
+    next_cursor: AccountId | None
+
+
+class ListAccountsHandler:
+    """
+    Use case handler for the paginated account listing.
+
+    Dependencies:
+        - AccountRepository: Keyset page reads (find_page)
+
+    Thread Safety:
+        Stateless handler, thread-safe. Repositories are singletons.
+
+    Example:
+        >>> page = handler.handle(ListAccountsQuery(limit=2))
+        >>> [str(account.email) for account in page.accounts], page.next_cursor
+    """
+
+    @inject
+    def __init__(self, repository: AccountRepository) -> None:
+        """
+        Initialize handler with injected dependencies.
+
+        Args:
+            repository: Repository for Account aggregate (injected)
+        """
+        self._repository = repository
+
+    def handle(self, query: ListAccountsQuery) -> AccountPage:
+        """
+        Handle the account listing query.
+
+        Args:
+            query: ListAccountsQuery with cursor, page size and time window
+
+        Returns:
+            AccountPage with up to query.limit accounts and the next cursor
+        """
+        accounts = self._repository.find_page(
+            query.after, query.limit + 1, query.created_from, query.created_until
+        )
+        if len(accounts) <= query.limit:
+            return AccountPage(accounts=accounts, next_cursor=None)
+
+        page = accounts[: query.limit]
+        return AccountPage(accounts=page, next_cursor=page[-1].id)
@@ -6,7 +6,7 @@ from src.account.domain.value_objects.email import Email
 from src.account.domain.value_objects.password import Password
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """
     Account aggregate root.
@@ -18,6 +18,12 @@ class Account:
         Use Account.create() for new accounts.
         Direct instantiation is reserved for repository reconstruction.
 
+    Change Tracking:
+        The account records which attributes changed since it was created or
+        loaded (changed_fields), so repositories can insert new accounts and
+        write only modified columns of existing ones. Repositories call
+        mark_persisted() once the account is written.
+
     Invariants:
         - id is immutable (entity identity)
         - email must be unique across all accounts (enforced by repository)
@@ -29,6 +35,9 @@ class Account:
     _email: Email = field(repr=False)
     _password: Password = field(repr=False)
     _is_activated: bool = field(default=False, repr=False)
+    _is_new: bool = field(default=False, repr=False, compare=False)
+    # Reassigned, never mutated: copies (copy.copy) do not share changes
+    _changes: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
 
     @classmethod
     def create(cls, email: Email, password: Password) -> Self:
@@ -57,6 +66,7 @@ class Account:
             _email=email,
             _password=password,
             _is_activated=False,
+            _is_new=True,
         )
 
     @property
@@ -75,6 +85,30 @@ class Account:
     def is_activated(self) -> bool:
         return self._is_activated
 
+    @property
+    def is_new(self) -> bool:
+        """True until the account is persisted for the first time."""
+        return self._is_new
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """
+        Attributes changed since the account was created, loaded or persisted.
+
+        Returns:
+            Property names (e.g., frozenset({"is_activated"})), empty if clean
+        """
+        return self._changes
+
+    def mark_persisted(self) -> None:
+        """
+        Record that the current state has been written (repositories only).
+
+        Clears changed_fields; the account is no longer new.
+        """
+        self._is_new = False
+        self._changes = frozenset()
+
     def activate(self) -> None:
         """
         Activate the account after email verification.
@@ -96,7 +130,11 @@ class Account:
             >>> account.is_activated
             True
         """
+        if self._is_activated:
+            return
+
         self._is_activated = True
+        self._changes = self._changes | {"is_activated"}
 
     def __eq__(self, other: object) -> bool:
         """
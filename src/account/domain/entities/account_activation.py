@@ -7,12 +7,13 @@ of account activation codes, including generation, validation, and expiration.
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import ClassVar
 
 from src.account.domain.value_objects.account_id import AccountId
 from src.account.domain.value_objects.activation_code import ActivationCode
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountActivation:
     """
     Entity representing an account activation with expiration logic.
@@ -52,7 +53,7 @@ class AccountActivation:
     _created_at: datetime
     _expires_at: datetime
 
-    EXPIRATION_SECONDS: int = 60
+    EXPIRATION_SECONDS: ClassVar[int] = 60
 
     @classmethod
     def create_for_account(cls, account_id: AccountId) -> "AccountActivation":
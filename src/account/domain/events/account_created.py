@@ -12,7 +12,7 @@ from src.account.domain.value_objects.account_id import AccountId
 from src.account.domain.value_objects.email import Email
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountCreated:
     """
     Domain event representing successful account creation.
@@ -7,9 +7,12 @@ account activation codes with expiration logic.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 
 from src.account.domain.entities.account_activation import AccountActivation
 from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.activation_code import ActivationCode
+from src.account.domain.value_objects.activation_outcome import ActivationOutcome
 
 
 class AccountActivationRepository(ABC):
@@ -28,6 +31,7 @@ class AccountActivationRepository(ABC):
     Business Rules Enforced:
         - One active code per account (account_id as primary key)
         - save() performs upsert (replaces existing code for same account)
+        - save_if_absent() keeps an unexpired code (idempotent redelivery)
         - delete() is idempotent (no error if activation doesn't exist)
 
     Example:
@@ -66,6 +70,33 @@ class AccountActivationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_if_absent(self, activation: AccountActivation) -> AccountActivation:
+        """
+        Save activation unless the account already has an unexpired code.
+
+        Idempotent counterpart of save() for handlers that may run again for
+        the same event (outbox redelivery): the code already sent to the
+        user stays valid instead of being replaced by a new one.
+
+        Args:
+            activation: AccountActivation entity to persist if needed
+
+        Returns:
+            AccountActivation: The stored unexpired activation if there was
+            one, otherwise activation (inserted, or replacing an expired code)
+
+        Implementation Notes:
+            - PostgreSQL: INSERT ... ON CONFLICT (account_id) DO UPDATE ...
+              WHERE expired RETURNING, then SELECT of the kept code
+
+        Example:
+            first = repository.save_if_absent(AccountActivation.create_for_account(account_id))
+            again = repository.save_if_absent(AccountActivation.create_for_account(account_id))
+            assert again.code == first.code  # Unexpired code reused
+        """
+        pass
+
     @abstractmethod
     def find_by_account_id(self, account_id: AccountId) -> AccountActivation | None:
         """
@@ -92,3 +123,82 @@ class AccountActivationRepository(ABC):
                 print("Activation is still valid")
         """
         pass
+
+    @abstractmethod
+    def activate_with_code(self, account_id: AccountId, code: ActivationCode) -> ActivationOutcome:
+        """
+        Activate the account if the given code is valid, in one operation.
+
+        Validates the activation code and marks the account as active without
+        loading either aggregate into memory. Business rules are evaluated
+        in order and the first failing rule determines the outcome.
+
+        Args:
+            account_id: AccountId of the account to activate
+            code: ActivationCode provided by the user
+
+        Returns:
+            ActivationOutcome: ACTIVATED on success, otherwise the failed rule
+
+        Business Rules:
+            1. Account must exist (ACCOUNT_NOT_FOUND)
+            2. Activation code must exist (CODE_NOT_FOUND)
+            3. Code must not be expired (CODE_EXPIRED)
+            4. Code value must match (CODE_MISMATCH)
+            - Idempotent: already active accounts report ACTIVATED
+
+        Implementation Notes:
+            - PostgreSQL: single statement joining account and account_activation,
+              with a conditional UPDATE account SET is_activated = TRUE
+            - Must not raise for business rule violations (return the outcome)
+
+        Example:
+            outcome = repository.activate_with_code(account_id, ActivationCode("1234"))
+            if outcome is not ActivationOutcome.ACTIVATED:
+                ...  # Map to domain exception
+        """
+        pass
+
+    @abstractmethod
+    def save_many(self, activations: Sequence[AccountActivation]) -> None:
+        """
+        Persist several activations at once (upsert, as save()).
+
+        Batch counterpart of save(): one transaction and one multi-row
+        statement instead of one round trip and commit per activation.
+
+        Args:
+            activations: AccountActivation entities to persist
+
+        Business Rules:
+            - One active code per account: replaces existing codes
+            - An account listed twice keeps its last activation
+            - All activations persisted or none
+
+        Implementation Notes:
+            - PostgreSQL: multi-row INSERT ... ON CONFLICT (account_id) DO UPDATE
+
+        Example:
+            activations = [AccountActivation.create_for_account(i) for i in ids]
+            repository.save_many(activations)
+        """
+        pass
+
+    @abstractmethod
+    def find_by_account_ids(
+        self, account_ids: Iterable[AccountId]
+    ) -> dict[AccountId, AccountActivation]:
+        """
+        Find the activations of several accounts in one lookup.
+
+        Args:
+            account_ids: AccountId value objects to search for
+
+        Returns:
+            Found activations keyed by AccountId (expired ones included,
+            accounts without activation absent)
+
+        Implementation Notes:
+            - PostgreSQL: WHERE account_id = ANY(%s)
+        """
+        pass
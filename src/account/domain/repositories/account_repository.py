@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
 
 from src.account.domain.entities.account import Account
 from src.account.domain.value_objects.account_id import AccountId
@@ -20,7 +22,7 @@ class AccountRepository(ABC):
         - Repository per aggregate root (Account is the aggregate root)
         - Returns domain entities, not DTOs or database records
         - Accepts value objects as parameters (not primitive types)
-        - save() method handles both insert and update (UPSERT pattern)
+        - save() method handles both insert and update (change tracking)
     """
 
     @abstractmethod
@@ -28,7 +30,9 @@ class AccountRepository(ABC):
         """
         Persist account in the data store (insert or update).
 
-        Uses UPSERT pattern: inserts if account.id doesn't exist, updates otherwise.
+        New accounts (account.is_new) are inserted; existing accounts only
+        have their changed_fields written, and nothing is written when no
+        field changed. The account is marked persisted afterwards.
         Email uniqueness constraint is preserved (will raise error if email conflict).
 
         Args:
@@ -39,22 +43,55 @@ class AccountRepository(ABC):
 
         Business Rules:
             - Email uniqueness must be enforced across all accounts
-            - UPSERT on account.id (primary key)
+            - Insert for new accounts, update by account.id (primary key) otherwise
             - Password is already hashed by Password value object
 
         Implementation Notes:
-            - PostgreSQL: INSERT ... ON CONFLICT (id) DO UPDATE
+            - PostgreSQL: INSERT for new accounts, UPDATE ... SET <changed
+              columns>, updated_at WHERE id = ... otherwise
             - Use account.id as primary key
             - Store password hash as-is (already processed)
             - Enforce database constraints (UNIQUE on email)
-            - UPDATE replaces all columns if id exists
+            - Call account.mark_persisted() after the write
 
         Example:
             account = Account.create(email, password)
             repository.save(account)  # INSERT
 
             account.activate()
-            repository.save(account)  # UPDATE (same id, is_active = True)
+            repository.save(account)  # UPDATE account SET is_activated, updated_at
+        """
+        pass
+
+    @abstractmethod
+    def create_if_email_absent(self, account: Account) -> bool:
+        """
+        Insert a new account unless its email is already registered.
+
+        Atomic alternative to a find_by_email() check followed by save():
+        the uniqueness decision is taken by the data store in the same
+        statement as the insert, so concurrent registrations for the same
+        email cannot both succeed (and never surface a constraint error).
+
+        Args:
+            account: The new Account aggregate to persist
+
+        Returns:
+            bool: True if the account was inserted, False if the email exists
+
+        Business Rules:
+            - Email uniqueness must be enforced across all accounts
+            - Never updates an existing account (insert-only)
+
+        Implementation Notes:
+            - PostgreSQL: INSERT ... ON CONFLICT (email) DO NOTHING RETURNING id
+            - An empty result means the email is already taken
+            - Call account.mark_persisted() when inserted
+
+        Example:
+            account = Account.create(email, password)
+            if not repository.create_if_email_absent(account):
+                raise EmailAlreadyExistsError(email)
         """
         pass
 
@@ -115,3 +152,140 @@ class AccountRepository(ABC):
             ...     repository.save(account)
         """
         pass
+
+    @abstractmethod
+    def save_many(self, accounts: Sequence[Account]) -> None:
+        """
+        Persist several accounts at once (insert or update, as save()).
+
+        Batch counterpart of save() for imports and batch jobs: one
+        transaction and a few multi-row statements instead of one round
+        trip and commit per account.
+
+        Args:
+            accounts: Account aggregates to persist (new and existing mixed)
+
+        Raises:
+            Exception: If an email already exists for a different account ID
+                (nothing is persisted)
+
+        Business Rules:
+            - Same rules as save(), all accounts persisted or none
+            - An account listed twice is persisted once (last occurrence)
+
+        Implementation Notes:
+            - PostgreSQL: multi-row INSERT for new accounts, UPDATE ... FROM
+              (VALUES ...) of changed columns for existing ones
+            - Call mark_persisted() on every account after the write
+
+        Example:
+            accounts = [Account.create(email, password) for email in emails]
+            repository.save_many(accounts)  # One transaction
+        """
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, account_ids: Iterable[AccountId]) -> dict[AccountId, Account]:
+        """
+        Find several accounts by their identifiers in one lookup.
+
+        Args:
+            account_ids: AccountId value objects to search for
+
+        Returns:
+            Found accounts keyed by AccountId (unknown ids are absent)
+
+        Implementation Notes:
+            - PostgreSQL: WHERE id = ANY(%s)
+
+        Example:
+            >>> accounts = repository.find_by_ids(ids)
+            >>> missing = set(ids) - accounts.keys()
+        """
+        pass
+
+    @abstractmethod
+    def find_by_emails(self, emails: Iterable[Email]) -> dict[Email, Account]:
+        """
+        Find several accounts by email address in one lookup.
+
+        Args:
+            emails: Email value objects (normalized) to search for
+
+        Returns:
+            Found accounts keyed by Email (unknown emails are absent)
+
+        Implementation Notes:
+            - PostgreSQL: WHERE email = ANY(%s)
+
+        Example:
+            >>> existing = repository.find_by_emails(emails)
+            >>> new_emails = [email for email in emails if email not in existing]
+        """
+        pass
+
+    @abstractmethod
+    def iter_accounts(
+        self, created_from: datetime | None = None, created_until: datetime | None = None
+    ) -> Iterator[Account]:
+        """
+        Stream every account, optionally restricted to a creation time range.
+
+        Accounts are yielded one at a time (exports, backfills, analytics):
+        memory use does not depend on the number of accounts.
+
+        Args:
+            created_from: Only ids generated at or after this instant
+            created_until: Only ids generated before this instant
+
+        Yields:
+            Account aggregates, ordered by id (creation order for UUID v7)
+
+        Implementation Notes:
+            - PostgreSQL: server-side (named) cursor, fetched in batches
+            - Time window: id range between AccountId.min_for_timestamp()
+              boundaries, as in find_page()
+            - The connection stays checked out until the iterator is exhausted
+              or closed: consume it promptly, do not keep it around
+
+        Example:
+            >>> for account in repository.iter_accounts(created_from=since):
+            ...     export(account)
+        """
+        pass
+
+    @abstractmethod
+    def find_page(
+        self,
+        after: AccountId | None,
+        limit: int,
+        created_from: datetime | None = None,
+        created_until: datetime | None = None,
+    ) -> list[Account]:
+        """
+        Find one page of accounts in id order (keyset pagination).
+
+        AccountId is a UUID v7, so id order is creation order. A page starts
+        right after the last id of the previous page: the cost of a page does
+        not depend on its depth (no OFFSET rows to skip).
+
+        Args:
+            after: Last id of the previous page (None for the first page)
+            limit: Maximum number of accounts to return
+            created_from: Only ids generated at or after this instant
+            created_until: Only ids generated before this instant
+
+        Returns:
+            Up to limit accounts, ordered by id
+
+        Implementation Notes:
+            - PostgreSQL: WHERE id > :after ORDER BY id LIMIT :limit (primary
+              key range scan)
+            - Time window: id range between AccountId.min_for_timestamp()
+              boundaries (millisecond precision, no created_at index needed)
+
+        Example:
+            >>> page = repository.find_page(None, 100)
+            >>> next_page = repository.find_page(page[-1].id, 100)
+        """
+        pass
@@ -8,9 +8,10 @@ validation logic and random generation capabilities.
 
 import random
 from dataclasses import dataclass
+from typing import ClassVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivationCode:
     """
     Value object representing a 4-digit activation code.
@@ -41,7 +42,7 @@ class ActivationCode:
 
     code: str
 
-    CODE_LENGTH: int = 4
+    CODE_LENGTH: ClassVar[int] = 4
 
     def __post_init__(self) -> None:
         """
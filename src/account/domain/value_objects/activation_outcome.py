@@ -0,0 +1,38 @@
+"""
+Activation outcome value object for account activation workflow.
+
+This module defines the ActivationOutcome enumeration returned by the
+single-statement activation path of AccountActivationRepository. It lets the
+repository report why an activation did not happen without raising, so the
+application layer stays in charge of mapping outcomes to domain exceptions.
+"""
+
+from enum import Enum
+
+
+class ActivationOutcome(Enum):
+    """
+    Result of an account activation attempt.
+
+    Outcomes are listed in validation order: when several rules fail at
+    once, the first one wins (e.g., an expired code with a wrong value is
+    reported as CODE_EXPIRED).
+
+    Members:
+        ACTIVATED: Code valid, account is now active (or already was)
+        ACCOUNT_NOT_FOUND: No account with this ID
+        CODE_NOT_FOUND: Account exists but has no activation code
+        CODE_EXPIRED: Activation code lifetime elapsed
+        CODE_MISMATCH: Activation code value does not match
+
+    Example:
+        outcome = repository.activate_with_code(account_id, code)
+        if outcome is ActivationOutcome.CODE_EXPIRED:
+            raise ActivationCodeExpiredError("Activation code expired")
+    """
+
+    ACTIVATED = "activated"
+    ACCOUNT_NOT_FOUND = "account_not_found"
+    CODE_NOT_FOUND = "code_not_found"
+    CODE_EXPIRED = "code_expired"
+    CODE_MISMATCH = "code_mismatch"
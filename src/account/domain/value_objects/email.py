@@ -1,9 +1,106 @@
+import functools
+import os
+import re
 from dataclasses import dataclass
+from typing import Self
 
+import email_validator
 from email_validator import EmailNotValidError, validate_email
 
+# Distinct raw inputs memoized per process (EMAIL_VALIDATION_CACHE_SIZE, 0 disables)
+VALIDATION_CACHE_SIZE = int(os.getenv("EMAIL_VALIDATION_CACHE_SIZE", "4096"))
+
+
+# Conservative subset of RFC 5321/5322 ASCII addresses accepted by email_validator:
+# dot-atom local part limited to [a-z0-9_%+-], LDH domain labels, alphabetic TLD
+_ASCII_ADDRESS = re.compile(
+    r"(?P<local>[a-z0-9_%+-]+(?:\.[a-z0-9_%+-]+)*)"
+    r"@(?P<domain>(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63})",
+    re.ASCII | re.IGNORECASE,
+)
+
+
+def _normalize_ascii(raw_value: str) -> str | None:
+    """
+    Normalize common ASCII addresses without email_validator.
+
+    Accepts only addresses email_validator is known to accept unchanged
+    (besides lowercasing); anything else returns None and takes the full
+    parse: IDN and Punycode ("--" labels), quoted or unusual local parts,
+    special-use domains (.test, .local...), length limits.
+
+    Returns:
+        Lowercased address, or None if the fast path does not apply
+    """
+    if len(raw_value) > 254:
+        return None
+
+    match = _ASCII_ADDRESS.fullmatch(raw_value)
+    if match is None or len(match["local"]) > 64:
+        return None
+
+    domain = match["domain"].lower()
+    if "--" in domain:
+        return None
+    for special in email_validator.SPECIAL_USE_DOMAIN_NAMES:
+        if domain == special or domain.endswith("." + special):
+            return None
+
+    return raw_value.lower()
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _normalize(raw_value: str) -> tuple[str, str | None]:
+    """
+    Validate and normalize a raw address, memoized per raw input.
+
+    The same addresses come back again and again (retries, duplicate
+    signups), and each email_validator parse (syntax, IDNA) costs far more
+    than a dictionary lookup. Failures are memoized too, as their message.
+    Plain ASCII addresses skip email_validator entirely (_normalize_ascii).
+
+    Returns:
+        (normalized value, None) if valid, (raw value, error message) otherwise
+    """
+    fast = _normalize_ascii(raw_value)
+    if fast is not None:
+        return fast, None
+
+    try:
+        validated = validate_email(raw_value, check_deliverability=False)
+    except EmailNotValidError as e:
+        return raw_value, f"Invalid email: {str(e)}"
+
+    # Normalize to full lowercase to prevent duplicate accounts
+    # (e.g., User@example.com and user@example.com should be the same)
+    return validated.normalized.lower(), None
+
 
 @dataclass(frozen=True)
+class EmailValidationCacheStats:
+    """
+    Snapshot of the email validation memo.
+
+    Attributes:
+        hits: Validations answered from the memo
+        misses: Validations that ran email_validator
+        size: Raw inputs currently memoized
+        max_size: Memo capacity (EMAIL_VALIDATION_CACHE_SIZE)
+    """
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of validations answered from the memo (0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """
     Email value object with strict validation.
@@ -14,6 +111,12 @@ class Email:
     Attributes:
         value: The normalized email address (lowercase)
 
+    Construction:
+        Use Email(value) for any external input (validated and normalized;
+        results memoized per raw input in a bounded, thread-safe LRU).
+        Email.from_trusted() is reserved for repository reconstruction of
+        values that were normalized before being stored.
+
     Raises:
         ValueError: If email format is invalid or empty
     """
@@ -24,16 +127,58 @@ class Email:
         if not self.value:
             raise ValueError("Email cannot be empty")
 
-        try:
-            validated = validate_email(self.value, check_deliverability=False)
+        normalized, error = _normalize(self.value)
+        if error is not None:
+            raise ValueError(error)
+
+        # Using object.__setattr__ as workaround for frozen dataclass
+        object.__setattr__(self, "value", normalized)
+
+    @classmethod
+    def from_trusted(cls, normalized_value: str) -> Self:
+        """
+        Rebuild an Email from an already normalized value, without validation.
+
+        email_validator parsing dominates the cost of loading an account.
+        Values read from persistence were produced by Email(value), so
+        parsing and normalizing them again is redundant.
+
+        Args:
+            normalized_value: Value of a previously validated Email
+
+        Returns:
+            Email wrapping the value as-is
+
+        Raises:
+            ValueError: If value is empty
+
+        Warning:
+            Persistence mappers only. Never pass user input: it would bypass
+            validation and lowercase normalization (duplicate accounts).
+        """
+        if not normalized_value:
+            raise ValueError("Email cannot be empty")
+
+        email = object.__new__(cls)
+        # Skips __post_init__; object.__setattr__ as for normalization above
+        object.__setattr__(email, "value", normalized_value)
+        return email
 
-            # Normalize to full lowercase to prevent duplicate accounts
-            # (e.g., User@example.com and user@example.com should be the same)
-            # Using object.__setattr__ as workaround for frozen dataclass
-            object.__setattr__(self, "value", validated.normalized.lower())
+    @staticmethod
+    def validation_cache_stats() -> EmailValidationCacheStats:
+        """
+        Return hit/miss counters of the validation memo (process-wide).
 
-        except EmailNotValidError as e:
-            raise ValueError(f"Invalid email: {str(e)}") from e
+        Returns:
+            EmailValidationCacheStats: Hits, misses, size and capacity
+        """
+        info = _normalize.cache_info()
+        return EmailValidationCacheStats(
+            hits=info.hits,
+            misses=info.misses,
+            size=info.currsize,
+            max_size=info.maxsize or 0,
+        )
 
     def __str__(self) -> str:
         return self.value
@@ -3,8 +3,10 @@ from typing import Self
 
 import bcrypt
 
+from src.shared.domain.services.password_hasher import PasswordHasher
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Password:
     """
     Password value object with hashing.
@@ -15,6 +17,11 @@ class Password:
     Attributes:
         hashed_value: The bcrypt-hashed password (never stores plain text)
 
+    Hashing Strategy:
+        An optional PasswordHasher moves the bcrypt work off the calling
+        thread (e.g., to a dedicated process pool). Without one, hashing
+        runs inline.
+
     Raises:
         ValueError: If password is invalid (too short, empty)
     """
@@ -22,12 +29,11 @@ class Password:
     hashed_value: str
 
     @classmethod
-    def from_plain_text(cls, plain_password: str) -> Self:
-        if not plain_password:
-            raise ValueError("Password cannot be empty")
+    def from_plain_text(cls, plain_password: str, hasher: PasswordHasher | None = None) -> Self:
+        plain_password = PlainTextPassword(plain_password).value
 
-        if len(plain_password) < 8:
-            raise ValueError("Password must be at least 8 characters long")
+        if hasher is not None:
+            return cls(hashed_value=hasher.hash(plain_password))
 
         hashed = bcrypt.hashpw(plain_password.encode("utf-8"), bcrypt.gensalt())
 
@@ -40,7 +46,10 @@ class Password:
 
         return cls(hashed_value=hashed_value)
 
-    def verify(self, plain_password: str) -> bool:
+    def verify(self, plain_password: str, hasher: PasswordHasher | None = None) -> bool:
+        if hasher is not None:
+            return hasher.verify(plain_password, self.hashed_value)
+
         return bcrypt.checkpw(plain_password.encode("utf-8"), self.hashed_value.encode("utf-8"))
 
     def __str__(self) -> str:
@@ -48,3 +57,63 @@ class Password:
 
     def __repr__(self) -> str:
         return "Password(hashed_value='***')"
+
+
+@dataclass(frozen=True, slots=True)
+class PlainTextPassword:
+    """
+    Validated plain text password whose hashing is deferred.
+
+    Carries the user's password through the application layer without paying
+    for bcrypt until the caller decides the hash is actually needed (e.g.,
+    after business rules that may reject the request have passed).
+
+    Attributes:
+        value: The plain text password (masked in str/repr)
+
+    Raises:
+        ValueError: If password is invalid (too short, empty)
+
+    Example:
+        >>> plain = PlainTextPassword("SecurePass123")  # Validated, not hashed
+        >>> password = plain.hash(hasher)                # bcrypt runs here
+    """
+
+    value: str
+
+    def __post_init__(self) -> None:
+        if not self.value:
+            raise ValueError("Password cannot be empty")
+
+        if len(self.value) < 8:
+            raise ValueError("Password must be at least 8 characters long")
+
+    def hash(self, hasher: PasswordHasher | None = None) -> Password:
+        """
+        Hash the password into a Password value object.
+
+        Args:
+            hasher: Optional PasswordHasher (inline bcrypt when omitted)
+
+        Returns:
+            Password: Hashed password value object
+        """
+        return Password.from_plain_text(self.value, hasher)
+
+    async def hash_async(self, hasher: PasswordHasher) -> Password:
+        """
+        Hash the password without blocking the event loop.
+
+        Args:
+            hasher: PasswordHasher whose hash_async() does the bcrypt work
+
+        Returns:
+            Password: Hashed password value object
+        """
+        return Password.from_hash(await hasher.hash_async(self.value))
+
+    def __str__(self) -> str:
+        return "********"
+
+    def __repr__(self) -> str:
+        return "PlainTextPassword(value='***')"
@@ -35,18 +35,51 @@ Usage Example:
     ```
 """
 
+import os
+
 from injector import Module, provider, singleton
 
 from src.account.domain.repositories.account_activation_repository import (
     AccountActivationRepository,
 )
 from src.account.domain.repositories.account_repository import AccountRepository
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.infrastructure.persistence.caching_account_repository import (
+    ACCOUNT_CHANGED_CHANNEL,
+    CachingAccountRepository,
+)
+from src.account.infrastructure.persistence.in_memory_account_activation_repository import (
+    InMemoryAccountActivationRepository,
+)
 from src.account.infrastructure.persistence.postgres_account_activation_repository import (
     PostgresAccountActivationRepository,
 )
 from src.account.infrastructure.persistence.postgres_account_repository import (
     PostgresAccountRepository,
 )
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+from src.shared.infrastructure.database.notification_listener import (
+    PostgresNotificationListener,
+)
+
+
+def _get_activation_store() -> str:
+    """
+    Read activation code store selection from environment variables.
+
+    Environment Variables:
+        ACCOUNT_ACTIVATION_STORE: "postgres" (default) or "memory"
+
+    Returns:
+        str: Selected store name
+
+    Raises:
+        ValueError: If the store name is unknown
+    """
+    store = os.getenv("ACCOUNT_ACTIVATION_STORE", "postgres").strip().lower()
+    if store not in ("postgres", "memory"):
+        raise ValueError(f"Unknown ACCOUNT_ACTIVATION_STORE: {store!r}")
+    return store
 
 
 class AccountModule(Module):
@@ -58,11 +91,14 @@ class AccountModule(Module):
     startup and provides singleton instances for account resources.
 
     Bindings:
-        - AccountRepository → PostgresAccountRepository (singleton)
-        - AccountActivationRepository → PostgresAccountActivationRepository (singleton)
+        - AccountRepository → CachingAccountRepository(PostgresAccountRepository) (singleton)
+        - AccountActivationRepository → PostgresAccountActivationRepository, or
+          InMemoryAccountActivationRepository if ACCOUNT_ACTIVATION_STORE=memory (singleton)
+        - PostgresNotificationListener → account_changed cache invalidation (singleton)
 
     Singleton Justification:
-        - Repositories are stateless (no mutable state)
+        - Repositories are stateless (no mutable state), except the account
+          cache which must be shared to be useful (thread-safe)
         - Connection pool managed by DatabaseConnectionFactory (injected)
         - Thread-safe for concurrent requests
         - Single instance reduces memory overhead
@@ -79,23 +115,41 @@ class AccountModule(Module):
 
     @singleton
     @provider
-    def provide_account_repository(
-        self, repository: PostgresAccountRepository
-    ) -> AccountRepository:
+    def provide_caching_account_repository(
+        self, repository: PostgresAccountRepository, db: DatabaseConnectionFactory
+    ) -> CachingAccountRepository:
+        """
+        Provide singleton account cache wrapping PostgresAccountRepository.
+
+        Args:
+            repository: PostgresAccountRepository instance (auto-injected)
+            db: Connection factory (from InfrastructureModule)
+
+        Returns:
+            CachingAccountRepository: Process-wide LRU + TTL account cache
+
+        Environment Configuration:
+            - ACCOUNT_CACHE_SIZE (default: 10000)
+            - ACCOUNT_CACHE_TTL (default: 60 seconds)
+        """
+        return CachingAccountRepository(repository, db)
+
+    @singleton
+    @provider
+    def provide_account_repository(self, repository: CachingAccountRepository) -> AccountRepository:
         """
         Provide singleton AccountRepository for dependency injection.
 
         Binds the domain interface (AccountRepository) to the infrastructure
-        implementation (PostgresAccountRepository). This preserves Clean
-        Architecture by keeping the domain layer independent of infrastructure.
+        implementation: PostgresAccountRepository behind a read cache. This
+        preserves Clean Architecture by keeping the domain layer independent
+        of infrastructure (handlers are unaware of the cache).
 
         Args:
-            repository: PostgresAccountRepository instance (auto-injected)
-                Injector automatically resolves PostgresAccountRepository
-                by injecting DatabaseConnectionFactory into its constructor
+            repository: CachingAccountRepository instance (singleton provider)
 
         Returns:
-            AccountRepository: Singleton instance of PostgresAccountRepository
+            AccountRepository: Singleton instance of CachingAccountRepository
 
         Lifecycle:
             - Created: Application startup (first injection request)
@@ -104,38 +158,80 @@ class AccountModule(Module):
 
         Dependency Chain:
             AccountRepository
-            └─> PostgresAccountRepository(@inject)
-                └─> DatabaseConnectionFactory (from InfrastructureModule)
+            └─> CachingAccountRepository
+                ├─> PostgresAccountRepository(@inject)
+                │   └─> DatabaseConnectionFactory (from InfrastructureModule)
+                └─> DatabaseConnectionFactory (transaction detection)
 
         Example:
             ```python
             # In application handler
             @inject
             def __init__(self, repository: AccountRepository):
-                self._repository = repository  # Gets PostgresAccountRepository
+                self._repository = repository  # Gets CachingAccountRepository
             ```
         """
         return repository
 
+    @singleton
+    @provider
+    def provide_account_cache_listener(
+        self, cache: CachingAccountRepository
+    ) -> PostgresNotificationListener:
+        """
+        Provide singleton listener invalidating the account cache.
+
+        Every account row change (any process) sends NOTIFY account_changed
+        with the account id; the listener drops the matching cache entry.
+        On (re)connection the whole cache is cleared, since notifications
+        sent while not listening are lost.
+
+        Args:
+            cache: CachingAccountRepository singleton
+
+        Returns:
+            PostgresNotificationListener: Started/stopped by the FastAPI lifespan
+        """
+        return PostgresNotificationListener(
+            channel=ACCOUNT_CHANGED_CHANNEL,
+            on_notify=lambda payload: cache.invalidate(AccountId.from_string(payload)),
+            on_reconnect=cache.clear,
+        )
+
     @singleton
     @provider
     def provide_account_activation_repository(
-        self, repository: PostgresAccountActivationRepository
+        self,
+        repository: PostgresAccountActivationRepository,
+        account_repository: AccountRepository,
     ) -> AccountActivationRepository:
         """
         Provide singleton AccountActivationRepository for dependency injection.
 
         Binds the domain interface (AccountActivationRepository) to the infrastructure
-        implementation (PostgresAccountActivationRepository). This preserves Clean
+        implementation selected by ACCOUNT_ACTIVATION_STORE. This preserves Clean
         Architecture by keeping the domain layer independent of infrastructure.
 
         Args:
             repository: PostgresAccountActivationRepository instance (auto-injected)
                 Injector automatically resolves PostgresAccountActivationRepository
                 by injecting DatabaseConnectionFactory into its constructor
+            account_repository: AccountRepository used by the in-memory store
+                to activate accounts
 
         Returns:
-            AccountActivationRepository: Singleton instance of PostgresAccountActivationRepository
+            AccountActivationRepository: Singleton instance of
+                PostgresAccountActivationRepository (default) or
+                InMemoryAccountActivationRepository
+
+        Raises:
+            ValueError: If ACCOUNT_ACTIVATION_STORE is unknown
+
+        Environment Configuration:
+            - ACCOUNT_ACTIVATION_STORE=postgres (default): Durable codes,
+              valid with any number of worker processes
+            - ACCOUNT_ACTIVATION_STORE=memory: Process-local codes expired by a
+              timing wheel (single worker process only, lost on restart)
 
         Lifecycle:
             - Created: Application startup (first injection request)
@@ -144,15 +240,19 @@ class AccountModule(Module):
 
         Dependency Chain:
             AccountActivationRepository
-            └─> PostgresAccountActivationRepository(@inject)
-                └─> DatabaseConnectionFactory (from InfrastructureModule)
+            ├─> PostgresAccountActivationRepository(@inject)
+            │   └─> DatabaseConnectionFactory (from InfrastructureModule)
+            └─> InMemoryAccountActivationRepository
+                └─> AccountRepository
 
         Example:
             ```python
             # In event handler
             @inject
             def __init__(self, activation_repo: AccountActivationRepository):
-                self._activation_repo = activation_repo  # Gets PostgresAccountActivationRepository
+                self._activation_repo = activation_repo  # Gets the selected store
             ```
         """
+        if _get_activation_store() == "memory":
+            return InMemoryAccountActivationRepository(account_repository)
         return repository
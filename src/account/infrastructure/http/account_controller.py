@@ -10,7 +10,8 @@ Design Decisions:
     - Dependency injection via fastapi-injector (Injected)
     - Domain exceptions mapped to HTTP status codes
     - Controllers are thin: validation → handler → response
-    - Basic Auth for activation endpoint (configurable via env vars)
+    - Basic Auth for activation and admin listing endpoints (configurable via env vars)
+    - Keyset pagination for the listing (cursor = last account id)
 
 Error Handling:
     - EmailAlreadyExistsError → HTTP 409 Conflict
@@ -29,9 +30,12 @@ Architecture:
     HTTP Request → DTO validation → Domain VOs → Command → Handler → Repository
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi_injector import Injected
+from starlette.concurrency import run_in_threadpool
 
 from src.account.application.commands.activate_account import (
     ActivateAccountCommand,
@@ -41,6 +45,11 @@ from src.account.application.commands.register_account import (
     RegisterAccountCommand,
     RegisterAccountHandler,
 )
+from src.account.application.queries.list_accounts import (
+    MAX_PAGE_SIZE,
+    ListAccountsHandler,
+    ListAccountsQuery,
+)
 from src.account.domain.exceptions import (
     AccountNotFoundError,
     ActivationCodeExpiredError,
@@ -50,12 +59,14 @@ from src.account.domain.exceptions import (
 )
 from src.account.domain.value_objects.account_id import AccountId
 from src.account.domain.value_objects.activation_code import ActivationCode
-from src.account.domain.value_objects.email import Email
-from src.account.domain.value_objects.password import Password
+from src.account.domain.value_objects.password import PlainTextPassword
 from src.account.infrastructure.http.dtos import (
+    AccountListResponse,
+    AccountSummaryResponse,
     ActivateAccountRequest,
     RegisterAccountRequest,
 )
+from src.shared.infrastructure.events.async_event_dispatcher import EventQueueFullError
 from src.shared.infrastructure.http.auth import validate_api_credentials
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
@@ -68,7 +79,7 @@ security = HTTPBasic()
     responses={
         201: {"description": "Account created (no body)"},
         400: {
-            "description": "Domain validation error (Email or Password value object)",
+            "description": "Domain validation error (Password value object)",
             "content": {
                 "application/json": {
                     "example": {"detail": "Password must be at least 8 characters long"}
@@ -85,10 +96,11 @@ security = HTTPBasic()
                 }
             },
         },
+        503: {"description": "Event queue full (asynchronous dispatcher), nothing created"},
     },
     response_class=Response,
 )
-def create_account(
+async def create_account(
     request: RegisterAccountRequest,
     handler: RegisterAccountHandler = Injected(RegisterAccountHandler),
 ) -> None:
@@ -105,13 +117,21 @@ def create_account(
     - Password must meet complexity requirements (enforced by Password VO)
     - Account created in inactive state (is_activated = False)
     - User must verify email via activation code to use account
+
+    Concurrency:
+    - Async endpoint: the database steps run in the threadpool, while the
+      bcrypt hash is awaited on the event loop (process pool future), so no
+      threadpool thread is held for the ~250ms hash
     """
     try:
-        email = Email(request.email)
-        password = Password.from_plain_text(request.password)
-        command = RegisterAccountCommand(email=email, password=password)
+        password = PlainTextPassword(request.password)
 
-        handler.handle(command)
+        # Fast path before paying for bcrypt
+        await run_in_threadpool(handler.ensure_email_available, request.email)
+        hashed_password = await handler.hash_password(password)
+
+        command = RegisterAccountCommand(email=request.email, password=hashed_password)
+        await run_in_threadpool(handler.handle, command)
 
     except EmailAlreadyExistsError as e:
         raise HTTPException(
@@ -119,6 +139,13 @@ def create_account(
             detail=f"Email address already registered: {e.email.value}",
         ) from e
 
+    except EventQueueFullError as e:
+        # Raised before the unit of work (reserve()): nothing was written
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Registration temporarily unavailable, retry later",
+        ) from e
+
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -215,3 +242,83 @@ def activate_account(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         ) from e
+
+
+@router.get(
+    "/",
+    response_model=AccountListResponse,
+    responses={
+        401: {
+            "description": "Invalid API credentials",
+            "content": {"application/json": {"example": {"detail": "Invalid API credentials"}}},
+        },
+        422: {
+            "description": "Invalid cursor, page size or time window",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "created_from must be before created_until"}
+                }
+            },
+        },
+    },
+)
+def list_accounts(
+    after: str | None = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    created_from: datetime | None = Query(None, description="Created at or after (ISO 8601)"),
+    created_until: datetime | None = Query(None, description="Created before (ISO 8601)"),
+    credentials: HTTPBasicCredentials = Depends(security),
+    handler: ListAccountsHandler = Injected(ListAccountsHandler),
+) -> AccountListResponse:
+    """
+    List accounts in creation order, one page at a time (admin).
+
+    Pages are keyset-paginated on the UUID v7 account id: pass the returned
+    next_cursor as after to get the next page. Every page costs the same,
+    however deep, and registrations during the walk do not shift pages.
+
+    Returns: HTTP 200 OK with items and next_cursor (null on the last page)
+
+    Security:
+    - Basic Auth required (configured via API_USERNAME/API_PASSWORD env vars)
+
+    Time Window:
+    - created_from/created_until filter on the id timestamp (millisecond
+      precision); timestamps without offset are read as UTC
+
+    Example:
+        curl "http://localhost:8000/accounts/?limit=100&created_from=2025-11-01T00:00:00Z" \\
+             -u api:secret
+    """
+    if not validate_api_credentials(credentials):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API credentials",
+            headers={"WWW-Authenticate": "Basic"},
+        )
+
+    try:
+        query = ListAccountsQuery(
+            after=AccountId.from_string(after) if after is not None else None,
+            limit=limit,
+            created_from=created_from,
+            created_until=created_until,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+
+    page = handler.handle(query)
+    return AccountListResponse(
+        items=[
+            AccountSummaryResponse(
+                id=str(account.id),
+                email=account.email.value,
+                is_activated=account.is_activated,
+            )
+            for account in page.accounts
+        ],
+        next_cursor=str(page.next_cursor) if page.next_cursor is not None else None,
+    )
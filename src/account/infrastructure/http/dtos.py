@@ -6,18 +6,52 @@ layer. They are completely separate from domain value objects to maintain clean
 architecture boundaries.
 
 Design Decisions:
-    - Pydantic v2 for validation (ConfigDict, EmailStr, Field)
-    - Primitive types only (str) - no domain objects in DTOs
-    - Email/password validation happens in domain layer (Email, Password VOs)
+    - Pydantic v2 for validation (ConfigDict, Field, Annotated validators)
+    - Primitive types (str), except EmailAddress which parses straight into
+      the domain Email value object
+    - Password validation happens in domain layer (PlainTextPassword VO)
     - DTOs convert to domain objects in controller before handler call
 
 Validation Strategy:
-    - Basic format validation in Pydantic (email format, min length)
+    - Basic format validation in Pydantic (min length, code pattern)
+    - Email validated exactly once: EmailAddress delegates to the Email VO
+      (email_validator parse + normalization), instead of EmailStr followed
+      by a second Email(value) in the controller
     - Business rules validation in domain layer (Email VO, Password VO)
     - This separation allows reusing domain logic across different interfaces
 """
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, WithJsonSchema
+
+from src.account.domain.value_objects.email import Email
+
+
+def _parse_email(value: Any) -> Email:
+    """
+    Build the domain Email from raw request input (single validation).
+
+    Raises:
+        ValueError: If input is not a string or not a valid email
+            (reported by Pydantic as HTTP 422)
+    """
+    if isinstance(value, Email):
+        return value
+    if not isinstance(value, str):
+        raise ValueError("Email must be a string")
+
+    # Field-level validators bypass str_strip_whitespace
+    return Email(value.strip())
+
+
+# Email request field: JSON string in, domain Email value object out
+EmailAddress = Annotated[
+    Email,
+    PlainValidator(_parse_email),
+    PlainSerializer(str, return_type=str),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
 
 
 class RegisterAccountRequest(BaseModel):
@@ -28,7 +62,7 @@ class RegisterAccountRequest(BaseModel):
     Domain value objects (Email, Password) will apply business rules.
 
     Attributes:
-        email: Email address (format validation by Pydantic EmailStr)
+        email: Email value object (validated and normalized once, by the Email VO)
         password: Plain text password (min 8 chars, domain VO enforces complexity)
 
     Example:
@@ -54,7 +88,7 @@ class RegisterAccountRequest(BaseModel):
         },
     )
 
-    email: EmailStr = Field(
+    email: EmailAddress = Field(
         ...,
         description="Email address (must be valid format)",
         examples=["user@example.com"],
@@ -112,3 +146,44 @@ class ActivateAccountRequest(BaseModel):
         description="4-digit activation code (numeric only)",
         examples=["1234", "5678"],
     )
+
+
+class AccountSummaryResponse(BaseModel):
+    """
+    Account item of GET /accounts (password hash never exposed).
+
+    Attributes:
+        id: Account id (UUID v7)
+        email: Normalized email address
+        is_activated: Whether the email was verified
+    """
+
+    id: str
+    email: str
+    is_activated: bool
+
+
+class AccountListResponse(BaseModel):
+    """
+    Response DTO for GET /accounts endpoint (one keyset page).
+
+    Attributes:
+        items: Accounts of the page, in creation order
+        next_cursor: Value of the after parameter for the next page
+            (null on the last page)
+
+    Example:
+        {
+            "items": [
+                {
+                    "id": "019a463c-ba8b-7325-b61e-8e12dc8f0c7e",
+                    "email": "user@example.com",
+                    "is_activated": true
+                }
+            ],
+            "next_cursor": "019a463c-ba8b-7325-b61e-8e12dc8f0c7e"
+        }
+    """
+
+    items: list[AccountSummaryResponse]
+    next_cursor: str | None
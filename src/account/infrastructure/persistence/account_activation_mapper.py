@@ -37,7 +37,7 @@ from src.account.domain.value_objects.account_id import AccountId
 from src.account.domain.value_objects.activation_code import ActivationCode
 
 
-def to_persistence(activation: AccountActivation) -> dict[str, str | datetime]:
+def to_persistence(activation: AccountActivation) -> dict[str, UUID | str | datetime]:
     """
     Convert AccountActivation entity to database row dictionary.
 
@@ -49,13 +49,13 @@ def to_persistence(activation: AccountActivation) -> dict[str, str | datetime]:
 
     Returns:
         Dictionary with database column names as keys:
-            - account_id: str (UUID converted to string for psycopg2)
+            - account_id: UUID (sent as a native uuid parameter)
             - code: str (from ActivationCode.code, 4-digit string)
             - created_at: datetime (UTC timestamp)
             - expires_at: datetime (UTC timestamp, created_at + 60 seconds)
 
     Note:
-        - AccountId UUID converted to string for psycopg2 compatibility
+        - UUID passed as-is (pooled connections register psycopg2's UUID adapter)
         - Timestamps are already in UTC (from AccountActivation.create_for_account)
         - Code is already validated by ActivationCode value object
 
@@ -68,7 +68,7 @@ def to_persistence(activation: AccountActivation) -> dict[str, str | datetime]:
         True
     """
     return {
-        "account_id": str(activation.account_id.value),  # Convert UUID to string
+        "account_id": activation.account_id.value,
         "code": activation.code.code,
         "created_at": activation.created_at,
         "expires_at": activation.expires_at,
@@ -84,7 +84,7 @@ def to_domain(row: dict[str, str | UUID | datetime]) -> AccountActivation:
 
     Args:
         row: Database row as dictionary with column names as keys:
-            - account_id: UUID or str (primary key, converted from string if needed)
+            - account_id: UUID (native from the driver) or str (primary key)
             - code: str (4-digit activation code)
             - created_at: datetime (UTC timestamp)
             - expires_at: datetime (UTC timestamp)
@@ -97,7 +97,8 @@ def to_domain(row: dict[str, str | UUID | datetime]) -> AccountActivation:
         - Does NOT use AccountActivation.create_for_account() (that's for new activations)
         - Reconstructs value objects from primitive database values
         - Private attributes (_account_id, _code, etc.) set via constructor
-        - Converts string UUID from database to UUID object for AccountId
+        - AccountId rebuilt with AccountId.from_trusted() (UUID from the
+          driver, version not checked again); strings are parsed first
 
     Example:
         >>> row = {"account_id": "019a4ba0-9bf9-71c9-91b2-b51c4e875388", "code": "1234", ...}
@@ -107,13 +108,12 @@ def to_domain(row: dict[str, str | UUID | datetime]) -> AccountActivation:
         >>> isinstance(activation.account_id, AccountId)
         True
     """
-    # Convert string UUID from database to UUID object
     account_id = (
         row["account_id"] if isinstance(row["account_id"], UUID) else UUID(str(row["account_id"]))
     )
 
     return AccountActivation(
-        _account_id=AccountId(account_id),
+        _account_id=AccountId.from_trusted(account_id),
         _code=ActivationCode(str(row["code"])),
         _created_at=row["created_at"],  # type: ignore
         _expires_at=row["expires_at"],  # type: ignore
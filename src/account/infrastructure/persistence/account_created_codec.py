@@ -0,0 +1,77 @@
+"""
+AccountCreated event to outbox payload codec.
+
+This module provides bidirectional mapping between the AccountCreated domain
+event and the JSON object stored in outbox.payload by OutboxEventDispatcher.
+
+Design Principles:
+    - Pure functions: No side effects, stateless transformations
+    - Stable format: Field names and the "AccountCreated" event name are
+      persisted; relays of another release must still decode them
+    - Trusted decoding: Payloads were produced from validated value objects,
+      so they are rebuilt with from_trusted() (no re-validation)
+
+Architecture:
+    - to_payload(): Domain event → JSON object
+    - from_payload(): JSON object → Domain event
+    - ACCOUNT_CREATED_CODEC: Registered on OutboxEventDispatcher (src/main.py)
+
+Usage Example:
+    ```python
+    payload = to_payload(event)
+    # {"account_id": "0192...", "email": "user@example.com",
+    #  "occurred_at": "2025-11-12T09:00:00+00:00"}
+
+    event = from_payload(payload)
+    ```
+"""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.account.domain.events.account_created import AccountCreated
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.email import Email
+from src.shared.infrastructure.events.outbox_event_dispatcher import OutboxCodec
+
+
+def to_payload(event: AccountCreated) -> dict[str, Any]:
+    """
+    Convert AccountCreated to a JSON-serializable object.
+
+    Args:
+        event: AccountCreated domain event
+
+    Returns:
+        Dictionary with string values (UUID, email, ISO 8601 timestamp)
+    """
+    return {
+        "account_id": str(event.account_id.value),
+        "email": event.email.value,
+        "occurred_at": event.occurred_at.isoformat(),
+    }
+
+
+def from_payload(payload: dict[str, Any]) -> AccountCreated:
+    """
+    Rebuild AccountCreated from an outbox payload.
+
+    Args:
+        payload: Object produced by to_payload()
+
+    Returns:
+        AccountCreated domain event
+
+    Raises:
+        KeyError: If a field is missing
+        ValueError: If the UUID or timestamp is malformed
+    """
+    return AccountCreated(
+        account_id=AccountId.from_trusted(UUID(payload["account_id"])),
+        email=Email.from_trusted(payload["email"]),
+        occurred_at=datetime.fromisoformat(payload["occurred_at"]),
+    )
+
+
+ACCOUNT_CREATED_CODEC = OutboxCodec(name="AccountCreated", encode=to_payload, decode=from_payload)
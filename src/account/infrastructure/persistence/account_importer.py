@@ -0,0 +1,458 @@
+"""
+Bulk account import through PostgreSQL COPY.
+
+Migrating legacy users through POST /accounts costs one bcrypt hash, several
+round trips and one activation email per user. This module loads accounts
+whose passwords are already bcrypt-hashed straight into the account table.
+
+Pipeline:
+    1. Read: The input is consumed line by line, in chunks of
+       IMPORT_CHUNK_SIZE lines (CSV with a header, or NDJSON)
+    2. Validate: Chunks are parsed and validated in worker processes
+       (Email value object, Password.from_hash() plus bcrypt format check)
+    3. Stage: Valid rows are sent with COPY into a temporary staging table
+       (account_import, dropped at the end of the transaction)
+    4. Merge: One INSERT ... SELECT DISTINCT ON (email) ... ON CONFLICT
+       (email) DO NOTHING moves staged rows into account, in id order
+    5. Report: Staged rows that were not inserted are streamed back through
+       a server-side cursor (already registered, or duplicate in file)
+
+Design Decisions:
+    - Constant memory: At most 2 chunks per worker are in flight; rejected
+      and duplicate rows are handed to callbacks, never accumulated
+    - Single transaction: The whole import commits (or rolls back) at once;
+      a dry run performs every step, then rolls back
+    - No domain events: Imported accounts do not trigger activation emails
+    - One record per line: CSV fields spanning several lines are not
+      supported (emails and bcrypt hashes never contain newlines)
+
+Input Columns:
+    email: Email address (validated and normalized like Email(value))
+    password_hash: bcrypt hash ($2a$, $2b$ or $2y$, 60 characters)
+    is_activated: Optional (true/false, 1/0, yes/no; default: False)
+
+Usage Example:
+    ```python
+    importer = PostgresAccountImporter(db, workers=4)
+    with open("legacy_users.csv", encoding="utf-8") as file:
+        result = importer.run(file, ImportFormat.CSV, on_rejected=print)
+
+    result.inserted, result.duplicates, result.rows_per_second
+    ```
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import islice
+
+from psycopg2.extensions import connection as Connection  # noqa: N812
+from psycopg2.extensions import cursor as Cursor  # noqa: N812
+
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+
+# Input lines validated per worker task (and rows per COPY statement)
+IMPORT_CHUNK_SIZE = 5000
+
+_BCRYPT_HASH = re.compile(r"\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}")
+
+_TRUE_VALUES = {"true", "1", "yes", "t", "y"}
+_FALSE_VALUES = {"false", "0", "no", "f", "n", ""}
+
+# Staged row: (line, id, email, password_hash, is_activated)
+_StagedRow = tuple[int, str, str, str, bool]
+
+
+class ImportFormat(Enum):
+    """Input file format."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+@dataclass(frozen=True)
+class RejectedRecord:
+    """
+    Input record that failed validation (not staged).
+
+    Attributes:
+        line: 1-based line number in the input
+        reason: Validation error message
+    """
+
+    line: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class DuplicateRecord:
+    """
+    Valid record not inserted because its email is taken.
+
+    Attributes:
+        line: 1-based line number in the input
+        email: Normalized email address
+        reason: "already_registered" (account existed before the import) or
+            "duplicate_in_file" (an earlier line of the file was inserted)
+    """
+
+    line: int
+    email: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """
+    Summary of an import run.
+
+    Attributes:
+        read: Input records read (header excluded)
+        rejected: Records that failed validation
+        inserted: Accounts inserted (or that would be, in a dry run)
+        duplicates: Valid records skipped because their email is taken
+        elapsed: Wall-clock seconds for the whole run
+        dry_run: True if the transaction was rolled back
+    """
+
+    read: int
+    rejected: int
+    inserted: int
+    duplicates: int
+    elapsed: float
+    dry_run: bool
+
+    @property
+    def rows_per_second(self) -> float:
+        """Input records processed per second (0 when nothing was read)."""
+        return self.read / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class _ChunkResult:
+    """Outcome of validating one chunk (returned by worker processes)."""
+
+    read: int = 0
+    rows: list[_StagedRow] = field(default_factory=list)
+    rejected: list[RejectedRecord] = field(default_factory=list)
+
+
+def _parse_activated(value: object) -> bool:
+    """Parse the optional is_activated column."""
+    if value is None or isinstance(value, bool):
+        return bool(value)
+
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid is_activated value: {value!r}")
+
+
+def _validate_record(record: dict[str, object]) -> tuple[str, str, bool]:
+    """
+    Validate one input record.
+
+    Returns:
+        (normalized email, password hash, is_activated)
+
+    Raises:
+        ValueError: If a field is missing or invalid
+    """
+    email = record.get("email")
+    password_hash = record.get("password_hash")
+    if not isinstance(email, str) or not isinstance(password_hash, str):
+        raise ValueError("email and password_hash are required strings")
+
+    password = Password.from_hash(password_hash.strip())
+    if _BCRYPT_HASH.fullmatch(password.hashed_value) is None:
+        raise ValueError("password_hash is not a bcrypt hash")
+
+    return (
+        Email(email.strip()).value,
+        password.hashed_value,
+        _parse_activated(record.get("is_activated")),
+    )
+
+
+def validate_chunk(
+    import_format: ImportFormat, header: list[str] | None, first_line: int, lines: list[str]
+) -> _ChunkResult:
+    """
+    Parse and validate a chunk of input lines (executed in a worker process).
+
+    Args:
+        import_format: Input format
+        header: CSV column names (None for NDJSON)
+        first_line: 1-based line number of lines[0]
+        lines: Raw input lines
+
+    Returns:
+        _ChunkResult: Staged rows (with generated account ids) and rejections
+    """
+    result = _ChunkResult()
+    valid: list[tuple[int, str, str, bool]] = []
+    for line_number, line in enumerate(lines, start=first_line):
+        if not line.strip():
+            continue
+
+        result.read += 1
+        try:
+            if import_format is ImportFormat.CSV:
+                assert header is not None
+                values = next(csv.reader([line]))
+                if len(values) != len(header):
+                    raise ValueError(f"Expected {len(header)} fields, got {len(values)}")
+                record: dict[str, object] = dict(zip(header, values, strict=True))
+            else:
+                parsed = json.loads(line)
+                if not isinstance(parsed, dict):
+                    raise ValueError("Expected a JSON object")
+                record = parsed
+
+            email, password_hash, is_activated = _validate_record(record)
+        except (ValueError, csv.Error) as e:  # json.JSONDecodeError is a ValueError
+            result.rejected.append(RejectedRecord(line_number, str(e)))
+            continue
+
+        valid.append((line_number, email, password_hash, is_activated))
+
+    # One allocation per chunk: ids increase along the chunk (append-only index inserts)
+    account_ids = AccountId.generate_many(len(valid))
+    result.rows = [
+        (line_number, str(account_id.value), email, password_hash, is_activated)
+        for (line_number, email, password_hash, is_activated), account_id in zip(
+            valid, account_ids, strict=True
+        )
+    ]
+    return result
+
+
+class PostgresAccountImporter:
+    """
+    Streaming bulk importer for pre-hashed accounts (COPY + merge).
+
+    Not registered in the DI container: used by scripts/import_accounts.py.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnectionFactory,
+        workers: int | None = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize importer.
+
+        Args:
+            db: Connection factory (one connection held for the whole run)
+            workers: Validation processes (default: CPU count; 0 or 1 validates
+                inline in the calling process)
+            chunk_size: Input lines per validation task and COPY statement
+        """
+        self._db = db
+        self._workers = (os.cpu_count() or 1) if workers is None else workers
+        self._chunk_size = chunk_size
+
+    def run(
+        self,
+        lines: Iterable[str],
+        import_format: ImportFormat,
+        dry_run: bool = False,
+        on_rejected: Callable[[RejectedRecord], None] | None = None,
+        on_duplicate: Callable[[DuplicateRecord], None] | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> ImportResult:
+        """
+        Import accounts from input lines in one transaction.
+
+        Args:
+            lines: Input lines (e.g. an open text file), consumed lazily
+            import_format: CSV (header line required) or NDJSON
+            dry_run: Roll back instead of committing (counts still reported)
+            on_rejected: Called for each record failing validation
+            on_duplicate: Called for each valid record whose email is taken
+            on_progress: Called with the number of records read after each chunk
+
+        Returns:
+            ImportResult: Counts and throughput
+
+        Raises:
+            ValueError: If the CSV header lacks email or password_hash
+            psycopg2.DatabaseError: If a database operation fails (rolled back)
+        """
+        started = time.perf_counter()
+        lines = iter(lines)
+        header = self._read_header(lines) if import_format is ImportFormat.CSV else None
+        first_line = 2 if header is not None else 1
+
+        read = rejected = 0
+        with self._db.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        CREATE TEMPORARY TABLE account_import (
+                            line INTEGER NOT NULL,
+                            id UUID NOT NULL,
+                            email VARCHAR(255) NOT NULL,
+                            password_hash VARCHAR(255) NOT NULL,
+                            is_activated BOOLEAN NOT NULL
+                        ) ON COMMIT DROP
+                        """)
+
+                    chunks = self._validated_chunks(lines, import_format, header, first_line)
+                    for chunk in chunks:
+                        read += chunk.read
+                        rejected += len(chunk.rejected)
+                        if on_rejected is not None:
+                            for record in chunk.rejected:
+                                on_rejected(record)
+                        self._copy(cursor, chunk.rows)
+                        if on_progress is not None:
+                            on_progress(read)
+
+                    inserted = self._merge(cursor)
+
+                duplicates = self._report_duplicates(conn, on_duplicate)
+
+                if dry_run:
+                    conn.rollback()
+                else:
+                    conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+        return ImportResult(
+            read=read,
+            rejected=rejected,
+            inserted=inserted,
+            duplicates=duplicates,
+            elapsed=time.perf_counter() - started,
+            dry_run=dry_run,
+        )
+
+    @staticmethod
+    def _read_header(lines: Iterator[str]) -> list[str]:
+        """Read and check the CSV header line."""
+        header = [column.strip() for column in next(csv.reader(islice(lines, 1)), [])]
+        if "email" not in header or "password_hash" not in header:
+            raise ValueError("CSV header must contain email and password_hash columns")
+        return header
+
+    def _validated_chunks(
+        self,
+        lines: Iterator[str],
+        import_format: ImportFormat,
+        header: list[str] | None,
+        first_line: int,
+    ) -> Iterator[_ChunkResult]:
+        """Validate input chunks in order, with a bounded number in flight."""
+        chunks = self._chunks(lines, first_line)
+        if self._workers <= 1:
+            for start, chunk in chunks:
+                yield validate_chunk(import_format, header, start, chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending: deque[Future[_ChunkResult]] = deque()
+            for start, chunk in chunks:
+                pending.append(executor.submit(validate_chunk, import_format, header, start, chunk))
+                if len(pending) >= 2 * self._workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _chunks(self, lines: Iterator[str], first_line: int) -> Iterator[tuple[int, list[str]]]:
+        """Group lines into (first line number, lines) chunks."""
+        start = first_line
+        while chunk := list(islice(lines, self._chunk_size)):
+            yield start, chunk
+            start += len(chunk)
+
+    @staticmethod
+    def _copy(cursor: Cursor, rows: list[_StagedRow]) -> None:
+        """COPY staged rows into account_import."""
+        if not rows:
+            return
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert(
+            "COPY account_import (line, id, email, password_hash, is_activated)"
+            " FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+    @staticmethod
+    def _merge(cursor: Cursor) -> int:
+        """
+        Insert staged rows into account (first line wins per email).
+
+        DISTINCT ON needs the rows sorted by email; the outer ORDER BY id
+        inserts them in UUID v7 order, so primary key entries are appended
+        to the right edge of the index instead of landing on random pages.
+        """
+        cursor.execute("""
+            INSERT INTO account (id, email, password_hash, is_activated, created_at, updated_at)
+            SELECT id, email, password_hash, is_activated, NOW(), NOW()
+            FROM (
+                SELECT DISTINCT ON (email) id, email, password_hash, is_activated
+                FROM account_import
+                ORDER BY email, line
+            ) first_lines
+            ORDER BY id
+            ON CONFLICT (email) DO NOTHING
+            """)
+        inserted = cursor.rowcount
+        cursor.execute("CREATE INDEX ON account_import (email, line)")
+        cursor.execute("ANALYZE account_import")
+        return inserted
+
+    @staticmethod
+    def _report_duplicates(
+        conn: Connection, on_duplicate: Callable[[DuplicateRecord], None] | None
+    ) -> int:
+        """
+        Stream staged rows that were not inserted (server-side cursor).
+
+        A skipped row's email is in account either way: the row is a
+        duplicate in the file only if that account was inserted by this
+        import (from another line); otherwise it was already registered,
+        whether or not the email is repeated in the file.
+        """
+        with conn.cursor(name="account_import_duplicates") as cursor:
+            cursor.itersize = IMPORT_CHUNK_SIZE
+            cursor.execute("""
+                SELECT staged.line, staged.email,
+                    NOT EXISTS (
+                        SELECT 1 FROM account
+                        JOIN account_import inserted
+                            ON inserted.email = account.email AND inserted.id = account.id
+                        WHERE account.email = staged.email
+                    ) AS registered
+                FROM account_import staged
+                WHERE NOT EXISTS (SELECT 1 FROM account WHERE account.id = staged.id)
+                ORDER BY staged.line
+                """)
+            duplicates = 0
+            for line, email, registered in cursor:
+                duplicates += 1
+                if on_duplicate is not None:
+                    reason = "already_registered" if registered else "duplicate_in_file"
+                    on_duplicate(DuplicateRecord(line, email, reason))
+
+        return duplicates
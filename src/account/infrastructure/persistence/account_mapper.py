@@ -12,6 +12,7 @@ Design Principles:
 
 Architecture:
     - to_persistence(): Domain entity → Database row (dict)
+    - to_persistence_changes(): Changed fields of an entity → Columns to update
     - to_domain(): Database row (dict) → Domain entity
     - Used by PostgresAccountRepository for INSERT/SELECT operations
 
@@ -37,8 +38,15 @@ from src.account.domain.value_objects.account_id import AccountId
 from src.account.domain.value_objects.email import Email
 from src.account.domain.value_objects.password import Password
 
+# Account property → account column (changed_fields of Account)
+_COLUMNS_BY_FIELD = {
+    "email": "email",
+    "password": "password_hash",
+    "is_activated": "is_activated",
+}
 
-def to_persistence(account: Account) -> dict[str, str | bool]:
+
+def to_persistence(account: Account) -> dict[str, UUID | str | bool]:
     """
     Convert Account entity to database row dictionary.
 
@@ -50,7 +58,7 @@ def to_persistence(account: Account) -> dict[str, str | bool]:
 
     Returns:
         Dictionary with database column names as keys:
-            - id: str (UUID converted to string for psycopg2)
+            - id: UUID (sent as a native uuid parameter)
             - email: str (from Email.value, normalized lowercase)
             - password_hash: str (from Password.hashed_value, bcrypt hash)
             - is_activated: bool (activation status)
@@ -59,7 +67,7 @@ def to_persistence(account: Account) -> dict[str, str | bool]:
         - created_at and updated_at are handled by database (NOW())
         - Password is already hashed by Password value object
         - Email is already normalized by Email value object
-        - UUID converted to string for psycopg2 compatibility
+        - UUID passed as-is (pooled connections register psycopg2's UUID adapter)
 
     Example:
         >>> account = Account.create(Email("user@example.com"), Password.from_plain_text("pass"))
@@ -70,13 +78,37 @@ def to_persistence(account: Account) -> dict[str, str | bool]:
         False
     """
     return {
-        "id": str(account.id.value),  # Convert UUID to string for psycopg2
+        "id": account.id.value,
         "email": account.email.value,
         "password_hash": account.password.hashed_value,
         "is_activated": account.is_activated,
     }
 
 
+def to_persistence_changes(account: Account) -> dict[str, UUID | str | bool]:
+    """
+    Convert the changed fields of an Account entity to database columns.
+
+    Only the columns of account.changed_fields are returned, so an update
+    can leave untouched columns (and their indexes) alone.
+
+    Args:
+        account: Account entity from domain layer
+
+    Returns:
+        Dictionary of changed column names to values (empty if unchanged),
+        in table column order
+
+    Example:
+        >>> account.activate()
+        >>> to_persistence_changes(account)
+        {'is_activated': True}
+    """
+    row = to_persistence(account)
+    columns = {_COLUMNS_BY_FIELD[name] for name in account.changed_fields}
+    return {column: value for column, value in row.items() if column in columns}
+
+
 def to_domain(row: dict[str, str | UUID | bool | datetime]) -> Account:
     """
     Convert database row to Account entity.
@@ -86,7 +118,7 @@ def to_domain(row: dict[str, str | UUID | bool | datetime]) -> Account:
 
     Args:
         row: Database row as dictionary with column names as keys:
-            - id: UUID or str (account primary key, converted from string if needed)
+            - id: UUID (native from the driver) or str (account primary key)
             - email: str (normalized email address)
             - password_hash: str (bcrypt hashed password)
             - is_activated: bool (activation status)
@@ -100,8 +132,11 @@ def to_domain(row: dict[str, str | UUID | bool | datetime]) -> Account:
         - Uses direct Account() constructor (repository reconstruction pattern)
         - Does NOT use Account.create() (that's for new accounts)
         - Reconstructs value objects from primitive database values
+        - Email rebuilt with Email.from_trusted(): stored values were
+          normalized on the way in, so email_validator is not run again
         - Private attributes (_id, _email, etc.) set via constructor
-        - Converts string UUID from database to UUID object for AccountId
+        - AccountId rebuilt with AccountId.from_trusted() (UUID from the
+          driver, version not checked again); strings are parsed first
 
     Example:
         >>> row = {"id": "019a4ba0-9bf9-71c9-91b2-b51c4e875388", "email": "user@example.com", ...}
@@ -111,12 +146,11 @@ def to_domain(row: dict[str, str | UUID | bool | datetime]) -> Account:
         >>> account.is_activated
         False
     """
-    # Convert string UUID from database to UUID object
     account_id = row["id"] if isinstance(row["id"], UUID) else UUID(str(row["id"]))
 
     return Account(
-        _id=AccountId(account_id),
-        _email=Email(str(row["email"])),
+        _id=AccountId.from_trusted(account_id),
+        _email=Email.from_trusted(str(row["email"])),
         _password=Password(str(row["password_hash"])),
         _is_activated=bool(row["is_activated"]),
     )
@@ -0,0 +1,410 @@
+"""
+Write-through caching decorator for AccountRepository.
+
+This module keeps recently read accounts in a bounded, per-process LRU so
+repeated lookups of the same account (duplicate registration attempts,
+status checks) are served from memory instead of PostgreSQL.
+
+Design Decisions:
+    - Decorator: Wraps any AccountRepository, persistence logic unchanged
+    - Bounded LRU: OrderedDict keyed by AccountId, plus an Email → AccountId
+      index (one entry per account, both keys evicted together)
+    - TTL: Entries older than ACCOUNT_CACHE_TTL are reloaded (upper bound on
+      staleness if an invalidation is ever missed)
+    - Write-through: save() writes to the inner repository, then replaces the
+      cached entry with the saved account
+    - Positive caching only: Misses are not cached (a registration must never
+      be hidden by a cached "not found")
+    - Transaction-aware: Inside a UnitOfWork, reads bypass the cache and
+      writes only invalidate (uncommitted rows may still be rolled back)
+    - Cross-process coherence: Every account row change sends NOTIFY
+      account_changed (database trigger); each worker's listener calls
+      invalidate(), and clear() on reconnect (missed notifications)
+    - Load races: A load overlapping an invalidation of the same account is
+      returned but not cached (no stale entry resurrected after NOTIFY)
+    - Copies: Account is mutable (activate()), so callers get their own copy
+
+Configuration:
+    ACCOUNT_CACHE_SIZE: Maximum cached accounts per process (default: 10000)
+    ACCOUNT_CACHE_TTL: Entry lifetime in seconds (default: 60)
+
+Architecture:
+    - Implements: AccountRepository (domain layer interface)
+    - Dependencies: Inner AccountRepository, DatabaseConnectionFactory
+      (transaction detection)
+    - DI: Provided by AccountModule around PostgresAccountRepository
+
+Usage Example:
+    ```python
+    repository = CachingAccountRepository(PostgresAccountRepository(db), db)
+
+    repository.find_by_email(email)  # Miss: SELECT, then cached
+    repository.find_by_email(email)  # Hit: no database round trip
+
+    repository.stats().hits  # 1
+    ```
+"""
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.account.domain.entities.account import Account
+from src.account.domain.repositories.account_repository import AccountRepository
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.email import Email
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+
+# NOTIFY channel fed by the account table trigger (payload: account id)
+ACCOUNT_CHANGED_CHANNEL = "account_changed"
+
+
+def _get_cache_config() -> dict[str, float]:
+    """
+    Read account cache configuration from environment variables.
+
+    Environment Variables:
+        ACCOUNT_CACHE_SIZE: Maximum cached accounts (default: 10000)
+        ACCOUNT_CACHE_TTL: Entry lifetime in seconds (default: 60)
+
+    Returns:
+        dict: max_size and ttl
+    """
+    return {
+        "max_size": int(os.getenv("ACCOUNT_CACHE_SIZE", "10000")),
+        "ttl": float(os.getenv("ACCOUNT_CACHE_TTL", "60")),
+    }
+
+
+@dataclass(frozen=True)
+class AccountCacheStats:
+    """
+    Snapshot of account cache activity.
+
+    Attributes:
+        size: Accounts currently cached
+        max_size: Capacity of the LRU
+        hits: Lookups served from memory
+        misses: Lookups delegated to the inner repository (absent or expired)
+        evictions: Entries dropped to stay within max_size
+        invalidations: Entries dropped by save() or change notifications
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """Cached account with its expiry deadline (monotonic clock)."""
+
+    account: Account
+    expires_at: float
+
+
+class CachingAccountRepository(AccountRepository):
+    """
+    AccountRepository decorator with a bounded LRU + TTL read cache.
+
+    Thread Safety:
+        - All cache state is guarded by one lock
+        - Inner repository calls run outside the lock (no I/O under lock)
+    """
+
+    def __init__(
+        self,
+        repository: AccountRepository,
+        db: DatabaseConnectionFactory,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize cache around an existing repository.
+
+        Args:
+            repository: Repository used for misses and all writes
+            db: Connection factory (tells whether a UnitOfWork is active)
+            max_size: Maximum cached accounts (default: ACCOUNT_CACHE_SIZE)
+            ttl: Entry lifetime in seconds (default: ACCOUNT_CACHE_TTL)
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If max_size is lower than 1
+        """
+        config = _get_cache_config()
+        self._max_size = int(config["max_size"] if max_size is None else max_size)
+        if self._max_size < 1:
+            raise ValueError("Account cache size must be at least 1")
+
+        self._repository = repository
+        self._db = db
+        self._ttl = config["ttl"] if ttl is None else ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[AccountId, _Entry] = OrderedDict()
+        self._ids_by_email: dict[Email, AccountId] = {}
+
+        # Load race detection (see _store())
+        self._generation = 0
+        self._cleared_at = 0
+        self._loads_in_flight = 0
+        self._invalidated_at: dict[AccountId, int] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def save(self, account: Account) -> None:
+        """
+        Persist account, then refresh its cached entry.
+
+        Inside a UnitOfWork the entry is only invalidated: the write may still
+        be rolled back, and the trigger notification follows the commit.
+        """
+        self.invalidate(account.id)
+        self._repository.save(account)
+
+        if not self._db.in_transaction():
+            with self._lock:
+                self._put(account)
+
+    def save_many(self, accounts: Sequence[Account]) -> None:
+        """Persist accounts, then refresh their cached entries (as save())."""
+        for account in accounts:
+            self.invalidate(account.id)
+        self._repository.save_many(accounts)
+
+        if not self._db.in_transaction():
+            with self._lock:
+                for account in accounts:
+                    self._put(account)
+
+    def create_if_email_absent(self, account: Account) -> bool:
+        """Insert account unless the email exists (not cached: new accounts are cold)."""
+        created = self._repository.create_if_email_absent(account)
+        if created:
+            self.invalidate(account.id)
+        return created
+
+    def find_by_email(self, email: Email) -> Account | None:
+        """Find account by email, from memory when cached and fresh."""
+        with self._lock:
+            account_id = self._ids_by_email.get(email)
+            cached = self._get(account_id) if account_id is not None else None
+            if cached is None:
+                self._misses += 1
+
+        if cached is not None:
+            return cached
+
+        return self._load(lambda: self._repository.find_by_email(email))
+
+    def find_by_id(self, account_id: AccountId) -> Account | None:
+        """Find account by id, from memory when cached and fresh."""
+        with self._lock:
+            cached = self._get(account_id)
+            if cached is None:
+                self._misses += 1
+
+        if cached is not None:
+            return cached
+
+        return self._load(lambda: self._repository.find_by_id(account_id))
+
+    def find_by_ids(self, account_ids: Iterable[AccountId]) -> dict[AccountId, Account]:
+        """Find accounts by id: cached ones from memory, the rest in one inner lookup."""
+        found: dict[AccountId, Account] = {}
+        missing: list[AccountId] = []
+        with self._lock:
+            for account_id in set(account_ids):
+                cached = self._get(account_id)
+                if cached is None:
+                    missing.append(account_id)
+                else:
+                    found[account_id] = cached
+            self._misses += len(missing)
+
+        if missing:
+            loaded = self._load_many(lambda: self._repository.find_by_ids(missing).values())
+            found.update((account.id, account) for account in loaded)
+        return found
+
+    def find_by_emails(self, emails: Iterable[Email]) -> dict[Email, Account]:
+        """Find accounts by email: cached ones from memory, the rest in one inner lookup."""
+        found: dict[Email, Account] = {}
+        missing: list[Email] = []
+        with self._lock:
+            for email in set(emails):
+                account_id = self._ids_by_email.get(email)
+                cached = self._get(account_id) if account_id is not None else None
+                if cached is None:
+                    missing.append(email)
+                else:
+                    found[email] = cached
+            self._misses += len(missing)
+
+        if missing:
+            loaded = self._load_many(lambda: self._repository.find_by_emails(missing).values())
+            found.update((account.email, account) for account in loaded)
+        return found
+
+    def iter_accounts(
+        self, created_from: datetime | None = None, created_until: datetime | None = None
+    ) -> Iterator[Account]:
+        """Stream accounts from the inner repository (bulk reads bypass the cache)."""
+        return self._repository.iter_accounts(created_from, created_until)
+
+    def find_page(
+        self,
+        after: AccountId | None,
+        limit: int,
+        created_from: datetime | None = None,
+        created_until: datetime | None = None,
+    ) -> list[Account]:
+        """Find a page of accounts from the inner repository (listings bypass the cache)."""
+        return self._repository.find_page(after, limit, created_from, created_until)
+
+    def invalidate(self, account_id: AccountId) -> None:
+        """
+        Drop the cached entry of an account (if any).
+
+        Called by save() and by the account_changed notification listener.
+
+        Args:
+            account_id: Account whose row changed
+        """
+        with self._lock:
+            self._generation += 1
+            if self._loads_in_flight:
+                self._invalidated_at[account_id] = self._generation
+            if self._remove(account_id):
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry (e.g. after missing change notifications)."""
+        with self._lock:
+            self._generation += 1
+            self._cleared_at = self._generation
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._ids_by_email.clear()
+
+    def stats(self) -> AccountCacheStats:
+        """
+        Return a snapshot of cache metrics.
+
+        Returns:
+            AccountCacheStats: Size, hits, misses, evictions and invalidations
+        """
+        with self._lock:
+            return AccountCacheStats(
+                size=len(self._entries),
+                max_size=self._max_size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    def _load(self, lookup: Callable[[], Account | None]) -> Account | None:
+        """Run lookup on the inner repository and cache the result if still valid."""
+        if self._db.in_transaction():
+            return lookup()
+
+        with self._lock:
+            self._loads_in_flight += 1
+            started_at = self._generation
+
+        account: Account | None = None
+        try:
+            account = lookup()
+        finally:
+            with self._lock:
+                self._loads_in_flight -= 1
+                if account is not None:
+                    self._store(account, started_at)
+                if not self._loads_in_flight:
+                    self._invalidated_at.clear()
+
+        return copy.copy(account) if account is not None else None
+
+    def _load_many(self, lookup: Callable[[], Iterable[Account]]) -> list[Account]:
+        """Batch counterpart of _load(): cache every loaded account still valid."""
+        if self._db.in_transaction():
+            return list(lookup())
+
+        with self._lock:
+            self._loads_in_flight += 1
+            started_at = self._generation
+
+        accounts: list[Account] = []
+        try:
+            accounts = list(lookup())
+        finally:
+            with self._lock:
+                self._loads_in_flight -= 1
+                for account in accounts:
+                    self._store(account, started_at)
+                if not self._loads_in_flight:
+                    self._invalidated_at.clear()
+
+        return [copy.copy(account) for account in accounts]
+
+    def _store(self, account: Account, started_at: int) -> None:
+        """
+        Cache a loaded account unless it was invalidated while loading.
+
+        The row read by the load may predate a change whose notification has
+        already been processed; caching it would keep it stale until the TTL.
+        Caller must hold the lock.
+        """
+        if self._cleared_at > started_at:
+            return
+        if self._invalidated_at.get(account.id, 0) > started_at:
+            return
+        self._put(account)
+
+    def _get(self, account_id: AccountId) -> Account | None:
+        """Return a copy of a fresh cached account (caller holds the lock)."""
+        entry = self._entries.get(account_id)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= self._clock():
+            self._remove(account_id)
+            return None
+
+        self._entries.move_to_end(account_id)
+        self._hits += 1
+        return copy.copy(entry.account)
+
+    def _put(self, account: Account) -> None:
+        """Insert or replace an entry, evicting the LRU one (caller holds the lock)."""
+        self._remove(account.id)
+        self._entries[account.id] = _Entry(copy.copy(account), self._clock() + self._ttl)
+        self._ids_by_email[account.email] = account.id
+
+        while len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, account_id: AccountId) -> bool:
+        """Remove an entry and its email index (caller holds the lock)."""
+        entry = self._entries.pop(account_id, None)
+        if entry is None:
+            return False
+
+        if self._ids_by_email.get(entry.account.email) == account_id:
+            del self._ids_by_email[entry.account.email]
+        return True
@@ -0,0 +1,212 @@
+"""
+In-memory implementation of AccountActivationRepository.
+
+Activation codes live for 60 seconds (AccountActivation.EXPIRATION_SECONDS),
+yet the PostgreSQL repository writes each one durably (WAL, index updates)
+and never deletes it. This module keeps codes in a process-local dictionary
+instead, and drops each one shortly after it expires, driven by a
+hierarchical timing wheel.
+
+Design Decisions:
+    - Dictionary keyed by AccountId: One code per account (save() replaces)
+    - Timing wheel expiry: Memory bounded by live codes, no periodic scan
+    - Retention after expiry: Expired codes are kept for a grace period so
+      activation still reports CODE_EXPIRED (not CODE_NOT_FOUND), as the
+      PostgreSQL repository does
+    - Lazy advance: The wheel is advanced on every call, no timer thread
+      (fork-safe, nothing to start or stop)
+    - Account activation through AccountRepository: The account row stays
+      in PostgreSQL; it is loaded and saved through the domain entity
+
+Limitations:
+    - Codes are lost on restart (users request a new one)
+    - Process-local: Only valid with a single application process (one
+      uvicorn worker), or with sticky routing of registration and
+      activation of one account to the same process
+
+Configuration:
+    ACCOUNT_ACTIVATION_STORE=memory selects this repository (AccountModule)
+
+Architecture:
+    - Implements: AccountActivationRepository (domain layer interface)
+    - Dependencies: AccountRepository (injected), TimingWheel
+    - DI: Provided by AccountModule when selected (singleton, holds the codes)
+
+Usage Example:
+    ```python
+    repository = InMemoryAccountActivationRepository(account_repository)
+
+    repository.save(AccountActivation.create_for_account(account.id))
+    repository.activate_with_code(account.id, ActivationCode("1234"))
+    ```
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+
+from src.account.domain.entities.account_activation import AccountActivation
+from src.account.domain.repositories.account_activation_repository import (
+    AccountActivationRepository,
+)
+from src.account.domain.repositories.account_repository import AccountRepository
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.activation_code import ActivationCode
+from src.account.domain.value_objects.activation_outcome import ActivationOutcome
+from src.shared.infrastructure.scheduling.timing_wheel import TimingWheel
+
+
+class InMemoryAccountActivationRepository(AccountActivationRepository):
+    """
+    Process-local AccountActivation store with timing wheel expiry.
+
+    Thread Safety:
+        - Codes and wheel guarded by one lock
+        - Account lookup and save (I/O) run outside the lock
+    """
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        retention: float = AccountActivation.EXPIRATION_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            account_repository: Repository used to activate accounts
+            retention: Seconds an expired code is kept (reported CODE_EXPIRED)
+            clock: Wall clock in seconds (compared with expires_at timestamps)
+        """
+        self._account_repository = account_repository
+        self._retention = retention
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._activations: dict[AccountId, AccountActivation] = {}
+        self._wheel: TimingWheel[AccountId] = TimingWheel(tick=1.0, start=clock())
+
+    def save(self, activation: AccountActivation) -> None:
+        """
+        Store activation, replacing any previous code of the account.
+
+        Args:
+            activation: AccountActivation entity to store
+
+        Note:
+            Unlike the PostgreSQL repository, the account is not checked
+            (no foreign key): codes of unknown accounts simply expire.
+        """
+        with self._lock:
+            self._expire()
+            self._store(activation)
+
+    def save_if_absent(self, activation: AccountActivation) -> AccountActivation:
+        """
+        Store activation unless the account already has an unexpired code.
+
+        Returns:
+            AccountActivation: The stored unexpired activation, or activation
+        """
+        with self._lock:
+            self._expire()
+            stored = self._activations.get(activation.account_id)
+            if stored is not None and stored.expires_at.timestamp() > self._clock():
+                return stored
+            self._store(activation)
+            return activation
+
+    def save_many(self, activations: Sequence[AccountActivation]) -> None:
+        """
+        Store several activations under one lock acquisition.
+
+        Args:
+            activations: AccountActivation entities to store (last one wins
+                for an account listed twice)
+        """
+        with self._lock:
+            self._expire()
+            for activation in activations:
+                self._store(activation)
+
+    def find_by_account_id(self, account_id: AccountId) -> AccountActivation | None:
+        """
+        Find activation by account ID.
+
+        Returns:
+            AccountActivation if stored (expired codes within retention
+            included), None otherwise
+        """
+        with self._lock:
+            self._expire()
+            return self._activations.get(account_id)
+
+    def find_by_account_ids(
+        self, account_ids: Iterable[AccountId]
+    ) -> dict[AccountId, AccountActivation]:
+        """
+        Find the activations of several accounts.
+
+        Returns:
+            Stored activations keyed by AccountId (accounts without one absent)
+        """
+        with self._lock:
+            self._expire()
+            return {
+                account_id: self._activations[account_id]
+                for account_id in account_ids
+                if account_id in self._activations
+            }
+
+    def activate_with_code(self, account_id: AccountId, code: ActivationCode) -> ActivationOutcome:
+        """
+        Validate the stored code, then activate the account.
+
+        Business rules are evaluated in the same order as the PostgreSQL
+        repository. The account is activated through the Account entity and
+        saved via AccountRepository (joins the active UnitOfWork).
+
+        Args:
+            account_id: AccountId of the account to activate
+            code: ActivationCode provided by the user
+
+        Returns:
+            ActivationOutcome: ACTIVATED or the first failed business rule
+        """
+        account = self._account_repository.find_by_id(account_id)
+        if account is None:
+            return ActivationOutcome.ACCOUNT_NOT_FOUND
+
+        activation = self.find_by_account_id(account_id)
+        if activation is None:
+            return ActivationOutcome.CODE_NOT_FOUND
+
+        if activation.expires_at.timestamp() <= self._clock():
+            return ActivationOutcome.CODE_EXPIRED
+
+        if not activation.code.matches(code.code):
+            return ActivationOutcome.CODE_MISMATCH
+
+        if not account.is_activated:
+            account.activate()
+            self._account_repository.save(account)
+
+        return ActivationOutcome.ACTIVATED
+
+    def __len__(self) -> int:
+        """Number of stored codes (live or within retention)."""
+        with self._lock:
+            self._expire()
+            return len(self._activations)
+
+    def _expire(self) -> None:
+        """Drop codes past expiry + retention (caller holds the lock)."""
+        for account_id in self._wheel.advance(self._clock()):
+            del self._activations[account_id]
+
+    def _store(self, activation: AccountActivation) -> None:
+        """Store activation and (re)schedule its removal (caller holds the lock)."""
+        self._activations[activation.account_id] = activation
+        self._wheel.schedule(
+            activation.account_id, activation.expires_at.timestamp() + self._retention
+        )
@@ -8,15 +8,20 @@ pattern from Domain-Driven Design.
 Design Decisions:
     - Raw SQL: No ORM magic, explicit queries for clarity
     - Parameterized queries: %s placeholders prevent SQL injection
-    - Auto-commit: Repository commits automatically after each operation
+    - Auto-commit: Writes commit automatically unless a UnitOfWork is active
     - Value object preservation: Uses mapper to maintain type safety
     - Connection pool: Injected DatabaseConnectionFactory for testability
 
 Architecture:
     - Implements: AccountActivationRepository (domain layer interface)
     - Dependencies: DatabaseConnectionFactory (injected), account_activation_mapper
-    - SQL: INSERT ... ON CONFLICT for save(), SELECT for find_by_account_id()
-    - Transactions: Each repository method commits automatically
+    - SQL: INSERT ... ON CONFLICT for save() and save_if_absent(), SELECT for
+      find_by_account_id(), conditional UPDATE for activate_with_code()
+    - Transactions: Writes run in DatabaseConnectionFactory.transaction()
+      (standalone commit, or joined to the active UnitOfWork)
+    - Reads: read_only_connection() (autocommit, no BEGIN/ROLLBACK round trips)
+    - Batches: save_many() sends multi-row upserts (execute_values) in one
+      transaction; find_by_account_ids() uses a single = ANY(%s) query
 
 Error Handling:
     - DatabaseError: Propagated to application layer for 500 response
@@ -41,19 +46,27 @@ Usage Example:
     ```
 """
 
+from collections.abc import Iterable, Sequence
+
 from injector import inject
+from psycopg2.extras import execute_values
 
 from src.account.domain.entities.account_activation import AccountActivation
 from src.account.domain.repositories.account_activation_repository import (
     AccountActivationRepository,
 )
 from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.activation_code import ActivationCode
+from src.account.domain.value_objects.activation_outcome import ActivationOutcome
 from src.account.infrastructure.persistence.account_activation_mapper import (
     to_domain,
     to_persistence,
 )
 from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
 
+# Rows per multi-row statement sent by save_many() (execute_values page size)
+BATCH_PAGE_SIZE = 1000
+
 
 class PostgresAccountActivationRepository(AccountActivationRepository):
     """
@@ -63,18 +76,21 @@ class PostgresAccountActivationRepository(AccountActivationRepository):
     Connection pool is injected for testability and resource management.
 
     Thread Safety:
-        - DatabaseConnectionFactory uses ThreadedConnectionPool
+        - DatabaseConnectionFactory uses BlockingConnectionPool
         - Safe for concurrent requests in FastAPI
-        - Each operation acquires connection from pool
+        - Each operation acquires connection from pool (waits up to
+          DATABASE_POOL_TIMEOUT seconds when every connection is busy)
 
     Transaction Management:
-        - Repository methods commit automatically after successful operations
-        - Each repository call is an independent transaction
+        - Write methods commit automatically after successful operations
+        - Inside a UnitOfWork, writes join the shared transaction instead
+          (single commit at the end of the command)
         - Simplifies application layer (no explicit transaction management)
 
     SQL Queries:
         - UPSERT: Creates or updates activation with account_id, code, timestamps
         - SELECT: Retrieves activation by account_id
+        - CTE + UPDATE: Validates code and activates account in one round trip
         - Constraints: PRIMARY KEY on account_id, FK to account.id
 
     Dependency Injection:
@@ -109,7 +125,7 @@ class PostgresAccountActivationRepository(AccountActivationRepository):
 
         Transaction:
             - Commits automatically after successful UPSERT
-            - Each repository call is an independent transaction
+            - Joins the active UnitOfWork instead, if any
             - UPSERT is atomic (no race condition between INSERT and UPDATE)
 
         Example:
@@ -119,7 +135,7 @@ class PostgresAccountActivationRepository(AccountActivationRepository):
             >>> new_activation = AccountActivation.create_for_account(account_id)
             >>> repository.save(new_activation)  # UPDATE (same account_id, new code)
         """
-        with self._db.connection() as conn:
+        with self._db.transaction() as conn:
             with conn.cursor() as cursor:
                 row = to_persistence(activation)
                 cursor.execute(
@@ -140,8 +156,66 @@ class PostgresAccountActivationRepository(AccountActivationRepository):
                         row["expires_at"],
                     ),
                 )
-                # Commit transaction immediately after successful UPSERT
-                conn.commit()
+
+    def save_if_absent(self, activation: AccountActivation) -> AccountActivation:
+        """
+        Insert activation unless the account already has an unexpired code.
+
+        Args:
+            activation: AccountActivation entity to persist if needed
+
+        Returns:
+            AccountActivation: The stored unexpired activation, or activation
+
+        Raises:
+            psycopg2.ForeignKeyViolation: If account_id doesn't exist in account table
+            psycopg2.DatabaseError: If database operation fails
+
+        SQL:
+            The upsert only replaces an expired code (DO UPDATE ... WHERE), so
+            RETURNING yields no row when an unexpired code is kept. The
+            conflicting row stays locked until the end of the transaction:
+            the follow-up SELECT reads the code that was kept.
+        """
+        row = to_persistence(activation)
+        with self._db.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO account_activation (
+                        account_id, code, created_at, expires_at
+                    )
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (account_id) DO UPDATE SET
+                        code = EXCLUDED.code,
+                        created_at = EXCLUDED.created_at,
+                        expires_at = EXCLUDED.expires_at
+                    WHERE account_activation.expires_at <= NOW()
+                    RETURNING account_id
+                    """,
+                    (
+                        row["account_id"],
+                        row["code"],
+                        row["created_at"],
+                        row["expires_at"],
+                    ),
+                )
+                if cursor.fetchone() is not None:
+                    return activation
+
+                cursor.execute(
+                    """
+                    SELECT account_id, code, created_at, expires_at
+                    FROM account_activation
+                    WHERE account_id = %s
+                    """,
+                    (row["account_id"],),
+                )
+                stored = cursor.fetchone()
+                assert stored is not None  # Locked by the upsert: cannot be gone
+
+                column_names = ["account_id", "code", "created_at", "expires_at"]
+                return to_domain(dict(zip(column_names, stored, strict=True)))
 
     def find_by_account_id(self, account_id: AccountId) -> AccountActivation | None:
         """
@@ -175,7 +249,7 @@ class PostgresAccountActivationRepository(AccountActivationRepository):
             >>> else:
             ...     print(f"Code: {activation.code.value}")
         """
-        with self._db.connection() as conn:
+        with self._db.read_only_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     """
@@ -183,7 +257,7 @@ class PostgresAccountActivationRepository(AccountActivationRepository):
                     FROM account_activation
                     WHERE account_id = %s
                     """,
-                    (str(account_id.value),),
+                    (account_id.value,),
                 )
                 row_tuple = cursor.fetchone()
 
@@ -196,3 +270,177 @@ class PostgresAccountActivationRepository(AccountActivationRepository):
                 row_dict = dict(zip(column_names, row_tuple, strict=False))
 
                 return to_domain(row_dict)
+
+    def activate_with_code(self, account_id: AccountId, code: ActivationCode) -> ActivationOutcome:
+        """
+        Validate activation code and activate account in a single statement.
+
+        Replaces the find account / find activation / save account sequence
+        (three round trips, three pooled connections) with one query: the
+        account is LEFT JOINed to its activation, and a data-modifying CTE
+        flips is_activated only when the code matches and has not expired.
+        The rule flags are returned alongside so every failure stays
+        distinguishable.
+
+        Args:
+            account_id: AccountId of the account to activate
+            code: ActivationCode provided by the user
+
+        Returns:
+            ActivationOutcome: ACTIVATED or the first failed business rule
+
+        Raises:
+            psycopg2.DatabaseError: If database operation fails
+
+        SQL:
+            WITH target AS (SELECT ... FROM account LEFT JOIN account_activation ...),
+                 activated AS (UPDATE account SET is_activated = TRUE ... RETURNING id)
+            SELECT has_code, is_expired, code_matches FROM target
+
+        Note:
+            - No row returned: account does not exist
+            - Expiration is evaluated with the database clock (NOW())
+            - Already active accounts are not rewritten (no-op UPDATE skipped)
+            - Only is_activated and updated_at are written (email and
+              password_hash are left untouched)
+
+        Example:
+            >>> outcome = repository.activate_with_code(account_id, ActivationCode("1234"))
+            >>> outcome is ActivationOutcome.ACTIVATED
+            True
+        """
+        with self._db.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    WITH target AS (
+                        SELECT
+                            account.id,
+                            account.is_activated,
+                            activation.account_id IS NOT NULL AS has_code,
+                            COALESCE(activation.expires_at <= NOW(), FALSE) AS is_expired,
+                            COALESCE(activation.code = %s, FALSE) AS code_matches
+                        FROM account
+                        LEFT JOIN account_activation AS activation
+                            ON activation.account_id = account.id
+                        WHERE account.id = %s
+                    ),
+                    activated AS (
+                        UPDATE account
+                        SET is_activated = TRUE, updated_at = NOW()
+                        FROM target
+                        WHERE account.id = target.id
+                            AND target.has_code
+                            AND NOT target.is_expired
+                            AND target.code_matches
+                            AND NOT target.is_activated
+                        RETURNING account.id
+                    )
+                    SELECT has_code, is_expired, code_matches
+                    FROM target
+                    """,
+                    (code.code, account_id.value),
+                )
+                row_tuple = cursor.fetchone()
+
+                if row_tuple is None:
+                    return ActivationOutcome.ACCOUNT_NOT_FOUND
+
+                has_code, is_expired, code_matches = row_tuple
+
+                if not has_code:
+                    return ActivationOutcome.CODE_NOT_FOUND
+
+                if is_expired:
+                    return ActivationOutcome.CODE_EXPIRED
+
+                if not code_matches:
+                    return ActivationOutcome.CODE_MISMATCH
+
+                return ActivationOutcome.ACTIVATED
+
+    def save_many(self, activations: Sequence[AccountActivation]) -> None:
+        """
+        Persist several activations in one transaction (multi-row UPSERT).
+
+        Args:
+            activations: AccountActivation entities to persist
+
+        Raises:
+            psycopg2.ForeignKeyViolation: If an account_id doesn't exist in
+                account table (whole batch rolled back)
+            psycopg2.DatabaseError: If database operation fails
+
+        Transaction:
+            - Single commit for the whole batch
+            - Joins the active UnitOfWork instead, if any
+
+        Note:
+            One row per account: ON CONFLICT DO UPDATE cannot touch the same
+            row twice in one statement, so the last activation of an account
+            wins (same result as successive save() calls).
+        """
+        latest = {activation.account_id: activation for activation in activations}
+        if not latest:
+            return
+
+        rows = [to_persistence(activation) for activation in latest.values()]
+        with self._db.transaction() as conn:
+            with conn.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO account_activation (
+                        account_id, code, created_at, expires_at
+                    )
+                    VALUES %s
+                    ON CONFLICT (account_id) DO UPDATE SET
+                        code = EXCLUDED.code,
+                        created_at = EXCLUDED.created_at,
+                        expires_at = EXCLUDED.expires_at
+                    """,
+                    [
+                        (row["account_id"], row["code"], row["created_at"], row["expires_at"])
+                        for row in rows
+                    ],
+                    page_size=BATCH_PAGE_SIZE,
+                )
+
+    def find_by_account_ids(
+        self, account_ids: Iterable[AccountId]
+    ) -> dict[AccountId, AccountActivation]:
+        """
+        Find the activations of several accounts in one query.
+
+        Args:
+            account_ids: AccountId value objects to search for
+
+        Returns:
+            Found activations keyed by AccountId (expired ones included)
+
+        SQL:
+            SELECT account_id, code, created_at, expires_at
+            FROM account_activation
+            WHERE account_id = ANY(%s)
+        """
+        ids = list({account_id.value for account_id in account_ids})
+        if not ids:
+            return {}
+
+        with self._db.read_only_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT account_id, code, created_at, expires_at
+                    FROM account_activation
+                    WHERE account_id = ANY(%s)
+                    """,
+                    (ids,),
+                )
+                column_names = ["account_id", "code", "created_at", "expires_at"]
+                activations = [
+                    to_domain(dict(zip(column_names, row_tuple, strict=True)))
+                    for row_tuple in cursor.fetchall()
+                ]
+
+        return {activation.account_id: activation for activation in activations}
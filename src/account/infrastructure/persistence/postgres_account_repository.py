@@ -8,15 +8,31 @@ pattern from Domain-Driven Design.
 Design Decisions:
     - Raw SQL: No ORM magic, explicit queries for clarity
     - Parameterized queries: %s placeholders prevent SQL injection
-    - Auto-commit: Repository commits automatically after each operation
+    - Auto-commit: Writes commit automatically unless a UnitOfWork is active
     - Value object preservation: Uses mapper to maintain type safety
     - Connection pool: Injected DatabaseConnectionFactory for testability
 
 Architecture:
     - Implements: AccountRepository (domain layer interface)
     - Dependencies: DatabaseConnectionFactory (injected), account_mapper
-    - SQL: INSERT for create(), SELECT for find_by_email()
-    - Transactions: Each repository method commits automatically
+    - SQL: INSERT (new account) or UPDATE of changed columns only for
+      save(), INSERT ... ON CONFLICT DO NOTHING for create_if_email_absent(),
+      SELECT for find_by_email()
+    - Minimal updates: save() of a loaded account writes its changed columns
+      and updated_at only (less WAL, email index untouched, HOT updates
+      possible). PostgreSQL activation does not go through save(): it is the
+      single statement of PostgresAccountActivationRepository.activate_with_code()
+    - Transactions: Writes run in DatabaseConnectionFactory.transaction()
+      (standalone commit, or joined to the active UnitOfWork)
+    - Reads: read_only_connection() (autocommit, no BEGIN/ROLLBACK round trips)
+    - Batches: save_many() sends multi-row statements (execute_values) in one
+      transaction; find_by_ids()/find_by_emails() use a single = ANY(%s) query
+    - Streaming: iter_accounts()/iter_rows() read through a server-side (named)
+      cursor, STREAM_ITERSIZE rows per round trip (constant client memory)
+    - Pagination: find_page() is a keyset range scan of the primary key
+      (UUID v7 ids are time-ordered)
+    - Time windows (find_page(), iter_rows()) become id boundaries: no
+      created_at index needed
 
 Error Handling:
     - IntegrityError (UNIQUE violation): Propagated to application layer
@@ -41,7 +57,16 @@ Usage Example:
     ```
 """
 
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
 from injector import inject
+from psycopg2 import sql
+from psycopg2.extensions import cursor as Cursor  # noqa: N812
+from psycopg2.extras import execute_values
 
 from src.account.domain.entities.account import Account
 from src.account.domain.repositories.account_repository import AccountRepository
@@ -50,9 +75,18 @@ from src.account.domain.value_objects.email import Email
 from src.account.infrastructure.persistence.account_mapper import (
     to_domain,
     to_persistence,
+    to_persistence_changes,
 )
 from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
 
+# Rows per multi-row statement sent by save_many() (execute_values page size)
+BATCH_PAGE_SIZE = 1000
+
+# Rows fetched per round trip by iter_rows()/iter_accounts() (named cursor itersize)
+STREAM_ITERSIZE = 2000
+
+_ACCOUNT_COLUMNS = ["id", "email", "password_hash", "is_activated", "created_at", "updated_at"]
+
 
 class PostgresAccountRepository(AccountRepository):
     """
@@ -62,17 +96,21 @@ class PostgresAccountRepository(AccountRepository):
     Connection pool is injected for testability and resource management.
 
     Thread Safety:
-        - DatabaseConnectionFactory uses ThreadedConnectionPool
+        - DatabaseConnectionFactory uses BlockingConnectionPool
         - Safe for concurrent requests in FastAPI
-        - Each operation acquires connection from pool
+        - Each operation acquires connection from pool (waits up to
+          DATABASE_POOL_TIMEOUT seconds when every connection is busy)
 
     Transaction Management:
-        - Repository methods commit automatically after successful operations
-        - Each repository call is an independent transaction
+        - Write methods commit automatically after successful operations
+        - Inside a UnitOfWork, writes join the shared transaction instead
+          (single commit at the end of the command)
         - Simplifies application layer (no explicit transaction management)
 
     SQL Queries:
-        - UPSERT: Creates or updates account with UUID v7, email, password hash
+        - INSERT: Creates account with UUID v7, email, password hash
+        - UPDATE: Writes changed columns only (Account.changed_fields)
+        - INSERT ON CONFLICT (email) DO NOTHING: Race-free registration
         - SELECT: Retrieves account by email (case-insensitive via Email VO)
         - Constraints: UNIQUE on email enforced by database
 
@@ -96,31 +134,105 @@ class PostgresAccountRepository(AccountRepository):
         """
         Persist account in the database (insert or update).
 
-        Uses UPSERT pattern: inserts if account.id doesn't exist, updates otherwise.
-        Email uniqueness constraint is preserved (will raise error if email conflict).
+        New accounts are inserted. Existing accounts only have their changed
+        columns updated (Account.changed_fields), plus updated_at; nothing is
+        sent when no field changed. The account is marked persisted afterwards.
+
+        With the PostgreSQL activation store, activation never calls save()
+        (activate_with_code() updates the row itself); the minimal UPDATE
+        serves the in-memory activation store, which activates a loaded
+        Account and saves it. See benchmarks/bench_account_activation_wal.py.
 
         Args:
             account: Account entity to persist
 
         Raises:
-            psycopg2.IntegrityError: If email already exists for a different account ID
+            psycopg2.IntegrityError: If email already exists for a different
+                account ID, or a new account's ID already exists
             psycopg2.DatabaseError: If database operation fails
 
         Transaction:
-            - Commits automatically after successful UPSERT
-            - Each repository call is an independent transaction
-            - UPSERT is atomic (no race condition between INSERT and UPDATE)
-            - For complex workflows requiring multiple operations in one transaction,
-              consider implementing Unit of Work pattern
+            - Commits automatically after successful INSERT/UPDATE
+            - Joins the active UnitOfWork instead, if any
+            - Account is marked persisted when the statement succeeds: after
+              a UnitOfWork rollback, reload it instead of saving it again
 
         Example:
             >>> account = Account.create(email, password)
-            >>> repository.save(account)  # INSERT (new id)
+            >>> repository.save(account)  # INSERT (new account)
             >>>
             >>> account.activate()
-            >>> repository.save(account)  # UPDATE (same id, is_activated = True)
+            >>> repository.save(account)  # UPDATE account SET is_activated, updated_at
+            >>> repository.save(account)  # No-op (no changes)
         """
-        with self._db.connection() as conn:
+        if account.is_new:
+            self._insert(account)
+        elif account.changed_fields:
+            self._update(account)
+
+        account.mark_persisted()
+
+    def _insert(self, account: Account) -> None:
+        """INSERT a new account (IntegrityError on duplicate id or email)."""
+        with self._db.transaction() as conn:
+            with conn.cursor() as cursor:
+                row = to_persistence(account)
+                cursor.execute(
+                    """
+                    INSERT INTO account (
+                        id, email, password_hash, is_activated, created_at, updated_at
+                    )
+                    VALUES (%s, %s, %s, %s, NOW(), NOW())
+                    """,
+                    (
+                        row["id"],
+                        row["email"],
+                        row["password_hash"],
+                        row["is_activated"],
+                    ),
+                )
+
+    def _update(self, account: Account) -> None:
+        """UPDATE the changed columns (and updated_at) of an existing account."""
+        changes = to_persistence_changes(account)
+        query = sql.SQL("UPDATE account SET {}, updated_at = NOW() WHERE id = %s").format(
+            sql.SQL(", ").join(
+                sql.SQL("{} = %s").format(sql.Identifier(column)) for column in changes
+            )
+        )
+
+        with self._db.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, (*changes.values(), account.id.value))
+
+    def create_if_email_absent(self, account: Account) -> bool:
+        """
+        Insert account unless the email is already registered.
+
+        Single round trip: the UNIQUE constraint on email arbitrates between
+        concurrent registrations, so a lost race returns False instead of
+        raising IntegrityError.
+
+        Args:
+            account: New Account entity to persist
+
+        Returns:
+            bool: True if inserted, False if the email already exists
+
+        Raises:
+            psycopg2.DatabaseError: If database operation fails
+
+        SQL:
+            INSERT INTO account (...) VALUES (...)
+            ON CONFLICT (email) DO NOTHING
+            RETURNING id
+
+        Transaction:
+            - Commits automatically (also when nothing was inserted)
+            - Joins the active UnitOfWork instead, if any
+            - Account is marked persisted when inserted
+        """
+        with self._db.transaction() as conn:
             with conn.cursor() as cursor:
                 row = to_persistence(account)
                 cursor.execute(
@@ -129,11 +241,8 @@ class PostgresAccountRepository(AccountRepository):
                         id, email, password_hash, is_activated, created_at, updated_at
                     )
                     VALUES (%s, %s, %s, %s, NOW(), NOW())
-                    ON CONFLICT (id) DO UPDATE SET
-                        email = EXCLUDED.email,
-                        password_hash = EXCLUDED.password_hash,
-                        is_activated = EXCLUDED.is_activated,
-                        updated_at = NOW()
+                    ON CONFLICT (email) DO NOTHING
+                    RETURNING id
                     """,
                     (
                         row["id"],
@@ -142,12 +251,11 @@ class PostgresAccountRepository(AccountRepository):
                         row["is_activated"],
                     ),
                 )
-                # Commit transaction immediately after successful UPSERT
-                # Note: For production systems with complex workflows requiring
-                # multiple operations in one transaction (e.g., create account +
-                # emit event + save activation code), consider implementing
-                # Unit of Work pattern or TransactionManager abstraction.
-                conn.commit()
+                created = cursor.fetchone() is not None
+
+        if created:
+            account.mark_persisted()
+        return created
 
     def find_by_email(self, email: Email) -> Account | None:
         """
@@ -179,7 +287,7 @@ class PostgresAccountRepository(AccountRepository):
             >>> else:
             ...     print(f"Found: {account.email}")
         """
-        with self._db.connection() as conn:
+        with self._db.read_only_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     """
@@ -240,7 +348,7 @@ class PostgresAccountRepository(AccountRepository):
             >>> account.activate()
             >>> repository.save(account)
         """
-        with self._db.connection() as conn:
+        with self._db.read_only_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     """
@@ -248,7 +356,7 @@ class PostgresAccountRepository(AccountRepository):
                     FROM account
                     WHERE id = %s
                     """,
-                    (str(account_id.value),),
+                    (account_id.value,),
                 )
                 row_tuple = cursor.fetchone()
 
@@ -268,3 +376,295 @@ class PostgresAccountRepository(AccountRepository):
                 row_dict = dict(zip(column_names, row_tuple, strict=False))
 
                 return to_domain(row_dict)
+
+    def save_many(self, accounts: Sequence[Account]) -> None:
+        """
+        Persist several accounts in one transaction.
+
+        New accounts are inserted with multi-row INSERT statements; existing
+        accounts with changes are updated with UPDATE ... FROM (VALUES ...),
+        one statement per set of changed columns. Unchanged accounts are
+        skipped. Every account is marked persisted afterwards.
+
+        Args:
+            accounts: Account entities to persist
+
+        Raises:
+            psycopg2.IntegrityError: If an email already exists for a different
+                account ID (whole batch rolled back)
+            psycopg2.DatabaseError: If database operation fails
+
+        Transaction:
+            - Single commit for the whole batch
+            - Joins the active UnitOfWork instead, if any
+
+        Example:
+            >>> accounts = [Account.create(email, password) for email in emails]
+            >>> repository.save_many(accounts)  # INSERT ... VALUES (...), (...), ...
+        """
+        latest = {account.id: account for account in accounts}  # Last occurrence wins
+        new = [account for account in latest.values() if account.is_new]
+        changed = [
+            account for account in latest.values() if not account.is_new and account.changed_fields
+        ]
+
+        if new or changed:
+            with self._db.transaction() as conn:
+                with conn.cursor() as cursor:
+                    if new:
+                        self._insert_many(cursor, new)
+                    if changed:
+                        self._update_many(cursor, changed)
+
+        for account in accounts:
+            account.mark_persisted()
+
+    def find_by_ids(self, account_ids: Iterable[AccountId]) -> dict[AccountId, Account]:
+        """
+        Find several accounts by ID in one query.
+
+        Args:
+            account_ids: AccountId value objects to search for
+
+        Returns:
+            Found accounts keyed by AccountId (unknown ids are absent)
+
+        SQL:
+            SELECT id, email, password_hash, is_activated, created_at, updated_at
+            FROM account
+            WHERE id = ANY(%s)
+        """
+        ids = list({account_id.value for account_id in account_ids})
+        if not ids:
+            return {}
+
+        accounts = self._find_many("id = ANY(%s)", ids)
+        return {account.id: account for account in accounts}
+
+    def find_by_emails(self, emails: Iterable[Email]) -> dict[Email, Account]:
+        """
+        Find several accounts by email in one query.
+
+        Args:
+            emails: Email value objects (already normalized to lowercase)
+
+        Returns:
+            Found accounts keyed by Email (unknown emails are absent)
+
+        SQL:
+            SELECT id, email, password_hash, is_activated, created_at, updated_at
+            FROM account
+            WHERE email = ANY(%s)
+        """
+        values = list({email.value for email in emails})
+        if not values:
+            return {}
+
+        accounts = self._find_many("email = ANY(%s)", values)
+        return {account.email: account for account in accounts}
+
+    def _find_many(self, condition: str, values: list[UUID] | list[str]) -> list[Account]:
+        """SELECT accounts matching condition (one array parameter)."""
+        with self._db.read_only_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT id, email, password_hash, is_activated, created_at, updated_at
+                    FROM account
+                    WHERE {condition}
+                    """,
+                    (values,),
+                )
+                return [
+                    to_domain(dict(zip(_ACCOUNT_COLUMNS, row_tuple, strict=True)))
+                    for row_tuple in cursor.fetchall()
+                ]
+
+    @staticmethod
+    def _insert_many(cursor: Cursor, accounts: list[Account]) -> None:
+        """Multi-row INSERT of new accounts."""
+        rows = [to_persistence(account) for account in accounts]
+        execute_values(
+            cursor,
+            """
+            INSERT INTO account (
+                id, email, password_hash, is_activated, created_at, updated_at
+            )
+            VALUES %s
+            """,
+            [(row["id"], row["email"], row["password_hash"], row["is_activated"]) for row in rows],
+            template="(%s, %s, %s, %s, NOW(), NOW())",
+            page_size=BATCH_PAGE_SIZE,
+        )
+
+    @staticmethod
+    def _update_many(cursor: Cursor, accounts: list[Account]) -> None:
+        """UPDATE ... FROM (VALUES ...) of changed columns, grouped by column set."""
+        groups: dict[tuple[str, ...], list[tuple[UUID | str | bool, ...]]] = {}
+        for account in accounts:
+            changes = to_persistence_changes(account)
+            groups.setdefault(tuple(changes), []).append((account.id.value, *changes.values()))
+
+        for columns, rows in groups.items():
+            query = sql.SQL(
+                "UPDATE account SET {}, updated_at = NOW() "
+                "FROM (VALUES %s) AS changed (id, {}) WHERE account.id = changed.id"
+            ).format(
+                sql.SQL(", ").join(
+                    sql.SQL("{0} = changed.{0}").format(sql.Identifier(column))
+                    for column in columns
+                ),
+                sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+            )
+            execute_values(cursor, query, rows, page_size=BATCH_PAGE_SIZE)
+
+    def iter_accounts(
+        self,
+        created_from: datetime | None = None,
+        created_until: datetime | None = None,
+        itersize: int = STREAM_ITERSIZE,
+    ) -> Iterator[Account]:
+        """
+        Stream accounts through a server-side cursor.
+
+        Args:
+            created_from: Only ids generated at or after this instant
+            created_until: Only ids generated before this instant
+            itersize: Rows fetched per round trip
+
+        Yields:
+            Account entities, ordered by id
+
+        Note:
+            See iter_rows(): the pooled connection is held until the
+            iterator is exhausted or closed.
+        """
+        for row_tuple in self.iter_rows(created_from, created_until, itersize):
+            yield to_domain(dict(zip(_ACCOUNT_COLUMNS, row_tuple, strict=True)))
+
+    def iter_rows(
+        self,
+        created_from: datetime | None = None,
+        created_until: datetime | None = None,
+        itersize: int = STREAM_ITERSIZE,
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Stream raw account rows through a server-side cursor.
+
+        A client-side cursor transfers the whole result set before the first
+        row is returned. A named cursor keeps it on the server and fetches
+        itersize rows per round trip, so client memory stays constant however
+        many accounts are read. Raw rows skip the domain mapping (exports).
+        As in find_page(), the time window is converted into id boundaries
+        (created_at has no index): a windowed export is a range scan of the
+        primary key, not a full scan.
+
+        Args:
+            created_from: Only ids generated at or after this instant
+            created_until: Only ids generated before this instant
+            itersize: Rows fetched per round trip
+
+        Yields:
+            Column tuples: id, email, password_hash, is_activated,
+            created_at, updated_at (ordered by id)
+
+        SQL:
+            DECLARE ... CURSOR FOR
+            SELECT id, email, password_hash, is_activated, created_at, updated_at
+            FROM account
+            [WHERE id >= %s AND id < %s]
+            ORDER BY id
+
+        Transaction:
+            - Named cursors live in a transaction: outside a UnitOfWork a
+              pooled connection is held (and rolled back on return) until the
+              iterator is exhausted or closed
+            - Inside a UnitOfWork, reads the shared transaction (sees its
+              uncommitted writes)
+
+        Example:
+            >>> for row in repository.iter_rows(created_from=since, itersize=5000):
+            ...     writer.writerow(row)
+        """
+        conditions: list[sql.Composable] = []
+        params: list[UUID] = []
+        if created_from is not None:
+            conditions.append(sql.SQL("id >= %s"))
+            params.append(AccountId.min_for_timestamp(created_from).value)
+        if created_until is not None:
+            conditions.append(sql.SQL("id < %s"))
+            params.append(AccountId.min_for_timestamp(created_until).value)
+
+        query = sql.SQL("SELECT {} FROM account {} ORDER BY id").format(
+            sql.SQL(", ").join(sql.Identifier(column) for column in _ACCOUNT_COLUMNS),
+            sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL(""),
+        )
+
+        with self._db.connection() as conn:
+            # Unique name: several streams may share a UnitOfWork connection
+            with conn.cursor(name=f"account_stream_{uuid.uuid4().hex}") as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, params)
+                yield from cursor
+
+    def find_page(
+        self,
+        after: AccountId | None,
+        limit: int,
+        created_from: datetime | None = None,
+        created_until: datetime | None = None,
+    ) -> list[Account]:
+        """
+        Find one page of accounts after a given id (keyset pagination).
+
+        OFFSET pagination reads and discards every row before the page, so
+        deep pages get slower as the table grows. Here the page is a range
+        scan of the primary key starting at the cursor: constant cost at any
+        depth. The time window is converted into id boundaries
+        (AccountId.min_for_timestamp()), so it narrows the same index range
+        instead of filtering on created_at.
+
+        Args:
+            after: Last id of the previous page (None for the first page)
+            limit: Maximum number of accounts to return
+            created_from: Only ids generated at or after this instant
+            created_until: Only ids generated before this instant
+
+        Returns:
+            Up to limit accounts, ordered by id
+
+        SQL:
+            SELECT id, email, password_hash, is_activated, created_at, updated_at
+            FROM account
+            WHERE id > %s [AND id >= %s] [AND id < %s]
+            ORDER BY id
+            LIMIT %s
+
+        Note:
+            The window applies to the id timestamp (generation time in the
+            application, millisecond precision), which may differ from
+            created_at (database clock) by a few milliseconds.
+        """
+        conditions: list[sql.Composable] = []
+        params: list[UUID] = []
+        for condition, boundary in (
+            ("id > %s", after),
+            ("id >= %s", AccountId.min_for_timestamp(created_from) if created_from else None),
+            ("id < %s", AccountId.min_for_timestamp(created_until) if created_until else None),
+        ):
+            if boundary is not None:
+                conditions.append(sql.SQL(condition))
+                params.append(boundary.value)
+
+        query = sql.SQL("SELECT {} FROM account {} ORDER BY id LIMIT %s").format(
+            sql.SQL(", ").join(sql.Identifier(column) for column in _ACCOUNT_COLUMNS),
+            sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL(""),
+        )
+
+        with self._db.read_only_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, (*params, limit))
+                return [
+                    to_domain(dict(zip(_ACCOUNT_COLUMNS, row_tuple, strict=True)))
+                    for row_tuple in cursor.fetchall()
+                ]
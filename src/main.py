@@ -1,9 +1,12 @@
 import logging
 import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi_injector import attach_injector
 from injector import Injector
+from starlette.concurrency import run_in_threadpool
 
 from src.account.application.events.account_created_handler import (
     AccountCreatedHandler,
@@ -13,9 +16,23 @@ from src.account.infrastructure.di.account_module import AccountModule
 from src.account.infrastructure.http.account_controller import (
     router as account_router,
 )
+from src.account.infrastructure.persistence.account_created_codec import (
+    ACCOUNT_CREATED_CODEC,
+)
 from src.shared.domain.events.event_dispatcher import EventDispatcher
+from src.shared.domain.services.password_hasher import PasswordHasher
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+from src.shared.infrastructure.database.notification_listener import (
+    PostgresNotificationListener,
+)
 from src.shared.infrastructure.di.container import InfrastructureModule
+from src.shared.infrastructure.events.async_event_dispatcher import AsyncEventDispatcher
+from src.shared.infrastructure.events.outbox_event_dispatcher import OutboxEventDispatcher
+from src.shared.infrastructure.events.outbox_relay import OutboxRelay, create_outbox_relay
 from src.shared.infrastructure.http.health_controller import router as health_router
+from src.shared.infrastructure.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
 
 # Configure logging level from environment variable (default: INFO)
 # Valid levels: DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -40,11 +57,62 @@ injector = Injector(
 # Register event handlers
 event_dispatcher = injector.get(EventDispatcher)  # type: ignore[type-abstract]
 event_dispatcher.register(AccountCreated, AccountCreatedHandler)
+if isinstance(event_dispatcher, OutboxEventDispatcher):
+    event_dispatcher.register_codec(AccountCreated, ACCOUNT_CREATED_CODEC)
+
+# Outbox relay thread in each API worker (disable to run scripts/run_outbox_relay.py only)
+OUTBOX_RELAY_IN_PROCESS = os.getenv("OUTBOX_RELAY_IN_PROCESS", "true").strip().lower() == "true"
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
+    """
+    Open shared resources per worker process and release them on shutdown.
+
+    Runs in each uvicorn worker after fork, so every process builds its own
+    connection pool instead of inheriting sockets from the parent.
+
+    Startup:
+        Pre-opens and verifies DATABASE_POOL_MIN connections before the
+        worker accepts requests (no connection setup on first requests),
+        then starts the account cache invalidation listener and (re)opens
+        the asynchronous event dispatcher or starts the outbox relay.
+
+    Shutdown:
+        Stops the listener, drains the asynchronous event queue or stops
+        the outbox relay after its current batch (handlers still need the
+        pool), stops the bcrypt worker processes, rejects new checkouts,
+        waits for in-flight ones, then closes every connection.
+    """
+    db = injector.get(DatabaseConnectionFactory)  # type: ignore[type-abstract]
+    password_hasher = injector.get(PasswordHasher)  # type: ignore[type-abstract]
+    account_cache_listener = injector.get(PostgresNotificationListener)
+    await run_in_threadpool(db.open)
+    account_cache_listener.start()
+    if isinstance(event_dispatcher, AsyncEventDispatcher):
+        event_dispatcher.start()
+    outbox_relay: OutboxRelay | None = None
+    if isinstance(event_dispatcher, OutboxEventDispatcher) and OUTBOX_RELAY_IN_PROCESS:
+        outbox_relay = create_outbox_relay(db, event_dispatcher)
+        outbox_relay.start()
+    try:
+        yield
+    finally:
+        await run_in_threadpool(account_cache_listener.stop)
+        if isinstance(event_dispatcher, AsyncEventDispatcher):
+            await run_in_threadpool(event_dispatcher.shutdown)
+        if outbox_relay is not None:
+            await run_in_threadpool(outbox_relay.stop)
+        if isinstance(password_hasher, ProcessPoolPasswordHasher):
+            await run_in_threadpool(password_hasher.shutdown)
+        await run_in_threadpool(db.close)
+
 
 app = FastAPI(
     title="User Registration API",
     description="REST API for user registration with email verification",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Attach injector to FastAPI app for automatic dependency resolution
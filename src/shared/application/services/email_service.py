@@ -40,6 +40,7 @@ Usage Example:
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.shared.application.services.email_message import EmailMessage
 
@@ -123,3 +124,22 @@ class EmailService(ABC):
             ```
         """
         pass
+
+    def send_emails(self, messages: Sequence[EmailMessage]) -> None:
+        """
+        Send several emails in one submission.
+
+        Batch counterpart of send_email(), used by batched event handlers.
+        The default implementation sends the messages one by one; providers
+        with a bulk API (SMTP connection reuse, SendGrid/SES batch endpoints)
+        override it to submit them together.
+
+        Args:
+            messages: EmailMessage DTOs to send
+
+        Raises:
+            Exception: Implementation-specific exceptions on failure (messages
+                before the failing one may already have been sent)
+        """
+        for message in messages:
+            self.send_email(message)
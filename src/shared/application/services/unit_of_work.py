@@ -0,0 +1,81 @@
+"""
+UnitOfWork interface for command-scoped transactions.
+
+This module defines the contract for grouping every repository operation of a
+command into a single atomic transaction. Repositories stay unaware of the
+transaction boundary: they join the active unit of work when there is one and
+run standalone otherwise.
+
+Design Decisions:
+    - Interface in application layer (transaction boundaries are a use case concern)
+    - Context manager: begin() commits on success, rolls back on exception
+    - Implicit enlistment: repositories join the active unit of work, no
+      session object threaded through method signatures
+    - Nesting: inner begin() joins the outer unit of work (single commit)
+
+Architecture:
+    - Interface: Shared Application Layer (application/services/)
+    - Implementations: Infrastructure Layer (infrastructure/database/)
+    - Consumed by: Command handlers (RegisterAccountHandler, ActivateAccountHandler)
+    - DI: Bound via InfrastructureModule (singleton)
+
+Usage Example:
+    ```python
+    # In command handler
+    @inject
+    def __init__(self, repository: AccountRepository, uow: UnitOfWork):
+        self._repository = repository
+        self._uow = uow
+
+    def handle(self, command: RegisterAccountCommand) -> None:
+        with self._uow.begin():
+            self._repository.create_if_email_absent(account)
+            self._dispatcher.dispatch(AccountCreated(...))  # Same transaction
+        # Committed once here
+    ```
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Generator
+from contextlib import contextmanager
+
+
+class UnitOfWork(ABC):
+    """
+    Abstract unit of work spanning all repositories used by a command.
+
+    All repository calls made inside begin() share one connection and one
+    transaction, committed once when the block exits normally.
+
+    Design Principles:
+        - Single Responsibility: Only defines transaction boundaries
+        - Dependency Inversion: Handlers depend on interface, not on psycopg2
+        - Atomicity: Either every write of the command persists, or none does
+
+    Implementations:
+        - PostgresUnitOfWork: Shared pooled connection, single COMMIT
+    """
+
+    @abstractmethod
+    @contextmanager
+    def begin(self) -> Generator[None]:
+        """
+        Open a unit of work (or join the one already active).
+
+        Yields:
+            None: Repository calls inside the block share the transaction
+
+        Transaction Management:
+            - Commits once when the outermost block exits normally
+            - Rolls back and re-raises if the block raises
+            - Nested begin() calls join the outer unit of work
+
+        Usage:
+            ```python
+            with uow.begin():
+                account_repository.create_if_email_absent(account)
+                activation_repository.save(activation)
+            # Single COMMIT here
+            ```
+        """
+        pass
@@ -6,6 +6,8 @@ Infrastructure layer provides concrete implementations (synchronous, async, etc.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Generator
+from contextlib import contextmanager
 
 
 class EventDispatcher(ABC):
@@ -23,7 +25,7 @@ class EventDispatcher(ABC):
 
     Implementations:
         - InMemoryEventDispatcher: Synchronous, in-process (MVP)
-        - AsyncEventDispatcher: Thread-based, asynchronous (future)
+        - AsyncEventDispatcher: Bounded queue and worker threads, after COMMIT
         - CeleryEventDispatcher: Distributed, Redis-backed (production)
 
     Example:
@@ -47,6 +49,9 @@ class EventDispatcher(ABC):
             - Handlers are resolved via dependency injection (injector)
             - Multiple handlers per event not supported in MVP (YAGNI)
             - Handler must have handle(event) method
+            - Handler may also define handle_batch(events), called with a
+              group of events of this type by batching implementations
+              (AsyncEventDispatcher with batch_size > 1)
         """
         pass
 
@@ -68,3 +73,33 @@ class EventDispatcher(ABC):
             - If no handler registered, silently ignores (idempotent)
         """
         pass
+
+    @contextmanager
+    def reserve(self, event_type: type) -> Generator[None]:
+        """
+        Reserve capacity for one event before the unit of work that emits it.
+
+        Bounded implementations may have to wait for, or fail to get, room
+        for the event. Reserving it before the transaction opens means that
+        wait holds no pooled connection and no uncommitted row; dispatch()
+        inside the block then uses the reservation. An unused reservation is
+        released when the block exits.
+
+        Args:
+            event_type: Domain event class that will be dispatched once
+
+        Yields:
+            None: dispatch() of one event_type inside the block is reserved
+
+        Notes:
+            - Default: nothing to reserve (unbounded implementations)
+            - AsyncEventDispatcher: takes a queue slot, raising
+              EventQueueFullError when none frees up
+
+        Example:
+            with dispatcher.reserve(AccountCreated):
+                with uow.begin():
+                    repository.create_if_email_absent(account)
+                    dispatcher.dispatch(AccountCreated(...))  # Reserved slot
+        """
+        yield
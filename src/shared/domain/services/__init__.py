@@ -0,0 +1,6 @@
+"""
+Shared domain services.
+
+Contains service interfaces for domain operations whose execution strategy
+is an infrastructure concern (e.g., where CPU-heavy password hashing runs).
+"""
@@ -0,0 +1,75 @@
+"""
+PasswordHasher interface.
+
+Defines the contract for password hashing and verification. The domain only
+knows that a plain text password becomes an opaque hash; infrastructure
+decides where the CPU-bound work runs (inline, process pool, remote service).
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+
+
+class PasswordHasher(ABC):
+    """
+    Abstract service for hashing and verifying passwords.
+
+    Password hashing (bcrypt) is deliberately slow (~250ms per hash). Keeping
+    it behind an interface lets the infrastructure layer move this work off
+    request worker threads without changing domain code.
+
+    Implementations:
+        - ProcessPoolPasswordHasher: Dedicated process pool sized from CPU count
+
+    Thread Safety:
+        Implementations must be thread-safe (shared singleton across requests).
+
+    Async Callers:
+        hash_async() lets async endpoints await the hash instead of parking
+        a threadpool thread on it. The default runs hash() in a worker
+        thread; implementations with their own executor override it.
+
+    Example:
+        >>> hashed = hasher.hash("SecurePass123")
+        >>> hasher.verify("SecurePass123", hashed)
+        True
+    """
+
+    @abstractmethod
+    def hash(self, plain_password: str) -> str:
+        """
+        Hash a plain text password.
+
+        Args:
+            plain_password: Password to hash (already validated by Password VO)
+
+        Returns:
+            str: bcrypt hash (salt included)
+        """
+        pass
+
+    async def hash_async(self, plain_password: str) -> str:
+        """
+        Hash a plain text password without blocking the event loop.
+
+        Args:
+            plain_password: Password to hash (already validated by Password VO)
+
+        Returns:
+            str: bcrypt hash (salt included)
+        """
+        return await asyncio.to_thread(self.hash, plain_password)
+
+    @abstractmethod
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Check a plain text password against a stored hash.
+
+        Args:
+            plain_password: Password provided by the user
+            hashed_password: Stored bcrypt hash
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise
+        """
+        pass
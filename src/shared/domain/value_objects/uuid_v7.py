@@ -1,10 +1,146 @@
+import os
+import secrets
+import struct
+import threading
+import time
 from abc import ABC
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Self
-from uuid import UUID, uuid7
+from uuid import UUID
 
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
 
-@dataclass(frozen=True)
+# Version (7) and variant (0b10) bits of every generated value
+_VERSION_AND_VARIANT = 0x7 << 76 | 0b10 << 62
+
+# 42-bit counter: 12 bits in rand_a, 30 bits at the top of rand_b
+_COUNTER_MAX = (1 << 42) - 1
+_COUNTER_LOW_BITS = 30
+_COUNTER_LOW_MASK = (1 << _COUNTER_LOW_BITS) - 1
+
+
+class _MonotonicAllocator:
+    """
+    Process-wide source of strictly increasing UUID v7 values.
+
+    Layout (RFC 9562, section 6.2, method 1 "fixed bit-length dedicated
+    counter"): 48-bit Unix timestamp in milliseconds, 42-bit counter, 32
+    random bits. The counter restarts from a random value below 2^41 on each
+    new millisecond and increments for every value of the same millisecond,
+    so consecutive values always sort after the previous ones, whichever
+    thread asked for them.
+
+    Design Decisions:
+        - One lock for the whole process: Only the (timestamp, counter)
+          reservation runs under it; UUIDs are built outside
+        - Clock going backwards: Allocation continues from the last
+          timestamp issued instead of going back in time
+        - Counter overflow (2^41+ values in one millisecond): The timestamp
+          is advanced by one millisecond, ahead of the clock
+        - Fork: The child process restarts from a fresh random counter, so
+          it never issues the parent's next values
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0  # Counter of the last value issued in _last_ms
+
+    def reset(self) -> None:
+        """Forget the last value issued (next allocation starts a new sequence)."""
+        self._lock = threading.Lock()
+        self._last_ms = -1
+
+    def next_value(self) -> int:
+        """
+        Reserve one value (generate() path, without allocate()'s batch overhead).
+
+        Returns:
+            128-bit integer of the value
+        """
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = secrets.randbits(41)
+            elif self._counter < _COUNTER_MAX:
+                self._counter += 1
+            else:
+                self._last_ms += 1
+                self._counter = secrets.randbits(41)
+            milliseconds, counter = self._last_ms, self._counter
+
+        return (
+            milliseconds << 80
+            | _VERSION_AND_VARIANT
+            | (counter >> _COUNTER_LOW_BITS) << 64
+            | (counter & _COUNTER_LOW_MASK) << 32
+            | int.from_bytes(os.urandom(4))
+        )
+
+    def allocate(self, count: int) -> list[int]:
+        """
+        Reserve count consecutive values.
+
+        Returns:
+            128-bit integers of the values, strictly increasing
+        """
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = secrets.randbits(41) - 1
+
+            if self._counter + count <= _COUNTER_MAX:
+                # Common case: the whole batch fits in the current millisecond
+                runs = [(self._last_ms, self._counter + 1, count)]
+                self._counter += count
+            else:
+                runs = self._reserve_overflowing(count)
+
+        randoms = struct.unpack(f">{count}I", os.urandom(4 * count))
+        values: list[int] = []
+        for milliseconds, first, taken in runs:
+            prefix = milliseconds << 80 | _VERSION_AND_VARIANT
+            offset = len(values) - first
+            values.extend(
+                prefix
+                | (counter >> _COUNTER_LOW_BITS) << 64
+                | (counter & _COUNTER_LOW_MASK) << 32
+                | randoms[offset + counter]
+                for counter in range(first, first + taken)
+            )
+        return values
+
+    def _reserve_overflowing(self, count: int) -> list[tuple[int, int, int]]:
+        """
+        Reserve count values across as many milliseconds as needed (lock held).
+
+        Returns:
+            (timestamp, first counter, count) runs, in order
+        """
+        runs: list[tuple[int, int, int]] = []
+        remaining = count
+        while remaining:
+            available = _COUNTER_MAX - self._counter
+            if not available:
+                self._last_ms += 1
+                self._counter = secrets.randbits(41) - 1
+                continue
+
+            taken = min(available, remaining)
+            runs.append((self._last_ms, self._counter + 1, taken))
+            self._counter += taken
+            remaining -= taken
+        return runs
+
+
+_ALLOCATOR = _MonotonicAllocator()
+os.register_at_fork(after_in_child=_ALLOCATOR.reset)
+
+
+@dataclass(frozen=True, slots=True)
 class UuidV7(ABC):
     """
     Abstract base class for UUID v7-based identifiers.
@@ -27,7 +163,86 @@ class UuidV7(ABC):
 
     @classmethod
     def generate(cls) -> Self:
-        return cls(value=uuid7())
+        return cls.from_trusted(UUID(int=_ALLOCATOR.next_value()))
+
+    @classmethod
+    def generate_many(cls, count: int) -> list[Self]:
+        """
+        Allocate count new identifiers in one call.
+
+        Identifiers come from the same process-wide allocator as generate():
+        each one sorts strictly after every identifier previously generated
+        in this process, from any thread, so inserting them in order only
+        ever appends to the primary key B-tree. The allocator lock is taken
+        once for the whole batch, and the version check is skipped (the
+        allocator only produces version 7 values).
+
+        Args:
+            count: Number of identifiers (0 returns an empty list)
+
+        Returns:
+            Identifiers in strictly increasing order
+
+        Raises:
+            ValueError: If count is negative
+        """
+        if count < 0:
+            raise ValueError(f"Identifier count cannot be negative, got {count}")
+
+        return [cls.from_trusted(UUID(int=value)) for value in _ALLOCATOR.allocate(count)]
+
+    @classmethod
+    def from_trusted(cls, value: UUID) -> Self:
+        """
+        Rebuild an identifier from a stored UUID, without validation.
+
+        Values read from persistence were produced by a validated instance,
+        so the version check is not repeated when loading rows.
+
+        Args:
+            value: UUID of a previously validated identifier
+
+        Returns:
+            Identifier wrapping the value as-is
+
+        Warning:
+            Persistence mappers only. Never pass user input: use
+            from_string() or the constructor, which check the version.
+        """
+        identifier = object.__new__(cls)
+        # Skips __post_init__; object.__setattr__ as frozen dataclasses require
+        object.__setattr__(identifier, "value", value)
+        return identifier
+
+    @classmethod
+    def min_for_timestamp(cls, instant: datetime) -> Self:
+        """
+        Build the smallest UUID v7 of the millisecond containing instant.
+
+        UUID v7 values start with their 48-bit Unix timestamp in milliseconds,
+        so they sort by generation time: every identifier generated at or
+        after instant compares >= this value, every earlier one compares <.
+        Used as a boundary to turn a time window into a primary key range
+        (WHERE id >= :from AND id < :until), without a timestamp column.
+
+        Args:
+            instant: Boundary time (naive values are read as UTC)
+
+        Returns:
+            Identifier with the instant's timestamp and all random bits zero
+
+        Raises:
+            ValueError: If instant is outside the UUID v7 timestamp range
+                (before 1970, or after year 10889)
+        """
+        if instant.tzinfo is None:
+            instant = instant.replace(tzinfo=UTC)
+
+        milliseconds = (instant - _UNIX_EPOCH) // timedelta(milliseconds=1)
+        if not 0 <= milliseconds < 1 << 48:
+            raise ValueError(f"Timestamp out of UUID v7 range: {instant.isoformat()}")
+
+        return cls(value=UUID(int=milliseconds << 80 | 0x7 << 76 | 0b10 << 62))
 
     @classmethod
     def from_string(cls, uuid_string: str) -> Self:
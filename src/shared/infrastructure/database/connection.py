@@ -8,12 +8,19 @@ principles.
 Design Decisions:
     - Factory pattern: DatabaseConnectionFactory interface for DI
     - Context manager: Automatic connection cleanup (putconn on exit)
-    - ThreadedConnectionPool: Thread-safe for FastAPI workers
+    - BlockingConnectionPool: Thread-safe, waits (bounded) for a free
+      connection instead of failing immediately when the pool is exhausted
     - Environment variables: Same configuration as docker-compose.yml
+    - Transaction scope: transaction() shares one connection per context
+      (ContextVar), so a unit of work spans every repository call it wraps
+    - Commit hooks: after_commit() defers work (e.g. handing events to
+      background workers) until the outermost transaction has committed
+    - Native UUIDs: Pooled connections return uuid columns as uuid.UUID, and
+      uuid.UUID parameters are sent as uuid literals (no str() round trips)
 
 Architecture:
     - Interface: DatabaseConnectionFactory (can be mocked in tests)
-    - Implementation: PostgresConnectionFactory (uses psycopg2.pool)
+    - Implementation: PostgresConnectionFactory (uses BlockingConnectionPool)
     - Injection: Repository receives DatabaseConnectionFactory via @inject
 
 Usage Example:
@@ -24,20 +31,43 @@ Usage Example:
             self._db = db
 
         def create(self, account: Account) -> None:
-            with self._db.connection() as conn:
+            with self._db.transaction() as conn:  # Joins active unit of work
                 with conn.cursor() as cursor:
                     cursor.execute("INSERT INTO account ...")
-                    conn.commit()
+            # Committed here, unless an outer transaction is active
     ```
 """
 
+import functools
+import math
 import os
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Generator
+from bisect import bisect_left
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
-
-from psycopg2 import pool
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import psycopg2
+from psycopg2 import DatabaseError
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INERROR,
+    TRANSACTION_STATUS_UNKNOWN,
+)
 from psycopg2.extensions import connection as Connection  # noqa: N812
+from psycopg2.extras import register_uuid
+from psycopg2.pool import PoolError
+
+# (on_commit, on_rollback) pair registered through after_commit()
+_TransactionHooks = tuple[Callable[[], None], Callable[[], None] | None]
+
+# Upper bounds (seconds) of the acquisition wait-time histogram buckets
+WAIT_TIME_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
 
 
 class DatabaseConnectionFactory(ABC):
@@ -75,6 +105,104 @@ class DatabaseConnectionFactory(ABC):
             - Connections are NOT auto-committed
             - Call conn.commit() explicitly after modifications
             - Call conn.rollback() to abort transaction
+            - Inside transaction(), yields the transaction's connection
+        """
+        pass
+
+    @abstractmethod
+    @contextmanager
+    def transaction(self) -> Generator[Connection]:
+        """
+        Provide a connection bound to a transaction committed on exit.
+
+        The outermost transaction() acquires a connection and commits it when
+        the block exits normally (rollback on exception). Nested transaction()
+        and connection() calls in the same context reuse that connection and
+        leave the commit to the outermost block.
+
+        Yields:
+            psycopg2 connection object
+
+        Usage:
+            ```python
+            with factory.transaction():
+                account_repository.save(account)        # Joins transaction
+                activation_repository.save(activation)  # Same connection
+            # Single COMMIT here
+            ```
+        """
+        pass
+
+    @abstractmethod
+    @contextmanager
+    def read_only_connection(self) -> Generator[Connection]:
+        """
+        Provide a connection for single-statement reads, without a transaction.
+
+        Outside a transaction the connection runs in autocommit mode: each
+        SELECT is sent alone, with no implicit BEGIN before it and no
+        ROLLBACK when the connection returns to the pool. Inside
+        transaction(), the active connection is reused so reads see the
+        unit of work's uncommitted writes.
+
+        Yields:
+            psycopg2 connection object
+
+        Usage:
+            ```python
+            with factory.read_only_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT ... FROM account WHERE email = %s", ...)
+            # One round trip (SELECT only)
+            ```
+        """
+        pass
+
+    @abstractmethod
+    def in_transaction(self) -> bool:
+        """
+        Tell whether the current context runs inside transaction().
+
+        Lets caches avoid storing uncommitted rows that may be rolled back.
+
+        Returns:
+            bool: True inside a transaction() block, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def after_commit(
+        self, on_commit: Callable[[], None], on_rollback: Callable[[], None] | None = None
+    ) -> None:
+        """
+        Run on_commit once the current transaction has committed.
+
+        Work that must only happen for durable writes (e.g. handing an event
+        to another thread, which cannot see uncommitted rows) is deferred to
+        after the outermost transaction() COMMIT. Outside a transaction,
+        on_commit runs immediately.
+
+        Args:
+            on_commit: Called after COMMIT, in registration order
+            on_rollback: Called instead if the transaction is rolled back
+        """
+        pass
+
+    @abstractmethod
+    def open(self) -> None:
+        """
+        Prepare connections before serving requests (application startup).
+
+        Called once per worker process, after fork, by the FastAPI lifespan.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Release all connections (application shutdown).
+
+        Called by the FastAPI lifespan once the worker stops serving requests.
         """
         pass
 
@@ -105,6 +233,395 @@ def _get_database_config() -> dict[str, str | int]:
     }
 
 
+def _connect(**params: Any) -> Connection:
+    """
+    Open a connection with native UUID support.
+
+    register_uuid() adapts uuid.UUID parameters to uuid literals (process
+    wide) and registers the uuid and uuid[] typecasters on this connection,
+    so identifiers travel as UUID objects in both directions: repositories
+    pass AccountId.value as-is and mappers receive UUIDs, not strings to
+    parse. Typecasters are per connection: registering them here covers
+    every connection the pool opens (including reconnections).
+
+    Args:
+        params: psycopg2.connect() keyword arguments
+
+    Returns:
+        Open psycopg2 connection
+    """
+    conn: Connection = psycopg2.connect(**params)
+    register_uuid(conn_or_curs=conn)  # type: ignore[no-untyped-call]
+    return conn
+
+
+def _get_pool_config() -> dict[str, float]:
+    """
+    Read connection pool sizing from environment variables.
+
+    Environment Variables:
+        DATABASE_POOL_MIN: Connections opened eagerly and kept alive (default: 2)
+        DATABASE_POOL_MAX: Upper bound of open connections (default: 10)
+        DATABASE_POOL_TIMEOUT: Seconds to wait for a free connection (default: 5)
+
+    Returns:
+        Dictionary with minconn, maxconn and timeout
+    """
+    return {
+        "minconn": int(os.getenv("DATABASE_POOL_MIN", "2")),
+        "maxconn": int(os.getenv("DATABASE_POOL_MAX", "10")),
+        "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", "5")),
+    }
+
+
+class PoolTimeoutError(PoolError):
+    """
+    Raised when no pooled connection becomes available within the timeout.
+
+    Subclass of psycopg2.pool.PoolError so callers handling pool exhaustion
+    keep working; the difference is that it is raised after a bounded wait
+    instead of immediately.
+    """
+
+    pass
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """
+    Snapshot of connection pool activity.
+
+    Attributes:
+        min_size: Connections opened eagerly and kept alive
+        max_size: Upper bound of open connections
+        in_use: Connections currently checked out
+        idle: Open connections waiting in the pool
+        waiters: Threads currently blocked waiting for a connection
+        acquisitions: Total successful checkouts since startup
+        timeouts: Checkouts that gave up after the acquisition timeout
+        wait_time_histogram: (upper bound in seconds, count) per bucket,
+            non-cumulative, covering every successful checkout
+    """
+
+    min_size: int
+    max_size: int
+    in_use: int
+    idle: int
+    waiters: int
+    acquisitions: int
+    timeouts: int
+    wait_time_histogram: tuple[tuple[float, int], ...]
+
+
+class BlockingConnectionPool:
+    """
+    Thread-safe connection pool that queues callers when exhausted.
+
+    Replaces psycopg2's ThreadedConnectionPool, which raises PoolError as soon
+    as maxconn connections are checked out. With FastAPI running up to 40
+    sync handlers concurrently, a burst above maxconn turned into 500s; here
+    callers wait on a condition variable (up to the acquisition timeout) for
+    a connection to be returned.
+
+    Behavior:
+        - Idle connections reused LIFO (the most recently used stays warm)
+        - New connections opened on demand up to maxconn (outside the lock)
+        - Returned connections kept open up to maxconn (psycopg2 closes any
+          connection above minconn on putconn, reconnecting on the next burst)
+        - Broken or mid-transaction connections reset/discarded on return
+
+    Lifecycle:
+        - Lazy: no connection opened by __init__ (safe to build before fork)
+        - open(): pre-opens minconn connections and verifies them (startup)
+        - closeall(): rejects new checkouts, drains in-flight ones, closes all
+        - Reopenable: open() after closeall() accepts checkouts again
+
+    Fork Safety:
+        A child process must never reuse the parent's sockets (both processes
+        would talk over the same server session). After os.fork() the child
+        forgets inherited connections without closing them (closing would
+        terminate the parent's sessions) and starts from an empty pool.
+
+    Thread Safety:
+        All state is guarded by a single Condition; waiters are woken one at
+        a time as connections are returned.
+    """
+
+    def __init__(
+        self,
+        minconn: int,
+        maxconn: int,
+        connect: Callable[[], Connection],
+        timeout: float = 5.0,
+    ) -> None:
+        """
+        Initialize an empty pool (connections are opened on demand or by open()).
+
+        Args:
+            minconn: Connections opened eagerly and kept alive
+            maxconn: Upper bound of open connections
+            connect: Factory opening a new database connection
+            timeout: Default seconds to wait for a free connection
+
+        Raises:
+            PoolError: If sizes are inconsistent
+        """
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise PoolError(f"Invalid pool size: minconn={minconn}, maxconn={maxconn}")
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self._connect = connect
+        self._timeout = timeout
+        self._condition = threading.Condition()
+        self._idle: list[Connection] = []
+        self._in_use: set[Connection] = set()
+        self._opening = 0
+        self._waiters = 0
+        self._acquisitions = 0
+        self._timeouts = 0
+        self._wait_counts = [0] * len(WAIT_TIME_BUCKETS)
+        self._closed = False
+
+        pool_ref = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: BlockingConnectionPool._forget(pool_ref))
+
+    def open(self, verify: bool = True) -> None:
+        """
+        Accept checkouts and pre-open minconn connections.
+
+        Called at application startup (after fork, in each worker) so the
+        first requests do not pay for TCP and authentication setup.
+
+        Args:
+            verify: Run a round trip (SELECT 1) on each idle connection and
+                replace the ones that fail
+
+        Raises:
+            psycopg2.OperationalError: If a connection cannot be opened
+        """
+        with self._condition:
+            self._closed = False
+            missing = max(0, self.minconn - self._open_count())
+            self._opening += missing
+
+        opened: list[Connection] = []
+        try:
+            for _ in range(missing):
+                opened.append(self._connect())
+        finally:
+            with self._condition:
+                self._opening -= missing
+                self._idle.extend(opened)
+                self._condition.notify_all()
+
+        if verify:
+            self._verify_idle()
+
+    def getconn(self, timeout: float | None = None) -> Connection:
+        """
+        Check out a connection, waiting if the pool is exhausted.
+
+        Args:
+            timeout: Seconds to wait (default: pool timeout)
+
+        Returns:
+            Connection: Open psycopg2 connection (caller must putconn())
+
+        Raises:
+            PoolTimeoutError: If no connection became available in time
+            PoolError: If the pool is closed
+            psycopg2.OperationalError: If opening a new connection fails
+        """
+        started = time.monotonic()
+        deadline = started + (self._timeout if timeout is None else timeout)
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise PoolError("connection pool is closed")
+
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._checkout(conn, started)
+                    return conn
+
+                if self._open_count() < self.maxconn:
+                    self._opening += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No connection available within {deadline - started:.3f}s "
+                        f"({self.maxconn} in use)"
+                    )
+
+                self._waiters += 1
+                try:
+                    self._condition.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+        # Slot reserved: open the connection without holding the lock
+        try:
+            conn = self._connect()
+        except BaseException:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._opening -= 1
+            self._checkout(conn, started)
+        return conn
+
+    def putconn(self, conn: Connection, close: bool = False) -> None:
+        """
+        Return a connection to the pool and wake one waiter.
+
+        Args:
+            conn: Connection previously obtained from getconn()
+            close: Discard the connection instead of keeping it idle
+
+        Raises:
+            PoolError: If the connection does not belong to this pool
+        """
+        with self._condition:
+            if conn not in self._in_use:
+                if self._closed:
+                    # Returned after a drain timeout: already forgotten
+                    if not conn.closed:
+                        conn.close()
+                    return
+                raise PoolError("trying to put unkeyed connection")
+            self._in_use.discard(conn)
+
+            if close or self._closed or not self._reset(conn):
+                if not conn.closed:
+                    conn.close()
+            else:
+                self._idle.append(conn)
+
+            self._condition.notify()
+
+    def closeall(self, drain_timeout: float = 0.0) -> None:
+        """
+        Reject further checkouts, drain in-flight ones and close every connection.
+
+        Waiters are woken and fail with PoolError. Connections still checked
+        out after drain_timeout are closed as well.
+
+        Args:
+            drain_timeout: Seconds to wait for checked-out connections to be
+                returned before closing them
+        """
+        deadline = time.monotonic() + drain_timeout
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+            while self._in_use:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            for conn in [*self._idle, *self._in_use]:
+                if not conn.closed:
+                    conn.close()
+            self._idle.clear()
+            self._in_use.clear()
+            self._condition.notify_all()
+
+    def stats(self) -> ConnectionPoolStats:
+        """
+        Return a snapshot of pool metrics.
+
+        Returns:
+            ConnectionPoolStats: Sizes, occupancy, waiters and wait times
+        """
+        with self._condition:
+            return ConnectionPoolStats(
+                min_size=self.minconn,
+                max_size=self.maxconn,
+                in_use=len(self._in_use),
+                idle=len(self._idle),
+                waiters=self._waiters,
+                acquisitions=self._acquisitions,
+                timeouts=self._timeouts,
+                wait_time_histogram=tuple(zip(WAIT_TIME_BUCKETS, self._wait_counts, strict=True)),
+            )
+
+    def _verify_idle(self) -> None:
+        """Ping idle connections, replacing the ones that fail."""
+        with self._condition:
+            candidates, self._idle = self._idle, []
+            checked_out = len(candidates)
+            self._opening += checked_out
+
+        verified: list[Connection] = []
+        try:
+            while candidates:
+                conn = candidates.pop()
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                    conn.rollback()
+                except psycopg2.Error:
+                    conn.close()
+                    conn = self._connect()
+                verified.append(conn)
+        finally:
+            with self._condition:
+                self._opening -= checked_out
+                self._idle.extend([*candidates, *verified])
+                self._condition.notify_all()
+
+    @staticmethod
+    def _forget(pool_ref: "weakref.ref[BlockingConnectionPool]") -> None:
+        """Reset pool state in a forked child (inherited sockets are not closed)."""
+        pool = pool_ref()
+        if pool is None:
+            return
+
+        pool._condition = threading.Condition()
+        pool._idle = []
+        pool._in_use = set()
+        pool._opening = 0
+        pool._waiters = 0
+
+    def _open_count(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def _checkout(self, conn: Connection, started: float) -> None:
+        self._in_use.add(conn)
+        self._acquisitions += 1
+        waited = time.monotonic() - started
+        self._wait_counts[bisect_left(WAIT_TIME_BUCKETS, waited)] += 1
+
+    @staticmethod
+    def _reset(conn: Connection) -> bool:
+        """Roll back leftover transaction state; False if conn must be dropped."""
+        if conn.closed:
+            return False
+
+        status = conn.info.transaction_status
+        if status == TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        if status != TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                return False
+
+        return True
+
+
 class PostgresConnectionFactory(DatabaseConnectionFactory):
     """
     PostgreSQL connection factory using psycopg2 connection pool.
@@ -114,20 +631,29 @@ class PostgresConnectionFactory(DatabaseConnectionFactory):
     for all connection requests.
 
     Connection Pool Configuration:
-        - minconn=2: Always keep 2 connections alive (reduces latency)
-        - maxconn=10: Limit to 10 concurrent connections (prevents DB overload)
+        - DATABASE_POOL_MIN=2: Always keep 2 connections alive (reduces latency)
+        - DATABASE_POOL_MAX=10: Limit concurrent connections (prevents DB overload)
+        - DATABASE_POOL_TIMEOUT=5: Seconds a checkout waits before PoolTimeoutError
         - connect_timeout=10: Fail fast if database unreachable
         - statement_timeout=30s: Kill long-running queries
 
     Thread Safety:
-        - ThreadedConnectionPool is thread-safe for multi-threaded applications
+        - BlockingConnectionPool is thread-safe for multi-threaded applications
         - Safe to use with FastAPI workers (multiple threads/processes)
+        - Bursts above DATABASE_POOL_MAX queue instead of failing
 
     Lifecycle:
-        - Pool created during __init__ (lazy initialization in DI container)
+        - Pool created during __init__ without connecting (lazy, fork-safe)
+        - open() pre-opens and verifies minconn connections (app startup)
         - Connections acquired via getconn() in connection() context manager
         - Connections returned via putconn() automatically (finally block)
-        - Pool closed via close() method (application shutdown)
+        - close() drains in-flight checkouts, then closes all (app shutdown)
+
+    Transaction Scope:
+        - transaction() stores its connection in a ContextVar
+        - Each request thread (or asyncio task) sees only its own transaction
+        - connection() and nested transaction() reuse the active connection
+        - read_only_connection() reuses it too, else runs in autocommit mode
     """
 
     def __init__(self) -> None:
@@ -135,17 +661,17 @@ class PostgresConnectionFactory(DatabaseConnectionFactory):
         Initialize PostgreSQL connection pool.
 
         Reads configuration from environment variables and creates a
-        ThreadedConnectionPool instance.
+        BlockingConnectionPool instance.
 
         Raises:
             psycopg2.OperationalError: If database connection fails
                 (wrong credentials, host unreachable, etc.)
         """
         config = _get_database_config()
+        pool_config = _get_pool_config()
 
-        self._pool: pool.ThreadedConnectionPool = pool.ThreadedConnectionPool(
-            minconn=2,
-            maxconn=10,
+        connect = functools.partial(
+            _connect,
             host=config["host"],
             port=config["port"],
             database=config["database"],
@@ -156,6 +682,20 @@ class PostgresConnectionFactory(DatabaseConnectionFactory):
             options="-c statement_timeout=30000",  # Kill queries after 30 seconds
         )
 
+        self._pool = BlockingConnectionPool(
+            minconn=int(pool_config["minconn"]),
+            maxconn=int(pool_config["maxconn"]),
+            connect=connect,
+            timeout=pool_config["timeout"],
+        )
+        self._active_connection: ContextVar[Connection | None] = ContextVar(
+            f"active_connection_{id(self)}", default=None
+        )
+        # (on_commit, on_rollback) hooks of the active transaction
+        self._transaction_hooks: ContextVar[list[_TransactionHooks] | None] = ContextVar(
+            f"transaction_hooks_{id(self)}", default=None
+        )
+
     @contextmanager
     def connection(self) -> Generator[Connection]:
         """
@@ -168,7 +708,7 @@ class PostgresConnectionFactory(DatabaseConnectionFactory):
             psycopg2 connection object
 
         Raises:
-            psycopg2.OperationalError: If no connections available in pool
+            PoolTimeoutError: If no connection is freed within DATABASE_POOL_TIMEOUT
             psycopg2.DatabaseError: If database operation fails
 
         Example:
@@ -185,7 +725,13 @@ class PostgresConnectionFactory(DatabaseConnectionFactory):
             - Caller is responsible for commit()/rollback()
             - Connection is NOT committed automatically
             - Repository layer handles transaction boundaries
+            - Inside transaction(), yields the shared transaction connection
         """
+        active = self._active_connection.get()
+        if active is not None:
+            yield active
+            return
+
         conn = self._pool.getconn()
 
         try:
@@ -195,19 +741,160 @@ class PostgresConnectionFactory(DatabaseConnectionFactory):
             # This is critical to prevent connection leaks
             self._pool.putconn(conn)
 
-    def close(self) -> None:
+    @contextmanager
+    def transaction(self) -> Generator[Connection]:
+        """
+        Provide a pooled connection committed once on exit.
+
+        Joins the active transaction when called inside another
+        transaction() block; otherwise acquires a connection, publishes it
+        to the current context and commits (or rolls back) on exit.
+
+        Yields:
+            psycopg2 connection object
+
+        Raises:
+            psycopg2.DatabaseError: If database operation or COMMIT fails, or
+                if a statement failed inside the block and its error was
+                swallowed (PostgreSQL would silently turn COMMIT into ROLLBACK)
+
+        Example:
+            ```python
+            with factory.transaction() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("INSERT INTO account ...")
+            # Committed here (outermost block only)
+            ```
+        """
+        active = self._active_connection.get()
+        if active is not None:
+            yield active
+            return
+
+        hooks: list[_TransactionHooks] = []
+        with self.connection() as conn:
+            token = self._active_connection.set(conn)
+            hooks_token = self._transaction_hooks.set(hooks)
+            try:
+                yield conn
+                if conn.info.transaction_status == TRANSACTION_STATUS_INERROR:
+                    raise DatabaseError("Transaction aborted by a failed statement")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                for _, on_rollback in hooks:
+                    if on_rollback is not None:
+                        on_rollback()
+                raise
+            finally:
+                self._transaction_hooks.reset(hooks_token)
+                self._active_connection.reset(token)
+
+        # Connection already back in the pool
+        for on_commit, _ in hooks:
+            on_commit()
+
+    @contextmanager
+    def read_only_connection(self) -> Generator[Connection]:
+        """
+        Provide a pooled connection in autocommit mode for lookups.
+
+        psycopg2 opens an implicit transaction before the first statement
+        (BEGIN) and the pool rolls it back on return (ROLLBACK): two extra
+        round trips around every SELECT. In autocommit mode only the SELECT
+        is sent. Switching autocommit is client-side (no round trip).
+
+        Yields:
+            psycopg2 connection object (autocommit, or the active transaction's)
+
+        Note:
+            Intended for single-statement reads. Several statements in the
+            block each see their own snapshot; use transaction() when reads
+            must be consistent with each other or with writes.
+        """
+        active = self._active_connection.get()
+        if active is not None:
+            yield active
+            return
+
+        with self.connection() as conn:
+            conn.autocommit = True
+            try:
+                yield conn
+            finally:
+                if not conn.closed:
+                    conn.autocommit = False
+
+    def in_transaction(self) -> bool:
+        """
+        Tell whether transaction() is active in the current context.
+
+        Returns:
+            bool: True if a transaction connection is published in the ContextVar
+        """
+        return self._active_connection.get() is not None
+
+    def after_commit(
+        self, on_commit: Callable[[], None], on_rollback: Callable[[], None] | None = None
+    ) -> None:
+        """
+        Defer on_commit to after the outermost transaction() COMMIT.
+
+        Hooks run on the committing thread, once the connection is back in
+        the pool; on_rollback hooks run before the exception propagates.
+        Outside a transaction, on_commit runs immediately.
+
+        Args:
+            on_commit: Called after COMMIT, in registration order
+            on_rollback: Called instead if the transaction is rolled back
+        """
+        hooks = self._transaction_hooks.get()
+        if hooks is None:
+            on_commit()
+        else:
+            hooks.append((on_commit, on_rollback))
+
+    def stats(self) -> ConnectionPoolStats:
+        """
+        Return a snapshot of connection pool metrics.
+
+        Returns:
+            ConnectionPoolStats: In-use, idle, waiters and wait-time histogram
+        """
+        return self._pool.stats()
+
+    def open(self) -> None:
+        """
+        Pre-open and verify DATABASE_POOL_MIN connections.
+
+        Should be called on application startup, in each worker process, so
+        connection setup (TCP, authentication) happens before readiness
+        instead of on the first requests.
+
+        Raises:
+            psycopg2.OperationalError: If the database is unreachable
+        """
+        self._pool.open(verify=True)
+
+    def close(self, drain_timeout: float = 10.0) -> None:
         """
         Close all connections in the pool and release resources.
 
-        Should be called on application shutdown to gracefully close all
-        database connections.
+        New checkouts are rejected immediately; in-flight ones get up to
+        drain_timeout seconds to be returned before every connection is
+        closed. The factory can be reopened with open().
+
+        Args:
+            drain_timeout: Seconds to wait for checked-out connections
 
         Usage:
             ```python
-            # In FastAPI shutdown event
-            @app.on_event("shutdown")
-            async def shutdown_event():
+            # In FastAPI lifespan (src/main.py)
+            @asynccontextmanager
+            async def lifespan(app: FastAPI):
+                connection_factory.open()
+                yield
                 connection_factory.close()
             ```
         """
-        self._pool.closeall()
+        self._pool.closeall(drain_timeout)
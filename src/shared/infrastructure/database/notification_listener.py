@@ -0,0 +1,188 @@
+"""
+PostgreSQL LISTEN/NOTIFY listener running in a background thread.
+
+This module delivers PostgreSQL notifications to a callback, so in-process
+state (e.g. a read cache) can react to changes committed by any process
+sharing the database.
+
+Design Decisions:
+    - Dedicated connection: LISTEN is per session, so the listener owns one
+      autocommit connection outside the pool (never returned, never shared)
+    - Daemon thread + select(): Blocks on the socket, no busy polling; a
+      socketpair wakes it immediately on stop()
+    - Reconnect with delay: A lost connection is reopened until stop()
+    - on_reconnect callback: Notifications sent while not listening are lost,
+      so consumers must resynchronise (e.g. clear a cache) every time LISTEN
+      is (re)established
+    - Started after fork: start() is called from the FastAPI lifespan, in
+      each worker process
+
+Architecture:
+    - Infrastructure only (psycopg2-specific, no domain interface)
+    - Consumers: CachingAccountRepository invalidation (account_changed)
+    - DI: Provided by the bounded context module owning the channel
+
+Usage Example:
+    ```python
+    listener = PostgresNotificationListener(
+        channel="account_changed",
+        on_notify=lambda payload: cache.invalidate(AccountId.from_string(payload)),
+        on_reconnect=cache.clear,
+    )
+    listener.start()   # Application startup (FastAPI lifespan)
+    ...
+    listener.stop()    # Application shutdown
+    ```
+"""
+
+import functools
+import logging
+import select
+import socket
+import threading
+from collections.abc import Callable
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import connection as Connection  # noqa: N812
+
+from src.shared.infrastructure.database.connection import _get_database_config
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresNotificationListener:
+    """
+    Deliver NOTIFY payloads of one channel to a callback.
+
+    Callbacks run on the listener thread, one notification at a time, and
+    must be thread-safe with respect to the rest of the application.
+
+    Lifecycle:
+        - Created: Application startup (DI container), without connecting
+        - start(): Spawns the listener thread (connects and issues LISTEN)
+        - stop(): Signals the thread and waits for it to close its connection
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_notify: Callable[[str], None],
+        on_reconnect: Callable[[], None] | None = None,
+        connect: Callable[[], Connection] | None = None,
+        poll_interval: float = 1.0,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """
+        Initialize listener (does not connect).
+
+        Args:
+            channel: Notification channel to LISTEN on
+            on_notify: Called with each notification payload
+            on_reconnect: Called each time LISTEN is (re)established
+            connect: Connection factory (default: DATABASE_* configuration)
+            poll_interval: Maximum seconds select() blocks while idle
+            retry_delay: Seconds to wait before reconnecting after a failure
+        """
+        self._channel = channel
+        self._on_notify = on_notify
+        self._on_reconnect = on_reconnect
+        self._connect = connect or functools.partial(
+            psycopg2.connect, **_get_database_config(), connect_timeout=10
+        )
+        self._poll_interval = poll_interval
+        self._retry_delay = retry_delay
+        self._stopping = threading.Event()
+        self._listening = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._wakeup: tuple[socket.socket, socket.socket] | None = None
+
+    def start(self) -> None:
+        """Start the listener thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopping.clear()
+        self._wakeup = socket.socketpair()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._wakeup[0],),
+            name=f"pg-listen-{self._channel}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the listener thread and close its connection.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stopping.set()
+        if self._wakeup is not None:
+            self._wakeup[1].send(b"\0")
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._wakeup is not None:
+            for sock in self._wakeup:
+                sock.close()
+            self._wakeup = None
+
+    def wait_until_listening(self, timeout: float) -> bool:
+        """
+        Block until LISTEN is active (startup readiness, tests).
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if listening, False on timeout
+        """
+        return self._listening.wait(timeout)
+
+    def _run(self, wakeup: socket.socket) -> None:
+        """Listener thread: connect, LISTEN, dispatch, reconnect until stopped."""
+        while not self._stopping.is_set():
+            try:
+                conn = self._connect()
+            except psycopg2.Error:
+                logger.warning("LISTEN %s: connection failed, retrying", self._channel)
+                self._stopping.wait(self._retry_delay)
+                continue
+
+            try:
+                self._listen(conn, wakeup)
+            except (psycopg2.Error, OSError):
+                logger.warning("LISTEN %s: connection lost, reconnecting", self._channel)
+                self._stopping.wait(self._retry_delay)
+            finally:
+                self._listening.clear()
+                conn.close()
+
+    def _listen(self, conn: Connection, wakeup: socket.socket) -> None:
+        """Issue LISTEN and dispatch notifications until stopped or disconnected."""
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self._channel)))
+
+        # Anything sent before LISTEN was missed: let the consumer resync
+        if self._on_reconnect is not None:
+            self._on_reconnect()
+        self._listening.set()
+
+        while not self._stopping.is_set():
+            readable, _, _ = select.select(
+                [conn.fileno(), wakeup.fileno()], [], [], self._poll_interval
+            )
+            if conn.fileno() not in readable:
+                continue
+
+            conn.poll()
+            while conn.notifies:
+                notification = conn.notifies.pop(0)
+                try:
+                    self._on_notify(notification.payload)
+                except Exception:
+                    logger.exception("LISTEN %s: notification handler failed", self._channel)
@@ -0,0 +1,69 @@
+"""
+PostgreSQL implementation of UnitOfWork.
+
+This module provides the concrete UnitOfWork backed by the shared connection
+pool. A unit of work checks out one pooled connection, lets every repository
+call in the block run on it, and commits once at the end.
+
+Design Decisions:
+    - Delegation: Transaction scope handled by DatabaseConnectionFactory.transaction()
+    - One checkout per command: Repositories join the active connection
+    - One COMMIT per command: Single WAL flush instead of one per repository call
+
+Architecture:
+    - Implements: UnitOfWork (application layer interface)
+    - Dependencies: DatabaseConnectionFactory (injected)
+    - DI: Bound in InfrastructureModule (singleton, stateless)
+
+Usage Example:
+    ```python
+    uow = PostgresUnitOfWork(db)
+
+    with uow.begin():
+        account_repository.create_if_email_absent(account)
+        activation_repository.save(activation)
+    # COMMIT (or ROLLBACK if the block raised)
+    ```
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from injector import inject
+
+from src.shared.application.services.unit_of_work import UnitOfWork
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+
+
+class PostgresUnitOfWork(UnitOfWork):
+    """
+    UnitOfWork sharing one PostgreSQL connection and transaction.
+
+    Thread Safety:
+        - Stateless: transaction state lives in the connection factory's
+          ContextVar, so concurrent requests get independent units of work
+    """
+
+    @inject
+    def __init__(self, db: DatabaseConnectionFactory) -> None:
+        """
+        Initialize unit of work with database connection factory.
+
+        Args:
+            db: Injected connection factory (singleton from DI container)
+        """
+        self._db = db
+
+    @contextmanager
+    def begin(self) -> Generator[None]:
+        """
+        Run the block inside a single database transaction.
+
+        Yields:
+            None: Repository calls inside the block share the transaction
+
+        Raises:
+            psycopg2.DatabaseError: If COMMIT fails (block changes rolled back)
+        """
+        with self._db.transaction():
+            yield
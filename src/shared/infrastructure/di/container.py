@@ -35,20 +35,35 @@ Usage Example:
     ```
 """
 
-from injector import Binder, Module, provider, singleton
+import os
+
+from injector import Binder, Injector, Module, provider, singleton
 
 from src.shared.application.services.email_service import EmailService
+from src.shared.application.services.unit_of_work import UnitOfWork
 from src.shared.domain.events.event_dispatcher import EventDispatcher
+from src.shared.domain.services.password_hasher import PasswordHasher
 from src.shared.infrastructure.database.connection import (
     DatabaseConnectionFactory,
     PostgresConnectionFactory,
 )
+from src.shared.infrastructure.database.postgres_unit_of_work import PostgresUnitOfWork
+from src.shared.infrastructure.events.async_event_dispatcher import (
+    AsyncEventDispatcher,
+    QueueFullPolicy,
+)
 from src.shared.infrastructure.events.in_memory_event_dispatcher import (
     InMemoryEventDispatcher,
 )
+from src.shared.infrastructure.events.outbox_event_dispatcher import (
+    OutboxEventDispatcher,
+)
 from src.shared.infrastructure.services.logger_email_service import (
     LoggerEmailService,
 )
+from src.shared.infrastructure.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
 
 
 class InfrastructureModule(Module):
@@ -62,13 +77,18 @@ class InfrastructureModule(Module):
 
     Bindings:
         - DatabaseConnectionFactory → PostgresConnectionFactory (singleton)
-        - EventDispatcher → InMemoryEventDispatcher (singleton)
+        - EventDispatcher → InMemoryEventDispatcher, AsyncEventDispatcher or
+          OutboxEventDispatcher (singleton, selected by EVENT_DISPATCHER)
         - EmailService → LoggerEmailService (singleton)
+        - PasswordHasher → ProcessPoolPasswordHasher (singleton)
+        - UnitOfWork → PostgresUnitOfWork (singleton)
 
     Singleton Justification:
         - Connection pool: Created once and reused (thread-safe pool)
+        - Password hasher: One process pool per application process
         - Event dispatcher: Single registry for all event→handler mappings
         - Email service: Stateless, thread-safe, no per-request state
+        - Unit of work: Stateless, transaction state is per context (ContextVar)
         - Shared resources prevent duplication and ensure consistency
 
     Future Bindings:
@@ -90,17 +110,17 @@ class InfrastructureModule(Module):
         Args:
             binder: Injector binder for dependency registration
         """
-        # Event dispatcher (singleton - one registry for entire application)
+        # Email service (singleton - stateless logger implementation)
         binder.bind(
-            EventDispatcher,  # type: ignore[type-abstract]
-            to=InMemoryEventDispatcher,
+            EmailService,  # type: ignore[type-abstract]
+            to=LoggerEmailService,
             scope=singleton,
         )
 
-        # Email service (singleton - stateless logger implementation)
+        # Unit of work (singleton - stateless, delegates to connection factory)
         binder.bind(
-            EmailService,  # type: ignore[type-abstract]
-            to=LoggerEmailService,
+            UnitOfWork,  # type: ignore[type-abstract]
+            to=PostgresUnitOfWork,
             scope=singleton,
         )
 
@@ -123,9 +143,11 @@ class InfrastructureModule(Module):
             - Closed: Application shutdown (via shutdown event)
 
         Thread Safety:
-            - PostgresConnectionFactory uses ThreadedConnectionPool
+            - PostgresConnectionFactory uses BlockingConnectionPool
             - Safe to inject in multiple FastAPI workers
-            - Pool handles concurrent connection requests
+            - Pool handles concurrent connection requests: when exhausted,
+              a checkout waits up to DATABASE_POOL_TIMEOUT seconds for a
+              free connection instead of raising PoolError
 
         Environment Configuration:
             Reads from environment variables (same as docker-compose.yml):
@@ -136,3 +158,65 @@ class InfrastructureModule(Module):
             - DATABASE_PASSWORD (default: postgres)
         """
         return PostgresConnectionFactory()
+
+    @singleton
+    @provider
+    def provide_event_dispatcher(
+        self, injector: Injector, db: DatabaseConnectionFactory
+    ) -> EventDispatcher:
+        """
+        Provide singleton EventDispatcher (one registry for entire application).
+
+        Returns:
+            EventDispatcher: InMemoryEventDispatcher (handlers run inline, in
+            the command's unit of work), AsyncEventDispatcher (handlers run
+            on worker threads after COMMIT) or OutboxEventDispatcher (events
+            stored in the command's transaction, delivered by OutboxRelay)
+
+        Environment Configuration:
+            - EVENT_DISPATCHER: "sync" (default), "async" or "outbox"
+            - EVENT_DISPATCHER_WORKERS: Worker threads (default: 4)
+            - EVENT_QUEUE_SIZE: Queue capacity in events (default: 1000)
+            - EVENT_QUEUE_FULL: "block" (default) or "reject"
+            - EVENT_QUEUE_TIMEOUT: Seconds "block" waits for a slot (default: 5)
+            - EVENT_BATCH_SIZE: Events per handle_batch() call (default: 1, off)
+            - EVENT_BATCH_WINDOW: Seconds a worker waits to fill a batch (default: 0.05)
+
+        Raises:
+            ValueError: If EVENT_DISPATCHER or EVENT_QUEUE_FULL is unknown
+        """
+        mode = os.getenv("EVENT_DISPATCHER", "sync").strip().lower()
+        if mode == "sync":
+            return InMemoryEventDispatcher(injector)
+        if mode == "outbox":
+            return OutboxEventDispatcher(injector, db)
+        if mode != "async":
+            raise ValueError(f"Unknown EVENT_DISPATCHER: {mode!r}")
+
+        return AsyncEventDispatcher(
+            injector,
+            db,
+            workers=int(os.getenv("EVENT_DISPATCHER_WORKERS", "4")),
+            queue_size=int(os.getenv("EVENT_QUEUE_SIZE", "1000")),
+            full_policy=QueueFullPolicy(os.getenv("EVENT_QUEUE_FULL", "block").strip().lower()),
+            block_timeout=float(os.getenv("EVENT_QUEUE_TIMEOUT", "5")),
+            batch_size=int(os.getenv("EVENT_BATCH_SIZE", "1")),
+            batch_window=float(os.getenv("EVENT_BATCH_WINDOW", "0.05")),
+        )
+
+    @singleton
+    @provider
+    def provide_password_hasher(self) -> PasswordHasher:
+        """
+        Provide singleton PasswordHasher for dependency injection.
+
+        Creates a ProcessPoolPasswordHasher so bcrypt runs in dedicated worker
+        processes instead of request worker threads.
+
+        Returns:
+            PasswordHasher: Singleton instance of ProcessPoolPasswordHasher
+
+        Environment Configuration:
+            - PASSWORD_HASHER_WORKERS (default: CPU count)
+        """
+        return ProcessPoolPasswordHasher()
@@ -0,0 +1,498 @@
+"""
+Asynchronous event dispatcher backed by a bounded queue and worker threads.
+
+InMemoryEventDispatcher runs handlers inline: POST /accounts waits for the
+activation code upsert and the email send before answering 201. This
+dispatcher queues the event and returns; a pool of worker threads resolves
+and runs the handlers in the background.
+
+Design Decisions:
+    - After-commit hand-off: Events dispatched inside a transaction are
+      queued only once it commits (DatabaseConnectionFactory.after_commit),
+      and dropped on rollback. Workers never see an event whose aggregate
+      is not durable yet, and never handle a rolled back registration
+    - Bounded capacity: A slot is taken by reserve(), before the caller's
+      unit of work opens (or by dispatch() without reservation), and
+      released when the handler finishes. Events awaiting COMMIT count
+      against the capacity, so a full queue is detected before anything is
+      written
+    - Full queue policy: BLOCK waits up to block_timeout for a slot, REJECT
+      fails immediately; both raise EventQueueFullError. Reserving first
+      keeps that wait from holding a pooled connection and uncommitted rows
+      (unique email index entry) while the pool drains
+    - Handler errors: Logged and counted, the worker moves on (no retry)
+    - Optional batching (batch_size > 1): A worker that takes an event keeps
+      collecting queued events until it holds batch_size of them or
+      batch_window elapsed, then hands each event type's group to the
+      handler's handle_batch(events) in one call. Handlers without
+      handle_batch() still get one handle(event) call per event
+    - Lazy worker spawn: Threads start on first dispatch (after fork)
+    - Graceful drain: shutdown() stops intake, lets workers finish every
+      queued event, then joins them; start() reopens (one FastAPI lifespan
+      per TestClient, like the connection pool)
+
+Trade-offs (compared with InMemoryEventDispatcher):
+    - Handlers run in their own transaction, after the command committed:
+      a failing AccountCreatedHandler leaves an account without activation
+      code (logged) instead of rolling back the registration
+    - Queued events are lost if the process dies before handling them
+    - Batching trades latency for throughput: an isolated event waits up to
+      batch_window for company, and a failing handle_batch() fails the
+      whole group
+
+Configuration (InfrastructureModule, EVENT_DISPATCHER=async):
+    EVENT_DISPATCHER_WORKERS: Worker threads (default: 4)
+    EVENT_QUEUE_SIZE: Capacity in events (default: 1000)
+    EVENT_QUEUE_FULL: "block" (default) or "reject"
+    EVENT_QUEUE_TIMEOUT: Seconds BLOCK waits for a slot (default: 5)
+    EVENT_BATCH_SIZE: Events handed over per handle_batch() call (default: 1,
+        no batching)
+    EVENT_BATCH_WINDOW: Seconds a worker waits to fill a batch (default: 0.05)
+
+Usage Example:
+    ```python
+    dispatcher = AsyncEventDispatcher(injector, db, workers=4, queue_size=1000)
+    dispatcher.register(AccountCreated, AccountCreatedHandler)
+
+    with dispatcher.reserve(AccountCreated):    # Waits for a slot, no connection held
+        with uow.begin():
+            repository.create_if_email_absent(account)
+            dispatcher.dispatch(AccountCreated(...))  # Queued after COMMIT
+    # Returns without waiting for the handler
+
+    dispatcher.stats().queue_depth  # Events waiting for a worker
+    dispatcher.shutdown()           # Application shutdown: drain, then stop
+    ```
+"""
+
+import functools
+import logging
+import math
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+
+from injector import Injector
+
+from src.shared.domain.events.event_dispatcher import EventDispatcher
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the dispatch-to-completion latency histogram buckets
+LATENCY_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
+
+
+class QueueFullPolicy(Enum):
+    """Behavior of dispatch() when every queue slot is taken."""
+
+    BLOCK = "block"
+    REJECT = "reject"
+
+
+class EventQueueFullError(Exception):
+    """
+    Raised by reserve() or dispatch() when no queue slot is available.
+
+    Raised before the caller's unit of work by reserve() (nothing written),
+    or inside it by dispatch() (the command is rolled back); either way the
+    command can be retried (HTTP 503).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        super().__init__(f"Event queue full ({capacity} events)")
+
+
+@dataclass(frozen=True)
+class EventDispatcherStats:
+    """
+    Snapshot of asynchronous dispatcher activity.
+
+    Attributes:
+        workers: Worker threads
+        capacity: Maximum events reserved, queued or being handled
+        pending_commit: Events dispatched in a transaction not committed yet
+        queue_depth: Events queued, waiting for a free worker
+        peak_queue_depth: Highest queue_depth observed since startup
+        in_progress: Events being handled by a worker
+        dispatched: Events accepted by dispatch()
+        handled: Events whose handler returned
+        failed: Events whose handler raised
+        rejected: dispatch() calls that found the queue full
+        batches: handle_batch() calls (events handed over in bulk)
+        latency_histogram: (upper bound in seconds, count) per bucket,
+            non-cumulative, from enqueue to handler completion
+    """
+
+    workers: int
+    capacity: int
+    pending_commit: int
+    queue_depth: int
+    peak_queue_depth: int
+    in_progress: int
+    dispatched: int
+    handled: int
+    failed: int
+    rejected: int
+    batches: int
+    latency_histogram: tuple[tuple[float, int], ...]
+
+
+class AsyncEventDispatcher(EventDispatcher):
+    """
+    Event dispatcher handing events to a pool of worker threads.
+
+    dispatch() returns as soon as the event is queued (or scheduled for
+    queueing after COMMIT). Handlers are resolved via injector on the worker
+    thread, one event (or one batch) at a time per worker: handlers must be
+    thread-safe.
+
+    Thread Safety:
+        reserve(), dispatch(), register() and stats() may be called from any
+        thread. Counters are guarded by a lock; capacity by a semaphore.
+        Reservations are tracked per thread (or asyncio task) in a ContextVar.
+
+    Lifecycle:
+        - Workers spawned lazily on first dispatch
+        - shutdown() rejects new events, drains the queue, joins workers
+        - Restartable: start() after shutdown() accepts events again
+    """
+
+    def __init__(
+        self,
+        injector: Injector,
+        db: DatabaseConnectionFactory,
+        workers: int = 4,
+        queue_size: int = 1000,
+        full_policy: QueueFullPolicy = QueueFullPolicy.BLOCK,
+        block_timeout: float = 5.0,
+        batch_size: int = 1,
+        batch_window: float = 0.05,
+    ) -> None:
+        """
+        Initialize dispatcher (no thread started).
+
+        Args:
+            injector: Injector resolving event handlers
+            db: Connection factory providing after_commit()
+            workers: Worker threads
+            queue_size: Capacity in events (reserved, queued or in progress)
+            full_policy: Wait for a slot (BLOCK) or fail at once (REJECT)
+            block_timeout: Seconds BLOCK waits before EventQueueFullError
+            batch_size: Maximum events per handle_batch() call (1: no batching)
+            batch_window: Seconds a worker waits for more events to fill a batch
+
+        Raises:
+            ValueError: If workers, queue_size or batch_size is below 1
+        """
+        if workers < 1:
+            raise ValueError(f"Worker count must be at least 1, got {workers}")
+        if queue_size < 1:
+            raise ValueError(f"Queue size must be at least 1, got {queue_size}")
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batch_size}")
+
+        self._injector = injector
+        self._db = db
+        self._handlers: dict[type, type] = {}
+        self._worker_count = workers
+        self._capacity = queue_size
+        self._full_policy = full_policy
+        self._block_timeout = block_timeout
+        self._batch_size = batch_size
+        self._batch_window = batch_window
+
+        self._slots = threading.BoundedSemaphore(queue_size)
+        # Slots taken by reserve() and not used by dispatch() yet, per context
+        self._reserved: ContextVar[int] = ContextVar(f"reserved_slots_{id(self)}", default=0)
+        # (event, enqueue time) entries; None tells a worker to exit
+        self._queue: queue.SimpleQueue[tuple[object, float] | None] = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._pending_commit = 0
+        self._queued = 0
+        self._peak_queue_depth = 0
+        self._in_progress = 0
+        self._dispatched = 0
+        self._handled = 0
+        self._failed = 0
+        self._rejected = 0
+        self._batches = 0
+        self._latency_counts = [0] * len(LATENCY_BUCKETS)
+
+    def register(self, event_type: type, handler_type: type) -> None:
+        """
+        Register event handler for given event type.
+
+        Args:
+            event_type: Domain event class (e.g., AccountCreated)
+            handler_type: Handler class (e.g., AccountCreatedHandler)
+        """
+        self._handlers[event_type] = handler_type
+
+    @contextmanager
+    def reserve(self, event_type: type) -> Generator[None]:
+        """
+        Take a queue slot for one event_type dispatched inside the block.
+
+        Call before opening the unit of work: a BLOCK wait then holds no
+        pooled connection and no uncommitted row.
+
+        Args:
+            event_type: Domain event class that will be dispatched once
+
+        Yields:
+            None: The next dispatch() in this context uses the slot
+
+        Raises:
+            EventQueueFullError: If no slot frees up (REJECT: immediately,
+                BLOCK: within block_timeout)
+            RuntimeError: If the dispatcher was shut down
+
+        Behavior:
+            - If no handler registered: nothing reserved
+            - Slot released on exit if dispatch() did not use it (command
+              failed before dispatching, e.g. duplicate email)
+        """
+        if event_type not in self._handlers:
+            yield
+            return
+
+        self._acquire_slot()
+        outer = self._reserved.get()
+        token = self._reserved.set(outer + 1)
+        try:
+            yield
+        finally:
+            unused = self._reserved.get() > outer
+            self._reserved.reset(token)
+            if unused:
+                self._slots.release()
+
+    def dispatch(self, event: object) -> None:
+        """
+        Queue event for a worker thread (non-blocking unless the queue is full).
+
+        Inside a transaction, the event is queued after COMMIT and dropped on
+        rollback; outside, it is queued immediately.
+
+        Args:
+            event: Domain event instance
+
+        Raises:
+            EventQueueFullError: If no slot was reserved and none frees up
+                (REJECT: immediately, BLOCK: within block_timeout)
+            RuntimeError: If the dispatcher was shut down
+
+        Behavior:
+            - If no handler registered: silently ignore (no slot used)
+            - Uses the slot taken by an enclosing reserve(), if any
+            - Handler exceptions are logged on the worker, never raised here
+        """
+        if type(event) not in self._handlers:
+            return
+
+        reserved = self._reserved.get()
+        if reserved:
+            if self._closed:
+                raise RuntimeError("Event dispatcher is shut down")
+            self._reserved.set(reserved - 1)
+        else:
+            self._acquire_slot()
+
+        self._start_workers()
+        with self._lock:
+            self._dispatched += 1
+            self._pending_commit += 1
+
+        self._db.after_commit(functools.partial(self._enqueue, event), self._discard)
+
+    def stats(self) -> EventDispatcherStats:
+        """
+        Return a snapshot of dispatcher metrics.
+
+        Returns:
+            EventDispatcherStats: Queue depth, counters and latency histogram
+        """
+        with self._lock:
+            return EventDispatcherStats(
+                workers=self._worker_count,
+                capacity=self._capacity,
+                pending_commit=self._pending_commit,
+                queue_depth=self._queued,
+                peak_queue_depth=self._peak_queue_depth,
+                in_progress=self._in_progress,
+                dispatched=self._dispatched,
+                handled=self._handled,
+                failed=self._failed,
+                rejected=self._rejected,
+                batches=self._batches,
+                latency_histogram=tuple(zip(LATENCY_BUCKETS, self._latency_counts, strict=True)),
+            )
+
+    def start(self) -> None:
+        """
+        Accept events again after shutdown() (application startup).
+
+        Workers are still spawned on the next dispatch. No-op if running.
+        """
+        with self._lock:
+            self._closed = False
+
+    def shutdown(self, timeout: float | None = 30.0) -> None:
+        """
+        Stop accepting events, handle every queued one, then stop the workers.
+
+        Should be called on application shutdown, once requests are drained.
+        Events committed after shutdown() (transactions still in flight) are
+        handled inline on the committing thread.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain (None: no limit)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers, self._workers = self._workers, []
+
+        for _ in workers:
+            self._queue.put(None)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in workers:
+            worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if worker.is_alive():
+                logger.warning("Event dispatcher shutdown timed out with events still queued")
+                return
+
+    def _acquire_slot(self) -> None:
+        """Take a queue slot according to the full queue policy."""
+        if self._closed:
+            raise RuntimeError("Event dispatcher is shut down")
+
+        blocking = self._full_policy is QueueFullPolicy.BLOCK
+        if not self._slots.acquire(blocking, self._block_timeout if blocking else None):
+            with self._lock:
+                self._rejected += 1
+            raise EventQueueFullError(self._capacity)
+
+    def _start_workers(self) -> None:
+        """Spawn the worker threads on first use."""
+        if self._workers:
+            return
+
+        with self._lock:
+            if self._workers or self._closed:
+                return
+            self._workers = [
+                threading.Thread(target=self._work, name=f"event-dispatcher-{index}", daemon=True)
+                for index in range(self._worker_count)
+            ]
+            for worker in self._workers:
+                worker.start()
+
+    def _enqueue(self, event: object) -> None:
+        """Hand a committed event to the workers (after_commit hook)."""
+        with self._lock:
+            self._pending_commit -= 1
+            if not self._closed:
+                self._queued += 1
+                self._peak_queue_depth = max(self._peak_queue_depth, self._queued)
+                self._queue.put((event, time.perf_counter()))
+                return
+            self._in_progress += 1
+
+        # Committed after shutdown(): no worker left to hand it to
+        self._handle([(event, time.perf_counter())])
+
+    def _discard(self) -> None:
+        """Release the slot of an event whose transaction rolled back."""
+        with self._lock:
+            self._dispatched -= 1
+            self._pending_commit -= 1
+        self._slots.release()
+
+    def _work(self) -> None:
+        """Worker thread loop: handle queued events (in batches) until the None entry."""
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+
+            entries = [entry]
+            self._take()
+            stopping = False
+            deadline = time.monotonic() + self._batch_window
+            while len(entries) < self._batch_size:
+                try:
+                    entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                entries.append(entry)
+                self._take()
+
+            self._handle(entries)
+            if stopping:
+                return
+
+    def _take(self) -> None:
+        """Move an event taken by a worker from queued to in progress."""
+        with self._lock:
+            self._queued -= 1
+            self._in_progress += 1
+
+    def _handle(self, entries: list[tuple[object, float]]) -> None:
+        """Run the registered handlers, one batch per event type if supported."""
+        groups: dict[type, list[tuple[object, float]]] = {}
+        for entry in entries:
+            groups.setdefault(type(entry[0]), []).append(entry)
+
+        for event_type, group in groups.items():
+            if len(group) > 1 and hasattr(self._handlers[event_type], "handle_batch"):
+                self._run(event_type, "handle_batch", [event for event, _ in group], group)
+            else:
+                for event, enqueued_at in group:
+                    self._run(event_type, "handle", event, [(event, enqueued_at)])
+
+    def _run(
+        self,
+        event_type: type,
+        method: str,
+        argument: object,
+        entries: list[tuple[object, float]],
+    ) -> None:
+        """Call handler.method(argument) for entries in progress, record outcomes, free slots."""
+        failed = False
+        try:
+            handler: object = self._injector.get(self._handlers[event_type])
+            getattr(handler, method)(argument)
+        except Exception:
+            failed = True
+            logger.exception("Handler failed for %s", event_type.__name__)
+        finally:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self._in_progress -= len(entries)
+                if failed:
+                    self._failed += len(entries)
+                else:
+                    self._handled += len(entries)
+                if method == "handle_batch":
+                    self._batches += 1
+                for _, enqueued_at in entries:
+                    latency = finished_at - enqueued_at
+                    self._latency_counts[bisect_left(LATENCY_BUCKETS, latency)] += 1
+            self._slots.release(len(entries))
@@ -21,30 +21,10 @@ Trade-offs:
     - Acceptable for test technique scope and demonstration purposes
     - Production evolution: replace with async implementation (see below)
 
-Future Evolution Path:
-    from queue import Queue
-    from threading import Thread
-
-    class AsyncEventDispatcher(EventDispatcher):
-        @inject
-        def __init__(self, injector: Injector):
-            self._injector = injector
-            self._handlers: Dict[Type, Type] = {}
-            self._queue: Queue[object] = Queue()
-            self._worker = Thread(target=self._process_events, daemon=True)
-            self._worker.start()
-
-        def dispatch(self, event: object) -> None:
-            self._queue.put(event)  # Non-blocking return
-
-        def _process_events(self) -> None:
-            while True:
-                event = self._queue.get()
-                handler_type = self._handlers.get(type(event))
-                if handler_type:
-                    handler = self._injector.get(handler_type)
-                    handler.handle(event)
-                self._queue.task_done()
+Evolution:
+    AsyncEventDispatcher (async_event_dispatcher.py) implements the async
+    path: bounded queue, worker threads, events handed over after COMMIT.
+    Selected with EVENT_DISPATCHER=async; this dispatcher stays the default.
 """
 
 from injector import Injector, inject
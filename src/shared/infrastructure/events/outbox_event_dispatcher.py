@@ -0,0 +1,175 @@
+"""
+Transactional outbox event dispatcher.
+
+InMemoryEventDispatcher runs handlers inside the command's transaction, and
+AsyncEventDispatcher hands events to threads after COMMIT: in both cases a
+crash at the wrong moment loses side effects that were never performed
+(e.g. the activation email). This dispatcher only records the event, as an
+outbox row written in the command's transaction; OutboxRelay workers
+deliver it to the registered handlers later.
+
+Design Decisions:
+    - Same transaction as the aggregate: dispatch() joins the active unit of
+      work, so the event is durable exactly when the account is
+    - Codecs: Each event type is stored as a JSON object by an OutboxCodec
+      (name + encode/decode), registered next to its handler
+    - Delivery through deliver(): The relay decodes the row and runs the
+      handler resolved via injector, as InMemoryEventDispatcher does
+    - At-least-once: A handler may run again if it failed halfway or the
+      relay died before marking the row; handlers must tolerate repeats
+      (AccountCreatedHandler reuses the unexpired activation code)
+
+Architecture:
+    - Implements: EventDispatcher (domain interface)
+    - Storage: outbox table (migrations/20251112_090000_create_outbox_table.sql)
+    - Delivery: OutboxRelay (outbox_relay.py), in-process or scripts/run_outbox_relay.py
+
+Usage Example:
+    ```python
+    dispatcher = OutboxEventDispatcher(injector, db)
+    dispatcher.register(AccountCreated, AccountCreatedHandler)
+    dispatcher.register_codec(AccountCreated, ACCOUNT_CREATED_CODEC)
+
+    with uow.begin():
+        repository.create_if_email_absent(account)
+        dispatcher.dispatch(AccountCreated(...))  # INSERT INTO outbox, same COMMIT
+    ```
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from injector import Injector
+from psycopg2.extras import Json
+
+from src.shared.domain.events.event_dispatcher import EventDispatcher
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+
+
+@dataclass(frozen=True)
+class OutboxCodec:
+    """
+    Serialization of one event type in outbox rows.
+
+    Attributes:
+        name: Stored in outbox.event_type (stable across releases)
+        encode: Event to JSON object
+        decode: JSON object back to the event
+    """
+
+    name: str
+    encode: Callable[[Any], dict[str, Any]]
+    decode: Callable[[dict[str, Any]], Any]
+
+
+class OutboxEventDispatcher(EventDispatcher):
+    """
+    Event dispatcher writing events to the outbox table.
+
+    dispatch() performs one INSERT in the active transaction (or in its own
+    when called outside a unit of work). Nothing runs until a relay claims
+    the row.
+
+    Thread Safety:
+        Registration happens at startup; dispatch() and deliver() are
+        stateless and may be called from any thread.
+    """
+
+    def __init__(self, injector: Injector, db: DatabaseConnectionFactory) -> None:
+        """
+        Initialize dispatcher.
+
+        Args:
+            injector: Injector resolving event handlers (relay side)
+            db: Connection factory (dispatch joins its active transaction)
+        """
+        self._injector = injector
+        self._db = db
+        self._handlers: dict[type, type] = {}
+        self._codecs: dict[type, OutboxCodec] = {}
+        self._types_by_name: dict[str, type] = {}
+
+    def register(self, event_type: type, handler_type: type) -> None:
+        """
+        Register event handler for given event type.
+
+        Args:
+            event_type: Domain event class (e.g., AccountCreated)
+            handler_type: Handler class (e.g., AccountCreatedHandler)
+        """
+        self._handlers[event_type] = handler_type
+
+    def register_codec(self, event_type: type, codec: OutboxCodec) -> None:
+        """
+        Register how event_type is stored in the outbox.
+
+        Args:
+            event_type: Domain event class (e.g., AccountCreated)
+            codec: Name and JSON conversion of the event
+        """
+        self._codecs[event_type] = codec
+        self._types_by_name[codec.name] = event_type
+
+    def dispatch(self, event: object) -> None:
+        """
+        Record event in the outbox, in the active transaction.
+
+        Args:
+            event: Domain event instance
+
+        Raises:
+            LookupError: If a handler is registered but no codec
+            psycopg2.DatabaseError: If the INSERT fails (the unit of work
+                is rolled back with it)
+
+        Behavior:
+            - If no handler registered: silently ignore (nothing stored)
+        """
+        event_type = type(event)
+        if event_type not in self._handlers:
+            return
+        codec = self._codecs.get(event_type)
+        if codec is None:
+            raise LookupError(f"No outbox codec registered for {event_type.__name__}")
+
+        with self._db.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "INSERT INTO outbox (event_type, payload) VALUES (%s, %s)",
+                    (codec.name, Json(codec.encode(event))),
+                )
+
+    def event_names(self) -> list[str]:
+        """
+        Names of the event types this process can deliver (handler and codec).
+
+        Returns:
+            list[str]: outbox.event_type values a relay should claim
+        """
+        return [
+            codec.name for event_type, codec in self._codecs.items() if event_type in self._handlers
+        ]
+
+    def deliver(self, event_name: str, payload: dict[str, Any]) -> None:
+        """
+        Decode an outbox row and run its handler (called by OutboxRelay).
+
+        Runs on the relay's thread, outside any transaction: handler writes
+        commit on their own, before the row is marked as processed.
+
+        Args:
+            event_name: outbox.event_type
+            payload: outbox.payload
+
+        Raises:
+            LookupError: If the event name has no codec or handler
+            Exception: Whatever the handler raises
+        """
+        event_type = self._types_by_name.get(event_name)
+        if event_type is None or event_type not in self._handlers:
+            raise LookupError(f"No handler registered for outbox event {event_name}")
+
+        event = self._codecs[event_type].decode(payload)
+        handler: object = self._injector.get(self._handlers[event_type])
+        handler.handle(event)  # type: ignore[attr-defined]
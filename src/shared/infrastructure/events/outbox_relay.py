@@ -0,0 +1,306 @@
+"""
+Outbox relay: delivers recorded events to their handlers.
+
+Reads the outbox table written by OutboxEventDispatcher and runs the
+registered handler of each pending event, then marks the row as processed.
+Runs as a background thread of the API process or as a standalone process
+(scripts/run_outbox_relay.py); any number of relays can run in parallel.
+
+Design Decisions:
+    - Claim with FOR UPDATE SKIP LOCKED: Each relay picks a batch of pending
+      rows in id order; concurrent relays skip locked rows instead of
+      waiting, so relays never serialize
+    - Claim committed up front: The claim statement counts the attempt and
+      pushes next_attempt_at to attempts * retry_delay seconds ahead, then
+      commits. The rows are unlocked but no other relay picks them before
+      that delay; a relay that dies mid-batch only delays its events
+      (at-least-once delivery)
+    - Handlers outside the claim transaction: No row lock or pooled
+      connection is held while a handler performs I/O (activation email).
+      Handler writes commit on their own (activation code saved before the
+      email is sent), so handlers must be idempotent (save_if_absent())
+    - processed_at after delivery: Rows of delivered events are marked in
+      one statement once the batch is handled; a failed event keeps its
+      last_error and is retried after attempts * retry_delay seconds, up to
+      max_attempts (then left as a dead letter)
+    - Drain then poll: Full batches are followed immediately by the next
+      one; a partial batch means the outbox is drained, so the relay sleeps
+      for poll_interval
+    - Only known events: A relay claims only the event types it has a
+      handler and codec for (several services may share the table)
+
+Configuration:
+    OUTBOX_RELAY_BATCH_SIZE: Events claimed per transaction (default: 100)
+    OUTBOX_RELAY_POLL_INTERVAL: Seconds between polls when idle (default: 0.5)
+    OUTBOX_RELAY_MAX_ATTEMPTS: Deliveries tried per event (default: 5)
+    OUTBOX_RELAY_RETRY_DELAY: Seconds of delay per attempt (default: 30)
+
+Usage Example:
+    ```python
+    relay = OutboxRelay(db, dispatcher, batch_size=100)
+    relay.start()               # Background thread (FastAPI lifespan)
+    ...
+    relay.stop()                # Application shutdown
+
+    relay.relay_batch()         # Or one batch at a time (tests, scripts)
+    ```
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+from src.shared.infrastructure.events.outbox_event_dispatcher import (
+    OutboxEventDispatcher,
+)
+
+logger = logging.getLogger(__name__)
+
+# Counts the attempt and postpones the rows (the retry delay doubles as the
+# claim lease), so the claim can commit before the handlers run
+_CLAIM_BATCH = """
+    UPDATE outbox
+    SET attempts = outbox.attempts + 1,
+        next_attempt_at = NOW() + (outbox.attempts + 1) * %s * INTERVAL '1 second'
+    WHERE id IN (
+        SELECT id
+        FROM outbox
+        WHERE processed_at IS NULL
+          AND event_type = ANY(%s)
+          AND attempts < %s
+          AND next_attempt_at <= NOW()
+        ORDER BY id
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, event_type, payload
+"""
+
+_MARK_PROCESSED = "UPDATE outbox SET processed_at = NOW() WHERE id = ANY(%s)"
+
+_RECORD_FAILURES = """
+    UPDATE outbox
+    SET last_error = failure.error
+    FROM unnest(%s::bigint[], %s::text[]) AS failure(id, error)
+    WHERE outbox.id = failure.id
+"""
+
+
+def _get_relay_config() -> dict[str, float]:
+    """
+    Read relay settings from environment variables.
+
+    Environment Variables:
+        OUTBOX_RELAY_BATCH_SIZE: Events per batch (default: 100)
+        OUTBOX_RELAY_POLL_INTERVAL: Idle poll interval in seconds (default: 0.5)
+        OUTBOX_RELAY_MAX_ATTEMPTS: Deliveries tried per event (default: 5)
+        OUTBOX_RELAY_RETRY_DELAY: Seconds of delay per attempt (default: 30)
+
+    Returns:
+        dict: batch_size, poll_interval, max_attempts and retry_delay
+    """
+    return {
+        "batch_size": int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "100")),
+        "poll_interval": float(os.getenv("OUTBOX_RELAY_POLL_INTERVAL", "0.5")),
+        "max_attempts": int(os.getenv("OUTBOX_RELAY_MAX_ATTEMPTS", "5")),
+        "retry_delay": float(os.getenv("OUTBOX_RELAY_RETRY_DELAY", "30")),
+    }
+
+
+def create_outbox_relay(
+    db: DatabaseConnectionFactory, dispatcher: OutboxEventDispatcher
+) -> "OutboxRelay":
+    """
+    Build a relay configured from OUTBOX_RELAY_* environment variables.
+
+    Args:
+        db: Connection factory shared with the handlers' repositories
+        dispatcher: Registry of handlers and codecs
+
+    Returns:
+        OutboxRelay: Relay not started yet
+    """
+    config = _get_relay_config()
+    return OutboxRelay(
+        db,
+        dispatcher,
+        batch_size=int(config["batch_size"]),
+        poll_interval=config["poll_interval"],
+        max_attempts=int(config["max_attempts"]),
+        retry_delay=config["retry_delay"],
+    )
+
+
+@dataclass(frozen=True)
+class OutboxRelayStats:
+    """
+    Snapshot of relay activity.
+
+    Attributes:
+        batches: Batches claimed and delivered
+        delivered: Events whose handler completed
+        failed: Delivery attempts whose handler raised
+    """
+
+    batches: int
+    delivered: int
+    failed: int
+
+
+class OutboxRelay:
+    """
+    Deliver pending outbox events, one claimed batch at a time.
+
+    Handlers run on the relay thread, after the claim committed and outside
+    any transaction (their repository calls commit on their own).
+
+    Lifecycle:
+        - Created without connecting
+        - start(): Spawns the relay thread (drain, then poll)
+        - stop(): Signals the thread and waits for the current batch
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnectionFactory,
+        dispatcher: OutboxEventDispatcher,
+        batch_size: int = 100,
+        poll_interval: float = 0.5,
+        max_attempts: int = 5,
+        retry_delay: float = 30.0,
+    ) -> None:
+        """
+        Initialize relay (no thread started).
+
+        Args:
+            db: Connection factory shared with the handlers' repositories
+            dispatcher: Registry of handlers and codecs (deliver())
+            batch_size: Events claimed per transaction
+            poll_interval: Seconds to sleep once the outbox is drained
+            max_attempts: Deliveries tried before an event is left pending
+            retry_delay: Seconds of delay per attempt (linear backoff); also
+                how long claimed rows stay reserved, so it must exceed the
+                time needed to deliver a batch
+
+        Raises:
+            ValueError: If batch_size or max_attempts is below 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batch_size}")
+        if max_attempts < 1:
+            raise ValueError(f"Max attempts must be at least 1, got {max_attempts}")
+
+        self._db = db
+        self._dispatcher = dispatcher
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._batches = 0
+        self._delivered = 0
+        self._failed = 0
+
+    def relay_batch(self) -> int:
+        """
+        Claim up to batch_size pending events and deliver them.
+
+        Returns:
+            int: Events claimed (delivered or failed); 0 when none is pending
+
+        Raises:
+            psycopg2.DatabaseError: If claiming or updating rows fails (rows
+                already claimed are delivered again after retry_delay)
+        """
+        event_names = self._dispatcher.event_names()
+        if not event_names:
+            return 0
+
+        with self._db.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    _CLAIM_BATCH,
+                    (self._retry_delay, event_names, self._max_attempts, self._batch_size),
+                )
+                rows = sorted(cursor.fetchall())  # RETURNING order is unspecified
+
+        delivered: list[int] = []
+        failures: list[tuple[int, str]] = []
+        for outbox_id, event_name, payload in rows:
+            try:
+                self._dispatcher.deliver(event_name, payload)
+            except Exception as e:
+                logger.exception("Outbox event %s (%s) failed", outbox_id, event_name)
+                failures.append((outbox_id, f"{type(e).__name__}: {e}"))
+            else:
+                delivered.append(outbox_id)
+
+        if delivered or failures:
+            with self._db.transaction() as conn:
+                with conn.cursor() as cursor:
+                    if delivered:
+                        cursor.execute(_MARK_PROCESSED, (delivered,))
+                    if failures:
+                        ids, errors = zip(*failures, strict=True)
+                        cursor.execute(_RECORD_FAILURES, (list(ids), list(errors)))
+
+        with self._lock:
+            self._batches += 1
+            self._delivered += len(delivered)
+            self._failed += len(failures)
+        return len(rows)
+
+    def start(self) -> None:
+        """Spawn the relay thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the relay thread after its current batch.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_forever(self) -> None:
+        """Relay on the calling thread until stop() (standalone relay process)."""
+        self._stop.clear()
+        self._run()
+
+    def stats(self) -> OutboxRelayStats:
+        """
+        Return a snapshot of relay metrics.
+
+        Returns:
+            OutboxRelayStats: Batches, delivered and failed counters
+        """
+        with self._lock:
+            return OutboxRelayStats(
+                batches=self._batches, delivered=self._delivered, failed=self._failed
+            )
+
+    def _run(self) -> None:
+        """Relay loop: back-to-back full batches, poll_interval sleep when drained."""
+        while not self._stop.is_set():
+            try:
+                claimed = self.relay_batch()
+            except Exception:
+                logger.exception("Outbox relay batch failed")
+                claimed = 0
+
+            if claimed < self._batch_size:
+                self._stop.wait(self._poll_interval)
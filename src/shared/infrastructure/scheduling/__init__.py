@@ -0,0 +1 @@
+"""Time-based scheduling primitives (expiry of in-memory entries)."""
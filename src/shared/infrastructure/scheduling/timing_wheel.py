@@ -0,0 +1,178 @@
+"""
+Hierarchical timing wheel for expiring in-memory entries.
+
+This module tracks deadlines for a large number of keys with O(1) schedule
+and cancel, and amortised O(1) expiry per key, instead of scanning every
+entry or keeping a heap that retains cancelled deadlines.
+
+Design Decisions:
+    - Levels of slots: Level 0 has one slot per tick, level n one slot per
+      slots^n ticks; a key lands in the lowest level whose span covers its
+      delay and cascades down as time advances
+    - Driven by the caller: advance(now) returns expired keys; no timer
+      thread (fork-safe, deterministic in tests)
+    - Key index: key → (level, slot) for O(1) cancel and reschedule
+    - Not thread-safe: Owners serialise access with their own lock
+
+Usage Example:
+    ```python
+    wheel: TimingWheel[AccountId] = TimingWheel(tick=1.0, start=time.time())
+
+    wheel.schedule(account_id, deadline=time.time() + 60)
+    ...
+    for expired_id in wheel.advance(time.time()):
+        del activations[expired_id]
+    ```
+"""
+
+import math
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+
+
+class TimingWheel(Generic[_K]):  # noqa: UP046
+    """
+    Hierarchical timing wheel of key deadlines.
+
+    Deadlines are rounded up to the next tick, so keys expire at most one
+    tick late and never early. Deadlines beyond the top level's span are
+    parked in the top level and cascade (or, with a single level, are
+    placed again) until due.
+    """
+
+    def __init__(self, tick: float, start: float, slots: int = 64, levels: int = 4) -> None:
+        """
+        Initialize an empty wheel.
+
+        Args:
+            tick: Resolution in seconds (level 0 slot width)
+            start: Current time (same clock as deadlines and advance())
+            slots: Slots per level
+            levels: Number of levels (span: tick * slots ** levels)
+
+        Raises:
+            ValueError: If tick is not positive, or slots/levels below 2/1
+        """
+        if tick <= 0 or slots < 2 or levels < 1:
+            raise ValueError("Timing wheel needs tick > 0, slots >= 2 and levels >= 1")
+
+        self._tick = tick
+        self._slots = slots
+        self._levels = levels
+        self._current = math.floor(start / tick)
+        self._wheels: list[list[dict[_K, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._positions: dict[_K, tuple[int, int]] = {}
+        self._due: list[_K] = []
+
+    def __len__(self) -> int:
+        """Number of scheduled keys."""
+        return len(self._positions)
+
+    def __contains__(self, key: object) -> bool:
+        """Tell whether a key is scheduled."""
+        return key in self._positions
+
+    def schedule(self, key: _K, deadline: float) -> None:
+        """
+        Schedule (or reschedule) a key to expire at deadline.
+
+        Args:
+            key: Key to expire
+            deadline: Expiry time (same clock as advance())
+        """
+        self.cancel(key)
+        self._place(key, math.ceil(deadline / self._tick))
+
+    def cancel(self, key: _K) -> bool:
+        """
+        Remove a key from the wheel.
+
+        Returns:
+            bool: True if the key was scheduled
+        """
+        position = self._positions.pop(key, None)
+        if position is None:
+            return False
+
+        level, slot = position
+        if level < 0:
+            self._due.remove(key)
+        else:
+            del self._wheels[level][slot][key]
+        return True
+
+    def advance(self, now: float) -> list[_K]:
+        """
+        Move the wheel to now and return the keys whose deadline has passed.
+
+        Args:
+            now: Current time
+
+        Returns:
+            list: Expired keys (no longer scheduled)
+        """
+        target = math.floor(now / self._tick)
+        expired = self._due
+        self._due = []
+
+        while self._current < target:
+            if not self._positions:
+                self._current = target  # Nothing to cascade: skip idle ticks
+                break
+
+            self._current += 1
+            self._cascade()
+            expired.extend(self._due)  # Cascaded with no delay left
+            self._due.clear()
+
+            bucket = self._wheels[0][self._current % self._slots]
+            entries = list(bucket.items())
+            bucket.clear()
+            for key, deadline in entries:
+                if deadline <= self._current:
+                    expired.append(key)
+                else:
+                    # Parked in level 0 (levels=1, delay beyond its span): place again
+                    del self._positions[key]
+                    self._place(key, deadline)
+
+        for key in expired:
+            del self._positions[key]
+        return expired
+
+    def _cascade(self) -> None:
+        """Redistribute higher-level slots whose span starts at the current tick."""
+        for level in range(self._levels - 1, 0, -1):
+            span = self._slots**level
+            if self._current % span:
+                continue
+
+            bucket = self._wheels[level][(self._current // span) % self._slots]
+            entries = list(bucket.items())
+            bucket.clear()
+            for key, deadline in entries:
+                del self._positions[key]
+                self._place(key, deadline)
+
+    def _place(self, key: _K, deadline: int) -> None:
+        """Insert a key in the lowest level covering its delay (in ticks)."""
+        delay = deadline - self._current
+        if delay <= 0:
+            self._due.append(key)
+            self._positions[key] = (-1, -1)
+            return
+
+        level = 0
+        while level < self._levels - 1 and delay >= self._slots ** (level + 1):
+            level += 1
+
+        # Beyond the top level span: park in the furthest top-level slot
+        span = self._slots**level
+        slot_tick = min(deadline, self._current + span * (self._slots - 1))
+        slot = (slot_tick // span) % self._slots
+        self._wheels[level][slot][key] = deadline
+        self._positions[key] = (level, slot)
@@ -0,0 +1,210 @@
+"""
+Process pool implementation of PasswordHasher.
+
+bcrypt is CPU-bound by design (~250ms per hash at the default cost). Running
+it inline inside sync FastAPI endpoints ties up one of the limited anyio
+threadpool threads for the full hash, and registration throughput stops
+scaling once a few cores are busy.
+
+This module submits hashing and verification to a dedicated process pool
+sized from the CPU count, so hashing concurrency is bounded by the hardware
+instead of by the request threadpool, and the work is isolated from the
+interpreter serving HTTP requests. hash_async() awaits the pool future on
+the event loop: async endpoints hold no thread at all while bcrypt runs.
+
+Design Decisions:
+    - ProcessPoolExecutor: One bcrypt computation per core, no GIL contention
+    - Module-level worker functions: Picklable targets for child processes
+    - Lazy worker spawn: Processes start on first submission (after fork)
+    - Queue-depth metrics: Submitted vs completed counters under a lock
+    - asyncio.wrap_future(): Awaitable hash without a thread blocked on result()
+
+Configuration:
+    PASSWORD_HASHER_WORKERS: Number of worker processes (default: CPU count)
+
+Usage Example:
+    ```python
+    hasher = ProcessPoolPasswordHasher(max_workers=4)
+
+    password = Password.from_plain_text("SecurePass123", hasher)
+    password.verify("SecurePass123", hasher)  # True
+
+    hashed = await hasher.hash_async("SecurePass123")  # From an async endpoint
+
+    hasher.stats().queue_depth  # Submissions waiting for a free worker
+    ```
+"""
+
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+import bcrypt
+
+from src.shared.domain.services.password_hasher import PasswordHasher
+
+_T = TypeVar("_T")
+
+
+def _hash_password(plain_password: str) -> str:
+    """Hash password with bcrypt (executed in a worker process)."""
+    return bcrypt.hashpw(plain_password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Check password against bcrypt hash (executed in a worker process)."""
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+def _get_worker_count() -> int:
+    """
+    Read hashing worker count from environment variables.
+
+    Environment Variables:
+        PASSWORD_HASHER_WORKERS: Worker processes (default: os.cpu_count())
+
+    Returns:
+        int: Number of worker processes (at least 1)
+    """
+    configured = os.getenv("PASSWORD_HASHER_WORKERS")
+    if configured:
+        return max(1, int(configured))
+
+    return os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class HashingExecutorStats:
+    """
+    Snapshot of hashing executor activity.
+
+    Attributes:
+        max_workers: Size of the process pool
+        submitted: Total hash/verify operations submitted
+        completed: Total operations finished (success or failure)
+        in_flight: Operations submitted but not yet completed
+        queue_depth: Operations waiting for a free worker process
+        peak_queue_depth: Highest queue_depth observed since startup
+    """
+
+    max_workers: int
+    submitted: int
+    completed: int
+    in_flight: int
+    queue_depth: int
+    peak_queue_depth: int
+
+
+class ProcessPoolPasswordHasher(PasswordHasher):
+    """
+    PasswordHasher running bcrypt in a dedicated process pool.
+
+    hash() and verify() block the calling thread on the result, but the CPU
+    work happens in a worker process; hash_async() awaits the same work
+    without blocking any thread. At most max_workers hashes run
+    concurrently; extra submissions queue inside the executor and are
+    reported as queue_depth.
+
+    Thread Safety:
+        ProcessPoolExecutor.submit() is thread-safe. Metric counters are
+        protected by a lock.
+
+    Lifecycle:
+        - Workers spawned lazily on first submission
+        - shutdown() waits for in-flight work and stops worker processes
+        - Restartable: a submission after shutdown() spawns new workers
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Initialize the hashing process pool.
+
+        Args:
+            max_workers: Worker processes (default: PASSWORD_HASHER_WORKERS
+                or CPU count)
+        """
+        self._max_workers = max_workers if max_workers is not None else _get_worker_count()
+        self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._peak_queue_depth = 0
+
+    def hash(self, plain_password: str) -> str:
+        """Hash password in a worker process (blocks until the hash is ready)."""
+        return self._run(_hash_password, plain_password)
+
+    async def hash_async(self, plain_password: str) -> str:
+        """Hash password in a worker process, awaiting the result on the event loop."""
+        self._count_submitted()
+        try:
+            return await asyncio.wrap_future(self._executor.submit(_hash_password, plain_password))
+        finally:
+            self._count_completed()
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password in a worker process (blocks until the check is done)."""
+        return self._run(_verify_password, plain_password, hashed_password)
+
+    def stats(self) -> HashingExecutorStats:
+        """
+        Return a snapshot of executor metrics.
+
+        Returns:
+            HashingExecutorStats: Submission counters and queue depth
+        """
+        with self._lock:
+            in_flight = self._submitted - self._completed
+            return HashingExecutorStats(
+                max_workers=self._max_workers,
+                submitted=self._submitted,
+                completed=self._completed,
+                in_flight=in_flight,
+                queue_depth=max(0, in_flight - self._max_workers),
+                peak_queue_depth=self._peak_queue_depth,
+            )
+
+    def shutdown(self) -> None:
+        """
+        Stop worker processes after in-flight operations complete.
+
+        Should be called on application shutdown. The hasher stays usable:
+        it switches to a fresh executor whose workers are spawned on the
+        next submission (one FastAPI lifespan per TestClient).
+        """
+        executor, self._executor = (
+            self._executor,
+            ProcessPoolExecutor(max_workers=self._max_workers),
+        )
+        executor.shutdown(wait=True)
+
+    def _run(self, fn: Callable[..., _T], *args: str) -> _T:
+        """
+        Submit fn to the pool and wait for its result.
+
+        Completion is counted by the caller once result() returned (or
+        raised), not in a done callback: Future.set_result() wakes the
+        waiter before running callbacks, so stats() could otherwise report
+        a finished operation as still in flight.
+        """
+        self._count_submitted()
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._count_completed()
+
+    def _count_submitted(self) -> None:
+        """Record a submission and update the peak queue depth."""
+        with self._lock:
+            self._submitted += 1
+            queue_depth = self._submitted - self._completed - self._max_workers
+            self._peak_queue_depth = max(self._peak_queue_depth, queue_depth)
+
+    def _count_completed(self) -> None:
+        """Record a finished operation (success or failure)."""
+        with self._lock:
+            self._completed += 1
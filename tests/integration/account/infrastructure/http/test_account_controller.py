@@ -417,3 +417,66 @@ class TestActivateAccountEndpoint:
         # Assert
         assert response.status_code == 422
         assert "detail" in response.json()
+
+
+# ─────────────────────────────────────────────────
+# GET /accounts - List Accounts Endpoint
+# ─────────────────────────────────────────────────
+
+
+def list_accounts_url() -> str:
+    """Return URL for account listing endpoint."""
+    return "/accounts/"
+
+
+class TestListAccountsEndpoint:
+    """Integration tests for GET /accounts (admin keyset pagination)."""
+
+    def test_walks_pages_of_a_time_window(self, client: TestClient) -> None:
+        """
+        GET /accounts should page through the accounts of a time window.
+
+        Validates:
+            - Accounts returned in creation order, limit per page
+            - next_cursor leads to the next page, null on the last one
+            - Password hash not exposed
+        """
+        # Arrange
+        from datetime import UTC, datetime, timedelta
+
+        created_from = (datetime.now(UTC) - timedelta(milliseconds=1)).isoformat()
+        emails = [f"list-{time.time_ns()}-{i}@example.com" for i in range(3)]
+        for email in emails:
+            response = client.post(
+                create_account_url(), json={"email": email, "password": "SecurePass123!"}
+            )
+            assert response.status_code == 201
+
+        # Act
+        params: dict[str, str | int] = {"limit": 2, "created_from": created_from}
+        first = client.get(list_accounts_url(), params=params, auth=("api", "secret"))
+        params["after"] = first.json()["next_cursor"]
+        second = client.get(list_accounts_url(), params=params, auth=("api", "secret"))
+
+        # Assert
+        assert first.status_code == 200
+        assert second.status_code == 200
+        items = first.json()["items"] + second.json()["items"]
+        assert [item["email"] for item in items] == emails
+        assert set(items[0]) == {"id", "email", "is_activated"}
+        assert first.json()["next_cursor"] == items[1]["id"]
+        assert second.json()["next_cursor"] is None
+
+    def test_returns_401_for_invalid_credentials(self, client: TestClient) -> None:
+        """GET /accounts without valid Basic Auth should return HTTP 401."""
+        response = client.get(list_accounts_url(), auth=("wrong", "credentials"))
+
+        assert response.status_code == 401
+
+    def test_returns_422_for_invalid_cursor(self, client: TestClient) -> None:
+        """GET /accounts with a malformed cursor should return HTTP 422."""
+        response = client.get(
+            list_accounts_url(), params={"after": "not-a-uuid"}, auth=("api", "secret")
+        )
+
+        assert response.status_code == 422
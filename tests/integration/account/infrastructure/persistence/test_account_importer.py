@@ -0,0 +1,139 @@
+"""
+Integration tests for PostgresAccountImporter.
+
+These tests run the whole import pipeline (validation, COPY into the
+staging table, merge into account) against a real PostgreSQL database.
+
+Test Strategy:
+    - Real PostgreSQL database (Docker service)
+    - Small in-memory inputs with unique emails per test run
+    - Inline validation and worker processes both exercised
+"""
+
+import json
+import time
+
+import pytest
+
+from src.account.domain.value_objects.email import Email
+from src.account.infrastructure.persistence.account_importer import (
+    DuplicateRecord,
+    ImportFormat,
+    PostgresAccountImporter,
+    RejectedRecord,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+
+HASH = "$2b$12$" + "b" * 53
+
+
+@pytest.fixture
+def db() -> PostgresConnectionFactory:
+    """Provide a connection factory to the test database."""
+    return PostgresConnectionFactory()
+
+
+@pytest.fixture
+def prefix() -> str:
+    """Provide a unique email prefix for each test."""
+    return f"import-{time.time_ns()}"
+
+
+def test_import_inserts_accounts_and_reports_duplicates_and_rejections(
+    db: PostgresConnectionFactory, prefix: str
+) -> None:
+    """
+    CSV import should insert valid accounts and report what it skipped.
+
+    Validates:
+        - Valid rows inserted (first line wins for a repeated email)
+        - Repeated email reported duplicate_in_file, existing one already_registered
+          (also when the existing email is repeated in the file)
+        - Invalid rows rejected with their line number
+    """
+    # Arrange
+    repository = PostgresAccountRepository(db)
+    PostgresAccountImporter(db, workers=0).run(
+        ["email,password_hash\n", f"{prefix}-existing@example.com,{HASH}\n"], ImportFormat.CSV
+    )
+    lines = [
+        "email,password_hash,is_activated\n",
+        f"{prefix}-a@example.com,{HASH},true\n",
+        f"{prefix}-b@example.com,{HASH},false\n",
+        f"{prefix}-A@example.com,{HASH},false\n",
+        f"{prefix}-existing@example.com,{HASH},false\n",
+        f"not-an-email,{HASH},false\n",
+        f"{prefix}-existing@example.com,{HASH},true\n",
+    ]
+    rejected: list[RejectedRecord] = []
+    duplicates: list[DuplicateRecord] = []
+
+    # Act
+    result = PostgresAccountImporter(db, workers=0, chunk_size=2).run(
+        lines, ImportFormat.CSV, on_rejected=rejected.append, on_duplicate=duplicates.append
+    )
+
+    # Assert
+    assert (result.read, result.rejected, result.inserted, result.duplicates) == (6, 1, 2, 3)
+    assert [record.line for record in rejected] == [6]
+    assert [(d.line, d.reason) for d in duplicates] == [
+        (4, "duplicate_in_file"),
+        (5, "already_registered"),
+        (7, "already_registered"),
+    ]
+    found = repository.find_by_email(Email(f"{prefix}-a@example.com"))
+    assert found is not None
+    assert found.is_activated is True
+
+
+def test_dry_run_rolls_back(db: PostgresConnectionFactory, prefix: str) -> None:
+    """
+    Dry run should report counts without inserting anything.
+
+    Validates:
+        - inserted counted, dry_run flagged
+        - Account absent afterwards
+    """
+    # Arrange
+    line = json.dumps({"email": f"{prefix}@example.com", "password_hash": HASH})
+
+    # Act
+    result = PostgresAccountImporter(db, workers=0).run([line], ImportFormat.NDJSON, dry_run=True)
+
+    # Assert
+    assert (result.inserted, result.dry_run) == (1, True)
+    assert PostgresAccountRepository(db).find_by_email(Email(f"{prefix}@example.com")) is None
+
+
+def test_import_with_worker_processes(db: PostgresConnectionFactory, prefix: str) -> None:
+    """
+    Validation in worker processes should import every chunk in order.
+
+    Validates:
+        - All rows inserted across several chunks
+        - Progress reported after each chunk
+    """
+    # Arrange
+    lines = [
+        json.dumps({"email": f"{prefix}-{i}@example.com", "password_hash": HASH}) + "\n"
+        for i in range(50)
+    ]
+    progress: list[int] = []
+
+    # Act
+    result = PostgresAccountImporter(db, workers=2, chunk_size=10).run(
+        iter(lines), ImportFormat.NDJSON, on_progress=progress.append
+    )
+
+    # Assert
+    assert (result.read, result.inserted) == (50, 50)
+    assert progress == [10, 20, 30, 40, 50]
+
+
+def test_import_rejects_csv_without_required_columns(db: PostgresConnectionFactory) -> None:
+    """A CSV header without email/password_hash should fail before any work."""
+    with pytest.raises(ValueError, match="email and password_hash"):
+        PostgresAccountImporter(db, workers=0).run(["mail,hash\n"], ImportFormat.CSV)
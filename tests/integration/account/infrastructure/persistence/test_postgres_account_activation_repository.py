@@ -10,6 +10,7 @@ Test Strategy:
     - Test UPSERT behavior (one code per account)
     - Test round-trip (entity → DB → entity preserves data)
     - Test FK constraint (activation requires existing account)
+    - Test single-statement activation outcomes (activate_with_code)
     - Repository commits automatically (no manual commit needed)
 
 Database:
@@ -24,10 +25,15 @@ Fixtures:
     - test_account: Sample Account entity for testing
 """
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
 from src.account.domain.entities.account import Account
 from src.account.domain.entities.account_activation import AccountActivation
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.activation_code import ActivationCode
+from src.account.domain.value_objects.activation_outcome import ActivationOutcome
 from src.account.domain.value_objects.email import Email
 from src.account.domain.value_objects.password import Password
 from src.account.infrastructure.persistence.postgres_account_activation_repository import (
@@ -256,3 +262,241 @@ def test_save_raises_foreign_key_error_for_nonexistent_account(
     # Act & Assert: Save should raise IntegrityError (FK violation)
     with pytest.raises(IntegrityError):
         activation_repository.save(activation)
+
+
+def _expired_activation(account_id: AccountId, code: str) -> AccountActivation:
+    """Build an activation whose 60-second lifetime elapsed one second ago."""
+    created_at = datetime.now(UTC) - timedelta(seconds=61)
+    return AccountActivation(
+        _account_id=account_id,
+        _code=ActivationCode(code),
+        _created_at=created_at,
+        _expires_at=created_at + timedelta(seconds=60),
+    )
+
+
+def _live_activation(account_id: AccountId, code: str) -> AccountActivation:
+    """Build an activation created now (60-second lifetime ahead)."""
+    created_at = datetime.now(UTC)
+    return AccountActivation(
+        _account_id=account_id,
+        _code=ActivationCode(code),
+        _created_at=created_at,
+        _expires_at=created_at + timedelta(seconds=60),
+    )
+
+
+def test_save_if_absent_keeps_unexpired_code(
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    """
+    save_if_absent() should reuse the live code (redelivered AccountCreated).
+
+    Validates:
+        - First call inserts and returns the new activation
+        - Second call returns the stored code, which stays in the database
+    """
+    # Act
+    first = activation_repository.save_if_absent(_live_activation(test_account.id, "1111"))
+    second = activation_repository.save_if_absent(_live_activation(test_account.id, "2222"))
+
+    # Assert
+    assert first.code == ActivationCode("1111")
+    assert second.code == ActivationCode("1111")
+    assert second.expires_at == first.expires_at
+    found = activation_repository.find_by_account_id(test_account.id)
+    assert found is not None
+    assert found.code == ActivationCode("1111")
+
+
+def test_save_if_absent_replaces_expired_code(
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    # Arrange
+    activation_repository.save(_expired_activation(test_account.id, "1111"))
+
+    # Act
+    saved = activation_repository.save_if_absent(_live_activation(test_account.id, "2222"))
+
+    # Assert
+    assert saved.code == ActivationCode("2222")
+    found = activation_repository.find_by_account_id(test_account.id)
+    assert found is not None
+    assert found.code == ActivationCode("2222")
+
+
+def test_activate_with_code_activates_account(
+    account_repository: PostgresAccountRepository,
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    """
+    activate_with_code() should activate account when code valid.
+
+    Validates:
+        - Returns ACTIVATED
+        - account.is_activated persisted as True
+        - Email and password hash left untouched
+    """
+    # Arrange
+    activation = AccountActivation.create_for_account(test_account.id)
+    activation_repository.save(activation)
+
+    # Act
+    outcome = activation_repository.activate_with_code(test_account.id, activation.code)
+
+    # Assert
+    assert outcome is ActivationOutcome.ACTIVATED
+    found_account = account_repository.find_by_id(test_account.id)
+    assert found_account is not None
+    assert found_account.is_activated is True
+    assert found_account.email == test_account.email
+    assert found_account.password == test_account.password
+
+
+def test_activate_with_code_is_idempotent_when_already_active(
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    """activate_with_code() should report ACTIVATED again for an active account."""
+    # Arrange
+    activation = AccountActivation.create_for_account(test_account.id)
+    activation_repository.save(activation)
+    activation_repository.activate_with_code(test_account.id, activation.code)
+
+    # Act
+    outcome = activation_repository.activate_with_code(test_account.id, activation.code)
+
+    # Assert
+    assert outcome is ActivationOutcome.ACTIVATED
+
+
+def test_activate_with_code_reports_account_not_found(
+    activation_repository: PostgresAccountActivationRepository,
+) -> None:
+    """activate_with_code() should report ACCOUNT_NOT_FOUND for unknown account."""
+    # Act
+    outcome = activation_repository.activate_with_code(AccountId.generate(), ActivationCode("1234"))
+
+    # Assert
+    assert outcome is ActivationOutcome.ACCOUNT_NOT_FOUND
+
+
+def test_activate_with_code_reports_code_not_found(
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    """activate_with_code() should report CODE_NOT_FOUND when no activation exists."""
+    # Act
+    outcome = activation_repository.activate_with_code(test_account.id, ActivationCode("1234"))
+
+    # Assert
+    assert outcome is ActivationOutcome.CODE_NOT_FOUND
+
+
+def test_activate_with_code_reports_expired_before_mismatch(
+    account_repository: PostgresAccountRepository,
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    """
+    activate_with_code() should check expiration before code value.
+
+    Validates:
+        - Expired code with wrong value reports CODE_EXPIRED (not mismatch)
+        - Account stays inactive
+    """
+    # Arrange
+    activation_repository.save(_expired_activation(test_account.id, "1234"))
+
+    # Act
+    outcome = activation_repository.activate_with_code(test_account.id, ActivationCode("9999"))
+
+    # Assert
+    assert outcome is ActivationOutcome.CODE_EXPIRED
+    found_account = account_repository.find_by_id(test_account.id)
+    assert found_account is not None
+    assert found_account.is_activated is False
+
+
+def test_activate_with_code_reports_code_mismatch(
+    account_repository: PostgresAccountRepository,
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    """
+    activate_with_code() should report CODE_MISMATCH for wrong code value.
+
+    Validates:
+        - Returns CODE_MISMATCH
+        - Account stays inactive
+    """
+    # Arrange
+    activation_repository.save(
+        AccountActivation(
+            _account_id=test_account.id,
+            _code=ActivationCode("1234"),
+            _created_at=datetime.now(UTC),
+            _expires_at=datetime.now(UTC) + timedelta(seconds=60),
+        )
+    )
+
+    # Act
+    outcome = activation_repository.activate_with_code(test_account.id, ActivationCode("9999"))
+
+    # Assert
+    assert outcome is ActivationOutcome.CODE_MISMATCH
+    found_account = account_repository.find_by_id(test_account.id)
+    assert found_account is not None
+    assert found_account.is_activated is False
+
+
+def test_save_many_upserts_and_find_by_account_ids_returns_activations(
+    account_repository: PostgresAccountRepository,
+    activation_repository: PostgresAccountActivationRepository,
+    test_account: Account,
+) -> None:
+    """
+    save_many() should upsert one activation per account in one statement.
+
+    Validates:
+        - Existing code replaced, new code inserted
+        - Account listed twice keeps its last activation
+        - find_by_account_ids() keyed by AccountId, accounts without code absent
+    """
+    # Arrange
+    other = Account.create(
+        Email(f"other-{test_account.email.value}"), Password.from_hash("$2b$12$hashedother")
+    )
+    account_repository.save(other)
+    activation_repository.save(_expired_activation(test_account.id, "0000"))
+    now = datetime.now(UTC)
+
+    def activation(account_id: AccountId, code: str) -> AccountActivation:
+        return AccountActivation(
+            _account_id=account_id,
+            _code=ActivationCode(code),
+            _created_at=now,
+            _expires_at=now + timedelta(seconds=60),
+        )
+
+    # Act
+    activation_repository.save_many(
+        [
+            activation(test_account.id, "1111"),
+            activation(other.id, "2222"),
+            activation(test_account.id, "3333"),
+        ]
+    )
+    found = activation_repository.find_by_account_ids(
+        [test_account.id, other.id, AccountId.generate()]
+    )
+
+    # Assert
+    assert {account_id: a.code for account_id, a in found.items()} == {
+        test_account.id: ActivationCode("3333"),
+        other.id: ActivationCode("2222"),
+    }
+    assert activation_repository.find_by_account_ids([]) == {}
@@ -23,6 +23,11 @@ Fixtures:
     - test_email/test_password: Sample value objects for testing
 """
 
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
 import pytest
 from psycopg2 import IntegrityError
 
@@ -117,6 +122,59 @@ def test_create_account_with_duplicate_email_raises_integrity_error(
         repository.save(account2)
 
 
+def test_create_if_email_absent_inserts_new_account(
+    repository: PostgresAccountRepository,
+    test_email: Email,
+    test_password: Password,
+) -> None:
+    """
+    PostgresAccountRepository.create_if_email_absent() should insert a new account.
+
+    Validates:
+        - Returns True when the email is free
+        - Account is retrievable by email afterwards
+    """
+    # Arrange
+    account = Account.create(test_email, test_password)
+
+    # Act
+    inserted = repository.create_if_email_absent(account)
+
+    # Assert
+    assert inserted is True
+    found_account = repository.find_by_email(test_email)
+    assert found_account is not None
+    assert found_account.id == account.id
+
+
+def test_create_if_email_absent_returns_false_for_duplicate_email(
+    repository: PostgresAccountRepository,
+    test_email: Email,
+    test_password: Password,
+) -> None:
+    """
+    PostgresAccountRepository.create_if_email_absent() should not raise on conflict.
+
+    Validates:
+        - Returns False when the email is already registered
+        - No IntegrityError raised
+        - Existing account is left untouched
+    """
+    # Arrange
+    account1 = Account.create(test_email, test_password)
+    account2 = Account.create(test_email, test_password)  # Same email, different ID
+    repository.create_if_email_absent(account1)
+
+    # Act
+    inserted = repository.create_if_email_absent(account2)
+
+    # Assert
+    assert inserted is False
+    found_account = repository.find_by_email(test_email)
+    assert found_account is not None
+    assert found_account.id == account1.id
+
+
 def test_find_by_email_returns_account_when_found(
     repository: PostgresAccountRepository,
     test_email: Email,
@@ -278,3 +336,294 @@ def test_find_by_id_returns_none_when_not_found(
 
     # Assert
     assert found_account is None
+
+
+def _read_columns(account_id: AccountId) -> tuple[str, bool, datetime]:
+    """Read password_hash, is_activated and updated_at straight from the table."""
+    with PostgresConnectionFactory().read_only_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT password_hash, is_activated, updated_at FROM account WHERE id = %s",
+                (str(account_id.value),),
+            )
+            row = cursor.fetchone()
+    assert row is not None
+    return row[0], row[1], row[2]
+
+
+def test_save_activation_updates_only_changed_columns(
+    repository: PostgresAccountRepository,
+    test_email: Email,
+) -> None:
+    """
+    save() of an activated account should write is_activated and updated_at only.
+
+    Validates:
+        - is_activated persisted, updated_at bumped
+        - Columns changed elsewhere since loading are not overwritten
+    """
+    # Arrange
+    repository.save(Account.create(test_email, Password.from_hash("$2b$12$hashedbeforeupdate")))
+    loaded = repository.find_by_email(test_email)
+    assert loaded is not None
+    _, _, updated_before = _read_columns(loaded.id)
+
+    with PostgresConnectionFactory().transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "UPDATE account SET password_hash = %s WHERE id = %s",
+                ("$2b$12$hashedconcurrently", str(loaded.id.value)),
+            )
+
+    # Act
+    loaded.activate()
+    repository.save(loaded)
+
+    # Assert
+    password_hash, is_activated, updated_after = _read_columns(loaded.id)
+    assert is_activated is True
+    assert updated_after > updated_before
+    assert password_hash == "$2b$12$hashedconcurrently"
+    assert loaded.changed_fields == frozenset()
+
+
+def test_save_unchanged_account_writes_nothing(
+    repository: PostgresAccountRepository,
+    test_email: Email,
+) -> None:
+    """
+    save() of a loaded, unchanged account should not touch the row.
+
+    Validates:
+        - updated_at unchanged (no UPDATE sent)
+        - Saving a new account twice inserts once (no IntegrityError)
+    """
+    # Arrange
+    account = Account.create(test_email, Password.from_hash("$2b$12$hashedforunchanged"))
+    repository.save(account)
+    repository.save(account)
+    loaded = repository.find_by_id(account.id)
+    assert loaded is not None
+    _, _, updated_before = _read_columns(account.id)
+
+    # Act
+    repository.save(loaded)
+
+    # Assert
+    assert _read_columns(account.id)[2] == updated_before
+
+
+def test_save_many_inserts_new_and_updates_changed_accounts(
+    repository: PostgresAccountRepository,
+    test_email: Email,
+) -> None:
+    """
+    save_many() should insert new accounts and update changed ones in one call.
+
+    Validates:
+        - New accounts inserted, existing activated account updated
+        - find_by_ids()/find_by_emails() return them keyed by id / email
+        - Unknown ids absent, every account marked persisted
+    """
+    # Arrange
+    password = Password.from_hash("$2b$12$hashedforsavemany")
+    existing = Account.create(test_email, password)
+    repository.save(existing)
+    loaded = repository.find_by_id(existing.id)
+    assert loaded is not None
+    loaded.activate()
+    new_accounts = [
+        Account.create(Email(f"batch-{i}-{test_email.value}"), password) for i in range(3)
+    ]
+
+    # Act
+    repository.save_many([*new_accounts, loaded])
+
+    # Assert
+    ids = [account.id for account in new_accounts] + [existing.id, AccountId.generate()]
+    by_id = repository.find_by_ids(ids)
+    by_email = repository.find_by_emails(account.email for account in new_accounts)
+
+    assert set(by_id) == {account.id for account in new_accounts} | {existing.id}
+    assert by_id[existing.id].is_activated is True
+    assert by_email == {account.email: account for account in new_accounts}
+    assert all(not account.is_new for account in new_accounts)
+    assert loaded.changed_fields == frozenset()
+
+
+def test_save_many_with_duplicate_email_persists_nothing(
+    repository: PostgresAccountRepository,
+    test_email: Email,
+) -> None:
+    """
+    save_many() should be atomic: a duplicate email rolls back the whole batch.
+
+    Validates:
+        - IntegrityError raised
+        - Accounts of the batch before the conflict not inserted
+    """
+    # Arrange
+    password = Password.from_hash("$2b$12$hashedforsavemany")
+    repository.save(Account.create(test_email, password))
+    first = Account.create(Email(f"atomic-{test_email.value}"), password)
+
+    # Act & Assert
+    with pytest.raises(IntegrityError):
+        repository.save_many([first, Account.create(test_email, password)])
+
+    assert repository.find_by_ids([first.id]) == {}
+
+
+def test_find_by_ids_and_emails_with_no_keys_return_empty_dict(
+    repository: PostgresAccountRepository,
+) -> None:
+    """Batch lookups with no keys should return {} (no query sent)."""
+    assert repository.find_by_ids([]) == {}
+    assert repository.find_by_emails([]) == {}
+
+
+def test_iter_accounts_filters_by_creation_time(
+    repository: PostgresAccountRepository, test_email: Email, test_password: Password
+) -> None:
+    """
+    iter_accounts() should stream the accounts of a creation time range, by id.
+
+    Validates:
+        - Window boundaries derived from the id timestamp
+        - created_from is inclusive, created_until exclusive
+        - Accounts are rebuilt as entities, ordered by id
+    """
+    # Arrange: ids generated in different milliseconds
+    created_from = datetime.now(UTC) - timedelta(milliseconds=1)
+    first = Account.create(test_email, test_password)
+    time.sleep(0.002)
+    second = Account.create(Email(f"second-{test_email.value}"), test_password)
+    repository.save(first)
+    repository.save(second)
+    second_generated = datetime.fromtimestamp((second.id.value.int >> 80) / 1000, UTC)
+
+    # Act
+    both = list(
+        repository.iter_accounts(
+            created_from=created_from, created_until=second_generated + timedelta(milliseconds=1)
+        )
+    )
+    only_first = list(
+        repository.iter_accounts(created_from=created_from, created_until=second_generated)
+    )
+
+    # Assert
+    assert [account.id for account in both] == [first.id, second.id]
+    assert {account.email for account in both} == {first.email, second.email}
+    assert [account.id for account in only_first] == [first.id]
+
+
+def _resident_memory() -> int:
+    """Current resident set size of this process, in bytes (Linux)."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="Needs Linux /proc")
+def test_iter_rows_memory_stays_flat_over_one_million_rows() -> None:
+    """
+    iter_rows() should stream 1M rows with constant client memory.
+
+    The rows are inserted and read inside one transaction that is rolled
+    back, so the test leaves no data behind. A client-side cursor would
+    receive the whole result set (about 200 MB in libpq buffers) before the
+    first row; the named cursor only holds itersize rows.
+
+    Validates:
+        - All 1M rows are streamed
+        - Resident memory never grows by more than a few MB while streaming
+    """
+    total = 1_000_000
+    db = PostgresConnectionFactory()
+    rows = 0
+    growth = 0
+
+    with pytest.raises(RuntimeError, match="rollback"):
+        with db.transaction() as conn:
+            with conn.cursor() as cursor:
+                # Sequential ids: cheap B-tree appends, rows sort before real UUID v7 ids
+                cursor.execute(
+                    """
+                    INSERT INTO account (id, email, password_hash, is_activated)
+                    SELECT ('00000000-0000-7000-8000-' || LPAD(TO_HEX(i), 12, '0'))::uuid,
+                           'stream-' || i || '@example.com', 'hash', FALSE
+                    FROM generate_series(1, %s) AS i
+                    """,
+                    (total,),
+                )
+
+            # Same transaction: the repository joins it; the seeded ids carry a
+            # zero timestamp, so a window ending 1 ms after the epoch keeps them only
+            baseline = _resident_memory()
+            until = datetime(1970, 1, 1, tzinfo=UTC) + timedelta(milliseconds=1)
+            for _ in PostgresAccountRepository(db).iter_rows(created_until=until):
+                rows += 1
+                if rows % 50_000 == 0:
+                    growth = max(growth, _resident_memory() - baseline)
+            raise RuntimeError("rollback")
+
+    assert rows == total
+    assert growth < 16 * 1024 * 1024
+
+
+def test_find_page_walks_accounts_in_id_order_within_time_window(
+    repository: PostgresAccountRepository, test_email: Email, test_password: Password
+) -> None:
+    """
+    find_page() should return keyset pages of a time window, in id order.
+
+    Validates:
+        - Window boundaries derived from the id timestamp
+        - Each page starts after the previous page's last id
+        - Accounts outside the window are excluded
+    """
+    # Arrange
+    created_from = datetime.now(UTC) - timedelta(milliseconds=1)
+    accounts = [
+        Account.create(Email(f"page-{i}-{test_email.value}"), test_password) for i in range(3)
+    ]
+    repository.save_many(accounts)
+    created_until = datetime.now(UTC) + timedelta(milliseconds=1)
+    expected = sorted(account.id.value for account in accounts)
+
+    # Act
+    first = repository.find_page(None, 2, created_from, created_until)
+    second = repository.find_page(first[-1].id, 2, created_from, created_until)
+    outside = repository.find_page(None, 2, created_from=created_until)
+
+    # Assert
+    assert [account.id.value for account in first + second] == expected
+    assert len(first) == 2
+    assert outside == []
+
+
+def test_driver_returns_native_uuids(
+    repository: PostgresAccountRepository, test_email: Email, test_password: Password
+) -> None:
+    """
+    Pooled connections should exchange uuid columns as uuid.UUID objects.
+
+    Validates:
+        - UUID parameters accepted for uuid columns (no str() conversion)
+        - uuid columns come back as UUID instances (register_uuid typecaster)
+    """
+    # Arrange
+    account = Account.create(test_email, test_password)
+    repository.save(account)
+
+    # Act
+    with PostgresConnectionFactory().read_only_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT id, ARRAY[id] FROM account WHERE id = %s", (account.id.value,))
+            row = cursor.fetchone()
+
+    # Assert
+    assert row is not None
+    assert row[0] == account.id.value
+    assert isinstance(row[0], UUID)
+    assert row[1] == [account.id.value]
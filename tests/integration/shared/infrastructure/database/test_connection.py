@@ -216,3 +216,141 @@ def test_postgres_connection_factory_implements_interface() -> None:
     assert callable(factory.connection)
 
     factory.close()
+
+
+def test_read_only_connection_does_not_open_transaction() -> None:
+    """
+    read_only_connection() should run lookups without an implicit transaction.
+
+    Validates:
+        - Connection is in autocommit mode inside the block
+        - No transaction left open after a SELECT (no ROLLBACK needed on return)
+        - Autocommit is switched off again before the connection is reused
+    """
+    # Arrange
+    from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+    factory = PostgresConnectionFactory()
+
+    # Act & Assert
+    with factory.read_only_connection() as conn:
+        assert conn.autocommit is True
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        assert conn.info.transaction_status == TRANSACTION_STATUS_IDLE
+
+    assert conn.autocommit is False
+
+    factory.close()
+
+
+def test_read_only_connection_joins_active_transaction() -> None:
+    """
+    read_only_connection() should reuse the active transaction's connection.
+
+    Validates:
+        - Same connection object inside transaction()
+        - Uncommitted writes of the transaction are visible
+    """
+    # Arrange
+    factory = PostgresConnectionFactory()
+
+    # Act & Assert
+    with factory.transaction() as tx_conn:
+        with tx_conn.cursor() as cursor:
+            cursor.execute("CREATE TEMP TABLE test_read_only (id INT)")
+            cursor.execute("INSERT INTO test_read_only VALUES (1)")
+
+        with factory.read_only_connection() as conn:
+            assert conn is tx_conn
+            assert conn.autocommit is False
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT id FROM test_read_only")
+                assert cursor.fetchone() == (1,)
+
+    factory.close()
+
+
+def test_postgres_connection_factory_open_close_lifecycle() -> None:
+    """
+    open() should pre-open verified connections; close() should release them.
+
+    Validates:
+        - DATABASE_POOL_MIN idle connections after open()
+        - No connection left after close()
+        - Factory can be reopened (one lifespan per TestClient)
+    """
+    # Arrange
+    factory = PostgresConnectionFactory()
+
+    # Act & Assert
+    factory.open()
+    stats = factory.stats()
+    assert stats.idle == stats.min_size
+    assert stats.in_use == 0
+
+    factory.close()
+    assert factory.stats().idle == 0
+
+    factory.open()
+    with factory.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            assert cursor.fetchone() == (1,)
+
+    factory.close()
+
+
+def test_after_commit_runs_hooks_once_outermost_transaction_commits() -> None:
+    """
+    after_commit() should defer on_commit to after the outermost COMMIT.
+
+    Validates:
+        - Hook not run inside the transaction (nested blocks included)
+        - Hook runs after COMMIT, connection back in the pool
+        - Outside a transaction, the hook runs immediately
+    """
+    # Arrange
+    factory = PostgresConnectionFactory()
+    calls: list[str] = []
+
+    # Act & Assert
+    with factory.transaction():
+        with factory.transaction():
+            factory.after_commit(lambda: calls.append(f"commit in_use={factory.stats().in_use}"))
+        assert calls == []
+
+    assert calls == ["commit in_use=0"]
+
+    factory.after_commit(lambda: calls.append("immediate"))
+    assert calls[-1] == "immediate"
+
+    factory.close()
+
+
+def test_after_commit_runs_rollback_hooks_when_transaction_fails() -> None:
+    """
+    after_commit() hooks should be discarded, on_rollback run, on rollback.
+
+    Validates:
+        - on_commit never runs for a rolled back transaction
+        - on_rollback runs before the exception propagates
+        - Hooks do not leak into the next transaction
+    """
+    # Arrange
+    factory = PostgresConnectionFactory()
+    calls: list[str] = []
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with factory.transaction():
+            factory.after_commit(lambda: calls.append("commit"), lambda: calls.append("rollback"))
+            raise RuntimeError("abort")
+
+    with factory.transaction():
+        pass
+
+    # Assert
+    assert calls == ["rollback"]
+
+    factory.close()
@@ -0,0 +1,141 @@
+"""
+Integration tests for PostgresNotificationListener.
+
+These tests validate that account row changes committed by any connection
+reach the listener through the account_changed trigger.
+
+Test Strategy:
+    - Real PostgreSQL database (Docker service)
+    - Test committed updates and deletes are notified with the account id
+    - Test inserts are not notified (nothing cached to invalidate)
+    - Test rolled back writes are never notified
+    - Test on_reconnect runs once LISTEN is established
+
+Database:
+    - Uses DATABASE_* environment variables (same as application)
+    - Requires the notify_account_changes migration
+"""
+
+import queue
+import time
+from collections.abc import Generator
+
+import pytest
+
+from src.account.domain.entities.account import Account
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.caching_account_repository import (
+    ACCOUNT_CHANGED_CHANNEL,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+from src.shared.infrastructure.database.notification_listener import (
+    PostgresNotificationListener,
+)
+
+
+@pytest.fixture
+def db() -> Generator[PostgresConnectionFactory]:
+    """Provide a connection factory closed after the test."""
+    factory = PostgresConnectionFactory()
+    yield factory
+    factory.close()
+
+
+@pytest.fixture
+def payloads() -> Generator["queue.Queue[str]"]:
+    """Provide the payloads received by a running account_changed listener."""
+    received: queue.Queue[str] = queue.Queue()
+    listener = PostgresNotificationListener(ACCOUNT_CHANGED_CHANNEL, received.put)
+    listener.start()
+    assert listener.wait_until_listening(timeout=5)
+    yield received
+    listener.stop()
+
+
+def create_account() -> Account:
+    email = Email(f"notify-{time.time_ns()}@example.com")
+    return Account.create(email, Password.from_hash("$2b$12$hashedfornotifytests"))
+
+
+def test_committed_account_change_is_notified(
+    db: PostgresConnectionFactory, payloads: "queue.Queue[str]"
+) -> None:
+    """
+    Updating then deleting an account should notify its id for each commit.
+
+    Validates:
+        - Insert not notified (no cached entry can exist for a new account)
+        - Payload is the account id
+        - Update (activation) and delete notified
+    """
+    # Arrange
+    repository = PostgresAccountRepository(db)
+    account = create_account()
+
+    # Act & Assert
+    repository.save(account)
+    with pytest.raises(queue.Empty):
+        payloads.get(timeout=0.5)
+
+    account.activate()
+    repository.save(account)
+    assert payloads.get(timeout=5) == str(account.id)
+
+    with db.transaction() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM account WHERE id = %s", (account.id.value,))
+    assert payloads.get(timeout=5) == str(account.id)
+
+
+def test_rolled_back_account_change_is_not_notified(
+    db: PostgresConnectionFactory, payloads: "queue.Queue[str]"
+) -> None:
+    """
+    NOTIFY is transactional: a rolled back write should not be delivered.
+
+    Validates:
+        - Nothing received after rollback
+    """
+    # Arrange
+    repository = PostgresAccountRepository(db)
+    account = create_account()
+    repository.save(account)
+    account.activate()
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            repository.save(account)
+            raise RuntimeError("rollback")
+
+    # Assert
+    with pytest.raises(queue.Empty):
+        payloads.get(timeout=0.5)
+
+
+def test_listener_calls_on_reconnect_when_listening() -> None:
+    """
+    on_reconnect should run once LISTEN is established (consumer resync).
+
+    Validates:
+        - Callback invoked before wait_until_listening() returns
+    """
+    # Arrange
+    reconnects: list[None] = []
+    listener = PostgresNotificationListener(
+        ACCOUNT_CHANGED_CHANNEL, lambda _: None, on_reconnect=lambda: reconnects.append(None)
+    )
+
+    # Act
+    listener.start()
+    try:
+        assert listener.wait_until_listening(timeout=5)
+    finally:
+        listener.stop()
+
+    # Assert
+    assert len(reconnects) == 1
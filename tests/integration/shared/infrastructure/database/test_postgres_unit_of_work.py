@@ -0,0 +1,169 @@
+"""
+Integration tests for PostgresUnitOfWork.
+
+These tests validate that repositories share one connection and one
+transaction inside a unit of work, with a real PostgreSQL database.
+
+Test Strategy:
+    - Real PostgreSQL database (Docker service)
+    - Test single commit across repositories (account + activation)
+    - Test rollback of every write when the block raises
+    - Test nested units of work (inner joins outer)
+    - Test swallowed statement errors abort the unit of work
+    - No mocking (full integration test)
+
+Database:
+    - Uses DATABASE_* environment variables (same as application)
+    - Tests run against real PostgreSQL instance
+    - Each test is independent (unique emails)
+"""
+
+import time
+from collections.abc import Generator
+
+import pytest
+from psycopg2 import DatabaseError, IntegrityError
+
+from src.account.domain.entities.account import Account
+from src.account.domain.entities.account_activation import AccountActivation
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.postgres_account_activation_repository import (
+    PostgresAccountActivationRepository,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+from src.shared.infrastructure.database.postgres_unit_of_work import PostgresUnitOfWork
+
+
+@pytest.fixture
+def db() -> Generator[PostgresConnectionFactory]:
+    """Provide a connection factory closed after the test."""
+    factory = PostgresConnectionFactory()
+    yield factory
+    factory.close()
+
+
+@pytest.fixture
+def account() -> Account:
+    """Provide a new (unsaved) account with a unique email."""
+    email = Email(f"uow-{time.time_ns()}@example.com")
+    return Account.create(email, Password.from_hash("$2b$12$hashedforunitofworktests"))
+
+
+def test_unit_of_work_commits_all_repositories_once(
+    db: PostgresConnectionFactory, account: Account
+) -> None:
+    """
+    Writes from several repositories should share one connection and commit together.
+
+    Validates:
+        - Both repositories see the same connection inside the block
+        - Account and activation are visible from another connection after exit
+    """
+    # Arrange
+    uow = PostgresUnitOfWork(db)
+    account_repository = PostgresAccountRepository(db)
+    activation_repository = PostgresAccountActivationRepository(db)
+
+    # Act
+    with uow.begin():
+        with db.connection() as first, db.transaction() as second:
+            assert first is second
+
+        account_repository.create_if_email_absent(account)
+        activation_repository.save(AccountActivation.create_for_account(account.id))
+
+        # Reads inside the unit of work see uncommitted writes
+        assert account_repository.find_by_id(account.id) is not None
+
+    # Assert: Committed (visible from a fresh factory/connection)
+    other = PostgresConnectionFactory()
+    try:
+        assert PostgresAccountRepository(other).find_by_id(account.id) is not None
+        assert PostgresAccountActivationRepository(other).find_by_account_id(account.id)
+    finally:
+        other.close()
+
+
+def test_unit_of_work_rolls_back_all_writes_on_exception(
+    db: PostgresConnectionFactory, account: Account
+) -> None:
+    """
+    No write should persist when the unit of work block raises.
+
+    Validates:
+        - Exception propagates to caller
+        - Account insert is rolled back
+    """
+    # Arrange
+    uow = PostgresUnitOfWork(db)
+    account_repository = PostgresAccountRepository(db)
+
+    # Act
+    with pytest.raises(RuntimeError, match="boom"):
+        with uow.begin():
+            account_repository.create_if_email_absent(account)
+            raise RuntimeError("boom")
+
+    # Assert
+    assert account_repository.find_by_id(account.id) is None
+
+
+def test_nested_unit_of_work_commits_with_outer(
+    db: PostgresConnectionFactory, account: Account
+) -> None:
+    """
+    An inner begin() should join the outer unit of work instead of committing.
+
+    Validates:
+        - Failure after the inner block rolls back the inner writes too
+    """
+    # Arrange
+    uow = PostgresUnitOfWork(db)
+    account_repository = PostgresAccountRepository(db)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with uow.begin():
+            with uow.begin():
+                account_repository.create_if_email_absent(account)
+            raise RuntimeError("outer failure")
+
+    # Assert
+    assert account_repository.find_by_id(account.id) is None
+
+
+def test_unit_of_work_rejects_commit_after_swallowed_statement_error(
+    db: PostgresConnectionFactory, account: Account
+) -> None:
+    """
+    A failed statement swallowed inside the block should abort the unit of work.
+
+    PostgreSQL silently turns COMMIT of an aborted transaction into ROLLBACK;
+    the unit of work must surface it instead of reporting success.
+
+    Validates:
+        - DatabaseError raised on exit
+        - Earlier writes of the block are rolled back
+    """
+    # Arrange
+    uow = PostgresUnitOfWork(db)
+    account_repository = PostgresAccountRepository(db)
+    activation_repository = PostgresAccountActivationRepository(db)
+    orphan = Account.create(Email(f"orphan-{time.time_ns()}@example.com"), account.password)
+
+    # Act
+    with pytest.raises(DatabaseError, match="aborted"):
+        with uow.begin():
+            account_repository.create_if_email_absent(account)
+            try:
+                # FK violation: orphan account was never inserted
+                activation_repository.save(AccountActivation.create_for_account(orphan.id))
+            except IntegrityError:
+                pass  # Swallowed, e.g. by an event dispatcher
+
+    # Assert
+    assert account_repository.find_by_id(account.id) is None
@@ -0,0 +1,248 @@
+"""
+Integration tests for AsyncEventDispatcher.
+
+These tests validate the after-commit hand-off with a real PostgreSQL
+database: AccountCreatedHandler runs on a worker thread, in its own
+transaction, only for registrations that committed.
+
+Test Strategy:
+    - Real PostgreSQL database (Docker service)
+    - Real AccountCreatedHandler and activation repository
+    - Mock EmailService (no delivery)
+    - shutdown() drains the queue before assertions
+    - Full queue with a single-connection pool (slot reserved before the
+      registration's unit of work)
+
+Database:
+    - Uses DATABASE_* environment variables (same as application)
+    - Each test is independent (unique emails)
+"""
+
+import threading
+import time
+from collections.abc import Generator
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+from injector import Injector
+
+from src.account.application.commands.register_account import (
+    RegisterAccountCommand,
+    RegisterAccountHandler,
+)
+from src.account.application.events.account_created_handler import AccountCreatedHandler
+from src.account.domain.entities.account import Account
+from src.account.domain.events.account_created import AccountCreated
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.postgres_account_activation_repository import (
+    PostgresAccountActivationRepository,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.application.services.email_service import EmailService
+from src.shared.domain.services.password_hasher import PasswordHasher
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+from src.shared.infrastructure.database.postgres_unit_of_work import PostgresUnitOfWork
+from src.shared.infrastructure.events.async_event_dispatcher import (
+    AsyncEventDispatcher,
+    QueueFullPolicy,
+)
+
+
+@pytest.fixture
+def db() -> Generator[PostgresConnectionFactory]:
+    """Provide a connection factory closed after the test."""
+    factory = PostgresConnectionFactory()
+    yield factory
+    factory.close()
+
+
+@pytest.fixture
+def email_service() -> Mock:
+    return Mock(spec=EmailService)
+
+
+@pytest.fixture
+def dispatcher(
+    db: PostgresConnectionFactory, email_service: Mock
+) -> Generator[AsyncEventDispatcher]:
+    """Dispatcher running the real AccountCreatedHandler (shut down after the test)."""
+    injector = Mock(spec=Injector)
+    injector.get.return_value = AccountCreatedHandler(
+        PostgresAccountActivationRepository(db), email_service
+    )
+    async_dispatcher = AsyncEventDispatcher(injector, db, workers=2)
+    async_dispatcher.register(AccountCreated, AccountCreatedHandler)
+    yield async_dispatcher
+    async_dispatcher.shutdown(timeout=5)
+
+
+def register(
+    db: PostgresConnectionFactory, dispatcher: AsyncEventDispatcher, fail: bool = False
+) -> Account:
+    """Insert an account and dispatch AccountCreated in one unit of work."""
+    email = Email(f"async-dispatch-{time.time_ns()}@example.com")
+    account = Account.create(email, Password.from_hash("$2b$12$hashedforasyncdispatch"))
+    with PostgresUnitOfWork(db).begin():
+        PostgresAccountRepository(db).create_if_email_absent(account)
+        dispatcher.dispatch(AccountCreated(account.id, account.email, datetime.now(UTC)))
+        if fail:
+            raise RuntimeError("registration aborted")
+    return account
+
+
+def test_committed_registration_is_handled_on_worker_after_commit(
+    db: PostgresConnectionFactory, dispatcher: AsyncEventDispatcher, email_service: Mock
+) -> None:
+    """
+    AccountCreatedHandler should run after COMMIT, in its own transaction.
+
+    Validates:
+        - Activation code saved (the worker saw the committed account)
+        - Activation email sent
+        - Latency recorded for the handled event
+    """
+    # Act
+    account = register(db, dispatcher)
+    dispatcher.shutdown(timeout=5)
+
+    # Assert
+    activation = PostgresAccountActivationRepository(db).find_by_account_id(account.id)
+    assert activation is not None
+    email_service.send_email.assert_called_once()
+    stats = dispatcher.stats()
+    assert (stats.handled, stats.failed) == (1, 0)
+    assert sum(count for _, count in stats.latency_histogram) == 1
+
+
+def test_rolled_back_registration_is_never_handled(
+    db: PostgresConnectionFactory, dispatcher: AsyncEventDispatcher, email_service: Mock
+) -> None:
+    """
+    Events of a rolled back unit of work should be dropped.
+
+    Validates:
+        - No handler call, no email for an account that does not exist
+        - Slot released (nothing pending or dispatched)
+    """
+    # Act
+    with pytest.raises(RuntimeError, match="aborted"):
+        register(db, dispatcher, fail=True)
+    dispatcher.shutdown(timeout=5)
+
+    # Assert
+    email_service.send_email.assert_not_called()
+    stats = dispatcher.stats()
+    assert (stats.dispatched, stats.pending_commit, stats.handled) == (0, 0, 0)
+
+
+def test_batched_registrations_share_activation_upsert_and_email_submission(
+    db: PostgresConnectionFactory, email_service: Mock
+) -> None:
+    """
+    With batching, a burst of registrations should be handled in bulk.
+
+    Validates:
+        - One activation code per committed account (multi-row upsert)
+        - Emails submitted through send_emails(), one message per account
+        - Fewer handler calls than events
+    """
+    # Arrange
+    injector = Mock(spec=Injector)
+    injector.get.return_value = AccountCreatedHandler(
+        PostgresAccountActivationRepository(db), email_service
+    )
+    batching = AsyncEventDispatcher(injector, db, workers=1, batch_size=10, batch_window=1)
+    batching.register(AccountCreated, AccountCreatedHandler)
+
+    # Act
+    accounts = [register(db, batching) for _ in range(5)]
+    batching.shutdown(timeout=5)
+
+    # Assert
+    activations = PostgresAccountActivationRepository(db)
+    assert all(activations.find_by_account_id(account.id) is not None for account in accounts)
+    messages = [
+        message for call in email_service.send_emails.call_args_list for message in call.args[0]
+    ]
+    singles = [call.args[0] for call in email_service.send_email.call_args_list]
+    assert sorted(m.to_email.value for m in messages + singles) == sorted(
+        account.email.value for account in accounts
+    )
+    stats = batching.stats()
+    assert stats.handled == 5
+    assert stats.batches >= 1
+
+
+def test_full_queue_wait_holds_no_pooled_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    A registration waiting for a queue slot should not hold a connection.
+
+    RegisterAccountHandler reserves the slot before its unit of work, so with
+    a single-connection pool and a full queue (BLOCK policy) the waiting
+    registration leaves the connection to other requests.
+
+    Validates:
+        - Connection available while the second registration waits
+        - Second registration completes once the slot frees up
+    """
+    # Arrange: one pooled connection, one queue slot held by a stuck handler
+    monkeypatch.setenv("DATABASE_POOL_MIN", "1")
+    monkeypatch.setenv("DATABASE_POOL_MAX", "1")
+    monkeypatch.setenv("DATABASE_POOL_TIMEOUT", "1")
+    small_db = PostgresConnectionFactory()
+    release = threading.Event()
+
+    class StuckHandler:
+        def handle(self, event: AccountCreated) -> None:
+            release.wait(timeout=10)
+
+    injector = Mock(spec=Injector)
+    injector.get.return_value = StuckHandler()
+    dispatcher = AsyncEventDispatcher(
+        injector,
+        small_db,
+        workers=1,
+        queue_size=1,
+        full_policy=QueueFullPolicy.BLOCK,
+        block_timeout=10,
+    )
+    dispatcher.register(AccountCreated, StuckHandler)
+    accounts = PostgresAccountRepository(small_db)
+    registration = RegisterAccountHandler(
+        accounts, dispatcher, Mock(spec=PasswordHasher), PostgresUnitOfWork(small_db)
+    )
+    password = Password.from_hash("$2b$12$hashedforasyncdispatch")
+
+    def register_account(email: Email) -> None:
+        registration.handle(RegisterAccountCommand(email=email, password=password))
+
+    first = Email(f"slot-first-{time.time_ns()}@example.com")
+    second = Email(f"slot-second-{time.time_ns()}@example.com")
+    try:
+        register_account(first)  # Takes the only slot (handler stuck)
+        waiting = threading.Thread(target=register_account, args=(second,))
+        waiting.start()
+        time.sleep(0.2)  # Second registration now waits for a slot
+
+        # Act: another request needs the only connection meanwhile
+        with small_db.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                connection_available = cursor.fetchone() == (1,)
+        still_waiting = waiting.is_alive()
+
+        release.set()
+        waiting.join(timeout=10)
+
+        # Assert
+        assert connection_available
+        assert still_waiting
+        assert accounts.find_by_email(second) is not None
+    finally:
+        release.set()
+        dispatcher.shutdown(timeout=5)
+        small_db.close()
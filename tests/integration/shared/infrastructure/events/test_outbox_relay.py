@@ -0,0 +1,395 @@
+"""
+Integration tests for OutboxEventDispatcher and OutboxRelay.
+
+These tests validate the transactional outbox with a real PostgreSQL
+database: events are recorded in the registration transaction, then
+delivered by relays that claim rows with FOR UPDATE SKIP LOCKED.
+
+Test Strategy:
+    - Real PostgreSQL database (Docker service)
+    - Real AccountCreatedHandler and activation repository
+    - Mock EmailService (no delivery)
+    - Relays driven with relay_batch() (no background thread), except for
+      the parallel relays test
+
+Database:
+    - Uses DATABASE_* environment variables (same as application)
+    - Each test claims only its own event type (unique name), so rows left
+      by other tests are never delivered here
+"""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Generator
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from injector import Injector
+
+from src.account.application.events.account_created_handler import AccountCreatedHandler
+from src.account.domain.entities.account import Account
+from src.account.domain.events.account_created import AccountCreated
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.account_created_codec import from_payload, to_payload
+from src.account.infrastructure.persistence.postgres_account_activation_repository import (
+    PostgresAccountActivationRepository,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+from src.shared.application.services.email_service import EmailService
+from src.shared.infrastructure.database.connection import PostgresConnectionFactory
+from src.shared.infrastructure.database.postgres_unit_of_work import PostgresUnitOfWork
+from src.shared.infrastructure.events.outbox_event_dispatcher import (
+    OutboxCodec,
+    OutboxEventDispatcher,
+)
+from src.shared.infrastructure.events.outbox_relay import OutboxRelay
+
+
+@pytest.fixture
+def db() -> Generator[PostgresConnectionFactory]:
+    """Provide a connection factory closed after the test."""
+    factory = PostgresConnectionFactory()
+    yield factory
+    factory.close()
+
+
+@pytest.fixture
+def email_service() -> Mock:
+    return Mock(spec=EmailService)
+
+
+@pytest.fixture
+def event_name() -> str:
+    """Event type unique to the test (isolates its outbox rows)."""
+    return f"AccountCreatedTest{time.time_ns()}"
+
+
+@pytest.fixture
+def dispatcher(
+    db: PostgresConnectionFactory, email_service: Mock, event_name: str
+) -> OutboxEventDispatcher:
+    """Dispatcher running the real AccountCreatedHandler."""
+    injector = Mock(spec=Injector)
+    injector.get.return_value = AccountCreatedHandler(
+        PostgresAccountActivationRepository(db), email_service
+    )
+    outbox_dispatcher = OutboxEventDispatcher(injector, db)
+    outbox_dispatcher.register(AccountCreated, AccountCreatedHandler)
+    outbox_dispatcher.register_codec(
+        AccountCreated, OutboxCodec(name=event_name, encode=to_payload, decode=from_payload)
+    )
+    return outbox_dispatcher
+
+
+def register(
+    db: PostgresConnectionFactory, dispatcher: OutboxEventDispatcher, fail: bool = False
+) -> Account:
+    """Insert an account and dispatch AccountCreated in one unit of work."""
+    email = Email(f"outbox-{time.time_ns()}@example.com")
+    account = Account.create(email, Password.from_hash("$2b$12$hashedforoutboxrelay"))
+    with PostgresUnitOfWork(db).begin():
+        PostgresAccountRepository(db).create_if_email_absent(account)
+        dispatcher.dispatch(AccountCreated(account.id, account.email, datetime.now(UTC)))
+        if fail:
+            raise RuntimeError("registration aborted")
+    return account
+
+
+def outbox_rows(db: PostgresConnectionFactory, event_name: str) -> list[tuple[Any, ...]]:
+    """Return (payload, attempts, last_error, processed_at) of the test's rows."""
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT payload, attempts, last_error, processed_at
+                FROM outbox WHERE event_type = %s ORDER BY id
+                """,
+                (event_name,),
+            )
+            return cursor.fetchall()
+
+
+def test_dispatch_records_event_in_registration_transaction(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    email_service: Mock,
+    event_name: str,
+) -> None:
+    """
+    A committed registration should leave one pending outbox row.
+
+    Validates:
+        - Row payload encoded by the codec
+        - Pending (not processed, no attempt) and no handler call yet
+    """
+    # Act
+    account = register(db, dispatcher)
+
+    # Assert
+    rows = outbox_rows(db, event_name)
+    assert len(rows) == 1
+    payload, attempts, last_error, processed_at = rows[0]
+    assert payload["account_id"] == str(account.id.value)
+    assert (attempts, last_error, processed_at) == (0, None, None)
+    email_service.send_email.assert_not_called()
+
+
+def test_rolled_back_registration_records_no_event(
+    db: PostgresConnectionFactory, dispatcher: OutboxEventDispatcher, event_name: str
+) -> None:
+    # Act
+    with pytest.raises(RuntimeError, match="aborted"):
+        register(db, dispatcher, fail=True)
+
+    # Assert
+    assert outbox_rows(db, event_name) == []
+
+
+def test_relay_delivers_event_and_marks_row_processed(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    email_service: Mock,
+    event_name: str,
+) -> None:
+    """
+    relay_batch() should run AccountCreatedHandler and mark the row.
+
+    Validates:
+        - Activation code saved and email sent
+        - processed_at set; nothing left to claim
+    """
+    # Arrange
+    account = register(db, dispatcher)
+    relay = OutboxRelay(db, dispatcher)
+
+    # Act
+    claimed = relay.relay_batch()
+
+    # Assert
+    assert claimed == 1
+    assert PostgresAccountActivationRepository(db).find_by_account_id(account.id) is not None
+    email_service.send_email.assert_called_once()
+    assert outbox_rows(db, event_name)[0][3] is not None
+    assert relay.relay_batch() == 0
+    assert relay.stats().delivered == 1
+
+
+def test_failing_email_keeps_committed_code_and_schedules_retry(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    email_service: Mock,
+    event_name: str,
+) -> None:
+    """
+    A handler failure should only affect its own event.
+
+    Validates:
+        - Activation code committed before the email failed (kept)
+        - attempts incremented, last_error recorded, row still pending
+        - Row not claimed again before next_attempt_at
+        - Other event of the batch delivered
+    """
+    # Arrange
+    failing = register(db, dispatcher)
+    delivered = register(db, dispatcher)
+    email_service.send_email.side_effect = [RuntimeError("SMTP down"), None]
+    relay = OutboxRelay(db, dispatcher, retry_delay=60)
+
+    # Act
+    claimed = relay.relay_batch()
+
+    # Assert
+    assert claimed == 2
+    activations = PostgresAccountActivationRepository(db)
+    assert activations.find_by_account_id(failing.id) is not None
+    assert activations.find_by_account_id(delivered.id) is not None
+    (_, attempts, last_error, processed_at), second = outbox_rows(db, event_name)
+    assert (attempts, processed_at) == (1, None)
+    assert last_error == "RuntimeError: SMTP down"
+    assert second[3] is not None
+    assert relay.relay_batch() == 0  # Retry scheduled 60 seconds later
+    stats = relay.stats()
+    assert (stats.delivered, stats.failed) == (1, 1)
+
+
+def test_redelivery_resends_the_stored_code(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    email_service: Mock,
+    event_name: str,
+) -> None:
+    """
+    A retried AccountCreated should email the code of the failed attempt.
+
+    Validates:
+        - Same code in both emails and in the database (no overwrite)
+        - Row processed after the successful retry
+    """
+    # Arrange
+    account = register(db, dispatcher)
+    email_service.send_email.side_effect = [RuntimeError("SMTP down"), None]
+    relay = OutboxRelay(db, dispatcher, retry_delay=0)
+
+    # Act
+    claims = [relay.relay_batch(), relay.relay_batch()]
+
+    # Assert
+    assert claims == [1, 1]
+    stored = PostgresAccountActivationRepository(db).find_by_account_id(account.id)
+    assert stored is not None
+    bodies = [call.args[0].body for call in email_service.send_email.call_args_list]
+    assert len(bodies) == 2
+    assert all(f"code={stored.code.code}" in body for body in bodies)
+    _, attempts, _, processed_at = outbox_rows(db, event_name)[0]
+    assert attempts == 2
+    assert processed_at is not None
+
+
+def test_handler_runs_without_transaction_or_row_lock(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    email_service: Mock,
+    event_name: str,
+) -> None:
+    """
+    The email should be sent once the claim and the code are committed.
+
+    Validates:
+        - No transaction active on the relay thread during send_email()
+        - Outbox row lockable by another connection (claim committed)
+        - Activation code visible to another connection (committed)
+    """
+    # Arrange
+    account = register(db, dispatcher)
+    observed: dict[str, object] = {}
+
+    def send_email(_message: object) -> None:
+        observed["in_transaction"] = db.in_transaction()
+        other = PostgresConnectionFactory()
+        try:
+            with other.transaction() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT id FROM outbox WHERE event_type = %s FOR UPDATE NOWAIT",
+                        (event_name,),
+                    )
+                    observed["row_locked"] = cursor.fetchone() is None
+            observed["code"] = PostgresAccountActivationRepository(other).find_by_account_id(
+                account.id
+            )
+        finally:
+            other.close()
+
+    email_service.send_email.side_effect = send_email
+
+    # Act
+    assert OutboxRelay(db, dispatcher).relay_batch() == 1
+
+    # Assert
+    assert observed["in_transaction"] is False
+    assert observed["row_locked"] is False
+    assert observed["code"] is not None
+
+
+def test_event_is_left_pending_after_max_attempts(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    email_service: Mock,
+    event_name: str,
+) -> None:
+    # Arrange
+    register(db, dispatcher)
+    email_service.send_email.side_effect = RuntimeError("SMTP down")
+    relay = OutboxRelay(db, dispatcher, max_attempts=2, retry_delay=0)
+
+    # Act
+    claims = [relay.relay_batch() for _ in range(3)]
+
+    # Assert
+    assert claims == [1, 1, 0]
+    _, attempts, _, processed_at = outbox_rows(db, event_name)[0]
+    assert (attempts, processed_at) == (2, None)
+
+
+def test_parallel_relays_deliver_each_event_exactly_once(
+    db: PostgresConnectionFactory, event_name: str
+) -> None:
+    """
+    Relays claiming concurrently should never share an event (SKIP LOCKED).
+
+    Validates:
+        - Every event delivered once across 4 relay threads
+        - All rows processed
+    """
+    # Arrange
+    deliveries: Counter[int] = Counter()
+    lock = threading.Lock()
+
+    class CountingHandler:
+        def handle(self, event: int) -> None:
+            with lock:
+                deliveries[event] += 1
+
+    injector = Mock(spec=Injector)
+    injector.get.return_value = CountingHandler()
+    dispatcher = OutboxEventDispatcher(injector, db)
+    dispatcher.register(int, CountingHandler)
+    dispatcher.register_codec(
+        int,
+        OutboxCodec(
+            name=event_name,
+            encode=lambda value: {"value": value},
+            decode=lambda payload: payload["value"],
+        ),
+    )
+    with PostgresUnitOfWork(db).begin():
+        for value in range(200):
+            dispatcher.dispatch(value)
+
+    relays = [OutboxRelay(db, dispatcher, batch_size=7) for _ in range(4)]
+
+    def drain(relay: OutboxRelay) -> None:
+        while relay.relay_batch():
+            pass
+
+    threads = [threading.Thread(target=drain, args=(relay,)) for relay in relays]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    # Assert
+    assert deliveries == Counter(range(200))
+    assert sum(relay.stats().delivered for relay in relays) == 200
+    assert all(row[3] is not None for row in outbox_rows(db, event_name))
+
+
+def test_relay_thread_delivers_until_stopped(
+    db: PostgresConnectionFactory,
+    dispatcher: OutboxEventDispatcher,
+    email_service: Mock,
+) -> None:
+    # Arrange
+    relay = OutboxRelay(db, dispatcher, poll_interval=0.01)
+    relay.start()
+
+    # Act
+    try:
+        account = register(db, dispatcher)
+        deadline = time.monotonic() + 5
+        while relay.stats().delivered == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        relay.stop()
+
+    # Assert
+    assert PostgresAccountActivationRepository(db).find_by_account_id(account.id) is not None
+    email_service.send_email.assert_called_once()
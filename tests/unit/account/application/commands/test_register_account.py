@@ -5,10 +5,12 @@ These tests verify the business logic of account registration without any
 infrastructure dependencies (no database, no HTTP, no injector).
 
 Testing Strategy:
-    - Mock AccountRepository and EventDispatcher using unittest.mock
+    - Mock AccountRepository, EventDispatcher, PasswordHasher and UnitOfWork
+      using unittest.mock
     - Test happy path (successful registration + event dispatch)
     - Test business rule violations (email uniqueness)
     - Test exception propagation from value objects
+    - Test deferred hashing (no bcrypt on the duplicate-email path)
 
 No Integration Dependencies:
     - No database connection required
@@ -17,7 +19,7 @@ No Integration Dependencies:
     - Fast execution (~milliseconds per test)
 """
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -30,8 +32,19 @@ from src.account.domain.events.account_created import AccountCreated
 from src.account.domain.exceptions import EmailAlreadyExistsError
 from src.account.domain.repositories.account_repository import AccountRepository
 from src.account.domain.value_objects.email import Email
-from src.account.domain.value_objects.password import Password
+from src.account.domain.value_objects.password import Password, PlainTextPassword
+from src.shared.application.services.unit_of_work import UnitOfWork
 from src.shared.domain.events.event_dispatcher import EventDispatcher
+from src.shared.domain.services.password_hasher import PasswordHasher
+
+HASHED_PASSWORD = "$2b$12$hashedbymockhasher"
+
+
+def create_mock_hasher() -> Mock:
+    """Provide a PasswordHasher mock returning a fixed hash (no bcrypt cost)."""
+    hasher = Mock(spec=PasswordHasher)
+    hasher.hash.return_value = HASHED_PASSWORD
+    return hasher
 
 
 def test_register_account_command_is_immutable() -> None:
@@ -42,7 +55,7 @@ def test_register_account_command_is_immutable() -> None:
     be accidentally modified after creation.
     """
     email = Email("user@example.com")
-    password = Password.from_plain_text("SecurePassword123")
+    password = PlainTextPassword("SecurePassword123")
 
     command = RegisterAccountCommand(email=email, password=password)
 
@@ -61,36 +74,42 @@ def test_register_account_success_when_email_available() -> None:
 
     Verification:
         - repository.find_by_email() called with correct email
-        - repository.save() called exactly once
-        - Account created with correct email and password
+        - repository.create_if_email_absent() called exactly once
+        - Account created with correct email and hashed password
     """
     # Arrange: Create command with valid credentials
     email = Email("newuser@example.com")
-    password = Password.from_plain_text("SecurePassword123")
+    password = PlainTextPassword("SecurePassword123")
     command = RegisterAccountCommand(email=email, password=password)
 
     # Mock repository: email doesn't exist
     mock_repository = Mock(spec=AccountRepository)
     mock_repository.find_by_email.return_value = None
+    mock_repository.create_if_email_absent.return_value = True
 
     # Mock event dispatcher
-    mock_dispatcher = Mock(spec=EventDispatcher)
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
 
     # Create handler with mocked dependencies (no @inject needed in tests)
-    handler = RegisterAccountHandler(repository=mock_repository, dispatcher=mock_dispatcher)
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
 
     # Act: Execute command
     handler.handle(command)
 
     # Assert: Verify business logic execution
     mock_repository.find_by_email.assert_called_once_with(email)
-    mock_repository.save.assert_called_once()
+    mock_repository.create_if_email_absent.assert_called_once()
 
     # Verify Account was created with correct properties
-    created_account = mock_repository.save.call_args[0][0]
+    created_account = mock_repository.create_if_email_absent.call_args[0][0]
     assert isinstance(created_account, Account)
     assert created_account.email == email
-    assert created_account.password == password
+    assert created_account.password == Password.from_hash(HASHED_PASSWORD)
     assert created_account.is_activated is False
 
 
@@ -102,22 +121,27 @@ def test_register_account_raises_error_when_email_already_exists() -> None:
 
     Verification:
         - EmailAlreadyExistsError raised with correct email
-        - repository.save() NOT called (early return on validation failure)
+        - repository.create_if_email_absent() NOT called (early return)
     """
     # Arrange: Create command with email that already exists
     email = Email("existing@example.com")
-    password = Password.from_plain_text("SecurePassword123")
+    password = PlainTextPassword("SecurePassword123")
     command = RegisterAccountCommand(email=email, password=password)
 
     # Mock repository: email already exists
-    existing_account = Account.create(email=email, password=password)
+    existing_account = Account.create(email=email, password=Password.from_hash(HASHED_PASSWORD))
     mock_repository = Mock(spec=AccountRepository)
     mock_repository.find_by_email.return_value = existing_account
 
     # Mock event dispatcher (not used in error path, but required for handler init)
-    mock_dispatcher = Mock(spec=EventDispatcher)
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
 
-    handler = RegisterAccountHandler(repository=mock_repository, dispatcher=mock_dispatcher)
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
 
     # Act & Assert: Verify exception is raised
     with pytest.raises(EmailAlreadyExistsError) as exc_info:
@@ -127,8 +151,77 @@ def test_register_account_raises_error_when_email_already_exists() -> None:
     assert exc_info.value.email == email
     assert "existing@example.com" in str(exc_info.value)
 
-    # Verify save() was NOT called (validation failed early)
-    mock_repository.save.assert_not_called()
+    # Verify no insert was attempted (validation failed early)
+    mock_repository.create_if_email_absent.assert_not_called()
+
+
+def test_register_account_does_not_hash_password_when_email_already_exists() -> None:
+    """
+    Handler should skip bcrypt entirely when the email is already taken.
+
+    Hashing costs ~250ms of CPU; paying it before a request that is rejected
+    with 409 Conflict would let duplicate submissions burn hashing capacity.
+    """
+    # Arrange
+    email = Email("existing@example.com")
+    command = RegisterAccountCommand(email=email, password=PlainTextPassword("SecurePassword123"))
+
+    existing_account = Account.create(email=email, password=Password.from_hash(HASHED_PASSWORD))
+    mock_repository = Mock(spec=AccountRepository)
+    mock_repository.find_by_email.return_value = existing_account
+
+    mock_hasher = create_mock_hasher()
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=MagicMock(spec=EventDispatcher),
+        hasher=mock_hasher,
+        uow=MagicMock(spec=UnitOfWork),
+    )
+
+    # Act
+    with pytest.raises(EmailAlreadyExistsError):
+        handler.handle(command)
+
+    # Assert: No hash computed on the conflict path
+    mock_hasher.hash.assert_not_called()
+
+
+def test_register_account_raises_error_when_email_registered_concurrently() -> None:
+    """
+    Handler should raise EmailAlreadyExistsError when the atomic insert loses a race.
+
+    Scenario:
+        - find_by_email() sees no account (fast path passes)
+        - A concurrent request registers the same email before our insert
+        - create_if_email_absent() reports the conflict (returns False)
+
+    Verification:
+        - EmailAlreadyExistsError raised (409), not a database IntegrityError
+        - No AccountCreated event dispatched
+    """
+    # Arrange
+    email = Email("racing@example.com")
+    command = RegisterAccountCommand(email=email, password=PlainTextPassword("SecurePassword123"))
+
+    mock_repository = Mock(spec=AccountRepository)
+    mock_repository.find_by_email.return_value = None
+    mock_repository.create_if_email_absent.return_value = False
+
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
+
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
+
+    # Act & Assert
+    with pytest.raises(EmailAlreadyExistsError) as exc_info:
+        handler.handle(command)
+
+    assert exc_info.value.email == email
+    mock_dispatcher.dispatch.assert_not_called()
 
 
 def test_register_account_propagates_invalid_email_error() -> None:
@@ -141,22 +234,22 @@ def test_register_account_propagates_invalid_email_error() -> None:
     # Arrange: Create command with invalid email (will raise ValueError)
     with pytest.raises(ValueError, match="Invalid email"):
         invalid_email = Email("not-an-email")
-        password = Password.from_plain_text("SecurePassword123")
+        password = PlainTextPassword("SecurePassword123")
         RegisterAccountCommand(email=invalid_email, password=password)
 
 
 def test_register_account_propagates_weak_password_error() -> None:
     """
-    Handler should propagate ValueError from Password value object.
+    Handler should propagate ValueError from PlainTextPassword value object.
 
     This test verifies that password strength validation is enforced
-    by the Password value object before reaching the handler.
+    by the PlainTextPassword value object before reaching the handler.
     """
     # Arrange: Create command with weak password (will raise ValueError)
     email = Email("user@example.com")
 
     with pytest.raises(ValueError, match="at least 8 characters"):
-        weak_password = Password.from_plain_text("weak")
+        weak_password = PlainTextPassword("weak")
         RegisterAccountCommand(email=email, password=weak_password)
 
 
@@ -176,15 +269,21 @@ def test_register_account_dispatches_account_created_event() -> None:
     """
     # Arrange
     email = Email("user@example.com")
-    password = Password.from_plain_text("SecurePassword123")
+    password = PlainTextPassword("SecurePassword123")
     command = RegisterAccountCommand(email=email, password=password)
 
     mock_repository = Mock(spec=AccountRepository)
     mock_repository.find_by_email.return_value = None
+    mock_repository.create_if_email_absent.return_value = True
 
-    mock_dispatcher = Mock(spec=EventDispatcher)
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
 
-    handler = RegisterAccountHandler(repository=mock_repository, dispatcher=mock_dispatcher)
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
 
     # Act
     handler.handle(command)
@@ -210,15 +309,21 @@ def test_register_account_with_normalized_email() -> None:
     """
     # Arrange: Create command with mixed-case email
     email = Email("MixedCase@Example.COM")
-    password = Password.from_plain_text("SecurePassword123")
+    password = PlainTextPassword("SecurePassword123")
     command = RegisterAccountCommand(email=email, password=password)
 
     mock_repository = Mock(spec=AccountRepository)
     mock_repository.find_by_email.return_value = None
+    mock_repository.create_if_email_absent.return_value = True
 
-    mock_dispatcher = Mock(spec=EventDispatcher)
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
 
-    handler = RegisterAccountHandler(repository=mock_repository, dispatcher=mock_dispatcher)
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
 
     # Act: Execute command
     handler.handle(command)
@@ -232,27 +337,33 @@ def test_register_account_with_hashed_password() -> None:
     """
     Handler should persist password hash, not plain text.
 
-    Password value object automatically hashes passwords using bcrypt.
-    The handler should pass the Password VO (with hash) to the repository.
+    The handler hashes the plain text password through the injected
+    PasswordHasher and passes the Password VO (with hash) to the repository.
     """
     # Arrange: Create command with plain text password
     email = Email("user@example.com")
     plain_password = "SecurePassword123"
-    password = Password.from_plain_text(plain_password)
+    password = PlainTextPassword(plain_password)
     command = RegisterAccountCommand(email=email, password=password)
 
     mock_repository = Mock(spec=AccountRepository)
     mock_repository.find_by_email.return_value = None
+    mock_repository.create_if_email_absent.return_value = True
 
-    mock_dispatcher = Mock(spec=EventDispatcher)
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
 
-    handler = RegisterAccountHandler(repository=mock_repository, dispatcher=mock_dispatcher)
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
 
     # Act: Execute command
     handler.handle(command)
 
     # Assert: Password was hashed (not plain text)
-    created_account = mock_repository.save.call_args[0][0]
+    created_account = mock_repository.create_if_email_absent.call_args[0][0]
     assert created_account.password.hashed_value != plain_password
 
 
@@ -265,23 +376,152 @@ def test_register_account_creates_different_ids_for_same_email_retry() -> None:
     """
     # Arrange: Create two commands with same credentials
     email = Email("user@example.com")
-    password = Password.from_plain_text("SecurePassword123")
+    password = PlainTextPassword("SecurePassword123")
     command1 = RegisterAccountCommand(email=email, password=password)
     command2 = RegisterAccountCommand(email=email, password=password)
 
     mock_repository = Mock(spec=AccountRepository)
     mock_repository.find_by_email.return_value = None
+    mock_repository.create_if_email_absent.return_value = True
 
-    mock_dispatcher = Mock(spec=EventDispatcher)
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
 
-    handler = RegisterAccountHandler(repository=mock_repository, dispatcher=mock_dispatcher)
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
 
     # Act: Execute both commands
     handler.handle(command1)
     handler.handle(command2)
 
     # Assert: Different Account IDs were generated
-    account1 = mock_repository.save.call_args_list[0][0][0]
-    account2 = mock_repository.save.call_args_list[1][0][0]
+    account1 = mock_repository.create_if_email_absent.call_args_list[0][0][0]
+    account2 = mock_repository.create_if_email_absent.call_args_list[1][0][0]
 
     assert account1.id != account2.id
+
+
+def test_register_account_inserts_and_dispatches_in_one_unit_of_work() -> None:
+    """
+    Handler should insert the account and dispatch AccountCreated in one unit of work.
+
+    The synchronous AccountCreated handler saves the activation code, so
+    running both inside the same unit of work means a single commit.
+    Hashing and the event slot reservation must happen before the unit of
+    work starts (no connection held during bcrypt or a full-queue wait).
+    """
+    # Arrange
+    command = RegisterAccountCommand(
+        email=Email("user@example.com"), password=PlainTextPassword("SecurePassword123")
+    )
+
+    calls = MagicMock()
+    mock_repository = Mock(spec=AccountRepository)
+    mock_repository.find_by_email.return_value = None
+    mock_repository.create_if_email_absent.return_value = True
+    mock_hasher = create_mock_hasher()
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
+    mock_uow = MagicMock(spec=UnitOfWork)
+
+    calls.attach_mock(mock_hasher.hash, "hash")
+    calls.attach_mock(mock_dispatcher.reserve, "reserve")
+    calls.attach_mock(mock_uow.begin, "begin")
+    calls.attach_mock(mock_repository.create_if_email_absent, "create_if_email_absent")
+    calls.attach_mock(mock_dispatcher.dispatch, "dispatch")
+
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=mock_dispatcher,
+        hasher=mock_hasher,
+        uow=mock_uow,
+    )
+
+    # Act
+    handler.handle(command)
+
+    # Assert: hash → reserve → begin → enter → insert → dispatch → exit
+    call_names = [name for name, _, _ in calls.mock_calls]
+    assert call_names == [
+        "hash",
+        "reserve",
+        "reserve().__enter__",
+        "begin",
+        "begin().__enter__",
+        "create_if_email_absent",
+        "dispatch",
+        "begin().__exit__",
+        "reserve().__exit__",
+    ]
+    mock_dispatcher.reserve.assert_called_once_with(AccountCreated)
+
+
+def test_register_account_with_prehashed_password_skips_fast_path_and_hash() -> None:
+    """
+    Handler should use a Password hashed by the caller as is.
+
+    Async endpoints run ensure_email_available() and hash_password()
+    themselves, so handle() neither queries the email again nor hashes.
+    """
+    # Arrange
+    password = Password.from_hash(HASHED_PASSWORD)
+    command = RegisterAccountCommand(email=Email("user@example.com"), password=password)
+
+    mock_repository = Mock(spec=AccountRepository)
+    mock_repository.create_if_email_absent.return_value = True
+    mock_hasher = create_mock_hasher()
+
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=MagicMock(spec=EventDispatcher),
+        hasher=mock_hasher,
+        uow=MagicMock(spec=UnitOfWork),
+    )
+
+    # Act
+    handler.handle(command)
+
+    # Assert
+    mock_repository.find_by_email.assert_not_called()
+    mock_hasher.hash.assert_not_called()
+    created_account = mock_repository.create_if_email_absent.call_args[0][0]
+    assert created_account.password == password
+
+
+def test_ensure_email_available_raises_when_email_exists() -> None:
+    email = Email("existing@example.com")
+    mock_repository = Mock(spec=AccountRepository)
+    mock_repository.find_by_email.return_value = Account.create(
+        email=email, password=Password.from_hash(HASHED_PASSWORD)
+    )
+
+    handler = RegisterAccountHandler(
+        repository=mock_repository,
+        dispatcher=MagicMock(spec=EventDispatcher),
+        hasher=create_mock_hasher(),
+        uow=MagicMock(spec=UnitOfWork),
+    )
+
+    with pytest.raises(EmailAlreadyExistsError):
+        handler.ensure_email_available(email)
+
+
+async def test_hash_password_awaits_hasher() -> None:
+    """hash_password() awaits hash_async() instead of blocking on hash()."""
+    mock_hasher = create_mock_hasher()
+    mock_hasher.hash_async.return_value = HASHED_PASSWORD
+
+    handler = RegisterAccountHandler(
+        repository=Mock(spec=AccountRepository),
+        dispatcher=MagicMock(spec=EventDispatcher),
+        hasher=mock_hasher,
+        uow=MagicMock(spec=UnitOfWork),
+    )
+
+    password = await handler.hash_password(PlainTextPassword("SecurePassword123"))
+
+    assert password == Password.from_hash(HASHED_PASSWORD)
+    mock_hasher.hash_async.assert_awaited_once_with("SecurePassword123")
+    mock_hasher.hash.assert_not_called()
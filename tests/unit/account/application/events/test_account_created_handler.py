@@ -21,6 +21,7 @@ import pytest
 from src.account.application.events.account_created_handler import (
     AccountCreatedHandler,
 )
+from src.account.domain.entities.account_activation import AccountActivation
 from src.account.domain.events.account_created import AccountCreated
 from src.account.domain.repositories.account_activation_repository import (
     AccountActivationRepository,
@@ -32,8 +33,10 @@ from src.shared.application.services.email_service import EmailService
 
 @pytest.fixture
 def mock_activation_repository() -> Mock:
-    """Provide mock AccountActivationRepository."""
-    return Mock(spec=AccountActivationRepository)
+    """Provide mock AccountActivationRepository (save_if_absent() stores the new code)."""
+    repository = Mock(spec=AccountActivationRepository)
+    repository.save_if_absent.side_effect = lambda activation: activation
+    return repository
 
 
 @pytest.fixture
@@ -69,16 +72,16 @@ def test_handle_generates_and_saves_activation_code(
     Validates:
         - AccountActivation created for account_id
         - Activation saved to repository
-        - save() called exactly once
+        - save_if_absent() called exactly once
     """
     # Act
     handler.handle(account_created_event)
 
     # Assert: Activation saved
-    assert mock_activation_repository.save.call_count == 1
+    assert mock_activation_repository.save_if_absent.call_count == 1
 
     # Assert: Activation for correct account_id
-    saved_activation = mock_activation_repository.save.call_args[0][0]
+    saved_activation = mock_activation_repository.save_if_absent.call_args[0][0]
     assert saved_activation.account_id == account_created_event.account_id
 
 
@@ -162,7 +165,7 @@ def test_handle_includes_code_in_email_body(
 
     # Code is 4 digits, should appear in body
     # Extract code from saved activation
-    saved_activation = mock_activation_repository.save.call_args[0][0]
+    saved_activation = mock_activation_repository.save_if_absent.call_args[0][0]
     assert saved_activation.code.code in body
 
 
@@ -181,13 +184,18 @@ def test_handle_workflow_order(
     """
     # Arrange: Track call order
     call_order = []
-    mock_activation_repository.save.side_effect = lambda *args: call_order.append("save")
+
+    def save_if_absent(activation: AccountActivation) -> AccountActivation:
+        call_order.append("save")
+        return activation
+
+    mock_activation_repository.save_if_absent.side_effect = save_if_absent
     mock_email_service.send_email.side_effect = lambda *args: call_order.append("email")
 
     # Act
     handler.handle(account_created_event)
 
-    # Assert: save() before send_email()
+    # Assert: save_if_absent() before send_email()
     assert call_order == ["save", "email"]
 
 
@@ -210,6 +218,31 @@ def test_handle_uses_default_from_email(
     assert email_message.from_email.value == "noreply@example.com"
 
 
+def test_handle_resends_stored_unexpired_code(
+    handler: AccountCreatedHandler,
+    mock_activation_repository: Mock,
+    mock_email_service: Mock,
+    account_created_event: AccountCreated,
+) -> None:
+    """
+    A redelivered event should email the code already stored.
+
+    Validates:
+        - save_if_absent() result (not the newly generated code) is emailed
+    """
+    # Arrange: A previous delivery stored a code for the account
+    stored = AccountActivation.create_for_account(account_created_event.account_id)
+    mock_activation_repository.save_if_absent.side_effect = None
+    mock_activation_repository.save_if_absent.return_value = stored
+
+    # Act
+    handler.handle(account_created_event)
+
+    # Assert
+    email_message = mock_email_service.send_email.call_args[0][0]
+    assert f"code={stored.code.code}" in email_message.body
+
+
 def test_handle_propagates_repository_exception(
     handler: AccountCreatedHandler,
     mock_activation_repository: Mock,
@@ -223,7 +256,7 @@ def test_handle_propagates_repository_exception(
         - Event dispatcher can log and handle errors
     """
     # Arrange: Repository raises exception
-    mock_activation_repository.save.side_effect = Exception("Database error")
+    mock_activation_repository.save_if_absent.side_effect = Exception("Database error")
 
     # Act & Assert: Exception propagated
     with pytest.raises(Exception, match="Database error"):
@@ -278,3 +311,56 @@ def test_build_email_body_includes_all_elements(
     assert "Activate Account" in body or "activate" in body.lower()
     assert "<html>" in body
     assert "</html>" in body
+
+
+def test_handle_batch_saves_all_activations_in_one_call(
+    handler: AccountCreatedHandler,
+    mock_activation_repository: Mock,
+    mock_email_service: Mock,
+) -> None:
+    """
+    handle_batch() should persist every code with a single save_many().
+
+    Validates:
+        - One activation per event, in event order
+        - save_many() called once, save() never
+        - One send_emails() submission with one message per account
+    """
+    # Arrange
+    events = [
+        AccountCreated(AccountId.generate(), Email(f"user{i}@example.com"), datetime.now(UTC))
+        for i in range(3)
+    ]
+
+    # Act
+    handler.handle_batch(events)
+
+    # Assert
+    mock_activation_repository.save.assert_not_called()
+    mock_activation_repository.save_many.assert_called_once()
+    activations = mock_activation_repository.save_many.call_args[0][0]
+    assert [activation.account_id for activation in activations] == [
+        event.account_id for event in events
+    ]
+
+    mock_email_service.send_email.assert_not_called()
+    mock_email_service.send_emails.assert_called_once()
+    messages = mock_email_service.send_emails.call_args[0][0]
+    assert [message.to_email for message in messages] == [event.email for event in events]
+    for event, activation, message in zip(events, activations, messages, strict=True):
+        assert f"/activate/{event.account_id.value}?code={activation.code.code}" in message.body
+
+
+def test_handle_batch_sends_no_email_if_save_fails(
+    handler: AccountCreatedHandler,
+    mock_activation_repository: Mock,
+    mock_email_service: Mock,
+    account_created_event: AccountCreated,
+) -> None:
+    # Arrange
+    mock_activation_repository.save_many.side_effect = Exception("Database error")
+
+    # Act & Assert
+    with pytest.raises(Exception, match="Database error"):
+        handler.handle_batch([account_created_event])
+    mock_email_service.send_emails.assert_not_called()
@@ -0,0 +1,90 @@
+"""
+Unit tests for ListAccountsHandler.
+
+Tests the page shaping around AccountRepository.find_page(): extra row
+detection of the next page, cursor value and query validation.
+
+Test Strategy:
+    - Unit tests (no database)
+    - Mock AccountRepository
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.account.application.queries.list_accounts import (
+    MAX_PAGE_SIZE,
+    ListAccountsHandler,
+    ListAccountsQuery,
+)
+from src.account.domain.entities.account import Account
+from src.account.domain.repositories.account_repository import AccountRepository
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+
+
+def create_accounts(count: int) -> list[Account]:
+    password = Password.from_hash("$2b$12$hashedforlistingtests")
+    return [Account.create(Email(f"user{i}@example.com"), password) for i in range(count)]
+
+
+@pytest.fixture
+def mock_repository() -> Mock:
+    """Provide mock AccountRepository."""
+    return Mock(spec=AccountRepository)
+
+
+def test_handle_returns_next_cursor_when_more_accounts_exist(mock_repository: Mock) -> None:
+    """
+    handle() should read one extra account to detect the next page.
+
+    Validates:
+        - Repository asked for limit + 1 accounts, with cursor and window
+        - Page trimmed to limit, next cursor is the last returned id
+    """
+    # Arrange
+    accounts = create_accounts(3)
+    mock_repository.find_page.return_value = accounts
+    after = AccountId.generate()
+    created_from = datetime(2025, 11, 1, tzinfo=UTC)
+    query = ListAccountsQuery(after=after, limit=2, created_from=created_from)
+
+    # Act
+    page = ListAccountsHandler(mock_repository).handle(query)
+
+    # Assert
+    mock_repository.find_page.assert_called_once_with(after, 3, created_from, None)
+    assert page.accounts == accounts[:2]
+    assert page.next_cursor == accounts[1].id
+
+
+def test_handle_returns_no_cursor_on_last_page(mock_repository: Mock) -> None:
+    """handle() should return next_cursor=None when no extra account came back."""
+    # Arrange
+    accounts = create_accounts(2)
+    mock_repository.find_page.return_value = accounts
+
+    # Act
+    page = ListAccountsHandler(mock_repository).handle(ListAccountsQuery(limit=2))
+
+    # Assert
+    assert page.accounts == accounts
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize("limit", [0, MAX_PAGE_SIZE + 1])
+def test_query_rejects_out_of_range_limit(limit: int) -> None:
+    """ListAccountsQuery should reject page sizes outside 1..MAX_PAGE_SIZE."""
+    with pytest.raises(ValueError, match="Page size"):
+        ListAccountsQuery(limit=limit)
+
+
+def test_query_rejects_empty_time_window() -> None:
+    """ListAccountsQuery should reject created_from not before created_until."""
+    instant = datetime(2025, 11, 1, tzinfo=UTC)
+
+    with pytest.raises(ValueError, match="created_from must be before created_until"):
+        ListAccountsQuery(created_from=instant, created_until=instant)
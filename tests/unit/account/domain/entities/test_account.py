@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from src.account.domain.entities.account import Account
@@ -210,3 +212,76 @@ def test_activate_is_the_only_way_to_activate_account() -> None:
     account.activate()
 
     assert account.is_activated is True
+
+
+def test_account_is_slotted_and_copyable() -> None:
+    email = Email("user@example.com")
+    password = Password.from_hash("$2b$12$hashedforslottests")
+    account = Account.create(email, password)
+
+    copied = copy.copy(account)
+    copied.activate()
+
+    assert not hasattr(account, "__dict__")
+    assert copied == account
+    assert copied.email is account.email
+    assert account.is_activated is False
+
+
+def test_account_create_is_new_without_changes() -> None:
+    account = Account.create(Email("user@example.com"), Password.from_hash("$2b$12$hashed"))
+
+    assert account.is_new is True
+    assert account.changed_fields == frozenset()
+
+
+def test_reconstructed_account_is_not_new() -> None:
+    account = Account(
+        AccountId.generate(), Email("user@example.com"), Password.from_hash("$2b$12$hashed")
+    )
+
+    assert account.is_new is False
+    assert account.changed_fields == frozenset()
+
+
+def test_activate_tracks_is_activated_change_once() -> None:
+    account = Account(
+        AccountId.generate(), Email("user@example.com"), Password.from_hash("$2b$12$hashed")
+    )
+
+    account.activate()
+    account.activate()
+
+    assert account.changed_fields == frozenset({"is_activated"})
+
+
+def test_activate_already_active_account_records_no_change() -> None:
+    account = Account(
+        AccountId.generate(), Email("user@example.com"), Password.from_hash("$2b$12$hashed"), True
+    )
+
+    account.activate()
+
+    assert account.changed_fields == frozenset()
+
+
+def test_mark_persisted_clears_changes_and_new_flag() -> None:
+    account = Account.create(Email("user@example.com"), Password.from_hash("$2b$12$hashed"))
+    account.activate()
+
+    account.mark_persisted()
+
+    assert account.is_new is False
+    assert account.changed_fields == frozenset()
+
+
+def test_account_copies_track_changes_independently() -> None:
+    account = Account(
+        AccountId.generate(), Email("user@example.com"), Password.from_hash("$2b$12$hashed")
+    )
+
+    copied = copy.copy(account)
+    copied.activate()
+
+    assert copied.changed_fields == frozenset({"is_activated"})
+    assert account.changed_fields == frozenset()
@@ -199,3 +199,15 @@ class TestAccountActivation:
         # Can be used in set
         activation_set = {activation1, activation2}
         assert len(activation_set) == 1  # Only one unique entity
+
+    def test_account_activation_is_slotted(self) -> None:
+        """Verify no per-instance __dict__ (entity and its value objects)."""
+        # Arrange
+        account_id = AccountId.from_string("0192a4e3-7890-7bcd-8000-123456789abc")
+        activation = AccountActivation.create_for_account(account_id)
+
+        # Act & Assert - EXPIRATION_SECONDS stays a class constant, not a slot
+        assert not hasattr(activation, "__dict__")
+        assert not hasattr(activation.account_id, "__dict__")
+        assert "EXPIRATION_SECONDS" not in AccountActivation.__slots__
+        assert activation.EXPIRATION_SECONDS == 60
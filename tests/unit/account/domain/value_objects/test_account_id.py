@@ -1,8 +1,13 @@
-from uuid import UUID
+import random
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
 
 import pytest
 
 from src.account.domain.value_objects.account_id import AccountId
+from src.shared.domain.value_objects import uuid_v7
 
 
 def test_account_id_generate_creates_uuid_v7() -> None:
@@ -105,3 +110,141 @@ def test_account_id_round_trip_string_conversion() -> None:
 
     assert restored_id == original_id
     assert restored_id.value == original_id.value
+
+
+def test_account_id_min_for_timestamp_encodes_milliseconds() -> None:
+    instant = datetime(2025, 11, 3, 16, 0, 0, 123_999, tzinfo=UTC)
+
+    boundary = AccountId.min_for_timestamp(instant)
+
+    assert boundary.value.version == 7
+    assert boundary.value.int >> 80 == int(instant.timestamp() * 1000)
+    assert boundary == AccountId.min_for_timestamp(instant.replace(microsecond=123_000))
+
+
+def test_account_id_min_for_timestamp_bounds_generated_ids() -> None:
+    before = datetime.now(UTC) - timedelta(milliseconds=1)
+    account_id = AccountId.generate()
+    after = datetime.now(UTC) + timedelta(milliseconds=1)
+
+    assert AccountId.min_for_timestamp(before).value <= account_id.value
+    assert account_id.value < AccountId.min_for_timestamp(after).value
+
+
+def test_account_id_min_for_timestamp_reads_naive_datetime_as_utc() -> None:
+    naive = datetime(2025, 11, 3, 16, 0)
+
+    assert AccountId.min_for_timestamp(naive) == AccountId.min_for_timestamp(
+        naive.replace(tzinfo=UTC)
+    )
+
+
+def test_account_id_min_for_timestamp_rejects_pre_epoch_instant() -> None:
+    with pytest.raises(ValueError, match="out of UUID v7 range"):
+        AccountId.min_for_timestamp(datetime(1969, 12, 31, tzinfo=UTC))
+
+
+def test_account_id_from_trusted_wraps_value_without_version_check() -> None:
+    stored = uuid4()  # Not v7: only from_trusted() accepts it
+
+    account_id = AccountId.from_trusted(stored)
+
+    assert account_id.value is stored
+    assert account_id == AccountId.from_trusted(UUID(str(stored)))
+    with pytest.raises(ValueError, match="version 7"):
+        AccountId(stored)
+
+
+def test_account_id_generate_many_creates_increasing_uuid_v7() -> None:
+    account_ids = AccountId.generate_many(10_000)
+
+    assert len(account_ids) == 10_000
+    assert all(isinstance(account_id, AccountId) for account_id in account_ids)
+    assert all(account_id.value.version == 7 for account_id in account_ids)
+    assert all(account_id.value.variant == "specified in RFC 4122" for account_id in account_ids)
+    assert all(a.value < b.value for a, b in zip(account_ids, account_ids[1:], strict=False))
+
+
+def test_account_id_generate_many_continues_after_generate() -> None:
+    first = AccountId.generate()
+    batch = AccountId.generate_many(3)
+    last = AccountId.generate()
+
+    assert first.value < batch[0].value < batch[1].value < batch[2].value < last.value
+
+
+def test_account_id_generate_many_handles_zero_and_rejects_negative_count() -> None:
+    assert AccountId.generate_many(0) == []
+    with pytest.raises(ValueError, match="cannot be negative"):
+        AccountId.generate_many(-1)
+
+
+def test_account_id_generate_stays_monotonic_when_clock_goes_backwards(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = iter([2_000_000_000, 1_000_000_000])  # ns: second reading 1s earlier
+    monkeypatch.setattr(time, "time_ns", lambda: next(clock))
+    monkeypatch.setattr(uuid_v7, "_ALLOCATOR", uuid_v7._MonotonicAllocator())
+
+    first = AccountId.generate()
+    second = AccountId.generate()
+
+    assert first.value < second.value
+    assert second.value.int >> 80 == 2_000  # Still the last issued millisecond
+
+
+def test_account_id_generate_many_advances_timestamp_on_counter_overflow(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    allocator = uuid_v7._MonotonicAllocator()
+    allocator._last_ms = 5_000
+    allocator._counter = uuid_v7._COUNTER_MAX - 1  # One value left in this millisecond
+    monkeypatch.setattr(time, "time_ns", lambda: 5_000_000_000)
+    monkeypatch.setattr(uuid_v7, "_ALLOCATOR", allocator)
+
+    account_ids = AccountId.generate_many(3)
+
+    assert [account_id.value.int >> 80 for account_id in account_ids] == [5_000, 5_001, 5_001]
+    assert account_ids[0].value < account_ids[1].value < account_ids[2].value
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_account_id_allocation_is_ordered_under_concurrency(seed: int) -> None:
+    """
+    Property: whatever the interleaving of threads and batch sizes, every
+    allocation is a strictly increasing run, runs never overlap, and each
+    thread sees its identifiers in increasing order.
+    """
+    rng = random.Random(seed)
+    plans = [[rng.choice([1, 1, 7, 100, 1_000]) for _ in range(50)] for _ in range(8)]
+    results: list[list[list[AccountId]]] = [[] for _ in plans]
+    barrier = threading.Barrier(len(plans))
+
+    def allocate(thread: int) -> None:
+        barrier.wait()
+        for count in plans[thread]:
+            if count == 1:
+                results[thread].append([AccountId.generate()])
+            else:
+                results[thread].append(AccountId.generate_many(count))
+
+    threads = [threading.Thread(target=allocate, args=(i,)) for i in range(len(plans))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    batches = [batch for thread_batches in results for batch in thread_batches]
+    ordered = sorted(account_id.value for batch in batches for account_id in batch)
+    position = {value: index for index, value in enumerate(ordered)}
+
+    assert len(position) == sum(len(batch) for batch in batches)  # No duplicates
+    for batch in batches:
+        # Contiguous in the global order: no other thread's id inside a batch
+        first = position[batch[0].value]
+        assert [position[account_id.value] for account_id in batch] == list(
+            range(first, first + len(batch))
+        )
+    for thread_batches in results:
+        values = [account_id.value for batch in thread_batches for account_id in batch]
+        assert values == sorted(values)
@@ -8,6 +8,8 @@ Tests verify:
     - Code matching logic (matches() method)
 """
 
+import dataclasses
+
 import pytest
 
 from src.account.domain.value_objects.activation_code import ActivationCode
@@ -97,6 +99,15 @@ class TestActivationCode:
         with pytest.raises(AttributeError):
             code.code = "5678"  # type: ignore[misc]
 
+    def test_activation_code_is_slotted(self) -> None:
+        """Verify ActivationCode has no per-instance __dict__ and CODE_LENGTH is no field."""
+        # Arrange
+        code = ActivationCode("1234")
+
+        # Assert
+        assert not hasattr(code, "__dict__")
+        assert [f.name for f in dataclasses.fields(code)] == ["code"]
+
     def test_matches_returns_true_for_correct_code(self) -> None:
         """Verify matches() returns True when input matches stored code."""
         # Arrange
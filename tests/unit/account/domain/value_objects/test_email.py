@@ -1,5 +1,11 @@
+import random
+import string
+from typing import Any
+
+import email_validator
 import pytest
 
+from src.account.domain.value_objects import email as email_module
 from src.account.domain.value_objects.email import Email
 
 
@@ -91,3 +97,156 @@ def test_email_is_immutable() -> None:
 
     with pytest.raises(AttributeError):
         email.value = "hacker@malicious.com"  # type: ignore[misc]
+
+
+def test_email_from_trusted_keeps_value_as_is() -> None:
+    email = Email.from_trusted("user@example.com")
+
+    assert email.value == "user@example.com"
+    assert email == Email("user@example.com")
+    assert hash(email) == hash(Email("user@example.com"))
+
+
+def test_email_from_trusted_does_not_validate() -> None:
+    email = Email.from_trusted("Not An Email")
+
+    assert email.value == "Not An Email"
+
+
+def test_email_from_trusted_rejects_empty_string() -> None:
+    with pytest.raises(ValueError, match="Email cannot be empty"):
+        Email.from_trusted("")
+
+
+def test_email_validation_is_memoized_per_raw_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    original = email_validator.validate_email
+
+    def counting_validate_email(value: str, **kwargs: Any) -> Any:
+        calls.append(value)
+        return original(value, **kwargs)
+
+    monkeypatch.setattr(email_module, "validate_email", counting_validate_email)
+
+    # Apostrophe: outside the ASCII fast path, so email_validator is called
+    first = Email("Memo.O'Repeat@Example.com")
+    second = Email("Memo.O'Repeat@Example.com")
+
+    assert first == second
+    assert second.value == "memo.o'repeat@example.com"
+    assert calls == ["Memo.O'Repeat@Example.com"]
+
+
+def test_email_validation_errors_are_memoized() -> None:
+    stats_before = Email.validation_cache_stats()
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid email"):
+            Email("memoized-invalid@")
+
+    stats_after = Email.validation_cache_stats()
+    assert stats_after.hits == stats_before.hits + 1
+    assert stats_after.misses == stats_before.misses + 1
+
+
+def test_email_validation_cache_stats_report_hit_rate() -> None:
+    Email("hit-rate@example.com")
+    Email("hit-rate@example.com")
+
+    stats = Email.validation_cache_stats()
+
+    assert stats.max_size == email_module.VALIDATION_CACHE_SIZE
+    assert 0 < stats.size <= stats.max_size
+    assert 0.0 < stats.hit_rate <= 1.0
+
+
+@pytest.mark.parametrize(
+    "raw_email",
+    [
+        "user@example.com",
+        "First.Last+tag@Sub.Example.ORG",
+        "user_name%dept@mail-server.example.co.uk",
+    ],
+)
+def test_email_ascii_fast_path_accepts_common_addresses(raw_email: str) -> None:
+    assert email_module._normalize_ascii(raw_email) == raw_email.lower()
+
+
+@pytest.mark.parametrize(
+    "raw_email",
+    [
+        "user@xn--e1afmkfd.com",  # Punycode
+        "user@пример.com",  # IDN
+        '"quoted"@example.com',  # Quoted local part
+        "o'brien@example.com",  # Valid but unusual character
+        "user@sub.test",  # Special-use domain
+        "user@example.c0m",  # Numeric TLD
+        f"{'a' * 65}@example.com",  # Local part too long
+    ],
+)
+def test_email_ascii_fast_path_defers_unusual_addresses(raw_email: str) -> None:
+    assert email_module._normalize_ascii(raw_email) is None
+
+
+def test_email_ascii_fast_path_agrees_with_email_validator() -> None:
+    """
+    Differential test: every address accepted by the fast path must be
+    accepted by email_validator with the same (lowercased) normalization.
+    """
+    rng = random.Random(1234)
+    local_chars = string.ascii_letters + string.digits + "._%+-!#$&'*/=?^`{|}~\"() ,:;<>@[\\]"
+    domain_chars = string.ascii_letters + string.digits + ".-_"
+    tlds = ["com", "org", "io", "co", "uk", "museum", "c0", "x", "test", "local", "arpa"]
+
+    def random_address() -> str:
+        local = "".join(rng.choices(local_chars, k=rng.randint(1, 70)))
+        labels = [
+            "".join(rng.choices(domain_chars, k=rng.randint(1, 12)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        address = f"{local}@{'.'.join(labels)}.{rng.choice(tlds)}"
+        if rng.random() < 0.05:
+            address += rng.choice([" ", ".", "é", "@x"])
+        return address
+
+    def plausible_address() -> str:
+        local = ".".join(
+            "".join(
+                rng.choices(string.ascii_letters + string.digits + "_%+-", k=rng.randint(1, 10))
+            )
+            for _ in range(rng.randint(1, 3))
+        )
+        labels = [
+            "".join(rng.choices(string.ascii_lowercase + string.digits + "-", k=rng.randint(1, 8)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        return f"{local}@{'.'.join(labels)}.{rng.choice(tlds)}"
+
+    corpus = [random_address() for _ in range(20_000)] + [
+        plausible_address() for _ in range(20_000)
+    ]
+
+    accepted = 0
+    for raw_email in corpus:
+        fast = email_module._normalize_ascii(raw_email)
+        if fast is None:
+            continue
+
+        accepted += 1
+        try:
+            expected = email_validator.validate_email(raw_email, check_deliverability=False)
+        except email_validator.EmailNotValidError as e:
+            pytest.fail(f"Fast path accepted invalid address {raw_email!r}: {e}")
+        assert fast == expected.normalized.lower(), raw_email
+
+    assert accepted > 10_000  # Plausible addresses mostly take the fast path
+
+
+@pytest.mark.parametrize(
+    "email",
+    [Email("User@Example.com"), Email.from_trusted("user@example.com")],
+    ids=["validated", "from_trusted"],
+)
+def test_email_is_slotted(email: Email) -> None:
+    assert not hasattr(email, "__dict__")
+    assert email.value == "user@example.com"
@@ -1,6 +1,9 @@
+from unittest.mock import Mock
+
 import pytest
 
-from src.account.domain.value_objects.password import Password
+from src.account.domain.value_objects.password import Password, PlainTextPassword
+from src.shared.domain.services.password_hasher import PasswordHasher
 
 BCRYPT_HASH_PREFIX = "$2b$"
 
@@ -89,3 +92,77 @@ def test_password_is_immutable() -> None:
 
     with pytest.raises(AttributeError):
         password.hashed_value = "hacked"  # type: ignore[misc]
+
+
+def test_password_from_plain_text_delegates_to_hasher() -> None:
+    hasher = Mock(spec=PasswordHasher)
+    hasher.hash.return_value = "$2b$12$delegatedhash"
+
+    password = Password.from_plain_text("MySecurePassword123", hasher)
+
+    hasher.hash.assert_called_once_with("MySecurePassword123")
+    assert password.hashed_value == "$2b$12$delegatedhash"
+
+
+def test_password_from_plain_text_validates_before_delegating() -> None:
+    hasher = Mock(spec=PasswordHasher)
+
+    with pytest.raises(ValueError, match="Password must be at least 8 characters long"):
+        Password.from_plain_text("short", hasher)
+
+    hasher.hash.assert_not_called()
+
+
+def test_password_verify_delegates_to_hasher() -> None:
+    hasher = Mock(spec=PasswordHasher)
+    hasher.verify.return_value = True
+    password = Password.from_hash("$2b$12$storedhash")
+
+    assert password.verify("MySecurePassword123", hasher) is True
+    hasher.verify.assert_called_once_with("MySecurePassword123", "$2b$12$storedhash")
+
+
+def test_plain_text_password_rejects_empty() -> None:
+    with pytest.raises(ValueError, match="Password cannot be empty"):
+        PlainTextPassword("")
+
+
+def test_plain_text_password_rejects_too_short() -> None:
+    with pytest.raises(ValueError, match="Password must be at least 8 characters long"):
+        PlainTextPassword("short")
+
+
+def test_plain_text_password_defers_hashing_until_hash() -> None:
+    hasher = Mock(spec=PasswordHasher)
+    hasher.hash.return_value = "$2b$12$deferredhash"
+
+    plain = PlainTextPassword("MySecurePassword123")
+    hasher.hash.assert_not_called()
+
+    password = plain.hash(hasher)
+
+    hasher.hash.assert_called_once_with("MySecurePassword123")
+    assert password == Password.from_hash("$2b$12$deferredhash")
+
+
+def test_plain_text_password_representation_is_masked() -> None:
+    plain = PlainTextPassword("MySecurePassword123")
+
+    assert str(plain) == "********"
+    assert "MySecurePassword123" not in repr(plain)
+
+
+class FixedHasher(PasswordHasher):
+    """Hasher without its own hash_async() (exercises the default)."""
+
+    def hash(self, plain_password: str) -> str:
+        return "$2b$12$fixedhash"
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return hashed_password == "$2b$12$fixedhash"
+
+
+async def test_plain_text_password_hash_async_uses_default_hash_async() -> None:
+    password = await PlainTextPassword("MySecurePassword123").hash_async(FixedHasher())
+
+    assert password == Password.from_hash("$2b$12$fixedhash")
@@ -0,0 +1 @@
+"""Unit tests for account HTTP layer."""
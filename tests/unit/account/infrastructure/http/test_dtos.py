@@ -0,0 +1,65 @@
+"""
+Unit tests for account HTTP DTOs.
+
+Validates that RegisterAccountRequest parses the email straight into the
+domain Email value object, with a single email_validator call.
+
+Test Strategy:
+    - Unit tests (no HTTP client, no database)
+    - email_validator call counting via monkeypatch
+"""
+
+import time
+from typing import Any
+
+import email_validator
+import pytest
+from pydantic import ValidationError
+
+from src.account.domain.value_objects import email as email_module
+from src.account.domain.value_objects.email import Email
+from src.account.infrastructure.http.dtos import RegisterAccountRequest
+
+
+def test_register_request_parses_email_value_object() -> None:
+    request = RegisterAccountRequest.model_validate(
+        {"email": "  User@Example.COM ", "password": "SecurePass123!"}
+    )
+
+    assert isinstance(request.email, Email)
+    assert request.email.value == "user@example.com"
+
+
+def test_register_request_validates_email_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    original = email_validator.validate_email
+
+    def counting_validate_email(value: str, **kwargs: Any) -> Any:
+        calls.append(value)
+        return original(value, **kwargs)
+
+    monkeypatch.setattr(email_module, "validate_email", counting_validate_email)
+    # Not memoized yet, and outside the ASCII fast path (apostrophe)
+    raw_email = f"o'nce-{time.time_ns()}@example.com"
+
+    RegisterAccountRequest.model_validate({"email": raw_email, "password": "SecurePass123!"})
+
+    assert calls == [raw_email]
+
+
+@pytest.mark.parametrize("invalid_email", ["not-an-email", "", 42])
+def test_register_request_rejects_invalid_email(invalid_email: object) -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        RegisterAccountRequest.model_validate(
+            {"email": invalid_email, "password": "SecurePass123!"}
+        )
+
+    assert exc_info.value.errors()[0]["loc"] == ("email",)
+
+
+def test_register_request_serializes_email_as_string() -> None:
+    request = RegisterAccountRequest.model_validate(
+        {"email": "user@example.com", "password": "SecurePass123!"}
+    )
+
+    assert request.model_dump()["email"] == "user@example.com"
@@ -30,7 +30,7 @@ def test_to_persistence_converts_activation_to_dict() -> None:
     to_persistence() should convert AccountActivation entity to database-compatible dictionary.
 
     Validates:
-        - account_id UUID converted to string
+        - account_id UUID passed as-is (native uuid parameter)
         - code extracted from value object
         - created_at timestamp preserved
         - expires_at timestamp preserved
@@ -44,7 +44,7 @@ def test_to_persistence_converts_activation_to_dict() -> None:
 
     # Assert
     assert isinstance(row, dict)
-    assert isinstance(row["account_id"], str)  # UUID converted to string
+    assert isinstance(row["account_id"], UUID)  # Native uuid parameter
     assert isinstance(row["code"], str)
     assert len(row["code"]) == 4  # 4-digit code
     assert isinstance(row["created_at"], datetime)
@@ -53,11 +53,10 @@ def test_to_persistence_converts_activation_to_dict() -> None:
 
 def test_to_persistence_preserves_uuid_value() -> None:
     """
-    to_persistence() should preserve the UUID value when converting to string.
+    to_persistence() should pass the identifier's UUID through unchanged.
 
     Validates:
-        - String UUID can be converted back to UUID object
-        - No data loss during string conversion
+        - Same UUID object as the value object (no str() round trip)
     """
     # Arrange
     account_id = AccountId.generate()
@@ -66,10 +65,9 @@ def test_to_persistence_preserves_uuid_value() -> None:
 
     # Act
     row = to_persistence(activation)
-    converted_uuid = UUID(row["account_id"])  # type: ignore[arg-type]
 
     # Assert
-    assert converted_uuid == original_uuid
+    assert row["account_id"] is original_uuid
 
 
 def test_to_persistence_preserves_timestamps() -> None:
@@ -201,7 +199,7 @@ def test_round_trip_preserves_activation_data() -> None:
     row = to_persistence(original_activation)
 
     # Act: Convert back to domain
-    reconstructed_activation = to_domain(row)  # type: ignore[arg-type]
+    reconstructed_activation = to_domain(row)
 
     # Assert: All data preserved
     assert reconstructed_activation.account_id == original_account_id
@@ -0,0 +1,86 @@
+"""
+Unit tests for account_created_codec.
+
+Tests the mapping between the AccountCreated domain event and the JSON
+object stored in outbox.payload.
+
+Test Strategy:
+    - Unit tests (no database required)
+    - Test to_payload() conversion (event → JSON-serializable dict)
+    - Test round-trip preservation (event → dict → event)
+"""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from src.account.domain.events.account_created import AccountCreated
+from src.account.domain.value_objects.account_id import AccountId
+from src.account.domain.value_objects.email import Email
+from src.account.infrastructure.persistence.account_created_codec import (
+    ACCOUNT_CREATED_CODEC,
+    from_payload,
+    to_payload,
+)
+
+
+@pytest.fixture
+def event() -> AccountCreated:
+    return AccountCreated(
+        account_id=AccountId.generate(),
+        email=Email("user@example.com"),
+        occurred_at=datetime(2025, 11, 12, 9, 0, 0, 123456, tzinfo=UTC),
+    )
+
+
+def test_to_payload_produces_json_serializable_strings(event: AccountCreated) -> None:
+    """
+    to_payload() should only contain JSON-native values.
+
+    Validates:
+        - UUID as canonical string, email as string
+        - Timestamp as ISO 8601 with offset
+        - json.dumps() accepts the result (psycopg2 Json adapter)
+    """
+    # Act
+    payload = to_payload(event)
+
+    # Assert
+    assert payload == {
+        "account_id": str(event.account_id.value),
+        "email": "user@example.com",
+        "occurred_at": "2025-11-12T09:00:00.123456+00:00",
+    }
+    json.dumps(payload)
+
+
+def test_round_trip_preserves_event(event: AccountCreated) -> None:
+    """
+    from_payload(to_payload(event)) should rebuild an equal event.
+
+    Validates:
+        - Identifier, email and timestamp (with time zone) preserved
+        - Same result after a JSON encode/decode (as read back from JSONB)
+    """
+    # Act
+    decoded = from_payload(json.loads(json.dumps(to_payload(event))))
+
+    # Assert
+    assert decoded == event
+    assert decoded.occurred_at.tzinfo is not None
+
+
+def test_codec_exposes_stable_event_name() -> None:
+    """The outbox event name is persisted: it must not follow class renames."""
+    assert ACCOUNT_CREATED_CODEC.name == "AccountCreated"
+    assert ACCOUNT_CREATED_CODEC.encode is to_payload
+    assert ACCOUNT_CREATED_CODEC.decode is from_payload
+
+
+def test_from_payload_rejects_missing_field(event: AccountCreated) -> None:
+    payload = to_payload(event)
+    del payload["email"]
+
+    with pytest.raises(KeyError):
+        from_payload(payload)
@@ -0,0 +1,108 @@
+"""
+Unit tests for the streaming account export.
+
+Validates CSV and NDJSON output, value formatting, the password hash
+opt-in, range arguments passed to the repository and progress callbacks.
+
+Test Strategy:
+    - Unit tests (no database required)
+    - Repository mocked, iter_rows() returns raw column tuples
+"""
+
+import csv
+import io
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from src.account.infrastructure.persistence.account_exporter import (
+    PROGRESS_EVERY,
+    ExportFormat,
+    export_accounts,
+)
+from src.account.infrastructure.persistence.postgres_account_repository import (
+    PostgresAccountRepository,
+)
+
+ACCOUNT_ID = UUID("01936f0e-1234-7abc-8def-0123456789ab")
+CREATED_AT = datetime(2025, 11, 3, 16, 0, tzinfo=UTC)
+ROW = (ACCOUNT_ID, "user@example.com", "$2b$12$hash", True, CREATED_AT, CREATED_AT)
+
+
+def create_repository(rows: list[tuple[object, ...]]) -> MagicMock:
+    repository = MagicMock(spec=PostgresAccountRepository)
+    repository.iter_rows.return_value = iter(rows)
+    return repository
+
+
+def test_export_ndjson_writes_one_object_per_line_without_password_hash() -> None:
+    """
+    NDJSON export should write JSON objects without the hash by default.
+
+    Validates:
+        - id as string, timestamps in ISO 8601
+        - password_hash omitted
+    """
+    # Arrange
+    out = io.StringIO()
+
+    # Act
+    result = export_accounts(create_repository([ROW, ROW]), out, ExportFormat.NDJSON)
+
+    # Assert
+    lines = out.getvalue().splitlines()
+    assert result.rows == 2
+    assert json.loads(lines[0]) == {
+        "id": str(ACCOUNT_ID),
+        "email": "user@example.com",
+        "is_activated": True,
+        "created_at": "2025-11-03T16:00:00+00:00",
+        "updated_at": "2025-11-03T16:00:00+00:00",
+    }
+
+
+def test_export_csv_with_password_hash_is_importable_header() -> None:
+    """
+    CSV export should carry a header and the hash (import_accounts columns).
+
+    Validates:
+        - Header row, then one row per account
+        - password_hash included when requested
+    """
+    # Arrange
+    out = io.StringIO()
+
+    # Act
+    export_accounts(create_repository([ROW]), out, ExportFormat.CSV, include_password_hash=True)
+
+    # Assert
+    header, row = list(csv.reader(io.StringIO(out.getvalue())))
+    assert header == ["id", "email", "password_hash", "is_activated", "created_at", "updated_at"]
+    assert row[:4] == [str(ACCOUNT_ID), "user@example.com", "$2b$12$hash", "True"]
+
+
+def test_export_passes_range_and_reports_progress() -> None:
+    """
+    Range and itersize should reach iter_rows(); progress every PROGRESS_EVERY rows.
+    """
+    # Arrange
+    repository = create_repository([ROW] * (PROGRESS_EVERY * 2 + 1))
+    until = datetime(2025, 12, 1, tzinfo=UTC)
+    progress: list[int] = []
+
+    # Act
+    result = export_accounts(
+        repository,
+        io.StringIO(),
+        ExportFormat.NDJSON,
+        created_from=CREATED_AT,
+        created_until=until,
+        itersize=500,
+        on_progress=progress.append,
+    )
+
+    # Assert
+    repository.iter_rows.assert_called_once_with(CREATED_AT, until, 500)
+    assert progress == [PROGRESS_EVERY, PROGRESS_EVERY * 2]
+    assert result.rows == PROGRESS_EVERY * 2 + 1
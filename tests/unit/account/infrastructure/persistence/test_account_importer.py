@@ -0,0 +1,100 @@
+"""
+Unit tests for the account importer validation step.
+
+Validates CSV and NDJSON parsing, email normalization, bcrypt hash checks,
+the optional is_activated column and line numbering of rejected records.
+
+Test Strategy:
+    - Unit tests (no database required)
+    - validate_chunk() called inline (as a worker process would)
+"""
+
+import json
+
+import pytest
+
+from src.account.infrastructure.persistence.account_importer import (
+    ImportFormat,
+    RejectedRecord,
+    validate_chunk,
+)
+
+HASH = "$2b$12$" + "a" * 53
+HEADER = ["email", "password_hash", "is_activated"]
+
+
+def test_validate_chunk_stages_valid_csv_rows() -> None:
+    """
+    Valid CSV lines should become staged rows.
+
+    Validates:
+        - Email normalized, hash kept, is_activated parsed
+        - Line numbers follow first_line
+    """
+    # Act
+    result = validate_chunk(
+        ImportFormat.CSV,
+        HEADER,
+        2,
+        [f" User@Example.COM ,{HASH},true\n", f"other@example.com,{HASH},0\n"],
+    )
+
+    # Assert
+    assert result.read == 2
+    assert result.rejected == []
+    assert [
+        (line, email, hashed, activated) for line, _, email, hashed, activated in result.rows
+    ] == [
+        (2, "user@example.com", HASH, True),
+        (3, "other@example.com", HASH, False),
+    ]
+
+
+def test_validate_chunk_rejects_invalid_records_with_line_numbers() -> None:
+    """
+    Invalid lines should be rejected, valid ones still staged.
+
+    Validates:
+        - Invalid email, non-bcrypt hash, wrong field count, bad is_activated
+        - Blank lines skipped (not counted)
+    """
+    # Act
+    result = validate_chunk(
+        ImportFormat.CSV,
+        HEADER,
+        10,
+        [
+            f"not-an-email,{HASH},false\n",
+            "user@example.com,plaintext-password,false\n",
+            "\n",
+            f"user@example.com,{HASH}\n",
+            f"user@example.com,{HASH},maybe\n",
+            f"valid@example.com,{HASH},\n",
+        ],
+    )
+
+    # Assert
+    assert result.read == 5
+    assert [record.line for record in result.rejected] == [10, 11, 13, 14]
+    assert isinstance(result.rejected[1], RejectedRecord)
+    assert "bcrypt" in result.rejected[1].reason
+    assert [row[0] for row in result.rows] == [15]
+
+
+@pytest.mark.parametrize(
+    ("line", "staged"),
+    [
+        (json.dumps({"email": "User@Example.com", "password_hash": HASH}), True),
+        (json.dumps({"email": "user@example.com", "password_hash": HASH, "is_activated": 1}), True),
+        ("{not json", False),
+        (json.dumps(["user@example.com", HASH]), False),
+        (json.dumps({"email": "user@example.com"}), False),
+    ],
+)
+def test_validate_chunk_parses_ndjson(line: str, staged: bool) -> None:
+    # Act
+    result = validate_chunk(ImportFormat.NDJSON, None, 1, [line])
+
+    # Assert
+    assert len(result.rows) == int(staged)
+    assert len(result.rejected) == int(not staged)
@@ -16,6 +16,8 @@ Test Strategy:
 from datetime import UTC, datetime
 from uuid import UUID, uuid7
 
+import pytest
+
 from src.account.domain.entities.account import Account
 from src.account.domain.value_objects.account_id import AccountId
 from src.account.domain.value_objects.email import Email
@@ -23,6 +25,7 @@ from src.account.domain.value_objects.password import Password
 from src.account.infrastructure.persistence.account_mapper import (
     to_domain,
     to_persistence,
+    to_persistence_changes,
 )
 
 
@@ -31,7 +34,7 @@ def test_to_persistence_converts_account_to_dict() -> None:
     to_persistence() should convert Account entity to database-compatible dictionary.
 
     Validates:
-        - UUID converted to string
+        - UUID passed as-is (native uuid parameter)
         - Email extracted from value object
         - Password hash extracted
         - is_activated boolean preserved
@@ -46,7 +49,7 @@ def test_to_persistence_converts_account_to_dict() -> None:
 
     # Assert
     assert isinstance(row, dict)
-    assert isinstance(row["id"], str)  # UUID converted to string
+    assert isinstance(row["id"], UUID)  # Native uuid parameter
     assert row["email"] == "test@example.com"
     assert isinstance(row["password_hash"], str)
     assert row["password_hash"].startswith("$2b$")  # bcrypt hash
@@ -55,11 +58,10 @@ def test_to_persistence_converts_account_to_dict() -> None:
 
 def test_to_persistence_preserves_uuid_value() -> None:
     """
-    to_persistence() should preserve the UUID value when converting to string.
+    to_persistence() should pass the identifier's UUID through unchanged.
 
     Validates:
-        - String UUID can be converted back to UUID object
-        - No data loss during string conversion
+        - Same UUID object as the value object (no str() round trip)
     """
     # Arrange
     email = Email("test@example.com")
@@ -69,10 +71,9 @@ def test_to_persistence_preserves_uuid_value() -> None:
 
     # Act
     row = to_persistence(account)
-    converted_uuid = UUID(row["id"])  # type: ignore[arg-type]
 
     # Assert
-    assert converted_uuid == original_uuid
+    assert row["id"] is original_uuid
 
 
 def test_to_domain_converts_dict_to_account() -> None:
@@ -131,7 +132,7 @@ def test_to_domain_handles_uuid_object() -> None:
     account = to_domain(row)  # type: ignore[arg-type]
 
     # Assert
-    assert account.id.value == uuid_obj
+    assert account.id.value is uuid_obj  # Driver UUID reused, not re-parsed
 
 
 def test_to_domain_handles_uuid_string() -> None:
@@ -186,7 +187,7 @@ def test_round_trip_preserves_account_data() -> None:
     }
 
     # Act: Convert back to domain
-    reconstructed_account = to_domain(row_with_timestamps)  # type: ignore[arg-type]
+    reconstructed_account = to_domain(row_with_timestamps)
 
     # Assert: All data preserved
     assert reconstructed_account.id == original_account.id
@@ -237,3 +238,84 @@ def test_to_domain_preserves_activated_status() -> None:
 
     # Assert
     assert account.is_activated is True
+
+
+def test_to_domain_does_not_revalidate_stored_email(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    to_domain() should trust stored emails (normalized before INSERT).
+
+    Validates:
+        - email_validator is not called
+        - Email value preserved
+    """
+
+    # Arrange
+    def fail_validation(*_: object, **__: object) -> None:
+        raise AssertionError("validate_email called")
+
+    monkeypatch.setattr("src.account.domain.value_objects.email.validate_email", fail_validation)
+    row = {
+        "id": str(uuid7()),
+        "email": "stored@example.com",
+        "password_hash": "$2b$12$hash",
+        "is_activated": False,
+        "created_at": datetime.now(UTC),
+        "updated_at": datetime.now(UTC),
+    }
+
+    # Act
+    account = to_domain(row)  # type: ignore[arg-type]
+
+    # Assert
+    assert account.email.value == "stored@example.com"
+
+
+def test_to_domain_returns_clean_persisted_account() -> None:
+    """
+    to_domain() should rebuild an existing account with no pending changes.
+
+    Validates:
+        - is_new is False (save() updates instead of inserting)
+        - changed_fields is empty
+    """
+    # Arrange
+    row = {
+        "id": str(uuid7()),
+        "email": "stored@example.com",
+        "password_hash": "$2b$12$hash",
+        "is_activated": False,
+        "created_at": datetime.now(UTC),
+        "updated_at": datetime.now(UTC),
+    }
+
+    # Act
+    account = to_domain(row)  # type: ignore[arg-type]
+
+    # Assert
+    assert account.is_new is False
+    assert account.changed_fields == frozenset()
+
+
+def test_to_persistence_changes_returns_changed_columns_only() -> None:
+    """
+    to_persistence_changes() should map changed fields to their columns.
+
+    Validates:
+        - Unchanged account: no columns
+        - Activated account: is_activated only
+    """
+    # Arrange
+    account = Account(
+        _id=AccountId.generate(),
+        _email=Email("test@example.com"),
+        _password=Password.from_hash("$2b$12$hash"),
+    )
+    unchanged = to_persistence_changes(account)
+
+    # Act
+    account.activate()
+    changes = to_persistence_changes(account)
+
+    # Assert
+    assert unchanged == {}
+    assert changes == {"is_activated": True}
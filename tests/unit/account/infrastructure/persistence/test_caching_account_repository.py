@@ -0,0 +1,444 @@
+"""
+Unit tests for CachingAccountRepository.
+
+Validates hits and misses by id and email, LRU eviction, TTL expiry,
+write-through on save(), invalidation and transaction awareness.
+
+Test Strategy:
+    - Unit tests (no database required)
+    - Inner repository and connection factory mocked
+    - Fake clock to control TTL expiry
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.account.domain.entities.account import Account
+from src.account.domain.repositories.account_repository import AccountRepository
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.caching_account_repository import (
+    CachingAccountRepository,
+)
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+
+TTL = 60.0
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_account(email: str = "user@example.com") -> Account:
+    return Account.create(Email(email), Password.from_hash("$2b$12$hashedforcachetests"))
+
+
+def create_cache(
+    inner: MagicMock,
+    db: MagicMock | None = None,
+    max_size: int = 10,
+    clock: FakeClock | None = None,
+) -> CachingAccountRepository:
+    if db is None:
+        db = MagicMock(spec=DatabaseConnectionFactory)
+        db.in_transaction.return_value = False
+    return CachingAccountRepository(
+        inner, db, max_size=max_size, ttl=TTL, clock=clock or FakeClock()
+    )
+
+
+def test_find_by_id_serves_repeated_lookups_from_memory() -> None:
+    """
+    Second lookup of the same id should not reach the inner repository.
+
+    Validates:
+        - One inner call for two lookups
+        - One miss then one hit
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.return_value = account
+    cache = create_cache(inner)
+
+    # Act
+    first = cache.find_by_id(account.id)
+    second = cache.find_by_id(account.id)
+
+    # Assert
+    assert first == account
+    assert second == account
+    inner.find_by_id.assert_called_once_with(account.id)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_find_by_email_hits_entry_loaded_by_id() -> None:
+    """
+    An account cached by id should also be found by email (shared entry).
+
+    Validates:
+        - find_by_email() never reaches the inner repository
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.return_value = account
+    cache = create_cache(inner)
+    cache.find_by_id(account.id)
+
+    # Act
+    found = cache.find_by_email(account.email)
+
+    # Assert
+    assert found == account
+    inner.find_by_email.assert_not_called()
+
+
+def test_misses_are_not_cached() -> None:
+    """
+    A "not found" result should never be cached.
+
+    Validates:
+        - Each lookup of an unknown email reaches the inner repository
+    """
+    # Arrange
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_email.return_value = None
+    cache = create_cache(inner)
+    email = Email("unknown@example.com")
+
+    # Act
+    cache.find_by_email(email)
+    result = cache.find_by_email(email)
+
+    # Assert
+    assert result is None
+    assert inner.find_by_email.call_count == 2
+    assert cache.stats().size == 0
+
+
+def test_returns_copies_of_cached_accounts() -> None:
+    """
+    Mutating a returned account should not alter the cached entry.
+
+    Validates:
+        - activate() on a returned copy without save() is not cached
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.return_value = account
+    cache = create_cache(inner)
+
+    # Act
+    cache.find_by_id(account.id)
+    returned = cache.find_by_id(account.id)
+    assert returned is not None
+    returned.activate()
+
+    # Assert
+    cached = cache.find_by_id(account.id)
+    assert cached is not None
+    assert cached.is_activated is False
+
+
+def test_evicts_least_recently_used_account() -> None:
+    """
+    Cache should stay within max_size by evicting the least recently used entry.
+
+    Validates:
+        - Recently read entry survives, oldest one evicted
+        - Eviction counter incremented
+        - Evicted email no longer indexed
+    """
+    # Arrange
+    first, second, third = (create_account(f"user{i}@example.com") for i in range(3))
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.side_effect = lambda account_id: {a.id: a for a in (first, second, third)}[
+        account_id
+    ]
+    cache = create_cache(inner, max_size=2)
+    cache.find_by_id(first.id)
+    cache.find_by_id(second.id)
+    cache.find_by_id(first.id)  # first is now most recently used
+
+    # Act
+    cache.find_by_id(third.id)
+
+    # Assert
+    stats = cache.stats()
+    assert (stats.size, stats.evictions) == (2, 1)
+    inner.find_by_email.return_value = second
+    cache.find_by_email(second.email)
+    inner.find_by_email.assert_called_once_with(second.email)
+
+
+def test_reloads_expired_entries() -> None:
+    """
+    Entries older than the TTL should be reloaded from the inner repository.
+
+    Validates:
+        - Lookup after TTL reaches the inner repository again
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.return_value = account
+    clock = FakeClock()
+    cache = create_cache(inner, clock=clock)
+    cache.find_by_id(account.id)
+
+    # Act
+    clock.now += TTL
+    cache.find_by_id(account.id)
+
+    # Assert
+    assert inner.find_by_id.call_count == 2
+    assert cache.stats().misses == 2
+
+
+def test_save_writes_through_and_refreshes_entry() -> None:
+    """
+    save() should persist via the inner repository and cache the saved account.
+
+    Validates:
+        - Inner save() called
+        - Following lookup returns the saved state without a database read
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.return_value = create_account()
+    cache = create_cache(inner)
+    account.activate()
+
+    # Act
+    cache.save(account)
+    found = cache.find_by_id(account.id)
+
+    # Assert
+    inner.save.assert_called_once_with(account)
+    inner.find_by_id.assert_not_called()
+    assert found is not None
+    assert found.is_activated is True
+
+
+def test_save_inside_transaction_only_invalidates() -> None:
+    """
+    save() inside a UnitOfWork should not cache a write that may be rolled back.
+
+    Validates:
+        - Entry dropped
+        - Next lookup (outside the transaction) reaches the inner repository
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.return_value = account
+    db = MagicMock(spec=DatabaseConnectionFactory)
+    db.in_transaction.return_value = False
+    cache = create_cache(inner, db=db)
+    cache.find_by_id(account.id)
+
+    # Act
+    db.in_transaction.return_value = True
+    cache.save(account)
+    db.in_transaction.return_value = False
+    cache.find_by_id(account.id)
+
+    # Assert
+    assert inner.find_by_id.call_count == 2
+
+
+def test_lookups_inside_transaction_are_not_cached() -> None:
+    """
+    Reads inside a UnitOfWork may see uncommitted rows and must bypass the cache.
+
+    Validates:
+        - Nothing cached after a lookup inside a transaction
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_email.return_value = account
+    db = MagicMock(spec=DatabaseConnectionFactory)
+    db.in_transaction.return_value = True
+    cache = create_cache(inner, db=db)
+
+    # Act
+    cache.find_by_email(account.email)
+
+    # Assert
+    assert cache.stats().size == 0
+
+
+def test_invalidate_drops_entry() -> None:
+    """
+    invalidate() (change notification) should force a reload.
+
+    Validates:
+        - Lookup after invalidate() reaches the inner repository
+        - Invalidation counter incremented
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_email.return_value = account
+    cache = create_cache(inner)
+    cache.find_by_email(account.email)
+
+    # Act
+    cache.invalidate(account.id)
+    cache.find_by_email(account.email)
+
+    # Assert
+    assert inner.find_by_email.call_count == 2
+    assert cache.stats().invalidations == 1
+
+
+def test_load_overlapping_invalidation_is_not_cached() -> None:
+    """
+    A row read before a change notification must not be cached after it.
+
+    Validates:
+        - Loaded account returned to the caller
+        - Not cached: next lookup reaches the inner repository
+    """
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    cache = create_cache(inner)
+
+    def read_then_notified(_: Email) -> Account:
+        cache.invalidate(account.id)  # NOTIFY processed while SELECT in flight
+        return account
+
+    inner.find_by_email.side_effect = read_then_notified
+
+    # Act
+    result = cache.find_by_email(account.email)
+
+    # Assert
+    assert result == account
+    assert cache.stats().size == 0
+
+
+def test_clear_drops_every_entry() -> None:
+    """
+    clear() (listener reconnection) should empty the cache.
+
+    Validates:
+        - Size back to zero
+    """
+    # Arrange
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.side_effect = lambda account_id: create_account()
+    cache = create_cache(inner)
+    cache.find_by_id(create_account().id)
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert cache.stats().size == 0
+
+
+def test_rejects_empty_cache_size() -> None:
+    """Cache size must allow at least one entry."""
+    with pytest.raises(ValueError, match="at least 1"):
+        create_cache(MagicMock(spec=AccountRepository), max_size=0)
+
+
+def test_find_by_ids_loads_only_uncached_accounts_in_one_call() -> None:
+    """
+    find_by_ids() should serve cached accounts and batch-load the others.
+
+    Validates:
+        - Inner find_by_ids() called once, with the uncached ids only
+        - Loaded accounts cached (following lookup is a hit)
+    """
+    # Arrange
+    cached = create_account("cached@example.com")
+    loaded = create_account("loaded@example.com")
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_id.return_value = cached
+    inner.find_by_ids.return_value = {loaded.id: loaded}
+    cache = create_cache(inner)
+    cache.find_by_id(cached.id)
+    unknown = create_account("unknown@example.com").id
+
+    # Act
+    found = cache.find_by_ids([cached.id, loaded.id, unknown])
+
+    # Assert
+    assert found == {cached.id: cached, loaded.id: loaded}
+    assert sorted(map(str, inner.find_by_ids.call_args.args[0])) == sorted(
+        [str(loaded.id), str(unknown)]
+    )
+    assert cache.find_by_email(loaded.email) == loaded
+    assert inner.find_by_email.call_count == 0
+
+
+def test_find_by_emails_loads_only_uncached_accounts_in_one_call() -> None:
+    """find_by_emails() should serve cached accounts and batch-load the others."""
+    # Arrange
+    cached = create_account("cached@example.com")
+    loaded = create_account("loaded@example.com")
+    inner = MagicMock(spec=AccountRepository)
+    inner.find_by_email.return_value = cached
+    inner.find_by_emails.return_value = {loaded.email: loaded}
+    cache = create_cache(inner)
+    cache.find_by_email(cached.email)
+
+    # Act
+    found = cache.find_by_emails([cached.email, loaded.email])
+
+    # Assert
+    assert found == {cached.email: cached, loaded.email: loaded}
+    inner.find_by_emails.assert_called_once_with([loaded.email])
+
+
+def test_save_many_writes_through_and_refreshes_entries() -> None:
+    """
+    save_many() should persist via the inner repository and cache every account.
+
+    Validates:
+        - Inner save_many() called once
+        - Following lookups served from memory
+    """
+    # Arrange
+    accounts = [create_account(f"user{i}@example.com") for i in range(3)]
+    inner = MagicMock(spec=AccountRepository)
+    cache = create_cache(inner)
+
+    # Act
+    cache.save_many(accounts)
+    found = cache.find_by_ids(account.id for account in accounts)
+
+    # Assert
+    inner.save_many.assert_called_once_with(accounts)
+    inner.find_by_ids.assert_not_called()
+    assert found == {account.id: account for account in accounts}
+
+
+def test_iter_accounts_streams_from_inner_repository_without_caching() -> None:
+    """Bulk streaming should bypass the cache (no entries, no stats)."""
+    # Arrange
+    account = create_account()
+    inner = MagicMock(spec=AccountRepository)
+    inner.iter_accounts.return_value = iter([account])
+    cache = create_cache(inner)
+
+    # Act
+    streamed = list(cache.iter_accounts(created_from=None, created_until=None))
+
+    # Assert
+    assert streamed == [account]
+    inner.iter_accounts.assert_called_once_with(None, None)
+    assert cache.stats().size == 0
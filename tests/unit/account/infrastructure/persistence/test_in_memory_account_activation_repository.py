@@ -0,0 +1,236 @@
+"""
+Unit tests for InMemoryAccountActivationRepository.
+
+Validates storage and replacement of codes, expiry through the timing
+wheel (with retention), and activation outcomes in business rule order.
+
+Test Strategy:
+    - Unit tests (no database required)
+    - AccountRepository mocked
+    - Fake wall clock to control expiry
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from src.account.domain.entities.account import Account
+from src.account.domain.entities.account_activation import AccountActivation
+from src.account.domain.repositories.account_repository import AccountRepository
+from src.account.domain.value_objects.activation_code import ActivationCode
+from src.account.domain.value_objects.activation_outcome import ActivationOutcome
+from src.account.domain.value_objects.email import Email
+from src.account.domain.value_objects.password import Password
+from src.account.infrastructure.persistence.in_memory_account_activation_repository import (
+    InMemoryAccountActivationRepository,
+)
+
+NOW = datetime(2025, 11, 10, 9, 0, tzinfo=UTC)
+RETENTION = 60.0
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_account() -> Account:
+    return Account.create(
+        Email("memory@example.com"), Password.from_hash("$2b$12$hashedformemorytests")
+    )
+
+
+def create_activation(account: Account, code: str = "1234") -> AccountActivation:
+    return AccountActivation(
+        _account_id=account.id,
+        _code=ActivationCode(code),
+        _created_at=NOW,
+        _expires_at=NOW + timedelta(seconds=AccountActivation.EXPIRATION_SECONDS),
+    )
+
+
+def create_repository(
+    account: Account | None, clock: FakeClock
+) -> tuple[InMemoryAccountActivationRepository, MagicMock]:
+    account_repository = MagicMock(spec=AccountRepository)
+    account_repository.find_by_id.return_value = account
+    repository = InMemoryAccountActivationRepository(
+        account_repository, retention=RETENTION, clock=clock
+    )
+    return repository, account_repository
+
+
+def test_save_replaces_previous_code() -> None:
+    """
+    save() should keep a single code per account (upsert semantics).
+
+    Validates:
+        - Latest code returned
+        - One stored entry
+    """
+    # Arrange
+    account = create_account()
+    repository, _ = create_repository(account, FakeClock())
+
+    # Act
+    repository.save(create_activation(account, "1111"))
+    repository.save(create_activation(account, "2222"))
+
+    # Assert
+    found = repository.find_by_account_id(account.id)
+    assert found is not None
+    assert found.code == ActivationCode("2222")
+    assert len(repository) == 1
+
+
+def test_save_if_absent_keeps_unexpired_code_and_replaces_expired_one() -> None:
+    """
+    save_if_absent() should only store a code when none is live.
+
+    Validates:
+        - Live code returned and kept
+        - Expired code (still within retention) replaced
+    """
+    # Arrange
+    account = create_account()
+    clock = FakeClock()
+    repository, _ = create_repository(account, clock)
+    repository.save(create_activation(account, "1111"))
+
+    # Act & Assert: live code kept
+    kept = repository.save_if_absent(create_activation(account, "2222"))
+    assert kept.code == ActivationCode("1111")
+
+    # Act & Assert: expired code replaced
+    clock.now += AccountActivation.EXPIRATION_SECONDS + 1
+    replacement = AccountActivation.create_for_account(account.id)
+    assert repository.save_if_absent(replacement) is replacement
+    found = repository.find_by_account_id(account.id)
+    assert found is not None
+    assert found.code == replacement.code
+
+
+def test_expired_code_is_kept_during_retention_then_dropped() -> None:
+    """
+    Expired codes should stay findable for the retention period only.
+
+    Validates:
+        - Found right after expiry (reported CODE_EXPIRED)
+        - Dropped once expiry + retention has passed (memory reclaimed)
+    """
+    # Arrange
+    account = create_account()
+    clock = FakeClock()
+    repository, _ = create_repository(account, clock)
+    repository.save(create_activation(account))
+
+    # Act & Assert
+    clock.now += AccountActivation.EXPIRATION_SECONDS + 1
+    assert repository.activate_with_code(account.id, ActivationCode("1234")) is (
+        ActivationOutcome.CODE_EXPIRED
+    )
+
+    clock.now += RETENTION
+    assert repository.find_by_account_id(account.id) is None
+    assert len(repository) == 0
+
+
+def test_activate_with_valid_code_activates_and_saves_account() -> None:
+    """
+    A matching, live code should activate the account through AccountRepository.
+
+    Validates:
+        - ACTIVATED returned
+        - Account saved with is_activated=True
+    """
+    # Arrange
+    account = create_account()
+    repository, account_repository = create_repository(account, FakeClock())
+    repository.save(create_activation(account))
+
+    # Act
+    outcome = repository.activate_with_code(account.id, ActivationCode("1234"))
+
+    # Assert
+    assert outcome is ActivationOutcome.ACTIVATED
+    account_repository.save.assert_called_once_with(account)
+    assert account.is_activated is True
+
+
+def test_activate_already_active_account_does_not_save() -> None:
+    """Idempotent activation should not rewrite an active account."""
+    # Arrange
+    account = create_account()
+    account.activate()
+    repository, account_repository = create_repository(account, FakeClock())
+    repository.save(create_activation(account))
+
+    # Act
+    outcome = repository.activate_with_code(account.id, ActivationCode("1234"))
+
+    # Assert
+    assert outcome is ActivationOutcome.ACTIVATED
+    account_repository.save.assert_not_called()
+
+
+def test_activate_reports_failed_rules_in_order() -> None:
+    """
+    Outcomes should follow the AccountActivationRepository rule order.
+
+    Validates:
+        - ACCOUNT_NOT_FOUND before code checks
+        - CODE_NOT_FOUND, then CODE_MISMATCH
+        - Account never saved on failure
+    """
+    # Arrange
+    account = create_account()
+    missing_repository, _ = create_repository(None, FakeClock())
+    repository, account_repository = create_repository(account, FakeClock())
+
+    # Act & Assert
+    assert missing_repository.activate_with_code(account.id, ActivationCode("1234")) is (
+        ActivationOutcome.ACCOUNT_NOT_FOUND
+    )
+    assert repository.activate_with_code(account.id, ActivationCode("1234")) is (
+        ActivationOutcome.CODE_NOT_FOUND
+    )
+
+    repository.save(create_activation(account))
+    assert repository.activate_with_code(account.id, ActivationCode("9999")) is (
+        ActivationOutcome.CODE_MISMATCH
+    )
+    account_repository.save.assert_not_called()
+
+
+def test_save_many_stores_codes_and_find_by_account_ids_returns_them() -> None:
+    """
+    save_many() should store one code per account, found back in one lookup.
+
+    Validates:
+        - Last code wins for an account listed twice
+        - Accounts without code absent from the result
+    """
+    # Arrange
+    account = create_account()
+    other = create_account()
+    without_code = create_account()
+    repository, _ = create_repository(account, FakeClock())
+
+    # Act
+    repository.save_many(
+        [
+            create_activation(account, "1111"),
+            create_activation(other, "2222"),
+            create_activation(account, "3333"),
+        ]
+    )
+    found = repository.find_by_account_ids([account.id, other.id, without_code.id])
+
+    # Assert
+    assert {account_id: activation.code for account_id, activation in found.items()} == {
+        account.id: ActivationCode("3333"),
+        other.id: ActivationCode("2222"),
+    }
+    assert len(repository) == 2
@@ -0,0 +1,291 @@
+"""
+Unit tests for BlockingConnectionPool.
+
+Validates checkout/return bookkeeping, bounded waiting when the pool is
+exhausted, connection reset on return and the metrics snapshot.
+
+Test Strategy:
+    - Fake connections (no database): pool logic only
+    - Threads to exercise waiting and wake-up on putconn()
+    - Short timeouts to keep tests fast
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import cast
+
+import psycopg2
+import pytest
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INTRANS,
+    TRANSACTION_STATUS_UNKNOWN,
+)
+from psycopg2.pool import PoolError
+
+from src.shared.infrastructure.database.connection import (
+    BlockingConnectionPool,
+    PoolTimeoutError,
+)
+
+
+@dataclass
+class FakeInfo:
+    transaction_status: int = TRANSACTION_STATUS_IDLE
+
+
+@dataclass(eq=False)
+class FakeConnection:
+    closed: bool = False
+    broken: bool = False
+    rollbacks: int = 0
+    info: FakeInfo = field(default_factory=FakeInfo)
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    def close(self) -> None:
+        self.closed = True
+
+    def cursor(self) -> "FakeCursor":
+        if self.broken:
+            raise psycopg2.OperationalError("server closed the connection")
+        return FakeCursor()
+
+
+class FakeCursor:
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        pass
+
+    def execute(self, query: str) -> None:
+        pass
+
+
+def make_pool(minconn: int = 1, maxconn: int = 2, timeout: float = 0.05) -> BlockingConnectionPool:
+    return BlockingConnectionPool(
+        minconn=minconn,
+        maxconn=maxconn,
+        connect=FakeConnection,  # type: ignore[arg-type]
+        timeout=timeout,
+    )
+
+
+def test_does_not_connect_before_open() -> None:
+    pool = make_pool(minconn=2, maxconn=4)
+
+    assert pool.stats().idle == 0
+
+
+def test_open_preopens_minconn_connections() -> None:
+    pool = make_pool(minconn=2, maxconn=4)
+
+    pool.open(verify=False)
+
+    stats = pool.stats()
+    assert stats.idle == 2
+    assert stats.in_use == 0
+
+
+def test_open_replaces_connections_failing_verification() -> None:
+    pool = make_pool(minconn=1, maxconn=2)
+    pool.open(verify=False)
+    broken = cast(FakeConnection, pool.getconn())
+    broken.broken = True
+    pool.putconn(broken)  # type: ignore[arg-type]
+
+    pool.open(verify=True)
+
+    assert broken.closed
+    assert pool.stats().idle == 1
+    assert pool.getconn() is not cast(object, broken)
+
+
+def test_reuses_most_recently_returned_connection() -> None:
+    pool = make_pool(minconn=1, maxconn=2)
+
+    conn = pool.getconn()
+    pool.putconn(conn)
+
+    assert pool.getconn() is conn
+
+
+def test_keeps_connections_above_minconn_open_on_return() -> None:
+    pool = make_pool(minconn=1, maxconn=3)
+
+    connections = [pool.getconn() for _ in range(3)]
+    for conn in connections:
+        pool.putconn(conn)
+
+    assert pool.stats().idle == 3
+    assert not any(conn.closed for conn in connections)
+
+
+def test_raises_timeout_when_exhausted() -> None:
+    pool = make_pool(minconn=0, maxconn=1, timeout=0.05)
+    pool.getconn()
+
+    started = time.monotonic()
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+
+    assert time.monotonic() - started >= 0.05
+    assert pool.stats().timeouts == 1
+
+
+def test_timeout_error_is_a_pool_error() -> None:
+    assert issubclass(PoolTimeoutError, PoolError)
+
+
+def test_waiter_receives_connection_returned_by_another_thread() -> None:
+    pool = make_pool(minconn=0, maxconn=1, timeout=2.0)
+    held = pool.getconn()
+    acquired: list[object] = []
+
+    waiter = threading.Thread(target=lambda: acquired.append(pool.getconn()))
+    waiter.start()
+
+    # Wait until the thread is blocked in getconn()
+    deadline = time.monotonic() + 2.0
+    while pool.stats().waiters == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert pool.stats().waiters == 1
+
+    pool.putconn(held)
+    waiter.join(timeout=2.0)
+
+    assert acquired == [held]
+    assert pool.stats().waiters == 0
+
+
+def test_rolls_back_connection_returned_mid_transaction() -> None:
+    pool = make_pool()
+    conn = cast(FakeConnection, pool.getconn())
+    conn.info.transaction_status = TRANSACTION_STATUS_INTRANS
+
+    pool.putconn(conn)  # type: ignore[arg-type]
+
+    assert conn.rollbacks == 1
+    assert pool.stats().idle == 1
+
+
+def test_discards_broken_connection() -> None:
+    pool = make_pool(minconn=0, maxconn=1)
+    conn = cast(FakeConnection, pool.getconn())
+    conn.info.transaction_status = TRANSACTION_STATUS_UNKNOWN
+
+    pool.putconn(conn)  # type: ignore[arg-type]
+
+    assert conn.closed
+    assert pool.stats().idle == 0
+    assert pool.getconn() is not cast(object, conn)
+
+
+def test_rejects_unknown_connection() -> None:
+    pool = make_pool()
+
+    with pytest.raises(PoolError):
+        pool.putconn(FakeConnection())  # type: ignore[arg-type]
+
+
+def test_closeall_closes_connections_and_rejects_checkout() -> None:
+    pool = make_pool(minconn=2, maxconn=2)
+    pool.open()
+    conn = pool.getconn()
+
+    pool.closeall()
+
+    assert conn.closed
+    with pytest.raises(PoolError):
+        pool.getconn()
+
+
+def test_closeall_waits_for_in_flight_checkouts() -> None:
+    pool = make_pool(minconn=0, maxconn=1)
+    conn = pool.getconn()
+
+    returner = threading.Timer(0.05, pool.putconn, args=(conn,))
+    returner.start()
+    pool.closeall(drain_timeout=2.0)
+    returner.join()
+
+    assert conn.closed
+    assert pool.stats().in_use == 0
+
+
+def test_closeall_closes_checkouts_not_returned_in_time() -> None:
+    pool = make_pool(minconn=0, maxconn=1)
+    conn = pool.getconn()
+
+    pool.closeall(drain_timeout=0.01)
+    pool.putconn(conn)  # Late return is tolerated
+
+    assert conn.closed
+
+
+def test_open_after_closeall_accepts_checkouts_again() -> None:
+    pool = make_pool(minconn=1, maxconn=1)
+    pool.closeall()
+
+    pool.open(verify=False)
+
+    assert pool.getconn() is not None
+
+
+def test_forked_child_starts_with_empty_pool() -> None:
+    pool = make_pool(minconn=2, maxconn=2)
+    pool.open(verify=False)
+    inherited = pool.getconn()
+
+    pid = os.fork()
+    if pid == 0:  # Child: inherited connections forgotten, never closed
+        stats = pool.stats()
+        ok = stats.idle == 0 and stats.in_use == 0 and not inherited.closed
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert pool.stats().in_use == 1
+
+
+def test_frees_slot_when_connect_fails() -> None:
+    attempts = 0
+
+    def flaky_connect() -> FakeConnection:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise OSError("connection refused")
+        return FakeConnection()
+
+    pool = BlockingConnectionPool(
+        minconn=0, maxconn=1, connect=flaky_connect, timeout=0.05  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(OSError):
+        pool.getconn()
+
+    assert pool.getconn() is not None
+
+
+def test_stats_record_wait_time_histogram() -> None:
+    pool = make_pool(minconn=1, maxconn=1)
+    pool.open()
+
+    pool.putconn(pool.getconn())
+    pool.putconn(pool.getconn())
+
+    stats = pool.stats()
+    assert stats.acquisitions == 2
+    assert sum(count for _, count in stats.wait_time_histogram) == 2
+    assert stats.wait_time_histogram[-1][0] == float("inf")
+
+
+def test_rejects_invalid_sizes() -> None:
+    with pytest.raises(PoolError):
+        make_pool(minconn=3, maxconn=2)
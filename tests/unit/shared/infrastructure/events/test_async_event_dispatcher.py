@@ -0,0 +1,426 @@
+"""
+Unit tests for AsyncEventDispatcher.
+
+Tests verify:
+    - Handlers run on worker threads, dispatch() does not wait for them
+    - Events dispatched in a transaction are queued only after COMMIT
+    - Full queue policies (block, reject) and slot release
+    - reserve(): slot taken before the unit of work, used by dispatch()
+    - Handler failures are counted and do not stop the workers
+    - shutdown() drains queued events
+    - Queue depth and latency metrics
+    - Batching: groups handed to handle_batch() by size or time window
+
+Test Strategy:
+    - Unit tests (no database)
+    - Mock DatabaseConnectionFactory: after_commit() runs on_commit
+      immediately, or records the hooks to simulate COMMIT/ROLLBACK
+"""
+
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import pytest
+from injector import Injector
+
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+from src.shared.infrastructure.events.async_event_dispatcher import (
+    AsyncEventDispatcher,
+    EventQueueFullError,
+    QueueFullPolicy,
+)
+
+
+@dataclass(frozen=True)
+class SampleEvent:
+    """Event for testing."""
+
+    message: str
+
+
+class RecordingHandler:
+    """Handler recording events and the thread that handled them."""
+
+    def __init__(self) -> None:
+        self.handled: list[SampleEvent] = []
+        self.threads: list[str] = []
+        self.release = threading.Event()
+        self.release.set()
+        self.done = threading.Semaphore(0)
+
+    def handle(self, event: SampleEvent) -> None:
+        self.release.wait(timeout=5)
+        if event.message == "fail":
+            self.done.release()
+            raise RuntimeError("handler failed")
+        self.handled.append(event)
+        self.threads.append(threading.current_thread().name)
+        self.done.release()
+
+    def wait_for(self, count: int) -> None:
+        for _ in range(count):
+            assert self.done.acquire(timeout=5), "handler was not called in time"
+
+
+class BatchRecordingHandler(RecordingHandler):
+    """Handler also accepting groups of events (handle_batch)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[SampleEvent]] = []
+
+    def handle_batch(self, events: list[SampleEvent]) -> None:
+        self.release.wait(timeout=5)
+        self.batches.append(list(events))
+        for _ in events:
+            self.done.release()
+        if any(event.message == "fail" for event in events):
+            raise RuntimeError("batch failed")
+
+
+@pytest.fixture
+def handler() -> RecordingHandler:
+    return RecordingHandler()
+
+
+@pytest.fixture
+def db() -> Mock:
+    """Connection factory outside any transaction (hooks run immediately)."""
+    mock_db = Mock(spec=DatabaseConnectionFactory)
+    mock_db.after_commit.side_effect = lambda on_commit, on_rollback=None: on_commit()
+    return mock_db
+
+
+@contextmanager
+def create_dispatcher(
+    handler: RecordingHandler, db: Mock, **options: object
+) -> Generator[AsyncEventDispatcher]:
+    injector = Mock(spec=Injector)
+    injector.get.return_value = handler
+    dispatcher = AsyncEventDispatcher(injector, db, **options)  # type: ignore[arg-type]
+    dispatcher.register(SampleEvent, type(handler))
+    try:
+        yield dispatcher
+    finally:
+        handler.release.set()
+        dispatcher.shutdown(timeout=5)
+
+
+@pytest.fixture
+def dispatcher(handler: RecordingHandler, db: Mock) -> Generator[AsyncEventDispatcher]:
+    with create_dispatcher(handler, db, workers=2, queue_size=10) as created:
+        yield created
+
+
+def test_dispatch_returns_before_handler_runs_on_worker_thread(
+    dispatcher: AsyncEventDispatcher, handler: RecordingHandler
+) -> None:
+    handler.release.clear()
+
+    dispatcher.dispatch(SampleEvent("hello"))
+    assert handler.handled == []  # Handler still blocked: dispatch() did not wait
+
+    handler.release.set()
+    handler.wait_for(1)
+    assert handler.handled == [SampleEvent("hello")]
+    assert handler.threads[0].startswith("event-dispatcher-")
+
+
+def test_dispatch_in_transaction_queues_event_after_commit(
+    dispatcher: AsyncEventDispatcher, handler: RecordingHandler, db: Mock
+) -> None:
+    hooks: list[tuple[Callable[[], None], Callable[[], None]]] = []
+    db.after_commit.side_effect = lambda on_commit, on_rollback: hooks.append(
+        (on_commit, on_rollback)
+    )
+
+    dispatcher.dispatch(SampleEvent("committed"))
+    assert dispatcher.stats().pending_commit == 1
+    assert handler.handled == []
+
+    on_commit, _ = hooks[0]
+    on_commit()  # COMMIT
+    handler.wait_for(1)
+
+    assert handler.handled == [SampleEvent("committed")]
+    assert dispatcher.stats().pending_commit == 0
+
+
+def test_dispatch_in_rolled_back_transaction_drops_event_and_frees_slot(
+    handler: RecordingHandler, db: Mock
+) -> None:
+    hooks: list[tuple[Callable[[], None], Callable[[], None]]] = []
+    db.after_commit.side_effect = lambda on_commit, on_rollback: hooks.append(
+        (on_commit, on_rollback)
+    )
+    with create_dispatcher(
+        handler, db, queue_size=1, full_policy=QueueFullPolicy.REJECT
+    ) as dispatcher:
+        dispatcher.dispatch(SampleEvent("rolled back"))
+        _, on_rollback = hooks[0]
+        on_rollback()  # ROLLBACK
+
+        dispatcher.dispatch(SampleEvent("retried"))  # The only slot was released
+        hooks[1][0]()
+        handler.wait_for(1)
+
+        assert handler.handled == [SampleEvent("retried")]
+        assert dispatcher.stats().dispatched == 1
+
+
+def test_dispatch_rejects_when_queue_full(handler: RecordingHandler, db: Mock) -> None:
+    with create_dispatcher(
+        handler, db, workers=1, queue_size=2, full_policy=QueueFullPolicy.REJECT
+    ) as dispatcher:
+        handler.release.clear()
+        dispatcher.dispatch(SampleEvent("in progress"))
+        dispatcher.dispatch(SampleEvent("queued"))
+
+        with pytest.raises(EventQueueFullError, match="2 events"):
+            dispatcher.dispatch(SampleEvent("rejected"))
+
+        handler.release.set()
+        handler.wait_for(2)
+        dispatcher.dispatch(SampleEvent("accepted again"))
+        handler.wait_for(1)
+
+        assert [event.message for event in handler.handled] == [
+            "in progress",
+            "queued",
+            "accepted again",
+        ]
+        assert dispatcher.stats().rejected == 1
+
+
+def test_dispatch_blocks_until_slot_frees_up(handler: RecordingHandler, db: Mock) -> None:
+    with create_dispatcher(handler, db, workers=1, queue_size=1, block_timeout=5) as dispatcher:
+        handler.release.clear()
+        dispatcher.dispatch(SampleEvent("first"))
+        threading.Timer(0.1, handler.release.set).start()
+
+        dispatcher.dispatch(SampleEvent("second"))  # Waits for "first" to finish
+        handler.wait_for(2)
+
+        assert [event.message for event in handler.handled] == ["first", "second"]
+
+
+def test_dispatch_block_times_out_when_queue_stays_full(
+    handler: RecordingHandler, db: Mock
+) -> None:
+    with create_dispatcher(handler, db, workers=1, queue_size=1, block_timeout=0.05) as dispatcher:
+        handler.release.clear()
+        dispatcher.dispatch(SampleEvent("stuck"))
+
+        with pytest.raises(EventQueueFullError):
+            dispatcher.dispatch(SampleEvent("timed out"))
+        assert dispatcher.stats().rejected == 1
+
+
+def test_dispatch_uses_slot_taken_by_reserve(handler: RecordingHandler, db: Mock) -> None:
+    with create_dispatcher(
+        handler, db, workers=1, queue_size=1, full_policy=QueueFullPolicy.REJECT
+    ) as dispatcher:
+        with dispatcher.reserve(SampleEvent):
+            dispatcher.dispatch(SampleEvent("reserved"))  # Would be rejected otherwise
+        handler.wait_for(1)
+
+        assert handler.handled == [SampleEvent("reserved")]
+        assert dispatcher.stats().rejected == 0
+
+
+def test_reserve_fails_before_the_block_when_queue_full(
+    handler: RecordingHandler, db: Mock
+) -> None:
+    """A full queue is reported before the caller opens its unit of work."""
+    with create_dispatcher(
+        handler, db, workers=1, queue_size=1, full_policy=QueueFullPolicy.REJECT
+    ) as dispatcher:
+        handler.release.clear()
+        dispatcher.dispatch(SampleEvent("stuck"))
+        entered = False
+
+        with pytest.raises(EventQueueFullError):
+            with dispatcher.reserve(SampleEvent):
+                entered = True
+
+        assert entered is False
+        assert dispatcher.stats().rejected == 1
+
+
+def test_unused_reservation_is_released(handler: RecordingHandler, db: Mock) -> None:
+    with create_dispatcher(
+        handler, db, workers=1, queue_size=1, full_policy=QueueFullPolicy.REJECT
+    ) as dispatcher:
+        with pytest.raises(RuntimeError, match="duplicate"):
+            with dispatcher.reserve(SampleEvent):
+                raise RuntimeError("duplicate email")  # Command failed before dispatch
+
+        dispatcher.dispatch(SampleEvent("after"))  # The only slot is free again
+        handler.wait_for(1)
+        assert handler.handled == [SampleEvent("after")]
+
+
+def test_reserve_ignores_unregistered_events(dispatcher: AsyncEventDispatcher) -> None:
+    with dispatcher.reserve(int):
+        pass
+
+    assert dispatcher.stats().rejected == 0
+
+
+def test_handler_failure_is_counted_and_worker_continues(
+    handler: RecordingHandler, db: Mock
+) -> None:
+    with create_dispatcher(handler, db, workers=1) as dispatcher:
+        dispatcher.dispatch(SampleEvent("fail"))
+        dispatcher.dispatch(SampleEvent("ok"))
+        handler.wait_for(2)
+        dispatcher.shutdown()
+
+        stats = dispatcher.stats()
+        assert handler.handled == [SampleEvent("ok")]
+        assert (stats.handled, stats.failed) == (1, 1)
+
+
+def test_dispatch_ignores_unregistered_events(dispatcher: AsyncEventDispatcher, db: Mock) -> None:
+    dispatcher.dispatch(object())
+
+    db.after_commit.assert_not_called()
+    assert dispatcher.stats().dispatched == 0
+
+
+def test_shutdown_drains_queued_events(handler: RecordingHandler, db: Mock) -> None:
+    with create_dispatcher(handler, db, workers=1, queue_size=100) as dispatcher:
+        handler.release.clear()
+        for index in range(20):
+            dispatcher.dispatch(SampleEvent(str(index)))
+
+        handler.release.set()
+        dispatcher.shutdown(timeout=5)
+
+        assert len(handler.handled) == 20
+        with pytest.raises(RuntimeError, match="shut down"):
+            dispatcher.dispatch(SampleEvent("late"))
+
+
+def test_stats_report_queue_depth_and_latency(handler: RecordingHandler, db: Mock) -> None:
+    with create_dispatcher(handler, db, workers=1, queue_size=10) as dispatcher:
+        handler.release.clear()
+        for index in range(4):
+            dispatcher.dispatch(SampleEvent(str(index)))
+
+        busy = dispatcher.stats()
+        handler.release.set()
+        handler.wait_for(4)
+        dispatcher.shutdown()
+        idle = dispatcher.stats()
+
+        assert busy.dispatched == 4
+        assert busy.queue_depth + busy.in_progress == 4
+        assert idle.peak_queue_depth >= 3
+        assert (idle.queue_depth, idle.in_progress, idle.handled) == (0, 0, 4)
+        assert sum(count for _, count in idle.latency_histogram) == 4
+
+
+@pytest.mark.parametrize(
+    ("workers", "queue_size", "batch_size"), [(0, 10, 1), (1, 0, 1), (1, 10, 0)]
+)
+def test_constructor_rejects_invalid_sizes(
+    workers: int, queue_size: int, batch_size: int, db: Mock
+) -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        AsyncEventDispatcher(
+            Mock(spec=Injector),
+            db,
+            workers=workers,
+            queue_size=queue_size,
+            batch_size=batch_size,
+        )
+
+
+def test_start_after_shutdown_accepts_events_again(
+    dispatcher: AsyncEventDispatcher, handler: RecordingHandler
+) -> None:
+    dispatcher.dispatch(SampleEvent("before"))
+    dispatcher.shutdown(timeout=5)
+
+    dispatcher.start()
+    dispatcher.dispatch(SampleEvent("after"))
+    handler.wait_for(2)
+
+    assert [event.message for event in handler.handled] == ["before", "after"]
+
+
+def test_batching_hands_queued_events_to_handle_batch_by_size(db: Mock) -> None:
+    handler = BatchRecordingHandler()
+    with create_dispatcher(handler, db, workers=1, batch_size=3, batch_window=5) as dispatcher:
+        for index in range(6):
+            dispatcher.dispatch(SampleEvent(str(index)))
+
+        handler.wait_for(6)  # Full batches: no wait for the 5 second window
+        dispatcher.shutdown(timeout=5)
+
+        assert handler.handled == []  # Never called one event at a time
+        assert [[event.message for event in batch] for batch in handler.batches] == [
+            ["0", "1", "2"],
+            ["3", "4", "5"],
+        ]
+        stats = dispatcher.stats()
+        assert (stats.handled, stats.batches) == (6, 2)
+
+
+def test_batching_flushes_partial_batch_after_window(db: Mock) -> None:
+    handler = BatchRecordingHandler()
+    with create_dispatcher(handler, db, workers=1, batch_size=100, batch_window=0.05) as dispatcher:
+        dispatcher.dispatch(SampleEvent("a"))
+        dispatcher.dispatch(SampleEvent("b"))
+
+        handler.wait_for(2)  # Well before 100 events: the window closed the batch
+
+        assert [event.message for batch in handler.batches for event in batch] == ["a", "b"]
+
+
+def test_batching_falls_back_to_handle_without_handle_batch(
+    handler: RecordingHandler, db: Mock
+) -> None:
+    with create_dispatcher(handler, db, workers=1, batch_size=10, batch_window=0.05) as dispatcher:
+        handler.release.clear()
+        for index in range(4):
+            dispatcher.dispatch(SampleEvent(str(index)))
+        handler.release.set()
+        handler.wait_for(4)
+        dispatcher.shutdown(timeout=5)
+
+        assert [event.message for event in handler.handled] == ["0", "1", "2", "3"]
+        assert dispatcher.stats().batches == 0
+
+
+def test_batch_failure_fails_whole_batch_and_frees_slots(db: Mock) -> None:
+    handler = BatchRecordingHandler()
+    with create_dispatcher(
+        handler,
+        db,
+        workers=1,
+        queue_size=3,
+        full_policy=QueueFullPolicy.REJECT,
+        batch_size=3,
+        batch_window=5,
+    ) as dispatcher:
+        handler.release.clear()
+        dispatcher.dispatch(SampleEvent("first"))
+        dispatcher.dispatch(SampleEvent("fail"))
+        dispatcher.dispatch(SampleEvent("last"))
+        handler.release.set()
+        handler.wait_for(3)
+        dispatcher.shutdown(timeout=5)
+
+        stats = dispatcher.stats()
+        failed_batch = [batch for batch in handler.batches if SampleEvent("fail") in batch][0]
+        assert stats.failed == len(failed_batch)
+        assert stats.handled + stats.failed == 3
+        assert (stats.queue_depth, stats.in_progress) == (0, 0)
+        dispatcher.start()
+        for index in range(3):  # Every slot was released
+            dispatcher.dispatch(SampleEvent(str(index)))
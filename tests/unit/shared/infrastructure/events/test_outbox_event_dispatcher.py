@@ -0,0 +1,140 @@
+"""
+Unit tests for OutboxEventDispatcher.
+
+Tests verify:
+    - dispatch() writes one outbox row in the active transaction
+    - Events without handler are ignored, events without codec rejected
+    - deliver() decodes the payload and runs the handler
+    - event_names() lists only deliverable event types
+
+Test Strategy:
+    - Unit tests (no database)
+    - Mock DatabaseConnectionFactory: transaction() yields a mock connection
+      whose cursor records the INSERT
+"""
+
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from injector import Injector
+from psycopg2.extras import Json
+
+from src.shared.infrastructure.database.connection import DatabaseConnectionFactory
+from src.shared.infrastructure.events.outbox_event_dispatcher import (
+    OutboxCodec,
+    OutboxEventDispatcher,
+)
+
+
+@dataclass(frozen=True)
+class SampleEvent:
+    """Event for testing."""
+
+    message: str
+
+
+class SampleHandler:
+    """Handler for testing."""
+
+    def __init__(self) -> None:
+        self.handled: list[SampleEvent] = []
+
+    def handle(self, event: SampleEvent) -> None:
+        self.handled.append(event)
+
+
+def encode(event: SampleEvent) -> dict[str, Any]:
+    return {"message": event.message}
+
+
+def decode(payload: dict[str, Any]) -> SampleEvent:
+    return SampleEvent(payload["message"])
+
+
+SAMPLE_CODEC = OutboxCodec(name="Sample", encode=encode, decode=decode)
+
+
+@pytest.fixture
+def cursor() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def db(cursor: MagicMock) -> Mock:
+    """Connection factory whose transaction yields a connection with cursor."""
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    mock_db = Mock(spec=DatabaseConnectionFactory)
+    mock_db.transaction.return_value.__enter__ = Mock(return_value=conn)
+    mock_db.transaction.return_value.__exit__ = Mock(return_value=False)
+    return mock_db
+
+
+@pytest.fixture
+def handler() -> SampleHandler:
+    return SampleHandler()
+
+
+@pytest.fixture
+def dispatcher(db: Mock, handler: SampleHandler) -> OutboxEventDispatcher:
+    injector = Mock(spec=Injector)
+    injector.get.return_value = handler
+    outbox_dispatcher = OutboxEventDispatcher(injector, db)
+    outbox_dispatcher.register(SampleEvent, SampleHandler)
+    outbox_dispatcher.register_codec(SampleEvent, SAMPLE_CODEC)
+    return outbox_dispatcher
+
+
+def test_dispatch_inserts_encoded_event_in_transaction(
+    dispatcher: OutboxEventDispatcher, db: Mock, cursor: MagicMock, handler: SampleHandler
+) -> None:
+    dispatcher.dispatch(SampleEvent("hello"))
+
+    db.transaction.assert_called_once()
+    sql, (event_name, payload) = cursor.execute.call_args.args
+    assert "INSERT INTO outbox" in sql
+    assert event_name == "Sample"
+    assert isinstance(payload, Json)
+    assert payload.adapted == {"message": "hello"}
+    assert handler.handled == []  # Delivered later, by the relay
+
+
+def test_dispatch_ignores_events_without_handler(
+    dispatcher: OutboxEventDispatcher, db: Mock
+) -> None:
+    dispatcher.dispatch(object())
+
+    db.transaction.assert_not_called()
+
+
+def test_dispatch_rejects_handled_event_without_codec(db: Mock) -> None:
+    dispatcher = OutboxEventDispatcher(Mock(spec=Injector), db)
+    dispatcher.register(SampleEvent, SampleHandler)
+
+    with pytest.raises(LookupError, match="SampleEvent"):
+        dispatcher.dispatch(SampleEvent("lost"))
+    db.transaction.assert_not_called()
+
+
+def test_deliver_decodes_payload_and_runs_handler(
+    dispatcher: OutboxEventDispatcher, handler: SampleHandler
+) -> None:
+    dispatcher.deliver("Sample", {"message": "from outbox"})
+
+    assert handler.handled == [SampleEvent("from outbox")]
+
+
+def test_deliver_rejects_unknown_event_name(dispatcher: OutboxEventDispatcher) -> None:
+    with pytest.raises(LookupError, match="Unknown"):
+        dispatcher.deliver("Unknown", {})
+
+
+def test_event_names_lists_types_with_handler_and_codec(db: Mock) -> None:
+    dispatcher = OutboxEventDispatcher(Mock(spec=Injector), db)
+    dispatcher.register_codec(SampleEvent, SAMPLE_CODEC)
+    assert dispatcher.event_names() == []  # Codec only: nothing to deliver to
+
+    dispatcher.register(SampleEvent, SampleHandler)
+    assert dispatcher.event_names() == ["Sample"]
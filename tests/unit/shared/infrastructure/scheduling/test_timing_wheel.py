@@ -0,0 +1,104 @@
+"""
+Unit tests for TimingWheel.
+
+Validates expiry timing across levels, cancel and reschedule, and that the
+wheel never expires a key early.
+
+Test Strategy:
+    - Small wheels (few slots per level) to exercise cascading quickly
+    - Explicit time values (no clock)
+"""
+
+import random
+
+import pytest
+
+from src.shared.infrastructure.scheduling.timing_wheel import TimingWheel
+
+
+def test_expires_key_once_deadline_is_reached() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=0.0)
+    wheel.schedule("a", deadline=5.0)
+
+    assert wheel.advance(4.9) == []
+    assert wheel.advance(5.0) == ["a"]
+    assert len(wheel) == 0
+
+
+def test_rounds_deadline_up_to_next_tick() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=0.0)
+    wheel.schedule("a", deadline=2.5)
+
+    assert wheel.advance(2.9) == []
+    assert wheel.advance(3.0) == ["a"]
+
+
+def test_past_deadline_expires_on_next_advance() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=10.0)
+    wheel.schedule("a", deadline=3.0)
+
+    assert wheel.advance(10.0) == ["a"]
+
+
+def test_cascades_deadlines_beyond_first_level() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=0.0, slots=4, levels=3)
+    wheel.schedule("a", deadline=37.0)
+
+    assert wheel.advance(36.0) == []
+    assert wheel.advance(37.0) == ["a"]
+
+
+def test_deadline_beyond_wheel_span_is_not_lost() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=0.0, slots=4, levels=2)
+    wheel.schedule("a", deadline=100.0)  # Span is 16 ticks
+
+    assert wheel.advance(99.0) == []
+    assert wheel.advance(100.0) == ["a"]
+
+
+def test_single_level_deadline_beyond_span_is_not_expired_early() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=0.0, slots=4, levels=1)
+    wheel.schedule("a", deadline=10.0)  # Span is 4 ticks: parked, then placed again
+
+    assert wheel.advance(9.0) == []
+    assert "a" in wheel
+    assert wheel.advance(10.0) == ["a"]
+
+
+def test_cancel_removes_key() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=0.0)
+    wheel.schedule("a", deadline=5.0)
+
+    assert wheel.cancel("a") is True
+    assert wheel.cancel("a") is False
+    assert wheel.advance(10.0) == []
+
+
+def test_reschedule_replaces_previous_deadline() -> None:
+    wheel: TimingWheel[str] = TimingWheel(tick=1.0, start=0.0)
+    wheel.schedule("a", deadline=5.0)
+    wheel.schedule("a", deadline=8.0)
+
+    assert wheel.advance(7.0) == []
+    assert wheel.advance(8.0) == ["a"]
+    assert "a" not in wheel
+
+
+@pytest.mark.parametrize("levels", [1, 2, 3])
+def test_random_deadlines_expire_on_time_tick_by_tick(levels: int) -> None:
+    rng = random.Random(42)
+    wheel: TimingWheel[int] = TimingWheel(tick=1.0, start=0.0, slots=4, levels=levels)
+    deadlines = {key: rng.randint(1, 200) for key in range(300)}
+    for key, deadline in deadlines.items():
+        wheel.schedule(key, float(deadline))
+
+    for now in range(1, 201):
+        expired = wheel.advance(float(now))
+        assert sorted(expired) == sorted(k for k, d in deadlines.items() if d == now)
+
+    assert len(wheel) == 0
+
+
+def test_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        TimingWheel(tick=0.0, start=0.0)
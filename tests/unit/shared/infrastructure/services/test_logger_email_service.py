@@ -239,3 +239,30 @@ def test_send_email_is_idempotent(caplog: pytest.LogCaptureFixture) -> None:
 
     # Assert: Identical logs (no state mutation)
     assert first_log == second_log
+
+
+def test_send_emails_logs_each_message(caplog: pytest.LogCaptureFixture) -> None:
+    """
+    LoggerEmailService.send_emails() should log one entry per message.
+
+    Validates:
+        - Default EmailService.send_emails() delegates to send_email()
+        - Messages logged in order
+    """
+    # Arrange
+    service = LoggerEmailService()
+    messages = [
+        EmailMessage(to_email=Email(f"user{i}@example.com"), subject="Batch", body="<p>Hi</p>")
+        for i in range(3)
+    ]
+
+    # Act
+    with caplog.at_level(logging.INFO):
+        service.send_emails(messages)
+
+    # Assert
+    assert [record.args[0] for record in caplog.records] == [  # type: ignore[index]
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
@@ -0,0 +1,111 @@
+"""
+Unit tests for ProcessPoolPasswordHasher.
+
+Validates that bcrypt hashing and verification run through the process pool
+and that executor metrics track submissions.
+
+Test Strategy:
+    - Real process pool (single worker to keep tests fast and deterministic)
+    - Round-trip hash → verify through the pool
+    - Compatibility with hashes produced inline by Password VO
+    - Metrics snapshot after completed operations
+    - hash_async() awaited from the event loop
+"""
+
+import asyncio
+from collections.abc import Generator
+
+import pytest
+
+from src.account.domain.value_objects.password import Password
+from src.shared.infrastructure.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
+
+BCRYPT_HASH_PREFIX = "$2b$"
+
+
+@pytest.fixture(scope="module")
+def hasher() -> Generator[ProcessPoolPasswordHasher]:
+    """Provide a single-worker hasher shared by the module (pool startup is slow)."""
+    pool_hasher = ProcessPoolPasswordHasher(max_workers=1)
+    yield pool_hasher
+    pool_hasher.shutdown()
+
+
+def test_hash_returns_bcrypt_hash(hasher: ProcessPoolPasswordHasher) -> None:
+    hashed = hasher.hash("MySecurePassword123")
+
+    assert hashed.startswith(BCRYPT_HASH_PREFIX)
+    assert hashed != "MySecurePassword123"
+
+
+def test_verify_round_trip(hasher: ProcessPoolPasswordHasher) -> None:
+    hashed = hasher.hash("MySecurePassword123")
+
+    assert hasher.verify("MySecurePassword123", hashed) is True
+    assert hasher.verify("WrongPassword", hashed) is False
+
+
+def test_verify_accepts_inline_hash(hasher: ProcessPoolPasswordHasher) -> None:
+    """Hashes produced without the pool stay verifiable through the pool."""
+    password = Password.from_plain_text("MySecurePassword123")
+
+    assert password.verify("MySecurePassword123", hasher) is True
+
+
+def test_password_from_plain_text_uses_hasher(hasher: ProcessPoolPasswordHasher) -> None:
+    password = Password.from_plain_text("MySecurePassword123", hasher)
+
+    assert password.hashed_value.startswith(BCRYPT_HASH_PREFIX)
+    assert password.verify("MySecurePassword123") is True
+
+
+def test_stats_track_completed_operations() -> None:
+    pool_hasher = ProcessPoolPasswordHasher(max_workers=1)
+    try:
+        hashed = pool_hasher.hash("MySecurePassword123")
+        pool_hasher.verify("MySecurePassword123", hashed)
+
+        stats = pool_hasher.stats()
+    finally:
+        pool_hasher.shutdown()
+
+    assert stats.max_workers == 1
+    assert stats.submitted == 2
+    assert stats.completed == 2
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+
+
+def test_hasher_is_usable_after_shutdown() -> None:
+    pool_hasher = ProcessPoolPasswordHasher(max_workers=1)
+    try:
+        pool_hasher.hash("MySecurePassword123")
+        pool_hasher.shutdown()  # Lifespan end (e.g. one TestClient)
+
+        hashed = pool_hasher.hash("MySecurePassword123")  # Next lifespan
+    finally:
+        pool_hasher.shutdown()
+
+    assert hashed.startswith(BCRYPT_HASH_PREFIX)
+    assert pool_hasher.stats().completed == 2
+
+
+async def test_hash_async_awaits_pool_without_blocking_event_loop() -> None:
+    """Concurrent hash_async() calls share the loop; each is counted once done."""
+    pool_hasher = ProcessPoolPasswordHasher(max_workers=2)
+    try:
+        hashes = await asyncio.gather(
+            pool_hasher.hash_async("MySecurePassword123"),
+            pool_hasher.hash_async("MySecurePassword123"),
+        )
+        stats = pool_hasher.stats()
+    finally:
+        pool_hasher.shutdown()
+
+    assert all(hashed.startswith(BCRYPT_HASH_PREFIX) for hashed in hashes)
+    assert pool_hasher.verify("MySecurePassword123", hashes[0]) is True
+    assert stats.submitted == 2
+    assert stats.completed == 2
+    assert stats.in_flight == 0